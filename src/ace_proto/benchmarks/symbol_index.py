@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the workspace symbol index: build throughput and query latency.
+
+Indexes a generated source tree (or an existing one with --root) serially and across worker processes, then
+measures a no-change update, an update after changing some files and the latency of each kind of query.
+
+Usage:
+    python benchmarks/symbol_index.py [--files 600] [--workers 4] [--changed 20] [--queries 200]
+    python benchmarks/symbol_index.py --root PATH --name ToolChest --method ToolChest.call_tools --pattern tool --module os
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from ts_tool.core.symbol_index import SymbolIndex
+
+
+PYTHON_TEMPLATE = '''
+from pkg{dep}.module{dep} import Service{dep}
+import os
+
+
+class Service{n}:
+    """Service number {n}."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def run_{n}(self, value):
+        return Service{dep}(value)
+
+    def stop(self):
+        pass
+
+
+def build_service_{n}(name):
+    return Service{n}(name)
+
+
+LIMIT_{n} = {n}
+'''
+
+JAVASCRIPT_TEMPLATE = '''
+import {{ Widget{dep} }} from './widget{dep}';
+
+class Widget{n} {{
+    render() {{ return new Widget{dep}(); }}
+    update(props) {{ this.props = props; }}
+}}
+
+function createWidget{n}() {{
+    return new Widget{n}();
+}}
+'''
+
+JAVA_TEMPLATE = '''
+package demo.pkg{n};
+
+import java.util.List;
+import demo.pkg{dep}.Handler{dep};
+
+public class Handler{n} {{
+    public void handle(List<String> items) {{}}
+    public Handler{dep} next() {{ return null; }}
+}}
+'''
+
+
+def generate_tree(root: str, count: int) -> None:
+    """Writes count source files, split between Python, JavaScript and Java."""
+    for n in range(count):
+        dep = max(0, n - 1)
+        kind = n % 3
+        if kind == 0:
+            path, code = os.path.join(root, f"pkg{n}", f"module{n}.py"), PYTHON_TEMPLATE.format(n=n, dep=dep)
+        elif kind == 1:
+            path, code = os.path.join(root, "web", f"widget{n}.js"), JAVASCRIPT_TEMPLATE.format(n=n, dep=dep)
+        else:
+            path, code = os.path.join(root, "java", f"pkg{n}", f"Handler{n}.java"), JAVA_TEMPLATE.format(n=n, dep=dep)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(code)
+
+
+def time_update(root: str, index_path: str, max_workers: int) -> Dict[str, float]:
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    index = SymbolIndex(root, index_path)
+    stats = index.update(max_workers=max_workers)
+    return {'files': stats['parsed'], 'seconds': stats['seconds']}
+
+
+def time_queries(run: Callable[[], List], count: int) -> Dict[str, float]:
+    latencies = []
+    results = 0
+    for _ in range(count):
+        start = time.perf_counter()
+        results = len(run())
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    latencies.sort()
+    return {'p50': statistics.median(latencies), 'p95': latencies[int(len(latencies) * 0.95) - 1], 'results': results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=600, help='Number of files to generate')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes for the parallel build')
+    parser.add_argument('--changed', type=int, default=20, help='Files changed before the incremental update')
+    parser.add_argument('--queries', type=int, default=200, help='Runs of each query')
+    parser.add_argument('--root', help='Index an existing source tree instead of a generated one')
+    parser.add_argument('--name', default='Service9', help='Symbol to find the definition of')
+    parser.add_argument('--method', default='Widget7.render', help='Qualified method to find the definition of')
+    parser.add_argument('--pattern', default='widget', help='Text to search symbol names for')
+    parser.add_argument('--glob', default='build_service_1*', help='Glob to search symbol names for')
+    parser.add_argument('--module', default='java.util', help='Module to find the importers of')
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix='symbol_index_bench_')
+    root = args.root or os.path.join(temp_dir, 'src')
+    index_path = os.path.join(temp_dir, 'symbol_index.json')
+    try:
+        if not args.root:
+            generate_tree(root, args.files)
+
+        print(f"Index build of {root}")
+        for label, workers in (('serial', 1), (f'{args.workers} workers', args.workers)):
+            result = time_update(root, index_path, workers)
+            print(f"  {label:<12} {result['files']:>6} files in {result['seconds']:7.2f}s"
+                  f"  {result['files'] / result['seconds']:8.0f} files/s")
+
+        index = SymbolIndex(root, index_path)
+        stats = index.update()
+        print(f"  {'no change':<12} {stats['files']:>6} files in {stats['seconds']:7.3f}s")
+
+        if not args.root:
+            for path in random.Random(1).sample(sorted(index.files), min(args.changed, len(index.files))):
+                with open(os.path.join(root, path), 'a', encoding='utf-8') as f:
+                    f.write('\n// changed\n' if not path.endswith('.py') else '\n# changed\n')
+            stats = index.update()
+            print(f"  {'changed':<12} {stats['parsed']:>6} files in {stats['seconds']:7.3f}s")
+
+        index_stats = index.get_stats()
+        print(f"\nQuery latency over {index_stats['files']} files, {index_stats['symbols']} symbols (microseconds)")
+        queries = {
+            'find_definition': lambda: index.find_definition(args.name),
+            'find_definition method': lambda: index.find_definition(args.method),
+            'search substring': lambda: index.search(args.pattern, limit=50),
+            'search glob': lambda: index.search(args.glob, limit=50),
+            'find_importers': lambda: index.find_importers(args.module, limit=100),
+        }
+        for label, run in queries.items():
+            result = time_queries(run, args.queries)
+            print(f"  {label:<24} p50 {result['p50']:9.1f}  p95 {result['p95']:9.1f}  results {result['results']}")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -50,13 +50,26 @@ def detect_language(code: str, filename: Optional[str] = None) -> Optional[str]:
     """
     return _explorer.detect_language(code, filename)
 
+def get_tree_cache_stats() -> Dict[str, Any]:
+    """Get statistics of the parsed tree cache.
+    
+    Returns:
+        A dictionary with the number of cached sources, hits, misses and incremental parses.
+    """
+    return _explorer.tree_cache.get_stats()
+
+def clear_tree_cache() -> None:
+    """Remove all parsed sources from the tree cache."""
+    _explorer.tree_cache.clear()
+
 
 def get_code_summary(
     code: str,
     language: Optional[str] = None,
     filename: Optional[str] = None,
     format: str = 'dict',
-    template_dir: Optional[str] = None
+    template_dir: Optional[str] = None,
+    source_id: Optional[str] = None
 ) -> str | dict[str, Any] | CodeSummaryResult:
     """Get a high-level summary of code structure.
 
@@ -66,11 +79,12 @@ def get_code_summary(
         filename: Optional filename which may help with language detection.
         format: Output format ('dict', 'json', or 'markdown').
         template_dir: Optional path to a directory containing custom templates.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
 
     Returns:
         Code summary in the specified format.
     """
-    result: CodeSummaryResult = _explorer.get_summary(code, language, filename)
+    result: CodeSummaryResult = _explorer.get_summary(code, language, filename, source_id)
 
     if format == 'dict':
         return result.to_dict()
@@ -89,6 +103,7 @@ def get_code_context(
     format: str = 'dict',
     style: str = "compact",
     template_dir: Optional[str] = None,
+    source_id: Optional[str] = None
 ) -> str | dict[str, Any] | ModuleExtractionResult:
     """
     Render a concise, agent-friendly module overview using external Jinja2 templates.
@@ -101,12 +116,13 @@ def get_code_context(
         style: 'standard' (default) or 'compact' — maps to context_<style>.jinja2 template
         template_dir: Optional path to a directory containing your jinja2 templates.
                       If not provided, defaults to a 'templates' directory alongside this file.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
 
     Returns:
         Markdown string rendered by the selected template.
     """
     # Get a full module parse
-    mod_result: ModuleExtractionResult = _explorer.explore_code(code, language, filename)
+    mod_result: ModuleExtractionResult = _explorer.explore_code(code, language, filename, source_id)
 
     if format == 'dict':
         return mod_result.to_dict()
@@ -123,7 +139,8 @@ def get_public_interface(
     language: Optional[str] = None,
     filename: Optional[str] = None,
     format: str = 'dict',
-    template_dir: Optional[str] = None
+    template_dir: Optional[str] = None,
+    source_id: Optional[str] = None
 ) -> str | dict[str, Any] | PublicInterfaceResult:
     """Extract the public interface from code.
 
@@ -134,11 +151,12 @@ def get_public_interface(
         format: Output format ('dict', 'json', or 'markdown').
         template_dir: Optional path to a directory containing your jinja2 templates.
                       If not provided, defaults to a 'templates' directory alongside this file.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
 
     Returns:
         Public interface in the specified format.
     """
-    result = _explorer.get_public_interface(code, language, filename)
+    result = _explorer.get_public_interface(code, language, filename, source_id)
 
     if format == 'dict':
         return result.to_dict()
@@ -160,7 +178,8 @@ def get_entity(
     language: Optional[str] = None,
     filename: Optional[str] = None,
     format: str = 'dict',
-    template_dir: Optional[str] = None
+    template_dir: Optional[str] = None,
+    source_id: Optional[str] = None
 ) -> Union[Dict[str, Any], str]:
     """Get a specific entity from code.
 
@@ -174,11 +193,12 @@ def get_entity(
         format: Output format ('dict', 'json', or 'markdown').
         template_dir: Optional path to a directory containing your jinja2 templates.
                       If not provided, defaults to a 'templates' directory alongside this file.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
 
     Returns:
         Entity information in the specified format.
     """
-    result = _explorer.get_entity(code, entity_type, entity_name, detail_level, language, filename)
+    result = _explorer.get_entity(code, entity_type, entity_name, detail_level, language, filename, source_id)
 
     if format == 'dict':
         return result.to_dict()
@@ -197,7 +217,8 @@ def explore_code(
     filename: Optional[str] = None,
     format: str = 'dict',
     style: str = 'standard',
-    template_dir: Optional[str] = None
+    template_dir: Optional[str] = None,
+    source_id: Optional[str] = None
 ) -> str | dict[str, Any] | ModuleExtractionResult:
     """Explore code and extract its complete structure.
 
@@ -209,11 +230,12 @@ def explore_code(
         style: For markdown format, the style to use ('standard' or 'compact'). Maps to explore_<style>.jinja2 template
         template_dir: Optional path to a directory containing your jinja2 templates.
                       If not provided, defaults to a 'templates' directory alongside this file.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
 
     Returns:
         Complete module structure in the specified format.
     """
-    result = _explorer.explore_code(code, language, filename)
+    result = _explorer.explore_code(code, language, filename, source_id)
 
     if format == 'dict':
         return result.to_dict()
@@ -229,7 +251,8 @@ def get_source_code(code: str,
                     entity_type: str,
                     entity_name: str,
                     language: Optional[str] = None,
-                    filename: Optional[str] = None) -> Optional[str]:
+                    filename: Optional[str] = None,
+                    source_id: Optional[str] = None) -> Optional[str]:
     """Get the source code for a specific entity.
     
     This is a convenience function to directly get the source code
@@ -241,11 +264,12 @@ def get_source_code(code: str,
         entity_name: The name of the entity to extract.
         language: Optional language name. If not provided, will be detected.
         filename: Optional filename which may help with language detection.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
         
     Returns:
         The source code of the entity, or None if not found.
     """
-    result = _explorer.get_entity(code, entity_type, entity_name, DetailLevel.FULL, language, filename)
+    result = _explorer.get_entity(code, entity_type, entity_name, DetailLevel.FULL, language, filename, source_id)
     
     if result.successful and hasattr(result, 'source_code') and result.source_code:
         return result.source_code
@@ -257,7 +281,8 @@ def get_signature(code: str,
                   entity_type: str,
                   entity_name: str,
                   language: Optional[str] = None,
-                  filename: Optional[str] = None) -> Optional[str]:
+                  filename: Optional[str] = None,
+                  source_id: Optional[str] = None) -> Optional[str]:
     """Get the signature for a specific entity.
     
     This is a convenience function to directly get the signature
@@ -269,11 +294,12 @@ def get_signature(code: str,
         entity_name: The name of the entity to extract.
         language: Optional language name. If not provided, will be detected.
         filename: Optional filename which may help with language detection.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
         
     Returns:
         The signature of the entity, or None if not found.
     """
-    result = _explorer.get_entity(code, entity_type, entity_name, DetailLevel.SIGNATURE, language, filename)
+    result = _explorer.get_entity(code, entity_type, entity_name, DetailLevel.SIGNATURE, language, filename, source_id)
     
     if result.successful and result.entity:
         if hasattr(result.entity, 'signature'):
@@ -286,7 +312,8 @@ def get_documentation(code: str,
                       entity_type: str,
                       entity_name: str,
                       language: Optional[str] = None,
-                      filename: Optional[str] = None) -> Optional[str]:
+                      filename: Optional[str] = None,
+                      source_id: Optional[str] = None) -> Optional[str]:
     """Get the documentation for a specific entity.
     
     This is a convenience function to directly get the documentation
@@ -298,16 +325,17 @@ def get_documentation(code: str,
         entity_name: The name of the entity to extract (use '' for module).
         language: Optional language name. If not provided, will be detected.
         filename: Optional filename which may help with language detection.
+        source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
         
     Returns:
         The documentation of the entity, or None if not found or not documented.
     """
     if entity_type == 'module':
-        result = _explorer.explore_code(code, language, filename)
+        result = _explorer.explore_code(code, language, filename, source_id)
         if result.successful and result.module and result.module.docstring:
             return result.module.docstring
     else:
-        result = _explorer.get_entity(code, entity_type, entity_name, DetailLevel.SUMMARY, language, filename)
+        result = _explorer.get_entity(code, entity_type, entity_name, DetailLevel.SUMMARY, language, filename, source_id)
         if result.successful and result.entity and result.entity.docstring:
             return result.entity.docstring
     
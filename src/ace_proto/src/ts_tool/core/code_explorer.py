@@ -5,9 +5,11 @@ point for AI agents to explore and extract information from code.
 """
 
 from typing import Dict, List, Optional, Any, Union, Type
+import dataclasses
 import os
 
 from ts_tool.core.parser_manager import ParserManager
+from ts_tool.core.tree_cache import ParsedSource, TreeCache
 from ts_tool.languages.base import BaseLanguage
 from ts_tool.languages import get_language_implementation, get_supported_languages
 from ts_tool.models.code_entity import (
@@ -35,12 +37,22 @@ class CodeExplorer:
     
     This class provides a high-level interface for AI agents to explore
     and extract information from code across multiple programming languages.
+    
+    Parsed sources are kept in a TreeCache, so requests for the same code
+    share one parse and its extracted structure. Passing a source_id (such
+    as the file path) lets a changed version of the source be reparsed
+    incrementally from the previous tree.
     """
     
-    def __init__(self):
-        """Initialize the code explorer."""
+    def __init__(self, tree_cache_size: int = 128):
+        """Initialize the code explorer.
+        
+        Args:
+            tree_cache_size: Maximum number of parsed sources to cache, 0 disables caching.
+        """
         self.parser_manager = ParserManager()
         self._language_instances: Dict[str, BaseLanguage] = {}
+        self.tree_cache = TreeCache(tree_cache_size)
     
     def _get_language_impl(self, language_name: str) -> BaseLanguage:
         """Get a language implementation instance.
@@ -97,7 +109,8 @@ class CodeExplorer:
         """
         return get_supported_languages()
     
-    def explore_code(self, code: str, language: Optional[str] = None, filename: Optional[str] = None) -> ModuleExtractionResult:
+    def explore_code(self, code: str, language: Optional[str] = None, filename: Optional[str] = None,
+                     source_id: Optional[str] = None) -> ModuleExtractionResult:
         """Explore code and extract its structure.
         
         This method parses the given code and extracts its complete structure,
@@ -107,105 +120,152 @@ class CodeExplorer:
             code: The source code to explore.
             language: Optional language name. If not provided, will be detected.
             filename: Optional filename which may help with language detection.
+            source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
             
         Returns:
-            A ModuleExtractionResult containing the extracted structure.
+            A ModuleExtractionResult containing the extracted structure. It is
+            shared with other requests for the same code and must not be modified.
         """
-        try:
-            # Detect language if not provided
-            if not language:
-                language = self.detect_language(code, filename)
-                if not language:
-                    return ModuleExtractionResult(
-                        successful=False,
-                        error_message="Could not detect language. Please specify the language explicitly."
-                    )
-            
-            # Get language implementation
-            language_impl = self._get_language_impl(language)
+        parsed = self._parse_source(code, language, filename, source_id)
+        if parsed is None:
+            return ModuleExtractionResult(
+                successful=False,
+                error_message="Could not detect language. Please specify the language explicitly."
+            )
+        
+        return parsed.module_result
+    
+    def _parse_source(self, code: str, language: Optional[str], filename: Optional[str],
+                      source_id: Optional[str]) -> Optional[ParsedSource]:
+        """Parse code and extract its structure, using the tree cache.
+        
+        Args:
+            code: The source code to parse.
+            language: Optional language name. If not provided, will be detected.
+            filename: Optional filename which may help with language detection.
+            source_id: Optional id of the source, defaults to the filename.
             
-            # Parse the code
+        Returns:
+            The parsed source, or None if the language could not be detected.
+        """
+        # Detect language if not provided
+        if not language:
+            language = self.detect_language(code, filename)
+            if not language:
+                return None
+        
+        key = self.tree_cache.make_key(language, code, filename)
+        parsed = self.tree_cache.get(key)
+        if parsed is not None:
+            return parsed
+        
+        # Get language implementation
+        language_impl = self._get_language_impl(language)
+        
+        # Parse the code, reusing the tree of the previous version of the source if there is one
+        source_id = source_id or filename
+        previous = self.tree_cache.get_latest(language, source_id)
+        if previous is not None:
+            tree = language_impl.reparse(code, previous.tree, previous.code)
+            self.tree_cache.incremental_parses += 1
+        else:
             tree = language_impl.parse(code)
+        
+        parsed = ParsedSource(language, code, tree, self._extract_module(language_impl, tree, code, language, filename))
+        self.tree_cache.put(key, parsed, source_id)
+        return parsed
+    
+    def _extract_module(self, language_impl: BaseLanguage, tree: Any, code: str, language: str,
+                        filename: Optional[str]) -> ModuleExtractionResult:
+        """Extract the module structure from a parsed syntax tree.
+        
+        Args:
+            language_impl: The language implementation the tree was parsed with.
+            tree: The parsed syntax tree.
+            code: The source code.
+            language: The language name.
+            filename: Optional filename of the source.
             
-            # Extract public interface
-            interface = language_impl.get_public_interface(tree, code)
-            
-            # Build module entity
-            module = ModuleEntity(
-                language=language,
-                filename=filename,
-                docstring=language_impl.get_module_docstring(tree, code),
-                imports=language_impl.get_imports(tree, code)
-            )
-            
-            # Add classes (including interfaces, structs, enums for C#/Java)
-            all_classes = []
-            all_classes.extend(interface.get('classes', []))
-            all_classes.extend(interface.get('interfaces', []))
-            all_classes.extend(interface.get('structs', []))
-            all_classes.extend(interface.get('enums', []))
-
-            for class_info in all_classes:
-                class_entity = ClassEntity(
-                    name=class_info['name'],
-                    line_range=class_info['line_range'],
-                    byte_range=class_info['byte_range'],
-                    docstring=class_info.get('docstring'),
-                    language=language
-                )
+        Returns:
+            A ModuleExtractionResult containing the extracted structure.
+        """
+        # Extract public interface
+        interface = language_impl.get_public_interface(tree, code)
+        
+        # Build module entity
+        module = ModuleEntity(
+            language=language,
+            filename=filename,
+            docstring=language_impl.get_module_docstring(tree, code),
+            imports=language_impl.get_imports(tree, code)
+        )
+        
+        # Add classes (including interfaces, structs, enums for C#/Java)
+        all_classes = []
+        all_classes.extend(interface.get('classes', []))
+        all_classes.extend(interface.get('interfaces', []))
+        all_classes.extend(interface.get('structs', []))
+        all_classes.extend(interface.get('enums', []))
 
-                # Add methods to class (if present - enums may not have methods)
-                for method_info in class_info.get('methods', []):
-                    method_entity = MethodEntity(
-                        name=method_info['name'],
-                        line_range=method_info['line_range'],
-                        byte_range=method_info['byte_range'],
-                        docstring=method_info.get('docstring'),
-                        language=language,
-                        signature=method_info['signature'],
-                        class_name=class_info['name'],
-                        return_type=method_info['return_type']
-                    )
-                    class_entity.methods.append(method_entity)
+        for class_info in all_classes:
+            class_entity = ClassEntity(
+                name=class_info['name'],
+                line_range=class_info['line_range'],
+                byte_range=class_info['byte_range'],
+                docstring=class_info.get('docstring'),
+                language=language
+            )
 
-                module.classes.append(class_entity)
-            
-            # Add functions
-            for func_info in interface['functions']:
-                func_entity = FunctionEntity(
-                    name=func_info['name'],
-                    line_range=func_info['line_range'],
-                    byte_range=func_info['byte_range'],
-                    docstring=func_info.get('docstring'),
+            # Add methods to class (if present - enums may not have methods)
+            for method_info in class_info.get('methods', []):
+                method_entity = MethodEntity(
+                    name=method_info['name'],
+                    line_range=method_info['line_range'],
+                    byte_range=method_info['byte_range'],
+                    docstring=method_info.get('docstring'),
                     language=language,
-                    signature=func_info['signature'],
-                    return_type=func_info['return_type']
+                    signature=method_info['signature'],
+                    class_name=class_info['name'],
+                    return_type=method_info['return_type']
                 )
-                module.functions.append(func_entity)
-            
-            # Add variables
-            for var_info in interface['variables']:
-                var_entity = VariableEntity(
-                    name=var_info['name'],
-                    line_range=var_info['line_range'],
-                    byte_range=var_info['byte_range'],
-                    language=language,
-                    value=var_info.get('value'),
-                    type_hint=var_info.get('type_hint')
-                )
-                module.variables.append(var_entity)
-            
-            return ModuleExtractionResult(
-                successful=True,
+                class_entity.methods.append(method_entity)
+
+            module.classes.append(class_entity)
+        
+        # Add functions
+        for func_info in interface['functions']:
+            func_entity = FunctionEntity(
+                name=func_info['name'],
+                line_range=func_info['line_range'],
+                byte_range=func_info['byte_range'],
+                docstring=func_info.get('docstring'),
                 language=language,
-                module=module,
-                source_code=code
+                signature=func_info['signature'],
+                return_type=func_info['return_type']
             )
-            
-        except Exception as e:
-            raise e
+            module.functions.append(func_entity)
+        
+        # Add variables
+        for var_info in interface['variables']:
+            var_entity = VariableEntity(
+                name=var_info['name'],
+                line_range=var_info['line_range'],
+                byte_range=var_info['byte_range'],
+                language=language,
+                value=var_info.get('value'),
+                type_hint=var_info.get('type_hint')
+            )
+            module.variables.append(var_entity)
+        
+        return ModuleExtractionResult(
+            successful=True,
+            language=language,
+            module=module,
+            source_code=code
+        )
     
-    def get_public_interface(self, code: str, language: Optional[str] = None, filename: Optional[str] = None) -> PublicInterfaceResult:
+    def get_public_interface(self, code: str, language: Optional[str] = None, filename: Optional[str] = None,
+                             source_id: Optional[str] = None) -> PublicInterfaceResult:
         """Extract the public interface from code.
         
         This method extracts only the public elements of the code, such as
@@ -215,13 +275,14 @@ class CodeExplorer:
             code: The source code to analyze.
             language: Optional language name. If not provided, will be detected.
             filename: Optional filename which may help with language detection.
+            source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
             
         Returns:
             A PublicInterfaceResult containing the public interface.
         """
         try:
             # Use explore_code to get the full module structure
-            module_result = self.explore_code(code, language, filename)
+            module_result = self.explore_code(code, language, filename, source_id)
             
             if not module_result.successful:
                 return PublicInterfaceResult(
@@ -266,8 +327,8 @@ class CodeExplorer:
                     # For PL/SQL, all package-level variables are public
                     # For other languages, assume all-caps variables are constants
                     if language == 'plsql' or var.name.isupper():
-                        var.is_constant = True
-                        result.public_constants.append(var)
+                        # Copied as the module is shared through the tree cache
+                        result.public_constants.append(dataclasses.replace(var, is_constant=True))
             
             return result
             
@@ -280,7 +341,8 @@ class CodeExplorer:
     
     def get_entity(self, code: str, entity_type: str, entity_name: str, 
                   detail_level: Union[str, DetailLevel] = DetailLevel.FULL,
-                  language: Optional[str] = None, filename: Optional[str] = None) -> EntityExtractionResult:
+                  language: Optional[str] = None, filename: Optional[str] = None,
+                  source_id: Optional[str] = None) -> EntityExtractionResult:
         """Get a specific entity from code.
         
         This method extracts a specific named entity from the code, such as
@@ -293,6 +355,7 @@ class CodeExplorer:
             detail_level: The level of detail to include (summary, signature, full).
             language: Optional language name. If not provided, will be detected.
             filename: Optional filename which may help with language detection.
+            source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
             
         Returns:
             An EntityExtractionResult containing the extracted entity.
@@ -302,20 +365,22 @@ class CodeExplorer:
             if isinstance(detail_level, str):
                 detail_level = DetailLevel.from_string(detail_level)
             
-            # Use explore_code to get the full module structure
-            module_result = self.explore_code(code, language, filename)
+            # Get the parsed source with its full module structure
+            parsed = self._parse_source(code, language, filename, source_id)
             
-            if not module_result.successful:
+            if parsed is None:
                 return EntityExtractionResult(
                     successful=False,
-                    error_message=module_result.error_message,
-                    language=module_result.language,
+                    error_message="Could not detect language. Please specify the language explicitly.",
+                    language="",
                     entity_type=entity_type,
                     entity_name=entity_name
                 )
             
-            # Get the entity from the module
-            entity = module_result.module.get_entity(entity_type, entity_name)
+            module_result = parsed.module_result
+            
+            # Get the entity from the parsed source's entity index
+            entity = parsed.get_entity(entity_type, entity_name)
             
             if not entity:
                 return EntityExtractionResult(
@@ -351,7 +416,8 @@ class CodeExplorer:
                 entity_name=entity_name
             )
     
-    def get_summary(self, code: str, language: Optional[str] = None, filename: Optional[str] = None) -> CodeSummaryResult:
+    def get_summary(self, code: str, language: Optional[str] = None, filename: Optional[str] = None,
+                    source_id: Optional[str] = None) -> CodeSummaryResult:
         """Get a high-level summary of code structure.
         
         This method provides a quick overview of the code structure,
@@ -361,13 +427,14 @@ class CodeExplorer:
             code: The source code to analyze.
             language: Optional language name. If not provided, will be detected.
             filename: Optional filename which may help with language detection.
+            source_id: Optional id of the source, such as its path, to reparse changed versions incrementally.
             
         Returns:
             A CodeSummaryResult containing the summary information.
         """
         try:
             # Use explore_code to get the full module structure
-            module_result = self.explore_code(code, language, filename)
+            module_result = self.explore_code(code, language, filename, source_id)
             
             if not module_result.successful:
                 return CodeSummaryResult(
@@ -0,0 +1,420 @@
+"""Persistent index of the symbols defined in a source tree.
+
+This module provides the SymbolIndex class, which uses CodeExplorer to
+extract the classes, methods, functions, variables and imports of every
+supported source file under a root directory. The index is stored on disk
+and updated incrementally: only files whose mtime or size changed are read
+again, and only files whose content hash changed are parsed again. Files
+are parsed in parallel across processes.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ts_tool.core.code_explorer import CodeExplorer
+from ts_tool.core.parser_manager import ParserManager
+from ts_tool.languages import get_supported_languages
+
+
+# Directories that hold dependencies, build output or tool state rather than source
+EXCLUDED_DIRS = {
+    'node_modules', '__pycache__', 'venv', 'site-packages', 'dist', 'build', 'bin', 'obj', 'target'
+}
+
+# Explorer used by _index_files, one per worker process
+_worker_explorer: Optional[CodeExplorer] = None
+
+
+def _index_files(root: str, files: List[Tuple[str, Optional[str]]]) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """Index a batch of files.
+
+    This runs in worker processes, so it is a module level function.
+
+    Args:
+        root: The root directory of the index.
+        files: (relative path, hash of the indexed content or None) pairs.
+
+    Returns:
+        (relative path, entry, error) tuples. The entry has no symbols when
+        the content hash matches the indexed one, and is None on error.
+    """
+    global _worker_explorer
+    if _worker_explorer is None:
+        _worker_explorer = CodeExplorer(tree_cache_size=0)
+
+    results = []
+    for rel_path, indexed_hash in files:
+        try:
+            results.append((rel_path, _index_file(_worker_explorer, root, rel_path, indexed_hash), None))
+        except Exception as e:
+            results.append((rel_path, None, str(e)))
+    return results
+
+
+def _index_file(explorer: CodeExplorer, root: str, rel_path: str, indexed_hash: Optional[str]) -> Dict[str, Any]:
+    """Extract the symbols and imports of a file.
+
+    Args:
+        explorer: The CodeExplorer to parse with.
+        root: The root directory of the index.
+        rel_path: Path of the file relative to the root.
+        indexed_hash: Hash of the indexed content of the file, if any.
+
+    Returns:
+        The index entry of the file.
+    """
+    full_path = os.path.join(root, rel_path)
+    stat = os.stat(full_path)
+    with open(full_path, 'rb') as f:
+        data = f.read()
+
+    entry: Dict[str, Any] = {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'hash': hashlib.sha1(data).hexdigest()
+    }
+    if entry['hash'] == indexed_hash:
+        # Touched but not changed, the indexed symbols are still valid
+        return entry
+
+    code = data.decode('utf-8', errors='replace')
+    language = explorer.detect_language(code, rel_path)
+    result = explorer.explore_code(code, language, os.path.basename(rel_path))
+    if not result.successful:
+        raise ValueError(result.error_message)
+
+    module = result.module
+    symbols = []
+
+    def add(entity: Any, kind: str, container: Optional[str] = None) -> None:
+        (start_line, _), (end_line, _) = entity.line_range
+        symbols.append({
+            'name': entity.name,
+            'kind': kind,
+            'container': container,
+            'line': start_line + 1,
+            'end_line': end_line + 1,
+            'signature': getattr(entity, 'signature', None)
+        })
+
+    for cls in module.classes:
+        add(cls, 'class')
+        for method in cls.methods:
+            add(method, 'method', cls.name)
+    for func in module.functions:
+        add(func, 'function')
+    for var in module.variables:
+        add(var, 'variable')
+
+    entry['language'] = result.language
+    entry['symbols'] = symbols
+    entry['imports'] = list(module.imports)
+    return entry
+
+
+class SymbolIndex:
+    """Index of the symbols defined in the source files under a directory.
+
+    The index answers where a symbol is defined, which symbols match a
+    pattern and which files import a module, across all supported languages.
+    Call update() to bring it up to date with the files on disk, queries
+    only see what the last update found.
+    """
+
+    INDEX_VERSION = 1
+
+    # Files parsed per task sent to a worker process
+    BATCH_SIZE = 32
+
+    # Below this many files to parse, parsing in this process is faster than starting workers
+    PARALLEL_THRESHOLD = 64
+
+    def __init__(self, root: str, index_path: Optional[str] = None):
+        """Initialize the index, loading it from disk if it exists.
+
+        Args:
+            root: The root directory of the source files.
+            index_path: Path of the index file, None to keep the index in memory only.
+        """
+        self.root = os.path.abspath(root)
+        self.index_path = index_path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.updated_at: Optional[float] = None
+        self.last_update: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._by_name: Optional[Dict[str, List[Tuple[str, Dict[str, Any]]]]] = None
+
+        supported = set(get_supported_languages())
+        self.extensions = {ext for ext, language in ParserManager.EXTENSION_MAP.items() if language in supported}
+
+        self._load()
+
+    def update(self, executor: Optional[Executor] = None, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Bring the index up to date with the files on disk and save it.
+
+        Args:
+            executor: Optional process pool to parse files with. If not given,
+                a pool is created for the update when there are enough files to parse.
+            max_workers: Maximum number of worker processes for a pool created
+                by the update, 1 parses in this process.
+
+        Returns:
+            Statistics of the update.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            seen = set()
+            pending: List[Tuple[str, Optional[str]]] = []
+            for rel_path, stat in self._iter_source_files():
+                seen.add(rel_path)
+                entry = self.files.get(rel_path)
+                if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                    continue
+                pending.append((rel_path, entry['hash'] if entry else None))
+
+            removed = [rel_path for rel_path in self.files if rel_path not in seen]
+            for rel_path in removed:
+                del self.files[rel_path]
+
+            parsed = 0
+            errors = {}
+            for rel_path, entry, error in self._index_pending(pending, executor, max_workers):
+                if entry is None:
+                    # Leave unreadable files out of the index, they're tried again next update
+                    self.files.pop(rel_path, None)
+                    errors[rel_path] = error
+                elif 'symbols' in entry:
+                    self.files[rel_path] = entry
+                    parsed += 1
+                else:
+                    self.files[rel_path].update(entry)
+
+            self._by_name = None
+            self.updated_at = time.time()
+            self.last_update = {
+                'files': len(self.files),
+                'checked': len(pending),
+                'parsed': parsed,
+                'removed': len(removed),
+                'errors': errors,
+                'seconds': time.perf_counter() - start
+            }
+            if pending or removed:
+                self._save()
+
+            return self.last_update
+
+    def find_definition(self, name: str, kind: Optional[str] = None, path_prefix: str = '') -> List[Dict[str, Any]]:
+        """Find where a symbol is defined.
+
+        Args:
+            name: The symbol name, methods may be qualified as ClassName.method_name.
+            kind: Optional kind of symbol ('class', 'method', 'function', 'variable').
+            path_prefix: Optional relative path prefix, such as 'src/', of the files to search.
+
+        Returns:
+            The matching symbols with the path of their file, exact case matches first.
+        """
+        with self._lock:
+            matches = [self._result(rel_path, symbol) for rel_path, symbol in self._names().get(name.lower(), [])
+                       if (kind is None or symbol['kind'] == kind) and rel_path.startswith(path_prefix)]
+
+        matches.sort(key=lambda match: (name not in (match['name'], match['qualified_name']), match['path'], match['line']))
+        return matches
+
+    def search(self, pattern: str, kind: Optional[str] = None, limit: int = 50, path_prefix: str = '') -> List[Dict[str, Any]]:
+        """Find the symbols with names matching a pattern.
+
+        Args:
+            pattern: A glob pattern such as 'get_*' or 'Calculator.*', or text that names must contain. Case insensitive.
+            kind: Optional kind of symbol ('class', 'method', 'function', 'variable').
+            limit: Maximum number of symbols to return.
+            path_prefix: Optional relative path prefix, such as 'src/', of the files to search.
+
+        Returns:
+            The matching symbols, exact matches first, then names starting with the pattern.
+        """
+        needle = pattern.lower()
+        if any(char in needle for char in '*?['):
+            regex = re.compile(fnmatch.translate(needle))
+            matches_name = lambda key: regex.match(key) is not None
+        else:
+            matches_name = lambda key: needle in key
+
+        with self._lock:
+            found = []
+            qualified = '.' in needle
+            for key, symbols in self._names().items():
+                # Qualified method names are only searched by patterns with a dot, such as 'Calculator.*'
+                if ('.' in key and not qualified) or not matches_name(key):
+                    continue
+                rank = 0 if key == needle else 1 if key.startswith(needle) else 2
+                for rel_path, symbol in symbols:
+                    if (kind is None or symbol['kind'] == kind) and rel_path.startswith(path_prefix):
+                        found.append((rank, key, rel_path, symbol))
+
+        found.sort(key=lambda item: (item[0], item[1], item[2], item[3]['line']))
+        results = []
+        seen = set()
+        for _, _, rel_path, symbol in found:
+            # Methods are keyed on both their name and qualified name
+            if id(symbol) in seen:
+                continue
+            seen.add(id(symbol))
+            results.append(self._result(rel_path, symbol))
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def find_importers(self, module: str, limit: int = 100, path_prefix: str = '') -> List[Dict[str, Any]]:
+        """Find the files that import a module or name.
+
+        Args:
+            module: A module, package or imported name, such as 'os.path' or 'List'.
+            limit: Maximum number of import statements to return.
+            path_prefix: Optional relative path prefix, such as 'src/', of the files to search.
+
+        Returns:
+            The import statements mentioning the module with the path of their file.
+        """
+        regex = re.compile(r'(?<![\w$])' + re.escape(module) + r'(?![\w$])')
+        results = []
+        with self._lock:
+            for rel_path in sorted(self.files):
+                if not rel_path.startswith(path_prefix):
+                    continue
+                entry = self.files[rel_path]
+                for statement in entry.get('imports', []):
+                    if regex.search(statement):
+                        results.append({'path': rel_path, 'language': entry.get('language'), 'import': statement})
+                        if len(results) >= limit:
+                            return results
+
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics of the index.
+
+        Returns:
+            A dictionary with the number of files and symbols per language and the last update.
+        """
+        with self._lock:
+            languages: Dict[str, Dict[str, int]] = {}
+            for entry in self.files.values():
+                counts = languages.setdefault(entry.get('language') or 'unknown', {'files': 0, 'symbols': 0})
+                counts['files'] += 1
+                counts['symbols'] += len(entry.get('symbols', []))
+
+            return {
+                'root': self.root,
+                'files': len(self.files),
+                'symbols': sum(counts['symbols'] for counts in languages.values()),
+                'languages': languages,
+                'updated_at': self.updated_at,
+                'last_update': self.last_update
+            }
+
+    def _iter_source_files(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield the relative path and stat of each supported source file under the root."""
+        for dir_path, dir_names, file_names in os.walk(self.root):
+            dir_names[:] = [name for name in dir_names if not name.startswith('.') and name not in EXCLUDED_DIRS]
+            for file_name in file_names:
+                if ParserManager._get_file_extension(file_name) not in self.extensions:
+                    continue
+
+                full_path = os.path.join(dir_path, file_name)
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue
+                yield os.path.relpath(full_path, self.root).replace(os.sep, '/'), stat
+
+    def _index_pending(self, pending: List[Tuple[str, Optional[str]]], executor: Optional[Executor],
+                       max_workers: Optional[int]) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+        """Index the pending files, in worker processes when there are enough of them."""
+        if not pending:
+            return []
+
+        if max_workers == 1 or len(pending) < self.PARALLEL_THRESHOLD:
+            return _index_files(self.root, pending)
+
+        batches = [pending[i:i + self.BATCH_SIZE] for i in range(0, len(pending), self.BATCH_SIZE)]
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+
+        try:
+            futures = [executor.submit(_index_files, self.root, batch) for batch in batches]
+            return [result for future in futures for result in future.result()]
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+    def _names(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Get the lowercase name to symbols map, rebuilt after updates."""
+        if self._by_name is None:
+            by_name: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+            for rel_path, entry in self.files.items():
+                for symbol in entry.get('symbols', []):
+                    by_name.setdefault(symbol['name'].lower(), []).append((rel_path, symbol))
+                    if symbol['container']:
+                        qualified = f"{symbol['container']}.{symbol['name']}".lower()
+                        by_name.setdefault(qualified, []).append((rel_path, symbol))
+            self._by_name = by_name
+        return self._by_name
+
+    def _result(self, rel_path: str, symbol: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a query result for a symbol."""
+        result = dict(symbol)
+        result['qualified_name'] = f"{symbol['container']}.{symbol['name']}" if symbol['container'] else symbol['name']
+        result['path'] = rel_path
+        result['language'] = self.files[rel_path].get('language')
+        return result
+
+    def _load(self) -> None:
+        """Load the index from disk, starting empty if it's missing or from another version or root."""
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') != self.INDEX_VERSION or data.get('root') != self.root:
+            return
+
+        self.files = data.get('files', {})
+        self.updated_at = data.get('updated_at')
+
+    def _save(self) -> None:
+        """Write the index to disk, replacing the previous file in one step."""
+        if not self.index_path:
+            return
+
+        index_dir = os.path.dirname(self.index_path) or '.'
+        os.makedirs(index_dir, exist_ok=True)
+        # A unique temp file per save, indexes of the same root in one process must not share it
+        fd, temp_path = tempfile.mkstemp(dir=index_dir, prefix=os.path.basename(self.index_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': self.INDEX_VERSION,
+                    'root': self.root,
+                    'updated_at': self.updated_at,
+                    'files': self.files
+                }, f)
+            os.replace(temp_path, self.index_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,195 @@
+"""Cache of parsed syntax trees for the code explorer.
+
+This module provides the TreeCache used by CodeExplorer to avoid parsing
+the same source again for every request. Parses are keyed by a hash of the
+source content, and the latest parse of each source is remembered so a
+changed file can be reparsed incrementally from its previous tree.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ts_tool.models.code_entity import ModuleEntity
+from ts_tool.models.extraction_result import ModuleExtractionResult
+
+
+class ParsedSource:
+    """A parsed source along with the module structure extracted from it.
+
+    The module result is shared by every request for the same source, so
+    callers must not modify it.
+    """
+
+    def __init__(self, language: str, code: str, tree: Any, module_result: ModuleExtractionResult):
+        """Initialize the parsed source.
+
+        Args:
+            language: The language the source was parsed as.
+            code: The source code.
+            tree: The parsed syntax tree.
+            module_result: The module structure extracted from the tree.
+        """
+        self.language = language
+        self.code = code
+        self.tree = tree
+        self.module_result = module_result
+        self._entities: Optional[Dict[Tuple[str, str], Any]] = None
+
+    def get_entity(self, entity_type: str, entity_name: str) -> Optional[Any]:
+        """Get an entity by type and name.
+
+        The entities are indexed on the first lookup, later lookups are a
+        dictionary access. Matches ModuleEntity.get_entity, where the first
+        entity with a name wins.
+
+        Args:
+            entity_type: The type of entity ('class', 'function', 'method', 'variable').
+            entity_name: The name of the entity, qualified as ClassName.method_name for methods.
+
+        Returns:
+            The entity, or None if not found.
+        """
+        if self._entities is None:
+            self._entities = self._index_entities(self.module_result.module)
+        return self._entities.get((entity_type, entity_name))
+
+    @staticmethod
+    def _index_entities(module: ModuleEntity) -> Dict[Tuple[str, str], Any]:
+        """Build the (entity type, name) index of a module's entities."""
+        entities: Dict[Tuple[str, str], Any] = {}
+
+        for cls in module.classes:
+            entities.setdefault(('class', cls.name), cls)
+
+        for cls in module.classes:
+            # Methods are looked up through the first class of a name, and qualified names split on the first dot
+            if entities[('class', cls.name)] is not cls or '.' in cls.name:
+                continue
+            for method in cls.methods:
+                entities.setdefault(('method', f"{cls.name}.{method.name}"), method)
+
+        for func in module.functions:
+            entities.setdefault(('function', func.name), func)
+
+        for var in module.variables:
+            entities.setdefault(('variable', var.name), var)
+
+        return entities
+
+
+class TreeCache:
+    """LRU cache of parsed sources.
+
+    Sources are keyed by language, filename and a hash of their content, so
+    a changed source is never served from a stale parse. Sources parsed with
+    a source id, usually the path of the file they were read from, are also
+    remembered as the latest version of that source so the next version can
+    be reparsed incrementally.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """Initialize the tree cache.
+
+        Args:
+            max_entries: Maximum number of parsed sources to keep, 0 disables caching.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Optional[str], str], ParsedSource]" = OrderedDict()
+        self._latest: Dict[Tuple[str, str], ParsedSource] = {}
+        self.hits = 0
+        self.misses = 0
+        self.incremental_parses = 0
+
+    @staticmethod
+    def make_key(language: str, code: str, filename: Optional[str] = None) -> Tuple[str, Optional[str], str]:
+        """Make the cache key of a source.
+
+        Args:
+            language: The language of the source.
+            code: The source code.
+            filename: The filename given with the source.
+
+        Returns:
+            The cache key.
+        """
+        return language, filename, hashlib.sha1(code.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def get(self, key: Tuple[str, Optional[str], str]) -> Optional[ParsedSource]:
+        """Get a parsed source by key.
+
+        Args:
+            key: The cache key from make_key.
+
+        Returns:
+            The parsed source, or None if it isn't cached.
+        """
+        parsed = self._entries.get(key)
+        if parsed is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return parsed
+
+    def get_latest(self, language: str, source_id: Optional[str]) -> Optional[ParsedSource]:
+        """Get the latest parsed version of a source.
+
+        Args:
+            language: The language of the source.
+            source_id: The id the source was parsed with.
+
+        Returns:
+            The latest parsed version, or None if the source hasn't been parsed.
+        """
+        if not source_id:
+            return None
+        return self._latest.get((language, source_id))
+
+    def put(self, key: Tuple[str, Optional[str], str], parsed: ParsedSource, source_id: Optional[str] = None) -> None:
+        """Cache a parsed source.
+
+        Args:
+            key: The cache key from make_key.
+            parsed: The parsed source.
+            source_id: Optional id of the source, remembered as its latest version.
+        """
+        if self.max_entries <= 0:
+            return
+
+        if source_id:
+            self._latest[(parsed.language, source_id)] = parsed
+
+        self._entries[key] = parsed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._forget_latest(evicted)
+
+    def clear(self) -> None:
+        """Remove all parsed sources from the cache."""
+        self._entries.clear()
+        self._latest.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            A dictionary with the number of cached sources, hits, misses and incremental parses.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'incremental_parses': self.incremental_parses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def _forget_latest(self, parsed: ParsedSource) -> None:
+        """Stop remembering an evicted source as the latest version of its source id."""
+        for latest_key, latest in list(self._latest.items()):
+            if latest is parsed:
+                del self._latest[latest_key]
@@ -54,6 +54,24 @@ class QueryWrapper:
         return getattr(self._query, name)
 
 
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    """Length of the common prefix of two byte strings, found by bisecting with slice comparisons."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _byte_point(data: bytes, offset: int) -> Tuple[int, int]:
+    """The (row, byte column) point of a byte offset, as tree-sitter expects for edits."""
+    row = data.count(b'\n', 0, offset)
+    return row, offset - (data.rfind(b'\n', 0, offset) + 1)
+
+
 class BaseLanguage(ABC):
     """Base class for language-specific functionality.
     
@@ -89,6 +107,41 @@ class BaseLanguage(ABC):
         """
         pass
     
+    def reparse(self, code: str, old_tree: Tree, old_code: str) -> Tree:
+        """Parse code that changed from a previously parsed version.
+        
+        The change is described to tree-sitter as a single edit spanning
+        everything between the common prefix and suffix of the two versions,
+        so the parts of the old tree outside it are reused. The old tree is
+        copied before being edited and stays valid for old_code.
+        
+        Args:
+            code: The new source code.
+            old_tree: The syntax tree parsed from old_code.
+            old_code: The previous source code.
+            
+        Returns:
+            The parsed syntax tree.
+        """
+        new_bytes = bytes(code, 'utf8')
+        old_bytes = bytes(old_code, 'utf8')
+        
+        start = _common_prefix_length(old_bytes, new_bytes)
+        suffix = _common_prefix_length(old_bytes[start:][::-1], new_bytes[start:][::-1])
+        old_end = len(old_bytes) - suffix
+        new_end = len(new_bytes) - suffix
+        
+        tree = old_tree.copy()
+        tree.edit(
+            start_byte=start,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=_byte_point(old_bytes, start),
+            old_end_point=_byte_point(old_bytes, old_end),
+            new_end_point=_byte_point(new_bytes, new_end)
+        )
+        return self.parser.parse(new_bytes, tree)
+    
     @abstractmethod
     def get_entity_names(self, tree: Tree) -> Dict[str, List[str]]:
         """Get all named entities from the syntax tree.
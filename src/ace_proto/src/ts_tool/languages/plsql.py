@@ -52,6 +52,21 @@ class PlsqlLanguage(BaseLanguage):
         """
         return self.parser.parse(code.encode("utf-8"))
 
+    def reparse(self, code: str, old_tree: Tree, old_code: str) -> Tree:
+        """Parse changed PL/SQL code.
+
+        The mock tree has nothing to reuse, so this is a full parse.
+
+        Args:
+            code: PL/SQL source code to parse
+            old_tree: Previously parsed mock tree (unused)
+            old_code: Previous source code (unused)
+
+        Returns:
+            MockPlsqlTree containing the code
+        """
+        return self.parse(code)
+
     def get_entity_names(self, tree: Tree) -> Dict[str, List[str]]:
         """Get entity names from code.
 
@@ -0,0 +1,173 @@
+"""Tests for the persistent workspace symbol index.
+
+Tests:
+- Indexing files of several languages
+- Definition, pattern and importer queries
+- Incremental updates by mtime and content hash
+- Loading the index from disk
+- Saving from several indexes of one root at once
+"""
+
+import os
+import threading
+
+import pytest
+from ts_tool.core.symbol_index import SymbolIndex
+
+
+FILES = {
+    'pkg/calculator.py': '''
+from pkg.util import helper
+import os.path
+
+class Calculator:
+    def add(self, a, b):
+        return a + b
+
+def make_calculator():
+    return Calculator()
+''',
+    'pkg/util.py': '''
+def helper():
+    return 1
+''',
+    'web/app.js': '''
+import { helper } from './util';
+
+class AppView {
+    render() { return helper(); }
+}
+
+function startApp() {}
+''',
+    'java/Main.java': '''
+package demo;
+
+import java.util.List;
+
+public class Main {
+    public static void main(String[] args) {}
+}
+''',
+    'node_modules/lib/index.js': 'function ignored() {}',
+    'README.md': '# not source',
+}
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    for rel_path, code in FILES.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(code)
+    return tmp_path
+
+
+def make_index(workspace):
+    return SymbolIndex(str(workspace), str(workspace / 'code_explorer' / 'symbol_index.json'))
+
+
+class TestSymbolIndex:
+    """Tests for building and querying the symbol index."""
+
+    def test_indexes_supported_source_files(self, workspace):
+        """Test every supported source file is indexed and dependency folders are skipped."""
+        index = make_index(workspace)
+        stats = index.update()
+
+        assert stats['parsed'] == 4
+        assert sorted(index.files) == ['java/Main.java', 'pkg/calculator.py', 'pkg/util.py', 'web/app.js']
+        assert set(index.get_stats()['languages']) == {'python', 'javascript', 'java'}
+
+    def test_find_definition(self, workspace):
+        """Test definitions are found by name and by qualified method name."""
+        index = make_index(workspace)
+        index.update()
+
+        classes = index.find_definition('Calculator')
+        methods = index.find_definition('Calculator.add')
+
+        assert [(match['path'], match['kind']) for match in classes] == [('pkg/calculator.py', 'class')]
+        assert methods[0]['kind'] == 'method' and methods[0]['line'] == 6
+        assert index.find_definition('Calculator', kind='function') == []
+        assert index.find_definition('helper', path_prefix='web/') == []
+
+    def test_search_ranks_exact_and_prefix_matches_first(self, workspace):
+        """Test pattern searches support globs and substrings across languages."""
+        index = make_index(workspace)
+        index.update()
+
+        assert [match['qualified_name'] for match in index.search('*app*')] == ['AppView', 'startApp']
+        assert [match['qualified_name'] for match in index.search('calculator.*')] == ['Calculator.add']
+        assert [match['name'] for match in index.search('calculator')] == ['Calculator', 'make_calculator']
+
+    def test_find_importers(self, workspace):
+        """Test importers are found by module and by imported name."""
+        index = make_index(workspace)
+        index.update()
+
+        assert [item['path'] for item in index.find_importers('pkg.util')] == ['pkg/calculator.py']
+        assert [item['path'] for item in index.find_importers('helper')] == ['pkg/calculator.py', 'web/app.js']
+        assert [item['path'] for item in index.find_importers('java.util')] == ['java/Main.java']
+        assert index.find_importers('os') == index.find_importers('os.path')
+
+    def test_only_changed_files_are_parsed_again(self, workspace):
+        """Test updates skip unchanged files and reparse changed, touched and deleted ones as needed."""
+        index = make_index(workspace)
+        index.update()
+
+        (workspace / 'pkg' / 'util.py').write_text('def helper():\n    return 1\n\ndef other():\n    pass\n')
+        touched = workspace / 'web' / 'app.js'
+        os.utime(touched, ns=(1, 1))
+        (workspace / 'java' / 'Main.java').unlink()
+
+        stats = index.update()
+
+        assert (stats['checked'], stats['parsed'], stats['removed']) == (2, 1, 1)
+        assert index.find_definition('other')[0]['path'] == 'pkg/util.py'
+        assert index.files['web/app.js']['mtime_ns'] == 1
+        assert index.update()['checked'] == 0
+
+    def test_index_is_loaded_from_disk(self, workspace):
+        """Test a saved index is loaded and only brought up to date."""
+        make_index(workspace).update()
+
+        index = make_index(workspace)
+
+        assert index.find_definition('Main')[0]['path'] == 'java/Main.java'
+        assert index.update()['parsed'] == 0
+
+    def test_parallel_update_matches_serial_update(self, workspace):
+        """Test files parsed in worker processes give the same index."""
+        serial = SymbolIndex(str(workspace))
+        serial.update(max_workers=1)
+
+        parallel = SymbolIndex(str(workspace))
+        parallel.PARALLEL_THRESHOLD = 0
+        parallel.BATCH_SIZE = 1
+        parallel.update(max_workers=2)
+
+        assert parallel.files == serial.files
+
+    def test_concurrent_saves_of_one_root_do_not_collide(self, workspace):
+        """Test indexes of the same root saving at once each write a whole index and leave no temp files."""
+        make_index(workspace).update()
+        indexes = [make_index(workspace) for _ in range(8)]
+        errors = []
+
+        def save(index):
+            try:
+                for _ in range(20):
+                    index._save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save, args=(index,)) for index in indexes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert os.listdir(workspace / 'code_explorer') == ['symbol_index.json']
+        assert make_index(workspace).find_definition('Main')[0]['path'] == 'java/Main.java'
@@ -0,0 +1,98 @@
+"""Tests for the parsed tree cache of the CodeExplorer.
+
+Tests:
+- Reuse of parses for unchanged code
+- Incremental reparsing of changed sources
+- Entity lookups through the entity index
+- LRU eviction
+"""
+
+from ts_tool.core.code_explorer import CodeExplorer
+
+
+CODE = '''
+class Calculator:
+    """A simple calculator."""
+
+    def add(self, a, b):
+        return a + b
+
+def helper():
+    return 1
+
+MAX_VALUE = 10
+'''
+
+
+class TestTreeCache:
+    """Tests for caching parsed sources."""
+
+    def test_unchanged_code_is_parsed_once(self):
+        """Test requests for the same code share one parse."""
+        explorer = CodeExplorer()
+
+        first = explorer.explore_code(CODE, 'python')
+        explorer.get_entity(CODE, 'function', 'helper', language='python')
+        explorer.get_summary(CODE, 'python')
+
+        assert explorer.explore_code(CODE, 'python') is first
+        stats = explorer.tree_cache.get_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 3
+
+    def test_changed_source_is_reparsed_incrementally(self):
+        """Test a changed version of a source reuses the previous tree."""
+        explorer = CodeExplorer()
+        explorer.explore_code(CODE, 'python', source_id='//ws/calc.py')
+
+        changed = CODE.replace('return a + b', 'return a + b + 0').replace('def helper', 'def other_helper')
+        result = explorer.explore_code(changed, 'python', source_id='//ws/calc.py')
+
+        assert explorer.tree_cache.get_stats()['incremental_parses'] == 1
+        assert [func.name for func in result.module.functions] == ['other_helper']
+        # The entity ranges match a full parse of the changed code
+        full = CodeExplorer(tree_cache_size=0).explore_code(changed, 'python')
+        assert result.to_dict() == full.to_dict()
+
+    def test_previous_version_stays_cached(self):
+        """Test reparsing a changed source leaves the previous parse valid."""
+        explorer = CodeExplorer()
+        original = explorer.explore_code(CODE, 'python', source_id='calc.py')
+        explorer.explore_code(CODE + '\ndef extra():\n    pass\n', 'python', source_id='calc.py')
+
+        again = explorer.explore_code(CODE, 'python', source_id='calc.py')
+
+        assert again is original
+        assert [func.name for func in again.module.functions] == ['helper']
+
+    def test_entity_lookup_uses_the_index(self):
+        """Test entities, including qualified methods, are found through the index."""
+        explorer = CodeExplorer()
+
+        method = explorer.get_entity(CODE, 'method', 'Calculator.add', 'full', 'python')
+        missing = explorer.get_entity(CODE, 'method', 'add', 'full', 'python')
+
+        assert method.successful
+        assert method.source_code.startswith('def add')
+        assert not missing.successful
+
+    def test_public_interface_does_not_modify_the_cached_module(self):
+        """Test marking constants in the public interface leaves the shared module unchanged."""
+        explorer = CodeExplorer()
+
+        interface = explorer.get_public_interface(CODE, 'python')
+        module = explorer.explore_code(CODE, 'python').module
+
+        assert interface.public_constants[0].is_constant
+        assert not module.get_variable('MAX_VALUE').is_constant
+
+    def test_least_recently_used_sources_are_evicted(self):
+        """Test the cache keeps at most max_entries sources."""
+        explorer = CodeExplorer(tree_cache_size=2)
+
+        for value in range(3):
+            explorer.explore_code(f'x = {value}\n', 'python', source_id='x.py')
+
+        assert explorer.tree_cache.get_stats()['entries'] == 2
+        explorer.explore_code('x = 0\n', 'python', source_id='x.py')
+        assert explorer.tree_cache.get_stats()['hits'] == 0
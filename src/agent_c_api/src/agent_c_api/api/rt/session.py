@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse
 from agent_c.util import MnemonicSlugs
 from agent_c.util.logging_utils import LoggingManager
 from agent_c_api.api.dependencies import get_auth_service, get_heygen_client
+from agent_c_api.core.services.auth_service import AuthServiceBusyError
 from agent_c_api.core.util.jwt import validate_request_jwt, create_jwt_token, verify_jwt_token
 from agent_c_api.models.auth_models import UserLoginRequest, RealtimeLoginResponse, LoginResponse
 
@@ -28,7 +29,10 @@ async def login(login_request: UserLoginRequest,
     """
     Authenticate user and return config with token.
     """
-    login_response: Optional[LoginResponse] = await auth_service.login(login_request.username, login_request.password)
+    try:
+        login_response: Optional[LoginResponse] = await auth_service.login(login_request.username, login_request.password)
+    except AuthServiceBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     
     if not login_response:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -56,7 +60,7 @@ async def refresh_token(request: Request,
     if not user_info:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = await auth_service.auth_repo.get_user_by_id(user_info['user_id'])
+    user = await auth_service.get_user_by_id(user_info['user_id'])
     if not user or not user.is_active:
         raise HTTPException(status_code=401, detail="User not found or inactive")
 
@@ -85,7 +89,7 @@ async def initialize_realtime_session(websocket: WebSocket,
     try:
         user_info: Dict[str, Any] = verify_jwt_token(token)
         auth_service: 'AuthService' = websocket.app.state.auth_service
-        user = await auth_service.auth_repo.get_user_by_id(user_info['user_id'])
+        user = await auth_service.get_user_by_id(user_info['user_id'])
         manager = websocket.app.state.realtime_manager
         if agent_key is None:
             agent_key = "default"
@@ -29,6 +29,33 @@ class Settings(BaseSettings):
     SESSION_CLEANUP_INTERVAL: int = 60 * 60  # 1 hour
     SESSION_CLEANUP_BATCH_SIZE: int = 100
 
+    # Chat session storage backend: "json" rewrites a JSON file per session on every flush,
+    # "segmented" appends new messages to a segment log (see agent_c.config.segmented_chat)
+    CHAT_SESSION_STORE: str = "json"
+
+    # Chat session cache limits, least recently used sessions not attached to a live bridge are
+    # flushed and dropped once either is exceeded, 0 disables a limit
+    CHAT_SESSION_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    CHAT_SESSION_CACHE_MAX_SESSIONS: int = 0
+
+    # Idle eviction of realtime UI sessions and per user runtime entries (tool chest, tool cache, workspaces).
+    # Sessions with no client connected are torn down after REALTIME_SESSION_IDLE_TTL seconds of inactivity,
+    # users with no sessions left after USER_RUNTIME_IDLE_TTL, 0 disables a limit
+    REALTIME_SESSION_IDLE_TTL: int = 30 * 60
+    USER_RUNTIME_IDLE_TTL: int = 60 * 60
+    USER_RUNTIME_MAX_USERS: int = 0
+    REALTIME_SWEEP_INTERVAL: int = 60
+
+    # Bytes of events that may wait in the outbound queue of a websocket before a client that isn't keeping up is disconnected
+    WS_SEND_QUEUE_MAX_BYTES: int = 4 * 1024 * 1024
+
+    # Password hashing runs on AUTH_HASH_WORKERS threads, logins beyond AUTH_HASH_MAX_PENDING waiting hashes
+    # are answered with a 503 (0 for no limit). Users looked up for token refreshes and websocket connects
+    # are reused for AUTH_USER_CACHE_TTL seconds, 0 disables the cache
+    AUTH_HASH_WORKERS: int = min(4, os.cpu_count() or 1)
+    AUTH_HASH_MAX_PENDING: int = 64
+    AUTH_USER_CACHE_TTL: int = 30
+
 # Can use getattr(settings, "SECRET_KEY", None) to get the value of SECRET_KEY
 # Instantiate the settings
 settings = Settings()
\ No newline at end of file
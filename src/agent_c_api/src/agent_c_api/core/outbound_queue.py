@@ -0,0 +1,227 @@
+import asyncio
+import json
+import time
+from collections import deque
+from contextlib import suppress
+from typing import Any, Callable, Deque, Dict, Optional, Union
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from agent_c.util.logging_utils import LoggingManager
+
+
+class _OutboundItem:
+    __slots__ = ('type', 'payload', 'data', 'size', 'enqueued_at')
+
+    def __init__(self, event_type: str, payload: Optional[Dict[str, Any]], data: Optional[Union[str, bytes]], size: int) -> None:
+        self.type = event_type
+        self.payload = payload
+        self.data = data
+        self.size = size
+        self.enqueued_at = time.monotonic()
+
+
+class OutboundEventQueue:
+    """
+    Outbound queue for a single websocket connection, drained by its own writer task.
+
+    Producers never wait on the socket, enqueueing is synchronous, so a slow client can't stall the agent
+    loop or tool execution.  While events wait in the queue:
+        - Consecutive text and thought deltas for the same session and role are merged into one event.
+        - A queued history or tool selection event is dropped when a newer one for the same session arrives,
+          each carries the complete state.
+        - If the queued bytes exceed `max_bytes`, the oldest low priority events are dropped.  If that isn't
+          enough the client can't keep up, the queue is cleared and `on_overflow` is called so the connection
+          can be closed and the client resync when it reconnects, the queue accepts nothing more.  A single event larger than `max_bytes`, such
+          as a long chat session, is queued without counting against it.
+    """
+    APPEND_COALESCED_TYPES = frozenset({"text_delta", "thought_delta"})
+    SUPERSEDED_TYPES = frozenset({"history", "tool_select_delta"})
+    LOW_PRIORITY_TYPES = frozenset({"history", "tool_select_delta", "thought_delta"})
+
+    # Rough size of the fields around the content of a delta event, used until it's serialized
+    DELTA_OVERHEAD = 256
+
+    def __init__(self, websocket: WebSocket, max_bytes: int = 4 * 1024 * 1024, name: str = "",
+                 on_overflow: Optional[Callable[[], None]] = None) -> None:
+        self.websocket = websocket
+        self.max_bytes = max_bytes
+        self.name = name
+        self.on_overflow = on_overflow
+        self.logger = LoggingManager(__name__).get_logger()
+
+        self._items: Deque[_OutboundItem] = deque()
+        self._bytes: int = 0
+        self._ready = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Metrics
+        self._sent = 0
+        self._coalesced = 0
+        self._superseded = 0
+        self._dropped = 0
+        self._overflows = 0
+        self._peak_depth = 0
+        self._peak_bytes = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latency_last = 0.0
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._writer(), name=f"ws-writer-{self.name}")
+
+    @property
+    def depth(self) -> int:
+        """The number of events waiting to be sent."""
+        return len(self._items)
+
+    def put_event(self, payload: Dict[str, Any]) -> bool:
+        """
+        Queue a dumped event for sending, returns False if the queue is closed.
+
+        Payloads of coalesced deltas are updated in place while queued, pass a dict the caller won't reuse.
+        """
+        if self._closed:
+            return False
+
+        event_type = payload.get('type', '')
+        if event_type in self.APPEND_COALESCED_TYPES and self._items:
+            tail = self._items[-1]
+            if tail.type == event_type and self._same_stream(tail.payload, payload):
+                tail.payload['content'] += payload['content']
+                tail.size += len(payload['content'])
+                self._bytes += len(payload['content'])
+                self._coalesced += 1
+                self._enforce_budget()
+                return True
+
+        if event_type in self.SUPERSEDED_TYPES:
+            self._drop_superseded(event_type, payload.get('session_id'))
+
+        if event_type in self.APPEND_COALESCED_TYPES:
+            item = _OutboundItem(event_type, payload, None, len(payload.get('content', '')) + self.DELTA_OVERHEAD)
+        else:
+            data = json.dumps(payload)
+            item = _OutboundItem(event_type, payload, data, len(data) if len(data) <= self.max_bytes else 0)
+
+        self._append(item)
+        return True
+
+    def put_bytes(self, data: bytes) -> bool:
+        """Queue binary data, such as audio, for sending, returns False if the queue is closed."""
+        if self._closed:
+            return False
+
+        self._append(_OutboundItem("binary", None, data, len(data) if len(data) <= self.max_bytes else 0))
+        return True
+
+    async def close(self) -> None:
+        """Stop the writer task and discard anything still queued."""
+        self._closed = True
+        self._clear()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            if self._writer_task is not asyncio.current_task():
+                with suppress(asyncio.CancelledError):
+                    await self._writer_task
+            self._writer_task = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Returns the queue depth and size, what was coalesced or dropped and the send latency in seconds."""
+        return {
+            'depth': len(self._items),
+            'bytes': self._bytes,
+            'peak_depth': self._peak_depth,
+            'peak_bytes': self._peak_bytes,
+            'sent': self._sent,
+            'coalesced': self._coalesced,
+            'superseded': self._superseded,
+            'dropped': self._dropped,
+            'overflows': self._overflows,
+            'latency_avg': self._latency_total / self._sent if self._sent else 0.0,
+            'latency_max': self._latency_max,
+            'latency_last': self._latency_last,
+        }
+
+    @staticmethod
+    def _same_stream(queued: Dict[str, Any], payload: Dict[str, Any]) -> bool:
+        return all(queued.get(key) == payload.get(key) for key in payload.keys() if key != 'content')
+
+    def _append(self, item: _OutboundItem) -> None:
+        self._items.append(item)
+        self._bytes += item.size
+        self._peak_depth = max(self._peak_depth, len(self._items))
+        self._enforce_budget()
+        self._ready.set()
+
+    def _drop_superseded(self, event_type: str, session_id: Optional[str]) -> None:
+        for item in [item for item in self._items if item.type == event_type and item.payload.get('session_id') == session_id]:
+            self._items.remove(item)
+            self._bytes -= item.size
+            self._superseded += 1
+
+    def _enforce_budget(self) -> None:
+        self._peak_bytes = max(self._peak_bytes, self._bytes)
+        if self._bytes <= self.max_bytes:
+            return
+
+        for item in [item for item in self._items if item.type in self.LOW_PRIORITY_TYPES]:
+            self._items.remove(item)
+            self._bytes -= item.size
+            self._dropped += 1
+            if self._bytes <= self.max_bytes:
+                return
+
+        self.logger.warning(f"Outbound queue for {self.name} overflowed with {len(self._items)} events, the client isn't keeping up")
+        self._overflows += 1
+        self._dropped += len(self._items)
+        self._closed = True
+        self._clear()
+        self._ready.set()
+        if self.on_overflow is not None:
+            self.on_overflow()
+
+    def _clear(self) -> None:
+        self._items.clear()
+        self._bytes = 0
+
+    def _record_sent(self, item: _OutboundItem) -> None:
+        latency = time.monotonic() - item.enqueued_at
+        self._sent += 1
+        self._latency_total += latency
+        self._latency_last = latency
+        self._latency_max = max(self._latency_max, latency)
+
+    async def _writer(self) -> None:
+        while not self._closed:
+            if not self._items:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            item = self._items.popleft()
+            self._bytes -= item.size
+            try:
+                if item.type == "binary":
+                    await self.websocket.send_bytes(item.data)
+                else:
+                    await self.websocket.send_text(item.data if item.data is not None else json.dumps(item.payload))
+                self._record_sent(item)
+            except WebSocketDisconnect as e:
+                self.logger.debug(f"WebSocket closed during send for {self.name}: {e}")
+                self._closed = True
+                self._clear()
+            except RuntimeError as e:
+                if "websocket.send" in str(e) or "websocket.close" in str(e):
+                    # The websocket closed under us, this is expected during disconnection
+                    self.logger.debug(f"WebSocket closed during send for {self.name}: {e}")
+                    self._closed = True
+                    self._clear()
+                else:
+                    self.logger.warning(f"RuntimeError sending event to {self.name}: {e}")
+            except Exception as e:
+                # Other exceptions (JSON errors, network issues, etc.) only lose this event
+                self.logger.warning(f"Failed to send event to {self.name}: {e}")
@@ -1,7 +1,7 @@
 import asyncio
-import copy
 import json
 import os
+import time
 import traceback
 from contextlib import suppress
 from datetime import datetime
@@ -17,7 +17,7 @@ from starlette.websockets import WebSocketState
 from agent_c.chat import ChatSessionManager
 
 from agent_c.models import ChatSession, ChatUser
-from agent_c.models.events import BaseEvent, TextDeltaEvent, HistoryEvent, RenderMediaEvent
+from agent_c.models.events import BaseEvent, TextDeltaEvent, HistoryEvent, HistoryAppendEvent, RenderMediaEvent
 from agent_c.models.heygen import HeygenAvatarSessionData, NewSessionRequest
 from agent_c.models.input import AudioInput
 from agent_c.models.input.file_input import FileInput
@@ -37,6 +37,7 @@ from agent_c_api.api.rt.models.control_events import ErrorEvent, AgentListEvent,
 
 from agent_c_api.core.event_handlers.client_event_handlers import ClientEventHandler
 from agent_c_api.core.file_handler import RTFileHandler, FileMetadata
+from agent_c_api.core.outbound_queue import OutboundEventQueue
 from agent_c_api.core.voice.models import open_ai_voice_models, AvailableVoiceModel, heygen_avatar_voice_model, no_voice_model
 from agent_c_api.core.voice.voice_io_manager import VoiceIOManager
 
@@ -65,13 +66,18 @@ class RealtimeBridge(ClientEventHandler):
                  chat_user: ChatUser,
                  ui_session_id: str,
                  session_manager: ChatSessionManager,
-                 runtime_cache_entry: UserRuntimeCacheEntry):
+                 runtime_cache_entry: UserRuntimeCacheEntry,
+                 **kwargs):
 
         self.runtime_cache: UserRuntimeCacheEntry = runtime_cache_entry
         self.ui_session_manager = ui_session_manager
         self.chat_session: Optional[ChatSession] = None
         self._websocket: Optional[WebSocket] = None
         self._websocket_lock = asyncio.Lock()
+        # Events are sent by the writer task of the outbound queue for the current websocket, see send_event
+        self._outbound: Optional[OutboundEventQueue] = None
+        self.send_queue_max_bytes: int = int(kwargs.get('send_queue_max_bytes', os.environ.get("WS_SEND_QUEUE_MAX_BYTES", 4 * 1024 * 1024)))
+        self._overflow_close_task: Optional[asyncio.Task] = None
         self.is_running = False
         self.is_connected = False
         self._is_new_bridge = True
@@ -90,7 +96,6 @@ class RealtimeBridge(ClientEventHandler):
         self.avatar_client = self.heygen_client
         self.client_wants_cancel = asyncio.Event()
         self._active_interact_task: Optional[asyncio.Task] = None
-        self._send_lock = asyncio.Lock()
         self.avatar_session: Optional[HeygenAvatarSessionData] = None
         self.avatar_session_id: Optional[str] = None
         self.avatar_session_token: Optional[str] = None
@@ -105,6 +110,49 @@ class RealtimeBridge(ClientEventHandler):
 
         self.command_handler =  ChatCommandHandler()
 
+        # Position in the HistoryAppendEvent stream when the runtime is in delta history mode
+        self._history_sequence: int = 0
+        self._history_checksum: int = 0
+
+        # Monotonic time of the last client event, connection change or interaction end, see RealtimeSessionManager.sweep
+        self.last_activity: float = time.monotonic()
+
+    def touch(self) -> None:
+        """Record activity on the bridge, keeping it from being evicted as idle."""
+        self.last_activity = time.monotonic()
+
+    @property
+    def is_busy(self) -> bool:
+        """True while an interaction is running."""
+        return self._active_interact_task is not None and not self._active_interact_task.done()
+
+    def is_idle(self, idle_ttl: float, now: Optional[float] = None) -> bool:
+        """
+        Returns True if the bridge has no client connected, isn't running an interaction,
+        and has seen no activity for `idle_ttl` seconds.
+        """
+        now = time.monotonic() if now is None else now
+        return not self.is_connected and not self.is_busy and now - self.last_activity >= idle_ttl
+
+    async def shutdown(self) -> None:
+        """
+        Tear down the bridge when its UI session is evicted: stop any running interaction,
+        flush the chat session and release it to the session cache.
+        """
+        self.is_running = False
+        if self.is_busy:
+            self.client_wants_cancel.set()
+            self._active_interact_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._active_interact_task
+
+        if self.chat_session is not None:
+            await self.flush_session(touch=False)
+
+        await self.release_current_session()
+        if self._websocket is not None:
+            await self._set_websocket(None)
+
     @property
     def websocket(self) -> Optional[WebSocket]:
         """Get current websocket connection."""
@@ -126,10 +174,16 @@ class RealtimeBridge(ClientEventHandler):
                         self.logger.debug(f"Closed old websocket for session {self.ui_session_id}")
                 except Exception as e:
                     self.logger.debug(f"Error closing old websocket for session {self.ui_session_id}: {e}")
-            
+
+            await self._stop_outbound()
+
             # Set new websocket
             self._websocket = websocket
             self.is_connected = websocket is not None
+            self.touch()
+            if websocket is not None:
+                self._outbound = OutboundEventQueue(websocket, self.send_queue_max_bytes, self.ui_session_id, self._on_send_overflow)
+                self._outbound.start()
             
             if websocket is not None:
                 self.logger.info(f"WebSocket connected for session {self.ui_session_id}")
@@ -142,10 +196,36 @@ class RealtimeBridge(ClientEventHandler):
         Use this when the websocket is already closed by the client.
         """
         async with self._websocket_lock:
+            await self._stop_outbound()
             self._websocket = None
             self.is_connected = False
+            self.touch()
             self.logger.debug(f"Cleared websocket reference for session {self.ui_session_id}")
 
+    async def _stop_outbound(self) -> None:
+        if self._outbound is not None:
+            await self._outbound.close()
+            self._outbound = None
+
+    def _on_send_overflow(self) -> None:
+        """
+        Close the connection of a client that can't keep up with its events, it resyncs when it reconnects.
+        The interaction keeps running, as it does when a client disconnects.
+        """
+        websocket = self._websocket
+        if websocket is None:
+            return
+
+        async def close_slow_client():
+            with suppress(Exception):
+                await websocket.close(code=1013)
+
+        self._overflow_close_task = asyncio.create_task(close_slow_client())
+
+    def get_send_metrics(self) -> Dict[str, Any]:
+        """Returns the metrics of the outbound queue for the current connection, empty if not connected."""
+        return self._outbound.get_metrics() if self._outbound is not None else {}
+
     async def reconnect(self, websocket: WebSocket) -> None:
         """
         Reconnect the bridge with a new websocket connection.
@@ -312,13 +392,14 @@ class RealtimeBridge(ClientEventHandler):
         await self.avatar_say("Avtar bridge connected to avatar session", role="system")
 
     async def resume_chat_session(self, session_id: str) -> None:
-        await self.release_current_session()
         session_info = await self.chat_session_manager.get_session(session_id, self.chat_user.user_id)
         if not session_info or session_info.user_id != self.chat_user.user_id:
             await self.send_error(f"Session '{session_id}' not found", source="resume_chat_session")
             return
 
+        await self.release_current_session()
         self.chat_session = session_info
+        await self.chat_session_manager.pin_session(self.chat_session)
         self.chat_session.agent_config = self.ui_session_manager.agent_config_loader.duplicate(self.chat_session.agent_config.key)
 
         if 'BridgeTools' not in self.chat_session.agent_config.tools:
@@ -418,10 +499,14 @@ class RealtimeBridge(ClientEventHandler):
         await self.send_chat_session_meta()
 
     async def release_current_session(self) -> None:
+        """
+        Detach from the current chat session, it stays in the session cache
+        until evicted, at which point it's flushed if it has unsaved changes.
+        """
         if self.chat_session is None:
             return
 
-        await self.chat_session_manager.release_session(self.chat_session.session_id, self.chat_session.user_id)
+        await self.chat_session_manager.unpin_session(self.chat_session.session_id, self.chat_session.user_id)
 
     async def new_chat_session(self, agent_key: Optional[str] = None) -> None:
         self.logger.info(f"Creating new chat session with {agent_key} from {self.ui_session_id}")
@@ -431,6 +516,7 @@ class RealtimeBridge(ClientEventHandler):
 
         session_id = f"{self.chat_session.user_id}-{MnemonicSlugs.generate_slug(2)}"
         self.chat_session =  await self._get_or_create_chat_session(session_id=session_id, agent_key=agent_key)
+        await self.chat_session_manager.pin_session(self.chat_session)
         if 'BridgeTools' not in self.chat_session.agent_config.tools:
             self.chat_session.agent_config.tools.append('BridgeTools')
         await self.send_chat_session()
@@ -570,16 +656,20 @@ class RealtimeBridge(ClientEventHandler):
 
     async def send_event(self, event: BaseEvent):
         """
-        Send event to connected client.
+        Queue an event to be sent to the connected client.
         
         Silently returns if no client is connected, allowing long-running
         interactions to continue even if client disconnects. This is critical
         for operations that may run for hours.
+
+        The event is sent by the writer task of the outbound queue, so a slow
+        client never stalls the agent loop, see OutboundEventQueue.
         
         Args:
             event: Event to send to client
         """
-        if self.websocket is None or self.websocket.client_state != WebSocketState.CONNECTED:
+        outbound = self._outbound
+        if outbound is None or self.websocket is None or self.websocket.client_state != WebSocketState.CONNECTED:
             return
 
         model_dump = event.model_dump()
@@ -588,26 +678,16 @@ class RealtimeBridge(ClientEventHandler):
                 return
 
         try:
-            async with self._send_lock:
-                event_str = json.dumps(model_dump)
-                await self.websocket.send_text(event_str)
-
-            #if event.type not in ["ping", "pong"]:
-            #    self.logger.info(f"Sent event {event.type} to {self.chat_session.session_id}")
-                # self.logger.info(event_str)
-        except RuntimeError as e:
-            # Race condition: websocket closed between check and send
-            # This is expected during disconnection, don't spam logs or stop interaction
-            if "websocket.send" in str(e) or "websocket.close" in str(e):
-                self.logger.debug(f"WebSocket closed during send for session {self.ui_session_id}: {e}")
-            else:
-                # Unexpected RuntimeError, log at warning level
-                self.logger.warning(f"RuntimeError sending event to session {self.ui_session_id}: {e}")
+            outbound.put_event(model_dump)
         except Exception as e:
-            # Other exceptions (JSON errors, network issues, etc.)
-            # Log but don't stop the interaction
+            # JSON errors and the like, log but don't stop the interaction
             self.logger.warning(f"Failed to send event to session {self.ui_session_id}: {e}")
 
+    async def send_audio(self, data: bytes) -> None:
+        """Queue binary audio to be sent to the connected client."""
+        if self._outbound is not None:
+            self._outbound.put_bytes(data)
+
     async def send_error(self, message: str, source: Optional[str] = None):
         """Send error message to client"""
         await self.send_event(ErrorEvent(message=message, source=source))
@@ -634,10 +714,35 @@ class RealtimeBridge(ClientEventHandler):
         """Default handler for runtime events, forward to client"""
         await self.send_event(event)
 
+    # The runtime hands over ownership of the messages in history events, it never mutates a message once it has
+    # been raised, so the session takes them as they are rather than paying for a deep copy of the history each round.
     @handle_runtime_event.register
     async def _(self, event: HistoryEvent):
         if event.session_id == self.chat_session.session_id:
-            self.chat_session.messages = copy.deepcopy(event.messages)
+            self.chat_session.messages = list(event.messages)
+            self._history_sequence = 0
+            self._history_checksum = 0
+
+    @handle_runtime_event.register
+    async def _(self, event: HistoryAppendEvent):
+        if event.session_id != self.chat_session.session_id:
+            return
+
+        previous_checksum = 0 if event.sequence == 1 else self._history_checksum
+        in_sync = ((event.sequence == 1 or event.sequence == self._history_sequence + 1)
+                   and event.start_index <= len(self.chat_session.messages)
+                   and event.checksum == HistoryAppendEvent.compute_checksum(event.messages, previous_checksum))
+
+        if not in_sync:
+            self.logger.warning(f"RealtimeBridge {self.ui_session_id}: History append {event.sequence} out of sync, requesting full history")
+            self.runtime_cache.runtime_for_agent(self.chat_session.agent_config).request_full_history(event.session_id)
+            return
+
+        self.chat_session.mark_messages_changed(event.start_index)
+        del self.chat_session.messages[event.start_index:]
+        self.chat_session.messages.extend(event.messages)
+        self._history_sequence = event.sequence
+        self._history_checksum = event.checksum
 
     @property
     def avatar_think_message(self) -> str:
@@ -719,6 +824,7 @@ class RealtimeBridge(ClientEventHandler):
             while self.is_running:
                 try:
                     message = await websocket.receive()
+                    self.touch()
                     if message["type"] == "websocket.receive":
                         if "text" in message:
                             event = self.parse_event(json.loads(message["text"]))
@@ -786,6 +892,7 @@ class RealtimeBridge(ClientEventHandler):
             self.interact(user_message=text, file_ids=file_ids),
             name=f"interact-{self.chat_session.session_id}"
         )
+        self._active_interact_task.add_done_callback(lambda _: self.touch())
 
     async def iter_interact(self, text: str, file_ids: Optional[List[str]] = None, max_buffer: int = 512) -> AsyncIterator[str]:
         """
@@ -931,8 +1038,9 @@ class RealtimeBridge(ClientEventHandler):
             tool_params = {}
             if len(self.chat_session.agent_config.tools):
                 await self.tool_chest.activate_toolset(self.chat_session.agent_config.tools)
-                tool_params = self.tool_chest.get_inference_data(self.chat_session.agent_config.tools, agent_runtime.tool_format)
-                tool_params['schemas'] = self.chat_session.agent_config.filter_allowed_tools(tool_params['schemas'])
+                agent_config = self.chat_session.agent_config
+                tool_params = self.tool_chest.get_inference_data(agent_config.tools, agent_runtime.tool_format,
+                                                                 agent_config.blocked_tool_patterns, agent_config.allowed_tool_patterns)
                 tool_params["toolsets"] = self.chat_session.agent_config.tools
 
             agent_prompt = self.chat_session.agent_config.persona
@@ -1014,8 +1122,9 @@ class RealtimeBridge(ClientEventHandler):
             tool_params = {}
             if len(self.chat_session.agent_config.tools):
                 await self.tool_chest.activate_toolset(self.chat_session.agent_config.tools)
-                tool_params = self.tool_chest.get_inference_data(self.chat_session.agent_config.tools, agent_runtime.tool_format)
-                tool_params['schemas'] = self.chat_session.agent_config.filter_allowed_tools(tool_params['schemas'])
+                agent_config = self.chat_session.agent_config
+                tool_params = self.tool_chest.get_inference_data(agent_config.tools, agent_runtime.tool_format,
+                                                                 agent_config.blocked_tool_patterns, agent_config.allowed_tool_patterns)
                 tool_params["toolsets"] = self.chat_session.agent_config.tools
 
             agent_prompt = self.chat_session.agent_config.persona
@@ -1108,6 +1217,7 @@ class RealtimeBridge(ClientEventHandler):
 
     async def initialize(self, chat_session_id: Optional[str] = None, agent_key: Optional[str] = None) -> None:
         self.chat_session = await self._get_or_create_chat_session(session_id=chat_session_id, agent_key=agent_key)
+        await self.chat_session_manager.pin_session(self.chat_session)
         await self.initialize_agent_parameters()
 
     async def process_files_for_message(
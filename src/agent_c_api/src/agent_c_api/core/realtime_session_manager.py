@@ -1,7 +1,9 @@
 import os
+import time
 import asyncio
 import json
 import threading
+from contextlib import suppress
 from pathlib import Path
 
 from typing import Dict, Optional, List, Any, Union, TYPE_CHECKING
@@ -22,8 +24,8 @@ if TYPE_CHECKING:
     from agent_c.config.agent_config_loader import AgentConfigLoader
     from agent_c.config import ModelConfigurationLoader
 
-from agent_c_tools import *  # noqa
-from agent_c_tools.tools.in_process import * # noqa
+from agent_c_tools.tools.workspace.local_storage import LocalStorageWorkspace, LocalProjectWorkspace
+from agent_c_tools.tools.workspace.s3_storage import S3StorageWorkspace
 from agent_c_tools.tools.workspace.blob_storage import BlobStorageWorkspace
 
 # Constants
@@ -37,9 +39,14 @@ DEFAULT_TOOLSETS = "ThinkTools,WorkspaceTools,AgentCloneTools,AgentAssistTools,A
 class RealtimeSessionManager:
     """
     Maintains the connection between client UI
+
+    A background sweeper (see `start_sweeper`) tears down UI sessions whose bridge has had no client
+    connected and no activity for `session_idle_ttl` seconds, then drops the runtime cache entries of
+    users with no UI sessions left once idle for `user_runtime_idle_ttl` seconds, or beyond `max_user_runtimes`.
+    A TTL or limit of 0 disables it.
     """
 
-    def __init__(self, state):
+    def __init__(self, state, **kwargs):
         logging_manager = LoggingManager(__name__)
         self.logger = logging_manager.get_logger()
         self.user_workspaces: Dict[str, List[BaseWorkspace]] = {}
@@ -54,6 +61,21 @@ class RealtimeSessionManager:
         self._locks: Dict[str, asyncio.Lock] = {}
         self._cancel_events: Dict[str, threading.Event] = {}
 
+        # Idle eviction
+        self.session_idle_ttl: float = float(kwargs.get('session_idle_ttl', os.environ.get("REALTIME_SESSION_IDLE_TTL", 30 * 60)))
+        self.user_runtime_idle_ttl: float = float(kwargs.get('user_runtime_idle_ttl', os.environ.get("USER_RUNTIME_IDLE_TTL", 60 * 60)))
+        self.max_user_runtimes: int = int(kwargs.get('max_user_runtimes', os.environ.get("USER_RUNTIME_MAX_USERS", 0)))
+        self.sweep_interval: float = float(kwargs.get('sweep_interval', os.environ.get("REALTIME_SWEEP_INTERVAL", 60)))
+        self.send_queue_max_bytes: int = int(kwargs.get('send_queue_max_bytes', os.environ.get("WS_SEND_QUEUE_MAX_BYTES", 4 * 1024 * 1024)))
+        self._user_last_active: Dict[str, float] = {}
+        self._sessions_being_created: Dict[str, int] = {}
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self._sweep_lock = asyncio.Lock()
+        self._sweeps: int = 0
+        self._sessions_evicted: int = 0
+        self._user_runtimes_evicted: int = 0
+        self._last_sweep_seconds: float = 0.0
+
     @staticmethod
     def _migrate_old_workspaces(workspaces: List[Dict[str, Any]]) -> List[WorkspaceDataEntry]:
         return [WorkspaceDataEntry(name=ws['name'],
@@ -176,15 +198,23 @@ class RealtimeSessionManager:
 
         self._locks[ui_session_id] = asyncio.Lock()
 
-        runtime_cache_entry = await self.create_user_runtime_cache_entry(user.user_id)
+        # Keeps the sweeper from evicting the user's runtime entry before the session is registered
+        self._sessions_being_created[user.user_id] = self._sessions_being_created.get(user.user_id, 0) + 1
+        try:
+            runtime_cache_entry = await self.create_user_runtime_cache_entry(user.user_id)
 
-        async with self._locks[ui_session_id]:
-            agent_bridge = RealtimeBridge(self, user, ui_session_id, self.chat_session_manager, runtime_cache_entry)
-            await agent_bridge.initialize(chat_session_id, agent_key)
-            self.ui_sessions[ui_session_id] = RealtimeSession(session_id=ui_session_id, user_id=user.user_id, bridge=agent_bridge)
+            async with self._locks[ui_session_id]:
+                agent_bridge = RealtimeBridge(self, user, ui_session_id, self.chat_session_manager, runtime_cache_entry,
+                                              send_queue_max_bytes=self.send_queue_max_bytes)
+                await agent_bridge.initialize(chat_session_id, agent_key)
+                self.ui_sessions[ui_session_id] = RealtimeSession(session_id=ui_session_id, user_id=user.user_id, bridge=agent_bridge)
 
-            self.logger.info(f"Session {ui_session_id} created")
-            return self.ui_sessions[ui_session_id]
+                self.logger.info(f"Session {ui_session_id} created")
+                return self.ui_sessions[ui_session_id]
+        finally:
+            self._sessions_being_created[user.user_id] -= 1
+            if self._sessions_being_created[user.user_id] == 0:
+                del self._sessions_being_created[user.user_id]
 
     async def cleanup_session(self, ui_session_id: str):
         """
@@ -201,6 +231,7 @@ class RealtimeSessionManager:
         """
         if ui_session_id in self.ui_sessions:
             try:
+                await self.ui_sessions[ui_session_id].bridge.release_current_session()
                 del self.ui_sessions[ui_session_id]
                 if ui_session_id in self._locks:
                     del self._locks[ui_session_id]
@@ -208,6 +239,169 @@ class RealtimeSessionManager:
             except Exception as e:
                 self.logger.error(f"Error cleaning up session {ui_session_id}: {e}")
 
+    def start_sweeper(self) -> None:
+        """
+        Start the background task that evicts idle sessions and user runtime entries.
+        """
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_loop(), name="realtime-session-sweeper")
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                self.logger.exception(f"Error sweeping idle sessions: {e}")
+
+    async def sweep(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Evict idle UI sessions, then the runtime cache entries of idle users.
+
+        Args:
+            now: Monotonic time to measure idleness against, defaults to the current time.
+
+        Returns:
+            Dict[str, int]: The number of sessions and user runtime entries evicted.
+        """
+        async with self._sweep_lock:
+            started = time.monotonic()
+            now = started if now is None else now
+            sessions_evicted = 0
+            if self.session_idle_ttl > 0:
+                for ui_session_id, session in list(self.ui_sessions.items()):
+                    if session.bridge.is_idle(self.session_idle_ttl, now) and await self.evict_session(ui_session_id):
+                        sessions_evicted += 1
+
+            users_evicted = 0
+            active_users = self._active_user_ids()
+            for user_id in list(self.user_runtime_cache.keys()):
+                if user_id in active_users:
+                    self._user_last_active[user_id] = now
+                elif self.user_runtime_idle_ttl > 0 and now - self._user_last_active.get(user_id, now) >= self.user_runtime_idle_ttl:
+                    if await self.evict_user_runtime(user_id):
+                        users_evicted += 1
+
+            users_evicted += await self._enforce_user_runtime_limit()
+
+            self._sweeps += 1
+            self._last_sweep_seconds = time.monotonic() - started
+            if sessions_evicted or users_evicted:
+                self.logger.info(f"Evicted {sessions_evicted} idle UI sessions and {users_evicted} user runtime entries")
+
+            return {'sessions_evicted': sessions_evicted, 'user_runtimes_evicted': users_evicted}
+
+    def _active_user_ids(self) -> set:
+        return {session.user_id for session in self.ui_sessions.values()} | set(self._sessions_being_created.keys())
+
+    async def evict_session(self, ui_session_id: str) -> bool:
+        """
+        Shut down the bridge for a UI session, flushing its chat session, and remove the session.
+
+        Returns:
+            bool: True if the session was evicted.
+        """
+        # Removed before shutting down so a client reconnecting meanwhile gets a new session
+        session = self.ui_sessions.pop(ui_session_id, None)
+        if session is None:
+            return False
+
+        self._locks.pop(ui_session_id, None)
+        try:
+            await session.bridge.shutdown()
+        except Exception as e:
+            self.logger.exception(f"Error shutting down bridge for session {ui_session_id}: {e}")
+
+        self._user_last_active[session.user_id] = time.monotonic()
+        self._sessions_evicted += 1
+        self.logger.info(f"Evicted UI session {ui_session_id}")
+        return True
+
+    async def evict_user_runtime(self, user_id: str) -> bool:
+        """
+        Drop and close the runtime cache entry (tool chest, tool cache, workspaces) for a user with no UI sessions.
+
+        Returns:
+            bool: True if the entry was evicted, False if the user has UI sessions or no entry.
+        """
+        if user_id in self._active_user_ids() or user_id not in self.user_runtime_cache:
+            return False
+
+        entry = self.user_runtime_cache.pop(user_id)
+        self.user_workspaces.pop(user_id, None)
+        self._user_last_active.pop(user_id, None)
+        self._user_runtimes_evicted += 1
+        try:
+            await entry.close()
+        except Exception as e:
+            self.logger.exception(f"Error closing runtime cache entry for user {user_id}: {e}")
+
+        self.logger.info(f"Evicted runtime cache entry for user {user_id}")
+        return True
+
+    async def _enforce_user_runtime_limit(self, keep_user_id: Optional[str] = None) -> int:
+        """
+        Evict the least recently active users with no UI sessions, other than `keep_user_id`, until within `max_user_runtimes`.
+        """
+        if self.max_user_runtimes <= 0:
+            return 0
+
+        evicted = 0
+        active_users = self._active_user_ids() | {keep_user_id}
+        candidates = sorted((user_id for user_id in self.user_runtime_cache if user_id not in active_users),
+                            key=lambda user_id: self._user_last_active.get(user_id, 0.0))
+        for user_id in candidates:
+            if len(self.user_runtime_cache) <= self.max_user_runtimes:
+                break
+
+            if await self.evict_user_runtime(user_id):
+                evicted += 1
+
+        return evicted
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Returns counts for live sessions and user runtime entries, eviction statistics and the state of the
+        outbound event queues of the connected sessions.
+        """
+        send_metrics = [session.bridge.get_send_metrics() for session in self.ui_sessions.values() if session.bridge.is_connected]
+        send_metrics = [metrics for metrics in send_metrics if metrics]
+        return {
+            'ui_sessions': len(self.ui_sessions),
+            'connected_ui_sessions': sum(1 for session in self.ui_sessions.values() if session.bridge.is_connected),
+            'busy_ui_sessions': sum(1 for session in self.ui_sessions.values() if session.bridge.is_busy),
+            'user_runtimes': len(self.user_runtime_cache),
+            'session_idle_ttl': self.session_idle_ttl,
+            'user_runtime_idle_ttl': self.user_runtime_idle_ttl,
+            'max_user_runtimes': self.max_user_runtimes,
+            'sweeps': self._sweeps,
+            'sessions_evicted': self._sessions_evicted,
+            'user_runtimes_evicted': self._user_runtimes_evicted,
+            'last_sweep_seconds': self._last_sweep_seconds,
+            'send_queue_depth': sum(metrics['depth'] for metrics in send_metrics),
+            'send_queue_bytes': sum(metrics['bytes'] for metrics in send_metrics),
+            'send_queue_max_depth': max((metrics['depth'] for metrics in send_metrics), default=0),
+            'send_latency_max': max((metrics['latency_max'] for metrics in send_metrics), default=0.0),
+            'send_events_dropped': sum(metrics['dropped'] for metrics in send_metrics),
+            'send_queue_overflows': sum(metrics['overflows'] for metrics in send_metrics),
+        }
+
+    async def shutdown(self) -> None:
+        """
+        Stop the sweeper, flush and tear down every UI session and close all user runtime entries.
+        """
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sweeper_task
+            self._sweeper_task = None
+
+        for ui_session_id in list(self.ui_sessions.keys()):
+            await self.evict_session(ui_session_id)
+
+        for user_id in list(self.user_runtime_cache.keys()):
+            await self.evict_user_runtime(user_id)
+
     def cancel_interaction(self, ui_session_id: str) -> bool:
         """
         Cancel an ongoing interaction for the specified session.
@@ -285,6 +479,7 @@ class RealtimeSessionManager:
         Returns:
             UserRuntimeCacheEntry: The created or existing cache entry
         """
+        self._user_last_active[user_id] = time.monotonic()
         if user_id in self.user_runtime_cache:
             return self.user_runtime_cache[user_id]
 
@@ -317,4 +512,5 @@ class RealtimeSessionManager:
         )
 
         self.user_runtime_cache[user_id] = cache_entry
+        await self._enforce_user_runtime_limit(keep_user_id=user_id)
         return cache_entry
\ No newline at end of file
@@ -1,3 +1,3 @@
-from .auth_service import AuthService
+from .auth_service import AuthService, AuthServiceBusyError
 
-__all__ = [ "AuthService"]
\ No newline at end of file
+__all__ = [ "AuthService", "AuthServiceBusyError"]
\ No newline at end of file
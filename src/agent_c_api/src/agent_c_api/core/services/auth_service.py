@@ -5,8 +5,12 @@ This module provides high-level authentication operations including password
 hashing, user authentication, and token management for the Avatar API.
 """
 
+import asyncio
+import os
 import time
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import timedelta
 import structlog
 from passlib.context import CryptContext
@@ -25,15 +29,26 @@ from agent_c_api.models.auth_models import (
 )
 
 
+class AuthServiceBusyError(RuntimeError):
+    """Raised when too many password hashes are already waiting for a worker."""
+
+
 class AuthService:
     """Service for user authentication and management operations."""
     
-    def __init__(self):
+    def __init__(self, **kwargs):
         """
         Initialize the authentication service as a singleton.
         
         This service manages its own database session lifecycle and should be
         initialized once during application startup.
+        
+        Keyword Args:
+            hash_workers: Threads that hash and verify passwords off the event loop
+            max_pending_hashes: Hashes that may run or wait for a thread before
+                new ones are rejected with AuthServiceBusyError, 0 for no limit
+            user_cache_ttl: Seconds a user looked up by ID is reused, 0 disables the cache
+            user_cache_max_entries: Most users kept in the cache
         """
         self.logger = structlog.get_logger(__name__)
         self.db_session: Optional[AsyncSession] = None
@@ -41,6 +56,19 @@ class AuthService:
         
         # Initialize password hashing context
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+        # bcrypt releases the GIL, so a few threads keep logins from stalling every other request on the loop
+        self.hash_workers: int = int(kwargs.get('hash_workers', os.environ.get("AUTH_HASH_WORKERS", min(4, os.cpu_count() or 1))))
+        self.max_pending_hashes: int = int(kwargs.get('max_pending_hashes', os.environ.get("AUTH_HASH_MAX_PENDING", 64)))
+        self._hash_executor = ThreadPoolExecutor(max_workers=max(1, self.hash_workers), thread_name_prefix="auth_hash")
+        self._pending_hashes: int = 0
+
+        # Users by ID for token refreshes and websocket connects, invalidated whenever this service changes a user
+        self.user_cache_ttl: float = float(kwargs.get('user_cache_ttl', os.environ.get("AUTH_USER_CACHE_TTL", 30)))
+        self.user_cache_max_entries: int = int(kwargs.get('user_cache_max_entries', 4096))
+        self._user_cache: "OrderedDict[str, Tuple[float, ChatUser]]" = OrderedDict()
+        # Bumped by every invalidation, a lookup that started before one doesn't fill the cache
+        self._user_cache_generation: int = 0
     
     async def initialize(self):
         """
@@ -94,6 +122,9 @@ class AuthService:
                 self.db_session = None
             
             self.auth_repo = None
+            self._user_cache.clear()
+            self._user_cache_generation += 1
+            self._hash_executor.shutdown(wait=False, cancel_futures=True)
             
             self.logger.info("auth_service_closed")
             
@@ -148,6 +179,68 @@ class AuthService:
                 hash_length=len(hashed_password) if hashed_password else 0
             )
             return False
+
+    async def _run_hash(self, func, *args):
+        """
+        Run a password hash or verification on the hash worker threads.
+        
+        Raises:
+            AuthServiceBusyError: If max_pending_hashes are already running or waiting
+        """
+        if self.max_pending_hashes and self._pending_hashes >= self.max_pending_hashes:
+            self.logger.warning("auth_hash_rejected", pending=self._pending_hashes)
+            raise AuthServiceBusyError("Too many authentication requests in progress, try again shortly")
+
+        loop = asyncio.get_running_loop()
+        future = self._hash_executor.submit(func, *args)
+        self._pending_hashes += 1
+        # The slot is held until the hash is done, a cancelled caller doesn't stop a hash that already started
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release_hash_slot))
+        return await asyncio.wrap_future(future)
+
+    def _release_hash_slot(self) -> None:
+        self._pending_hashes -= 1
+
+    async def hash_password(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._run_hash(self._hash_password, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash without blocking the event loop."""
+        return await self._run_hash(self._verify_password, plain_password, hashed_password)
+
+    async def get_user_by_id(self, user_id: str) -> Optional[ChatUser]:
+        """
+        Get a user by ID, reusing a recent lookup when possible.
+        
+        Args:
+            user_id: User ID to look up
+            
+        Returns:
+            Optional[ChatUser]: A copy of the user, active or not, or None if not found
+        """
+        self._ensure_initialized()
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._user_cache.move_to_end(user_id)
+                return cached[1].model_copy(deep=True)
+            del self._user_cache[user_id]
+
+        generation = self._user_cache_generation
+        user = await self.auth_repo.get_user_by_id(user_id)
+        if user is None or self.user_cache_ttl <= 0 or generation != self._user_cache_generation:
+            return user
+
+        self._user_cache[user_id] = (time.monotonic() + self.user_cache_ttl, user)
+        while len(self._user_cache) > self.user_cache_max_entries:
+            self._user_cache.popitem(last=False)
+        return user.model_copy(deep=True)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop a user from the user cache, call after changing the user outside this service."""
+        self._user_cache_generation += 1
+        self._user_cache.pop(user_id, None)
     
     async def create_user(self, user_request: UserCreateRequest) -> ChatUserResponse:
         """
@@ -174,7 +267,7 @@ class AuthService:
             )
             
             # Hash the password
-            password_hash = self._hash_password(user_request.password)
+            password_hash = await self.hash_password(user_request.password)
             
             # Create user in database
             user = await self.auth_repo.create_user(
@@ -250,7 +343,7 @@ class AuthService:
                 return None
             
             # Verify password
-            if not self._verify_password(password, user.password_hash):
+            if not await self.verify_password(password, user.password_hash):
                 duration = time.time() - start_time
                 self.logger.warning(
                     "auth_password_invalid",
@@ -262,6 +355,7 @@ class AuthService:
             
             # Update last login time
             await self.auth_repo.update_last_login(user.user_id)
+            self.invalidate_user(user.user_id)
             
             duration = time.time() - start_time
             self.logger.info(
@@ -344,8 +438,7 @@ class AuthService:
                 self.logger.warning("auth_token_missing_user_id")
                 return None
             
-            # Get user from database
-            user = await self.auth_repo.get_user_by_id(user_id)
+            user = await self.get_user_by_id(user_id)
             if not user or not user.is_active:
                 self.logger.warning(
                     "auth_token_user_invalid",
@@ -355,8 +448,7 @@ class AuthService:
                 )
                 return None
             
-            # Convert to ChatUser for framework compatibility
-            return user.to_chat_user()
+            return user
             
         except Exception as e:
             self.logger.warning(
@@ -389,6 +481,7 @@ class AuthService:
         self._ensure_initialized()
         self.logger.info("auth_user_deleting", user_id=user_id)
         result = await self.auth_repo.delete_user(user_id)
+        self.invalidate_user(user_id)
         
         if result:
             self.logger.info("auth_user_deleted", user_id=user_id)
@@ -430,6 +523,7 @@ class AuthService:
                 roles=update_request.roles,
                 is_active=update_request.is_active
             )
+            self.invalidate_user(update_request.user_id)
             
             if not user:
                 duration = time.time() - start_time
@@ -501,7 +595,7 @@ class AuthService:
                     return False
                 
                 # Verify old password
-                if not self._verify_password(password_request.old_password, user.password_hash):
+                if not await self.verify_password(password_request.old_password, user.password_hash):
                     duration = time.time() - start_time
                     self.logger.warning(
                         "auth_password_change_verification_failed",
@@ -511,13 +605,14 @@ class AuthService:
                     raise ValueError("Current password is incorrect")
             
             # Hash new password
-            new_password_hash = self._hash_password(password_request.new_password)
+            new_password_hash = await self.hash_password(password_request.new_password)
             
             # Update password in database
             result = await self.auth_repo.update_password(
                 user_id=password_request.user_id,
                 password_hash=new_password_hash
             )
+            self.invalidate_user(password_request.user_id)
             
             if not result:
                 duration = time.time() - start_time
@@ -56,9 +56,13 @@ def create_application(router: APIRouter, **kwargs) -> FastAPI:
         lifespan_app.state.model_configs = lifespan_app.state.model_config_loader.flattened_config()
         logger.info("✅  Model config loader initialized successfully")
 
-        from agent_c.config.saved_chat import SavedChatLoader
-        lifespan_app.state.chat_loader = SavedChatLoader()
-        logger.info("✅  Saved chat loader initialized successfully")
+        if settings.CHAT_SESSION_STORE == "segmented":
+            from agent_c.config.segmented_chat import SegmentedChatLoader
+            lifespan_app.state.chat_loader = SegmentedChatLoader()
+        else:
+            from agent_c.config.saved_chat import SavedChatLoader
+            lifespan_app.state.chat_loader = SavedChatLoader()
+        logger.info(f"✅  Saved chat loader initialized successfully ({settings.CHAT_SESSION_STORE} storage)")
 
         logger.info("🔧 Initializing HeyGen client")
         try:
@@ -75,21 +79,31 @@ def create_application(router: APIRouter, **kwargs) -> FastAPI:
         logger.info(f"🔧 Initializing chat session index and migrating old chat sessions (this may take a while):")
         await lifespan_app.state.chat_loader.initialize_with_migration()
         from agent_c.chat import ChatSessionManager
-        lifespan_app.state.chat_session_manager = ChatSessionManager(loader=lifespan_app.state.chat_loader)
+        lifespan_app.state.chat_session_manager = ChatSessionManager(loader=lifespan_app.state.chat_loader,
+                                                                     max_cache_bytes=settings.CHAT_SESSION_CACHE_MAX_BYTES,
+                                                                     max_cached_sessions=settings.CHAT_SESSION_CACHE_MAX_SESSIONS)
         logger.info("✅  Chat session manager initialized successfully")
 
         logger.info(f"🔧 Discovering tools")
-        from agent_c_tools import discovered_tools # noqa
-        from agent_c_tools.tools.standalone import BridgeTools # noqa
+        from agent_c_tools.toolset_manifest import register_toolsets
+        toolset_stats = register_toolsets()
+        logger.info(f"✅  {toolset_stats['lazy']} toolsets registered from the manifest, {toolset_stats['imported']} modules imported "
+                    f"in {toolset_stats['seconds']:.2f}s")
         from agent_c.util.registries.section import SectionRegistry
         SectionRegistry.export_prompt_vars()
 
         logger.info("🤖 Initializing Client Session Manager...")
         from agent_c_api.core.realtime_session_manager import RealtimeSessionManager
-        lifespan_app.state.realtime_manager = RealtimeSessionManager(lifespan_app.state)
+        lifespan_app.state.realtime_manager = RealtimeSessionManager(lifespan_app.state,
+                                                                     session_idle_ttl=settings.REALTIME_SESSION_IDLE_TTL,
+                                                                     user_runtime_idle_ttl=settings.USER_RUNTIME_IDLE_TTL,
+                                                                     max_user_runtimes=settings.USER_RUNTIME_MAX_USERS,
+                                                                     sweep_interval=settings.REALTIME_SWEEP_INTERVAL,
+                                                                     send_queue_max_bytes=settings.WS_SEND_QUEUE_MAX_BYTES)
 
         logger.info(f"🔧 Pre-creating runtime cache entries...")
         await lifespan_app.state.realtime_manager.create_user_runtime_cache_entry("admin")  # Pre-create cache for admin user
+        lifespan_app.state.realtime_manager.start_sweeper()
         logger.info("✅  Client Session Manager initialized successfully")
 
         # Initialize authentication database
@@ -99,7 +113,9 @@ def create_application(router: APIRouter, **kwargs) -> FastAPI:
         logger.info("✅  Authentication database initialized")
 
         from agent_c_api.core.services.auth_service import AuthService
-        lifespan_app.state.auth_service = AuthService()
+        lifespan_app.state.auth_service = AuthService(hash_workers=settings.AUTH_HASH_WORKERS,
+                                                      max_pending_hashes=settings.AUTH_HASH_MAX_PENDING,
+                                                      user_cache_ttl=settings.AUTH_USER_CACHE_TTL)
         await lifespan_app.state.auth_service.initialize()
         logger.info("✅  Authentication Service initialized successfully")
 
@@ -110,6 +126,14 @@ def create_application(router: APIRouter, **kwargs) -> FastAPI:
 
         # Shutdown: Close authentication service, database and Redis connections
         logger.info("🔄 Application shutdown initiated...")
+
+        # Flush and tear down realtime sessions
+        logger.info("🤖 Shutting down Client Session Manager...")
+        try:
+            await lifespan_app.state.realtime_manager.shutdown()
+            logger.info("✅  Client Session Manager shut down successfully")
+        except Exception as e:
+            logger.error(f"❌ Error during Client Session Manager shutdown: {e}")
         
         # Close authentication service
         logger.info("🔐 Closing Authentication Service...")
@@ -119,7 +143,26 @@ def create_application(router: APIRouter, **kwargs) -> FastAPI:
             logger.info("✅  Authentication Service closed successfully")
         except Exception as e:
             logger.error(f"❌ Error during Authentication Service cleanup: {e}")
-        
+
+        # Close the shared toolsets and stop the shared tool executors, running tool calls are abandoned
+        logger.info("🧰 Shutting down shared toolsets and tool executors...")
+        try:
+            from agent_c.toolsets.tool_chest import ToolChest
+            await ToolChest.close_shared_toolsets()
+            ToolChest.shutdown_executors(wait=False)
+            logger.info("✅  Shared toolsets and tool executors shut down successfully")
+        except Exception as e:
+            logger.error(f"❌ Error during shared toolset and tool executor shutdown: {e}")
+
+        # Close the pooled LLM clients and their connection pools
+        logger.info("🤖 Closing pooled LLM clients...")
+        try:
+            from agent_c.agents.client_pool import LLMClientPool
+            await LLMClientPool.close_all()
+            logger.info("✅  Pooled LLM clients closed successfully")
+        except Exception as e:
+            logger.error(f"❌ Error during pooled LLM client cleanup: {e}")
+
         # Close database connections
         logger.info("🗄️ Closing database connections...")
         try:
@@ -135,7 +135,7 @@ class VoiceIOManager:
         async for event in result.stream():
             if event.type == "voice_stream_event_audio":
                 self.logger.debug("Sending audio chunk")
-                await self._bridge.websocket.send_bytes(event.data)
+                await self._bridge.send_audio(event.data)
             elif event.type == "voice_stream_event_error":
                 self.logger.error(f"UI session {self._bridge.ui_session_id }, voice pipeline error: {event.data}")
 
@@ -7,6 +7,7 @@ from agent_c.models import BaseModel
 from agent_c.toolsets import ToolChest, ToolCache
 from agent_c.agents import ClaudeChatAgent, BaseAgent
 from agent_c.agents.claude import ClaudeBedrockChatAgent
+from agent_c.agents.client_pool import LLMClientPool
 from agent_c.agents.gpt import AzureGPTChatAgent, GPTChatAgent
 from agent_c.models.agent_config import CurrentAgentConfiguration
 
@@ -35,11 +36,22 @@ class UserRuntimeCacheEntry(BaseModel):
             return self.runtime_cache[agent_config.model_id]
 
 
+    async def close(self) -> None:
+        """
+        Release the toolsets, tool cache handles and workspaces held by this entry, used when it's evicted.
+        """
+        await self.tool_chest.close()
+        self.tool_cache.close()
+        for workspace in self.workspaces:
+            await workspace.close()
+
+        self.runtime_cache.clear()
+
     def _runtime_for_agent(self, agent_config: CurrentAgentConfiguration) -> BaseAgent:
         model_config = self.model_configs[agent_config.model_id]
         runtime_cls = self.__vendor_agent_map[model_config["vendor"]]
 
         auth_info = agent_config.agent_params.auth.model_dump() if agent_config.agent_params.auth is not None else {}
-        client = runtime_cls.client(**auth_info)
+        client = LLMClientPool.get_client(runtime_cls, **auth_info)
         return runtime_cls(model_name=model_config["id"], client=client)
 
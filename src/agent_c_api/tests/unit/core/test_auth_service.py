@@ -0,0 +1,154 @@
+"""Unit tests for the password worker pool and user cache of AuthService.
+
+These tests verify that:
+- Passwords are hashed and verified off the event loop
+- Hashes beyond the pending limit are rejected instead of queued
+- Users looked up by ID are reused until they expire or are changed through the service
+"""
+
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from agent_c.models.chat_history.user import ChatUser
+from agent_c_api.core.services.auth_service import AuthService, AuthServiceBusyError
+from agent_c_api.models.auth_models import PasswordChangeRequest, UserUpdateRequest
+
+
+def make_service(**kwargs) -> AuthService:
+    service = AuthService(**kwargs)
+    service.db_session = Mock()
+    service.auth_repo = Mock()
+    service.auth_repo.get_user_by_id = AsyncMock(side_effect=lambda user_id: ChatUser(user_id=user_id, user_name=user_id))
+    service.pwd_context = Mock()
+    return service
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_passwords_are_checked_off_the_event_loop():
+    service = make_service(hash_workers=2)
+    loop_thread = threading.get_ident()
+    service.pwd_context.verify.side_effect = lambda plain, hashed: threading.get_ident() != loop_thread
+
+    assert await service.verify_password("secret", "hash")
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_hashes_beyond_the_pending_limit_are_rejected():
+    service = make_service(hash_workers=1, max_pending_hashes=2)
+    release = threading.Event()
+    service.pwd_context.hash.side_effect = lambda password: release.wait(5) and f"hashed-{password}"
+
+    running = [asyncio.create_task(service.hash_password(f"pw{n}")) for n in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(AuthServiceBusyError):
+        await service.hash_password("pw2")
+
+    release.set()
+    assert await asyncio.gather(*running) == ["hashed-pw0", "hashed-pw1"]
+    assert service._pending_hashes == 0
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_users_are_cached_by_id():
+    service = make_service(user_cache_ttl=30)
+
+    first = await service.get_user_by_id("user-a")
+    first.roles.append("changed")
+    second = await service.get_user_by_id("user-a")
+
+    assert service.auth_repo.get_user_by_id.await_count == 1
+    assert second.roles == []
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_expired_users_are_looked_up_again():
+    service = make_service(user_cache_ttl=30)
+    await service.get_user_by_id("user-a")
+
+    service._user_cache["user-a"] = (0, service._user_cache["user-a"][1])
+    await service.get_user_by_id("user-a")
+
+    assert service.auth_repo.get_user_by_id.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_changing_a_user_invalidates_the_cache():
+    service = make_service(user_cache_ttl=30)
+    service.auth_repo.update_user = AsyncMock(return_value=ChatUser(user_id="user-a", user_name="user-a"))
+    service.auth_repo.update_password = AsyncMock(return_value=True)
+    service.auth_repo.delete_user = AsyncMock(return_value=True)
+    service.pwd_context.hash.return_value = "hashed"
+
+    changes = [
+        lambda: service.update_user(UserUpdateRequest(user_id="user-a", first_name="Changed")),
+        lambda: service.change_password(PasswordChangeRequest(user_id="user-a", new_password="new-password")),
+        lambda: service.delete_user("user-a"),
+    ]
+    for change in changes:
+        await service.get_user_by_id("user-a")
+        await change()
+        assert "user-a" not in service._user_cache
+
+    assert service.auth_repo.get_user_by_id.await_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_cancelled_hashes_hold_their_slot_until_done():
+    service = make_service(hash_workers=1, max_pending_hashes=1)
+    started, release = threading.Event(), threading.Event()
+    service.pwd_context.hash.side_effect = lambda password: started.set() or release.wait(5) and f"hashed-{password}"
+
+    running = asyncio.create_task(service.hash_password("pw0"))
+    await asyncio.to_thread(started.wait, 5)
+    running.cancel()
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(AuthServiceBusyError):
+        await service.hash_password("pw1")
+    assert service._pending_hashes == 1
+
+    release.set()
+    for _ in range(100):
+        if service._pending_hashes == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert await service.hash_password("pw2") == "hashed-pw2"
+    assert service._pending_hashes == 0
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_lookups_racing_an_invalidation_are_not_cached():
+    service = make_service(user_cache_ttl=30)
+    lookup_started, finish_lookup = asyncio.Event(), asyncio.Event()
+
+    async def slow_lookup(user_id):
+        lookup_started.set()
+        await finish_lookup.wait()
+        return ChatUser(user_id=user_id, user_name="stale")
+
+    service.auth_repo.get_user_by_id = AsyncMock(side_effect=slow_lookup)
+    lookup = asyncio.create_task(service.get_user_by_id("user-a"))
+    await lookup_started.wait()
+    service.invalidate_user("user-a")
+    finish_lookup.set()
+
+    assert (await lookup).user_name == "stale"
+    assert "user-a" not in service._user_cache
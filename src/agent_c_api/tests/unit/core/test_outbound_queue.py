@@ -0,0 +1,97 @@
+"""Unit tests for the per connection OutboundEventQueue.
+
+These tests verify that the queue:
+- Never blocks the producer on a slow socket
+- Coalesces consecutive deltas and supersedes queued history events
+- Drops low priority events, then gives up on the client, when over its byte budget
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import Mock
+
+from agent_c_api.core.outbound_queue import OutboundEventQueue
+
+
+class SlowSocket:
+    """Records what was sent, each send waits until released."""
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+
+    async def send_text(self, data):
+        await self.release.wait()
+        self.sent.append(json.loads(data))
+
+    async def send_bytes(self, data):
+        await self.release.wait()
+        self.sent.append(data)
+
+
+def delta(content, event_type="text_delta", session_id="s1"):
+    return {"type": event_type, "session_id": session_id, "role": "assistant", "content": content, "format": "markdown"}
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_deltas_are_coalesced_while_the_client_is_slow():
+    socket = SlowSocket()
+    queue = OutboundEventQueue(socket, name="test")
+    queue.start()
+
+    queue.put_event(delta("first"))
+    await asyncio.sleep(0)  # the writer takes the first delta and waits on the socket
+    for word in [" second", " third"]:
+        queue.put_event(delta(word))
+    queue.put_event(delta("hmm", event_type="thought_delta"))
+    queue.put_event(delta(" more"))
+
+    assert queue.depth == 3
+    socket.release.set()
+    while queue.depth:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert [event["content"] for event in socket.sent] == ["first", " second third", "hmm", " more"]
+    metrics = queue.get_metrics()
+    assert metrics["sent"] == 4 and metrics["coalesced"] == 1
+    await queue.close()
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_newer_history_supersedes_queued_history():
+    queue = OutboundEventQueue(SlowSocket(), name="test")
+    queue.put_event({"type": "history", "session_id": "s1", "messages": [1]})
+    queue.put_event({"type": "history", "session_id": "s2", "messages": [1]})
+    queue.put_event({"type": "history", "session_id": "s1", "messages": [1, 2]})
+
+    assert queue.depth == 2
+    assert queue.get_metrics()["superseded"] == 1
+    await queue.close()
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_over_budget_drops_low_priority_then_overflows():
+    on_overflow = Mock()
+    queue = OutboundEventQueue(SlowSocket(), max_bytes=2000, name="test", on_overflow=on_overflow)
+
+    queue.put_event({"type": "history", "session_id": "s1", "messages": ["x" * 900]})
+    queue.put_event({"type": "render_media", "session_id": "s1", "content": "y" * 900})
+    queue.put_event({"type": "render_media", "session_id": "s1", "content": "z" * 900})
+
+    assert queue.depth == 2
+    assert queue.get_metrics()["dropped"] == 1
+    on_overflow.assert_not_called()
+
+    queue.put_event({"type": "render_media", "session_id": "s1", "content": "w" * 900})
+    on_overflow.assert_called_once()
+    assert queue.depth == 0
+    assert not queue.put_event(delta("late"))
+    await queue.close()
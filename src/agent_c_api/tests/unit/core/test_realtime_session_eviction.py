@@ -0,0 +1,98 @@
+"""Unit tests for idle eviction in RealtimeSessionManager.
+
+These tests verify that the sweeper:
+- Shuts down and removes UI sessions whose bridge is idle, keeping the others
+- Evicts and closes user runtime entries once their user has no sessions and is idle
+- Keeps the number of user runtime entries within the configured limit
+"""
+
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from agent_c_api.core.realtime_bridge import RealtimeBridge
+from agent_c_api.core.realtime_session_manager import RealtimeSessionManager
+from agent_c_api.models.realtime_session import RealtimeSession
+
+
+def make_manager(**kwargs) -> RealtimeSessionManager:
+    state = Mock()
+    state.model_configs = {}
+    with patch("agent_c_api.core.realtime_session_manager.locate_config_path", return_value="."):
+        return RealtimeSessionManager(state, **kwargs)
+
+
+def add_session(manager: RealtimeSessionManager, ui_session_id: str, user_id: str, idle: bool) -> Mock:
+    bridge = Mock(spec=RealtimeBridge)
+    bridge.is_idle.return_value = idle
+    bridge.is_connected = not idle
+    bridge.is_busy = False
+    bridge.shutdown = AsyncMock()
+    bridge.get_send_metrics.return_value = {}
+    manager.ui_sessions[ui_session_id] = RealtimeSession(session_id=ui_session_id, user_id=user_id, bridge=bridge)
+    return bridge
+
+
+def add_runtime(manager: RealtimeSessionManager, user_id: str, last_active: float) -> Mock:
+    entry = Mock()
+    entry.close = AsyncMock()
+    manager.user_runtime_cache[user_id] = entry
+    manager.user_workspaces[user_id] = []
+    manager._user_last_active[user_id] = last_active
+    return entry
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_sweep_evicts_idle_sessions_only():
+    manager = make_manager(session_idle_ttl=60, user_runtime_idle_ttl=0)
+    idle_bridge = add_session(manager, "UI-idle", "user-a", idle=True)
+    live_bridge = add_session(manager, "UI-live", "user-b", idle=False)
+
+    result = await manager.sweep()
+
+    assert result["sessions_evicted"] == 1
+    idle_bridge.shutdown.assert_awaited_once()
+    live_bridge.shutdown.assert_not_awaited()
+    assert list(manager.ui_sessions.keys()) == ["UI-live"]
+    assert manager.get_metrics()["sessions_evicted"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_sweep_evicts_idle_user_runtimes():
+    manager = make_manager(session_idle_ttl=0, user_runtime_idle_ttl=60)
+    now = time.monotonic()
+    stale = add_runtime(manager, "stale-user", now - 120)
+    recent = add_runtime(manager, "recent-user", now - 10)
+    in_use = add_runtime(manager, "busy-user", now - 120)
+    add_session(manager, "UI-busy", "busy-user", idle=False)
+
+    result = await manager.sweep(now)
+
+    assert result["user_runtimes_evicted"] == 1
+    stale.close.assert_awaited_once()
+    recent.close.assert_not_awaited()
+    in_use.close.assert_not_awaited()
+    assert set(manager.user_runtime_cache.keys()) == {"recent-user", "busy-user"}
+    assert "stale-user" not in manager.user_workspaces
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.asyncio
+async def test_max_user_runtimes_evicts_least_recently_active():
+    manager = make_manager(session_idle_ttl=0, user_runtime_idle_ttl=0, max_user_runtimes=2)
+    now = time.monotonic()
+    oldest = add_runtime(manager, "oldest", now - 30)
+    add_runtime(manager, "middle", now - 20)
+    add_runtime(manager, "newest", now - 10)
+
+    result = await manager.sweep(now)
+
+    assert result["user_runtimes_evicted"] == 1
+    oldest.close.assert_awaited_once()
+    assert set(manager.user_runtime_cache.keys()) == {"middle", "newest"}
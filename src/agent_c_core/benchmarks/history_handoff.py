@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the CPU spent handing history over from the agent runtime to the session, per tool round.
+
+Each round runs one tool call through a ToolChest, raises the full history as a HistoryEvent and applies it
+to a ChatSession the way the RealtimeBridge does.  The legacy column repeats the round with the deep copies
+the handoff used to make, of the tool call, its arguments and the history.
+
+Usage:
+    python benchmarks/history_handoff.py [--rounds 20] [--lengths 50 200 1000 4000]
+"""
+import argparse
+import asyncio
+import copy
+import time
+from typing import Any, Dict, List
+
+from agent_c.models.chat_history.chat_session import ChatSession
+from agent_c.models.events import HistoryEvent
+from agent_c.toolsets.json_schema import json_schema
+from agent_c.toolsets.tool_chest import ToolChest
+from agent_c.toolsets.tool_set import Toolset
+
+
+class BenchmarkTools(Toolset):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="bench")
+
+    @json_schema("Returns the length of the text", {"text": {"type": "string", "description": "Some text"}})
+    async def measure(self, **kwargs):
+        return str(len(kwargs.get("text", "")))
+
+
+Toolset.register(BenchmarkTools)
+
+
+def make_history(length: int) -> List[Dict[str, Any]]:
+    """Builds a Claude format history of tool rounds, roughly 2KB per message."""
+    filler = "lorem ipsum dolor sit amet " * 75
+    messages = []
+    for i in range(length // 2):
+        call_id = f"toolu_{i}"
+        messages.append({'role': 'assistant', 'content': [{'type': 'text', 'text': filler},
+                                                          {'type': 'tool_use', 'id': call_id, 'name': 'bench_measure',
+                                                           'input': {'text': filler}}]})
+        messages.append({'role': 'user', 'content': [{'type': 'tool_result', 'tool_use_id': call_id, 'content': filler}]})
+    return messages
+
+
+async def run_round(tool_chest: ToolChest, session: ChatSession, messages: List[Dict[str, Any]], legacy: bool) -> None:
+    tool_call = {'type': 'tool_use', 'id': 'toolu_bench', 'name': 'bench_measure', 'input': {'text': "x" * 2048}}
+    if legacy:
+        copy.deepcopy(tool_call)
+        copy.deepcopy(tool_call['input'])
+
+    await tool_chest.call_tools([tool_call], {}, format_type="claude")
+
+    event = HistoryEvent(messages=messages, vendor="anthropic", session_id=session.session_id, role="assistant")
+    session.messages = copy.deepcopy(event.messages) if legacy else list(event.messages)
+
+
+async def measure(tool_chest: ToolChest, length: int, rounds: int, legacy: bool) -> float:
+    session = ChatSession(session_id="bench", user_id="bench")
+    messages = make_history(length)
+    await run_round(tool_chest, session, messages, legacy)
+
+    start = time.process_time()
+    for _ in range(rounds):
+        await run_round(tool_chest, session, messages, legacy)
+
+    return (time.process_time() - start) / rounds * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[50, 200, 1000, 4000])
+    args = parser.parse_args()
+
+    tool_chest = ToolChest({})
+    await tool_chest.activate_toolset("BenchmarkTools")
+
+    print(f"{'messages':>10} {'legacy ms/round':>16} {'handoff ms/round':>17} {'speedup':>8}")
+    for length in args.lengths:
+        legacy = await measure(tool_chest, length, args.rounds, legacy=True)
+        handoff = await measure(tool_chest, length, args.rounds, legacy=False)
+        print(f"{length:>10} {legacy:>16.2f} {handoff:>17.2f} {legacy / max(handoff, 1e-6):>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
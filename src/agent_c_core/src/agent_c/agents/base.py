@@ -5,12 +5,13 @@ import asyncio
 from asyncio import Semaphore
 from fnmatch import fnmatch
 
-from typing import Any, Dict, List, Union, Optional, Callable, Awaitable, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Set, Union, Optional, Callable, Awaitable, Tuple, TYPE_CHECKING
 
+from agent_c.agents.governor import CompletionGovernor
 from agent_c.models.chat_history.chat_session import ChatSession
 
 from agent_c.models import ImageInput
-from agent_c.models.events.chat import ThoughtDeltaEvent, HistoryDeltaEvent, CompleteThoughtEvent, SystemPromptEvent, UserMessageEvent
+from agent_c.models.events.chat import ThoughtDeltaEvent, HistoryDeltaEvent, HistoryAppendEvent, CompleteThoughtEvent, SystemPromptEvent, UserMessageEvent
 from agent_c.models.input import FileInput, AudioInput
 from agent_c.models.events import ToolCallEvent, InteractionEvent, TextDeltaEvent, HistoryEvent, CompletionEvent, ToolSelectDeltaEvent, SystemMessageEvent, SessionEvent
 from agent_c.prompting.prompt_builder import PromptBuilder
@@ -20,6 +21,7 @@ from agent_c.util.logging_utils import LoggingManager
 from agent_c.util.token_counter import TokenCounter
 
 if TYPE_CHECKING:
+    import httpx
     from agent_c.models.agent_config import CurrentAgentConfiguration
 
 
@@ -53,6 +55,11 @@ class BaseAgent:
             A semaphore to limit the number of concurrent operations.
         max_delay: int, default is 10
             Maximum delay for exponential backoff.
+        history_delta_mode: bool, default is the HISTORY_DELTA_MODE env var or False
+            When True, history updates within an interaction are raised as HistoryAppendEvents
+            containing only the new messages instead of a full HistoryEvent.
+        governor: CompletionGovernor, default is CompletionGovernor.default()
+            Caps the completions in flight across every agent in the process.
         """
         self.model_name: str = kwargs.get("model_name")
         self.vendor: str = kwargs.get("vendor", "unknown")
@@ -60,6 +67,7 @@ class BaseAgent:
         self.max_delay: int = kwargs.get("max_delay", 500)
         self.concurrency_limit: int = kwargs.get("concurrency_limit", 3)
         self.semaphore: Semaphore = asyncio.Semaphore(self.concurrency_limit)
+        self.governor: CompletionGovernor = kwargs.get("governor", CompletionGovernor.default())
         self.tool_chest: Optional[ToolChest] = kwargs.get("tool_chest", None)
         if self.tool_chest is not None:
             self.tool_chest.agent = self
@@ -73,6 +81,11 @@ class BaseAgent:
         self.supports_multimodal: bool = False
         self.token_counter: TokenCounter = kwargs.get("token_counter", TokenCounter())
         self.root_message_role: str = kwargs.get("root_message_role", os.environ.get("ROOT_MESSAGE_ROLE", "system"))
+        self.history_delta_mode: bool = kwargs.get("history_delta_mode", os.environ.get("HISTORY_DELTA_MODE", "false").lower() == "true")
+        # Per session high-water marks for delta history mode, keyed by session_id
+        self._history_marks: Dict[str, Dict[str, Any]] = {}
+        # Sessions whose consumer asked for a resync while no interaction was tracked
+        self._pending_resyncs: Set[str] = set()
 
         logging_manager = LoggingManager(self.__class__.__name__)
         self.logger = logging_manager.get_logger()
@@ -94,6 +107,14 @@ class BaseAgent:
     def client(cls, **opts):
         raise NotImplementedError
 
+    @classmethod
+    def http_client(cls, limits: 'httpx.Limits') -> Optional[Any]:
+        """
+        Returns an HTTP client with the given connection limits for `client` to use, see LLMClientPool.
+        Agents whose SDK doesn't accept one return None.
+        """
+        return None
+
     @property
     def tool_format(self) -> str:
         raise NotImplementedError
@@ -285,6 +306,7 @@ class BaseAgent:
         return iid
 
     async def _raise_interaction_end(self, **data):
+        self._end_history_tracking(data.get('session_id', 'none'))
         streaming_callback = data.pop('streaming_callback', None)
         await self._raise_event(InteractionEvent(started=False, **data), streaming_callback=streaming_callback)
 
@@ -302,8 +324,83 @@ class BaseAgent:
         await self._raise_event(CompleteThoughtEvent(content=content, **data), streaming_callback=streaming_callback)
 
     async def _raise_history_event(self, messages: List[dict[str, Any]], **data):
+        """
+        Raise the history for the session to the event stream.
+
+        In delta history mode, while an interaction is being tracked, only the messages appended since the last
+        history event are raised as a HistoryAppendEvent.  A full HistoryEvent is raised when not tracking,
+        when the history shrank below the high-water mark or when a consumer asked for a resync.
+
+        Ownership of the raised messages passes to the consumers, new messages must be appended rather than
+        written into messages that have already been raised.
+        """
+        mark = self._history_marks.get(data.get('session_id', 'none')) if self.history_delta_mode else None
+        if mark is not None and not mark['resync'] and mark['mark'] <= len(messages):
+            await self._raise_history_append(messages, mark, **data)
+            return
+
         streaming_callback = data.pop('streaming_callback', None)
         await self._raise_event(HistoryEvent(messages=messages, vendor=self.vendor,  **data ), streaming_callback=streaming_callback)
+        self._pending_resyncs.discard(data.get('session_id', 'none'))
+        if mark is not None:
+            mark.update(mark=len(messages), sequence=0, checksum=0, resync=False)
+
+    async def _raise_history_append(self, messages: List[dict[str, Any]], mark: Dict[str, Any], **data):
+        start_index = mark['mark']
+        appended = messages[start_index:]
+        if len(appended) == 0:
+            return
+
+        mark['sequence'] += 1
+        mark['checksum'] = HistoryAppendEvent.compute_checksum(appended, mark['checksum'])
+        mark['mark'] = len(messages)
+
+        streaming_callback = data.pop('streaming_callback', None)
+        await self._raise_event(HistoryAppendEvent(messages=appended, vendor=self.vendor, start_index=start_index,
+                                                   total_messages=len(messages), sequence=mark['sequence'],
+                                                   checksum=mark['checksum'], **data),
+                                streaming_callback=streaming_callback)
+
+        # A consumer that found this append out of sync asked for a resync while handling it, this may be the
+        # last history event of the interaction so the full history is raised now rather than with the next one
+        if mark['resync']:
+            await self._raise_history_event(messages, streaming_callback=streaming_callback, **data)
+
+    def _start_history_tracking(self, messages: List[dict[str, Any]], chat_session: Optional[ChatSession], **data) -> None:
+        """
+        Set the high-water mark for an interaction in delta history mode.
+
+        The mark is the number of leading messages the consumer already holds, which is the chat session history
+        when the message array was built on top of it.  Otherwise the first append will carry the entire history.
+        """
+        if not self.history_delta_mode:
+            return
+
+        known: List[dict[str, Any]] = chat_session.messages if chat_session is not None else []
+        mark = len(known)
+        if mark > len(messages) or (mark > 0 and messages[mark - 1] is not known[mark - 1]):
+            mark = 0
+
+        session_id = data.get('session_id', 'none')
+        resync = session_id in self._pending_resyncs
+        self._pending_resyncs.discard(session_id)
+        self._history_marks[session_id] = {'mark': mark, 'sequence': 0, 'checksum': 0, 'resync': resync}
+
+    def _end_history_tracking(self, session_id: str) -> None:
+        self._history_marks.pop(session_id, None)
+
+    def request_full_history(self, session_id: str) -> None:
+        """
+        Ask for the next history event of an active interaction to carry the full history.
+        Consumers call this when they detect a gap or checksum mismatch in the HistoryAppendEvents they receive,
+        a request made while handling an append is served as soon as the append completes.  Without an active
+        interaction the first history event of the next interaction of the session carries the full history.
+        """
+        mark = self._history_marks.get(session_id)
+        if mark is not None:
+            mark['resync'] = True
+        elif self.history_delta_mode:
+            self._pending_resyncs.add(session_id)
 
     async def _exponential_backoff(self, delay: int) -> None:
         """
@@ -1,3 +1,4 @@
+import os
 import asyncio
 import copy
 import json
@@ -11,10 +12,11 @@ from enum import Enum, auto
 from typing import Any, List, Union, Dict, Tuple
 
 
-from anthropic import AsyncAnthropic, APITimeoutError, Anthropic, RateLimitError, AsyncAnthropicBedrock
+from anthropic import AsyncAnthropic, APITimeoutError, Anthropic, RateLimitError, AsyncAnthropicBedrock, DefaultAsyncHttpxClient
 
 
 from agent_c.agents.base import BaseAgent
+from agent_c.agents.prompt_cache import AnthropicPromptCacheStrategy
 from agent_c.chat.session_manager import ChatSessionManager
 from agent_c.models.events.chat import AnthropicUserMessageEvent
 from agent_c.models.input import FileInput
@@ -77,6 +79,9 @@ class ClaudeChatAgent(BaseAgent):
             The client to use for making requests to the Anthropic API.
         max_tokens: int, optional
             The maximum number of tokens to generate in the response.
+        prompt_cache: AnthropicPromptCacheStrategy, optional
+            Places prompt cache breakpoints on each request, by default enabled unless
+            `prompt_caching` is False or CLAUDE_PROMPT_CACHING is "false".
         """
         kwargs['token_counter'] = kwargs.get('token_counter', ClaudeChatAgent.ClaudeTokenCounter())
         super().__init__(**kwargs, vendor="anthropic")
@@ -89,10 +94,19 @@ class ClaudeChatAgent(BaseAgent):
         self.max_tokens = kwargs.get("max_tokens", self.CLAUDE_MAX_TOKENS)
         self.budget_tokens = kwargs.get("budget_tokens", 0)
 
+        prompt_caching: bool = kwargs.get("prompt_caching", os.environ.get("CLAUDE_PROMPT_CACHING", "true").lower() == "true")
+        self.prompt_cache: AnthropicPromptCacheStrategy = kwargs.get("prompt_cache",
+                                                                     AnthropicPromptCacheStrategy(enabled=prompt_caching,
+                                                                                                  ttl=kwargs.get("prompt_cache_ttl", os.environ.get("CLAUDE_PROMPT_CACHE_TTL"))))
+
     @classmethod
     def client(cls, **opts):
         return AsyncAnthropic(**opts)
 
+    @classmethod
+    def http_client(cls, limits):
+        return DefaultAsyncHttpxClient(limits=limits)
+
     @property
     def tool_format(self) -> str:
         return "claude"
@@ -135,7 +149,8 @@ class ClaudeChatAgent(BaseAgent):
 
 
         tool_chest = kwargs.get("tool_chest", self.tool_chest)
-        functions: List[Dict[str, Any]] = kwargs['schemas']
+        # Tool schemas from the tool chest are shared and immutable, copy the list so server tools can be added
+        functions: List[Dict[str, Any]] = list(kwargs['schemas'])
 
         kwargs['prompt_metadata']['model_id'] = model_name
         (tool_context, prompt_context) = await self._render_contexts(**kwargs)
@@ -207,9 +222,10 @@ class ClaudeChatAgent(BaseAgent):
         agent_config = kwargs['prompt_metadata']['agent_config']
         session_manager: Union[ChatSessionManager, None] = kwargs.get("session_manager", None)
         messages = opts["completion_opts"]["messages"]
+        chat_session = kwargs.get("chat_session")
         interaction_id = await self._raise_interaction_start(**callback_opts)
+        self._start_history_tracking(messages, chat_session, **callback_opts)
         await self._raise_system_prompt(opts["completion_opts"]["system"], **callback_opts)
-        chat_session = kwargs.get("chat_session")
 
         delay = 3  # Initial delay between retries
         async with (self.semaphore):
@@ -257,8 +273,9 @@ class ClaudeChatAgent(BaseAgent):
                     # opts["completion_opts"]['tools'] = chat_session.agent_config.filter_allowed_tools(tool_params['schemas'])
                     agent_config = chat_session.agent_config if chat_session else opts['tool_context'].get('active_agent') or opts['tool_context'].get('agent_config')
                     if agent_config:
-                        tool_params = tool_chest.get_inference_data(agent_config.tools, self.tool_format)
-                        opts["completion_opts"]['tools'] = agent_config.filter_allowed_tools(tool_params['schemas'])
+                        tool_params = tool_chest.get_inference_data(agent_config.tools, self.tool_format,
+                                                                    agent_config.blocked_tool_patterns, agent_config.allowed_tool_patterns)
+                        opts["completion_opts"]['tools'] = tool_params['schemas']
 
 
                     delay = 3
@@ -284,11 +301,13 @@ class ClaudeChatAgent(BaseAgent):
                         self.logger.exception(f"Uncoverable error during Claude chat: {e}", exc_info=True)
                         await self._raise_system_event(f"Exception calling `client.messages.stream`.\n\n{e}\n",  **callback_opts)
                         await self._raise_completion_end(opts["completion_opts"], stop_reason="exception", **callback_opts)
+                        self._end_history_tracking(callback_opts['session_id'])
                         return []
 
         self.logger.warning("ABNORMAL TERMINATION OF CLAUDE CHAT")
         await self._raise_system_event(f"ABNORMAL TERMINATION OF CLAUDE CHAT", **callback_opts)
         await self._raise_completion_end(opts["completion_opts"], stop_reason="overload", **callback_opts)
+        self._end_history_tracking(callback_opts['session_id'])
         return messages
 
 
@@ -326,9 +345,11 @@ class ClaudeChatAgent(BaseAgent):
         else:
             stream_source = self.client
 
+        # The governor slot is released as soon as the response is complete, before any tool calls run
+        slot = await self.governor.acquire(self.model_name)
         try:
 
-            async with stream_source.messages.stream(**completion_opts) as stream:
+            async with stream_source.messages.stream(**self.prompt_cache.apply(completion_opts)) as stream:
                 async for event in stream:
                     await self._process_stream_event(event, state, tool_chest, session_manager,
                                                      messages, callback_opts)
@@ -338,6 +359,9 @@ class ClaudeChatAgent(BaseAgent):
                         state['complete'] = True
                         state['stop_reason'] = "client_cancel"
 
+                    if state['complete']:
+                        slot.release()
+
                     # If we've reached the end of a non-tool response, return
                     if state['complete'] and state['stop_reason'] != 'tool_use':
                         if state['stop_reason'] == 'refusal':
@@ -368,6 +392,8 @@ class ClaudeChatAgent(BaseAgent):
             await self._raise_system_event(f"Exception during Claude streaming: {e}\n", **callback_opts)
             state['complete'] = True
             state['stop_reason'] = "exception"
+        finally:
+            slot.release()
 
         return messages, state
 
@@ -381,6 +407,8 @@ class ClaudeChatAgent(BaseAgent):
             "server_tool_responses": [],
             "input_tokens": 0,
             "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
             "model_outputs": [],
             "current_block_type": None,
             "current_thought": None,
@@ -430,7 +458,10 @@ class ClaudeChatAgent(BaseAgent):
 
     async def _handle_message_start(self, event, state, callback_opts):
         """Handle the message_start event."""
-        state["input_tokens"] = event.message.usage.input_tokens
+        usage = event.message.usage
+        state["input_tokens"] = usage.input_tokens
+        state["cache_creation_input_tokens"] = getattr(usage, "cache_creation_input_tokens", None) or 0
+        state["cache_read_input_tokens"] = getattr(usage, "cache_read_input_tokens", None) or 0
 
     async def _handle_server_tool_use_block(self, event, state, callback_opts):
         """Handle server tool use block event."""
@@ -560,6 +591,8 @@ class ClaudeChatAgent(BaseAgent):
             stop_reason=state['stop_reason'],
             input_tokens=state['input_tokens'],
             output_tokens=state['output_tokens'],
+            cache_creation_tokens=state['cache_creation_input_tokens'],
+            cache_read_tokens=state['cache_read_input_tokens'],
             **callback_opts
         )
 
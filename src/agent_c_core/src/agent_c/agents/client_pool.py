@@ -0,0 +1,95 @@
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Tuple, Type
+
+import httpx
+
+from agent_c.util.logging_utils import LoggingManager
+
+
+class LLMClientPool:
+    """
+    Process wide pool of vendor SDK clients, keyed by the agent class and a fingerprint of the auth options.
+
+    Every user running the same model with the same credentials shares one client, and with it one HTTP
+    connection pool, instead of each runtime opening its own connections and TLS sessions.  The connection
+    pool of pooled clients is sized by LLM_CLIENT_MAX_CONNECTIONS, LLM_CLIENT_MAX_KEEPALIVE_CONNECTIONS and
+    LLM_CLIENT_KEEPALIVE_EXPIRY (seconds), the SDK defaults are used for any that aren't set.
+    """
+    _clients: Dict[Tuple[str, str], Any] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(auth_info: Dict[str, Any]) -> str:
+        """
+        Returns a stable digest of the auth options, so keys and secrets aren't held in the pool keys.
+        """
+        canonical = json.dumps(auth_info, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def connection_limits() -> Optional[httpx.Limits]:
+        """
+        Returns the connection limits for pooled clients from the environment, None if none are set.
+        """
+        max_connections = os.environ.get("LLM_CLIENT_MAX_CONNECTIONS")
+        max_keepalive = os.environ.get("LLM_CLIENT_MAX_KEEPALIVE_CONNECTIONS")
+        keepalive_expiry = os.environ.get("LLM_CLIENT_KEEPALIVE_EXPIRY")
+        if max_connections is None and max_keepalive is None and keepalive_expiry is None:
+            return None
+
+        return httpx.Limits(max_connections=int(max_connections) if max_connections else 1000,
+                            max_keepalive_connections=int(max_keepalive) if max_keepalive else 100,
+                            keepalive_expiry=float(keepalive_expiry) if keepalive_expiry else 5.0)
+
+    @classmethod
+    def get_client(cls, runtime_cls: Type, **auth_info: Any) -> Any:
+        """
+        Returns the shared client for an agent class and auth options, creating it on first use.
+
+        Args:
+            runtime_cls: The agent class, whose `client` class method creates the SDK client.
+            **auth_info: The auth options passed to `client`.
+        """
+        key = (f"{runtime_cls.__module__}.{runtime_cls.__qualname__}", cls.fingerprint(auth_info))
+        with cls._lock:
+            client = cls._clients.get(key)
+            if client is None:
+                opts = dict(auth_info)
+                limits = cls.connection_limits()
+                if limits is not None:
+                    http_client = runtime_cls.http_client(limits)
+                    if http_client is not None:
+                        opts['http_client'] = http_client
+
+                client = runtime_cls.client(**opts)
+                cls._clients[key] = client
+                LoggingManager(__name__).get_logger().info(f"Created pooled {runtime_cls.__name__} client, {len(cls._clients)} pooled clients")
+
+            return client
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """
+        Returns the number of pooled clients.
+        """
+        return {'clients': len(cls._clients)}
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """
+        Close and drop every pooled client, closing their connection pools.
+        """
+        with cls._lock:
+            clients = list(cls._clients.values())
+            cls._clients.clear()
+
+        for client in clients:
+            close = getattr(client, 'close', None)
+            if close is not None:
+                try:
+                    await close()
+                except Exception as e:
+                    LoggingManager(__name__).get_logger().warning(f"Error closing pooled client: {e}")
@@ -0,0 +1,122 @@
+import os
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+
+class CompletionSlot:
+    """
+    A slot held by one in-flight completion, released once the model has finished responding.
+
+    Release is idempotent so the agents can free the slot as soon as a response is complete, before running
+    tool calls that may start completions of their own, and again unconditionally when the stream closes.
+    """
+    def __init__(self, semaphores: List[asyncio.Semaphore], on_release: Optional[Callable[[], None]] = None) -> None:
+        self._semaphores = semaphores
+        self._on_release = on_release
+        self._released = False
+
+    def release(self) -> None:
+        if self._released:
+            return
+
+        self._released = True
+        for semaphore in reversed(self._semaphores):
+            semaphore.release()
+
+        if self._on_release is not None:
+            self._on_release()
+
+    async def __aenter__(self) -> 'CompletionSlot':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+
+class CompletionGovernor:
+    """
+    Caps the number of completions in flight across every agent runtime in the process, in total and per model.
+
+    The per agent `concurrency_limit` semaphore only throttles a single runtime, and each user gets their own
+    runtimes, so it can't protect the vendor rate limits or the process's connection pool.  A limit of 0 disables it.
+    """
+    _default: Optional['CompletionGovernor'] = None
+
+    def __init__(self, max_concurrent: int = 0, max_concurrent_per_model: int = 0,
+                 model_limits: Optional[Dict[str, int]] = None) -> None:
+        """
+        Args:
+            max_concurrent: Limit on completions in flight across all models.
+            max_concurrent_per_model: Limit on completions in flight for each model without a specific limit.
+            model_limits: Specific limits for models, by model name.
+        """
+        self.max_concurrent = max_concurrent
+        self.max_concurrent_per_model = max_concurrent_per_model
+        self.model_limits: Dict[str, int] = dict(model_limits or {})
+        self._global: Optional[asyncio.Semaphore] = None
+        self._per_model: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._waiting: int = 0
+
+    @classmethod
+    def default(cls) -> 'CompletionGovernor':
+        """
+        Returns the process wide governor, configured by LLM_MAX_CONCURRENT_COMPLETIONS and
+        LLM_MAX_CONCURRENT_COMPLETIONS_PER_MODEL.
+        """
+        if cls._default is None:
+            cls._default = cls(int(os.environ.get("LLM_MAX_CONCURRENT_COMPLETIONS", 0)),
+                               int(os.environ.get("LLM_MAX_CONCURRENT_COMPLETIONS_PER_MODEL", 0)))
+        return cls._default
+
+    def _semaphores_for(self, model_name: str) -> List[asyncio.Semaphore]:
+        semaphores = []
+        if self.max_concurrent > 0:
+            if self._global is None:
+                self._global = asyncio.Semaphore(self.max_concurrent)
+            semaphores.append(self._global)
+
+        limit = self.model_limits.get(model_name, self.max_concurrent_per_model)
+        if limit > 0:
+            if model_name not in self._per_model:
+                self._per_model[model_name] = asyncio.Semaphore(limit)
+            semaphores.append(self._per_model[model_name])
+
+        return semaphores
+
+    async def acquire(self, model_name: str) -> CompletionSlot:
+        """
+        Wait for a slot to run a completion against a model.
+        """
+        semaphores = self._semaphores_for(model_name)
+        acquired = []
+        self._waiting += 1
+        try:
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+        except BaseException:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+            raise
+        finally:
+            self._waiting -= 1
+
+        self._in_flight[model_name] = self._in_flight.get(model_name, 0) + 1
+
+        def on_release() -> None:
+            self._in_flight[model_name] -= 1
+
+        return CompletionSlot(acquired, on_release)
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Returns the configured limits and the completions currently in flight and waiting.
+        """
+        return {
+            'max_concurrent': self.max_concurrent,
+            'max_concurrent_per_model': self.max_concurrent_per_model,
+            'in_flight': sum(self._in_flight.values()),
+            'in_flight_by_model': {model: count for model, count in self._in_flight.items() if count},
+            'waiting': self._waiting,
+        }
@@ -73,6 +73,10 @@ class GPTChatAgent(BaseAgent):
     def client(cls, **opts):
         return AsyncOpenAI(**opts)
 
+    @classmethod
+    def http_client(cls, limits):
+        return openai.DefaultAsyncHttpxClient(limits=limits)
+
     @property
     def tool_format(self) -> str:
         """
@@ -247,6 +251,7 @@ class GPTChatAgent(BaseAgent):
         async with self.semaphore:
             self.logger.debug("Starting Interaction")
             interaction_id = await self._raise_interaction_start(**callback_opts)
+            self._start_history_tracking(messages, kwargs.get("chat_session"), **callback_opts)
 
             await self._raise_user_message(messages[-1], **callback_opts)
 
@@ -312,8 +317,15 @@ class GPTChatAgent(BaseAgent):
         # Initialize state
         state = self._init_stream_state()
 
-        # Start API call
-        async with await self.client.chat.completions.create(**completion_opts) as stream:
+        # Start API call, the governor slot is released as soon as the response is complete, before any tool calls run
+        slot = await self.governor.acquire(self.model_name)
+        try:
+            stream = await self.client.chat.completions.create(**completion_opts)
+        except BaseException:
+            slot.release()
+            raise
+
+        async with stream, slot:
 
             try:
                 async for chunk in stream:
@@ -325,6 +337,9 @@ class GPTChatAgent(BaseAgent):
                         state['complete'] = True
                         state['stop_reason'] = "client_cancel"
 
+                    if state['complete']:
+                        slot.release()
+
                     # If we've completed processing and it's not a tool call, we're done
                     if state['complete'] and not state['tool_calls_processed'] and state['stop_reason'] != "client_cancel":
                         # Add the collected content to messages and finalize
@@ -0,0 +1,139 @@
+from typing import Any, Dict, List, Optional
+
+
+class AnthropicPromptCacheStrategy:
+    """
+    Places Anthropic prompt cache breakpoints on a completion request.
+
+    The API caches the request prefix up to each block marked with `cache_control`, in the order
+    tools -> system -> messages, and allows at most four breakpoints per request.  Breakpoints are
+    placed, in priority order, on:
+        - The last tool, which caches the whole tool list.
+        - The system prompt, which the PromptBuilder keeps byte-stable within an interaction.
+        - The last message, so the next tool round or turn reads the history written by this one.
+        - The tail of the previous round (`lookback` messages back), so a round that appended more
+          content blocks than the API searches back through still reads from cache.
+
+    Breakpoints already present in the request (e.g. on PDF documents) count against the limit.
+    The completion options passed in are never modified, the messages in them are the chat history.
+    """
+    MAX_BREAKPOINTS: int = 4
+    UNCACHEABLE_BLOCK_TYPES = ("thinking", "redacted_thinking")
+
+    def __init__(self, enabled: bool = True, ttl: Optional[str] = None, lookback: int = 2) -> None:
+        """
+        Args:
+            enabled: When False `apply` returns the options unchanged.
+            ttl: Optional cache TTL, e.g. "1h", the API default (5 minutes) is used when None.
+            lookback: How many messages before the tail to place the rolling breakpoint, 0 disables it.
+        """
+        self.enabled = enabled
+        self.lookback = lookback
+        self.cache_control: Dict[str, str] = {"type": "ephemeral"}
+        if ttl:
+            self.cache_control["ttl"] = ttl
+
+    def apply(self, completion_opts: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return a copy of the completion options with cache breakpoints added.
+
+        Only the containers that receive a breakpoint are copied, everything else is shared with the input.
+        """
+        if not self.enabled:
+            return completion_opts
+
+        opts = dict(completion_opts)
+        budget = self.MAX_BREAKPOINTS - self.count_breakpoints(completion_opts)
+
+        tools = opts.get('tools')
+        if budget > 0 and tools:
+            opts['tools'] = list(tools)
+            opts['tools'][-1] = self._mark(tools[-1])
+            budget -= 1
+
+        system = opts.get('system')
+        if budget > 0 and system:
+            if isinstance(system, str):
+                opts['system'] = [self._mark({"type": "text", "text": system})]
+                budget -= 1
+            elif isinstance(system, list):
+                index = self._last_cacheable_block(system)
+                if index is not None:
+                    opts['system'] = list(system)
+                    opts['system'][index] = self._mark(system[index])
+                    budget -= 1
+
+        messages = opts.get('messages')
+        if budget > 0 and messages:
+            positions = [len(messages) - 1]
+            if self.lookback > 0 and len(messages) - 1 - self.lookback >= 0:
+                positions.append(len(messages) - 1 - self.lookback)
+
+            new_messages = None
+            for position in positions:
+                if budget <= 0:
+                    break
+
+                marked = self._mark_message(messages[position])
+                if marked is not None:
+                    if new_messages is None:
+                        new_messages = list(messages)
+                    new_messages[position] = marked
+                    budget -= 1
+
+            if new_messages is not None:
+                opts['messages'] = new_messages
+
+        return opts
+
+    @staticmethod
+    def count_breakpoints(completion_opts: Dict[str, Any]) -> int:
+        """
+        Count the cache breakpoints already present in a request.
+        """
+        count = sum(1 for tool in completion_opts.get('tools') or [] if isinstance(tool, dict) and 'cache_control' in tool)
+
+        system = completion_opts.get('system')
+        if isinstance(system, list):
+            count += sum(1 for block in system if isinstance(block, dict) and 'cache_control' in block)
+
+        for message in completion_opts.get('messages') or []:
+            content = message.get('content')
+            if isinstance(content, list):
+                count += sum(1 for block in content if isinstance(block, dict) and 'cache_control' in block)
+
+        return count
+
+    def _mark(self, block: Dict[str, Any]) -> Dict[str, Any]:
+        marked = dict(block)
+        marked['cache_control'] = self.cache_control
+        return marked
+
+    def _last_cacheable_block(self, blocks: List[Any]) -> Optional[int]:
+        for index in range(len(blocks) - 1, -1, -1):
+            block = blocks[index]
+            if not isinstance(block, dict) or block.get('type') in self.UNCACHEABLE_BLOCK_TYPES:
+                continue
+            if block.get('type') == 'text' and not block.get('text'):
+                continue
+            return index
+
+        return None
+
+    def _mark_message(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        content = message.get('content')
+        if isinstance(content, str):
+            if not content:
+                return None
+            return dict(message, content=[self._mark({"type": "text", "text": content})])
+
+        if not isinstance(content, list):
+            return None
+
+        index = self._last_cacheable_block(content)
+        if index is None or 'cache_control' in content[index]:
+            return None
+
+        new_content = list(content)
+        new_content[index] = self._mark(content[index])
+        return dict(message, content=new_content)
@@ -1,7 +1,9 @@
+import os
 import json
 import yaml
 
-from typing import Optional, Dict, List
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple
 
 from agent_c.config.saved_chat import SavedChatLoader
 from agent_c.models.chat_history.chat_session import ChatSession, ChatSessionQueryResponse, ChatSessionIndexEntry
@@ -17,9 +19,20 @@ class ChatSessionManager:
     to implement all methods for functionality. On its own, it's purely a blueprint.
     """
 
-    def __init__(self, loader: Optional[SavedChatLoader] = None) -> None:
+    # Rough allowance for everything in a session that isn't a message (agent config, metadata, etc.)
+    SESSION_OVERHEAD_BYTES: int = 4096
+
+    def __init__(self, loader: Optional[SavedChatLoader] = None, max_cache_bytes: Optional[int] = None,
+                 max_cached_sessions: Optional[int] = None) -> None:
         """
         Initializes a new instance of ChatSessionManager with default values.
+
+        Args:
+            loader: The loader used to persist sessions, defaults to a SavedChatLoader.
+            max_cache_bytes: Estimated memory budget for cached sessions, defaults to the
+                             CHAT_SESSION_CACHE_MAX_BYTES env var or 256MB.  0 disables the limit.
+            max_cached_sessions: Maximum number of cached sessions, defaults to the
+                                 CHAT_SESSION_CACHE_MAX_SESSIONS env var or 0 (no limit).
         """
         self.is_new_user: bool = True
         self.is_new_session: bool = True
@@ -28,6 +41,170 @@ class ChatSessionManager:
         self._session_cache: Dict[str, Dict[str, ChatSession]] = {}
         self.logger = LoggingManager(__name__).get_logger()
 
+        if max_cache_bytes is None:
+            max_cache_bytes = int(os.environ.get("CHAT_SESSION_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+        if max_cached_sessions is None:
+            max_cached_sessions = int(os.environ.get("CHAT_SESSION_CACHE_MAX_SESSIONS", 0))
+
+        self.max_cache_bytes: int = max_cache_bytes
+        self.max_cached_sessions: int = max_cached_sessions
+
+        # LRU order of cached sessions, oldest first: {(user_id, session_id): (message_count, estimated_bytes, last_use)}
+        self._lru: OrderedDict[Tuple[str, str], Tuple[int, int, int]] = OrderedDict()
+        self._use_counter: int = 0
+        self._cache_bytes: int = 0
+        # Sessions attached to a live consumer (e.g. a RealtimeBridge) are never evicted: {key: pin_count}
+        self._pins: Dict[Tuple[str, str], int] = {}
+        # Sessions handed out since they were last loaded or saved, these are flushed before eviction
+        self._dirty: set = set()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._eviction_flushes: int = 0
+
+    @staticmethod
+    def _estimate_message_bytes(messages: List[dict]) -> int:
+        total = 0
+        for message in messages:
+            try:
+                total += len(json.dumps(message, default=str))
+            except Exception:
+                total += len(str(message))
+
+        return total
+
+    def _track(self, session: ChatSession, dirty: bool = True) -> None:
+        """
+        Add or refresh a session in the cache, mark it most recently used and update its size estimate.
+
+        Size estimates are incremental; only messages appended since the last estimate are measured
+        unless the history shrank, in which case the whole history is re-measured.
+        """
+        key = (session.user_id, session.session_id)
+        user_sessions = self._session_cache.setdefault(session.user_id, {})
+        same_object = user_sessions.get(session.session_id) is session
+        user_sessions[session.session_id] = session
+
+        count = len(session.messages)
+        old_count, old_bytes, _ = self._lru.get(key, (0, 0, 0))
+        if same_object and key in self._lru and count >= old_count:
+            new_bytes = old_bytes + self._estimate_message_bytes(session.messages[old_count:])
+        else:
+            new_bytes = self.SESSION_OVERHEAD_BYTES + self._estimate_message_bytes(session.messages)
+
+        self._cache_bytes += new_bytes - old_bytes
+        self._use_counter += 1
+        self._lru[key] = (count, new_bytes, self._use_counter)
+        self._lru.move_to_end(key)
+
+        if dirty:
+            self._dirty.add(key)
+
+    def _untrack(self, session_id: str, user_id: str) -> Optional[ChatSession]:
+        """
+        Remove a session from the cache and its bookkeeping, pins are left alone.
+        """
+        key = (user_id, session_id)
+        _, size, _ = self._lru.pop(key, (0, 0, 0))
+        self._cache_bytes -= size
+        self._dirty.discard(key)
+
+        user_sessions = self._session_cache.get(user_id)
+        if user_sessions is None:
+            return None
+
+        session = user_sessions.pop(session_id, None)
+        if not user_sessions:
+            del self._session_cache[user_id]
+
+        return session
+
+    def _over_budget(self) -> bool:
+        if 0 < self.max_cache_bytes < self._cache_bytes:
+            return True
+
+        return 0 < self.max_cached_sessions < len(self._lru)
+
+    async def _enforce_budget(self) -> None:
+        """
+        Evict least recently used, unpinned sessions until the cache is within budget.
+
+        Dirty sessions are saved through the loader before being dropped, a session that fails
+        to save is kept so that nothing is lost.
+        """
+        if not self._over_budget():
+            return
+
+        for key in list(self._lru.keys()):
+            if not self._over_budget():
+                break
+
+            if self._pins.get(key, 0) > 0 or key not in self._lru:
+                continue
+
+            user_id, session_id = key
+            session = self._session_cache.get(user_id, {}).get(session_id)
+            if session is not None and key in self._dirty and len(session.messages) > 0:
+                last_use = self._lru[key][2]
+                try:
+                    await self._loader.save_session(session)
+                    self._eviction_flushes += 1
+                except Exception as e:
+                    self.logger.exception(f"Failed to save session {session_id} for user {user_id} before eviction: {e}")
+                    continue
+
+                # The session may have been used or pinned while we were saving, if so it stays
+                if key not in self._lru or self._lru[key][2] != last_use:
+                    continue
+
+                self._dirty.discard(key)
+                if self._pins.get(key, 0) > 0:
+                    continue
+
+            self._untrack(session_id, user_id)
+            self._evictions += 1
+            self.logger.debug(f"Evicted session {session_id} for user {user_id} from the session cache")
+
+        if self._over_budget():
+            self.logger.warning(f"Session cache is over budget ({self._cache_bytes} bytes, {len(self._lru)} sessions) "
+                                f"but the remaining sessions are pinned or could not be saved")
+
+    async def pin_session(self, session: ChatSession) -> None:
+        """
+        Pin a session in the cache so that it is not evicted while a live consumer is attached to it.
+        Pins are counted, each call must be matched by a call to `unpin_session`.
+
+        Args:
+            session: The ChatSession to pin, it is added to the cache if not already present.
+        """
+        key = (session.user_id, session.session_id)
+        self._pins[key] = self._pins.get(key, 0) + 1
+        self._track(session)
+        await self._enforce_budget()
+
+    async def unpin_session(self, session_id: str, user_id: str) -> None:
+        """
+        Release one pin on a session, once unpinned it is subject to normal LRU eviction.
+
+        Args:
+            session_id: The session ID to unpin
+            user_id: The user ID who owns the session
+        """
+        key = (user_id, session_id)
+        count = self._pins.get(key, 0) - 1
+        if count > 0:
+            self._pins[key] = count
+        else:
+            self._pins.pop(key, None)
+
+        await self._enforce_budget()
+
+    def is_pinned(self, session_id: str, user_id: str) -> bool:
+        """
+        Returns True if the session is pinned by at least one consumer.
+        """
+        return self._pins.get((user_id, session_id), 0) > 0
+
     async def initialize(self) -> dict:
         """
         Initialize the chat session manager and underlying storage.
@@ -49,11 +226,8 @@ class ChatSessionManager:
             user_id (str): The user ID who owns the session.
         """
         # Remove from user's cache if present
-        if user_id in self._session_cache and session_id in self._session_cache[user_id]:
-            del self._session_cache[user_id][session_id]
-            # Clean up empty user cache
-            if not self._session_cache[user_id]:
-                del self._session_cache[user_id]
+        self._untrack(session_id, user_id)
+        self._pins.pop((user_id, session_id), None)
 
         await self._loader.delete_session(session_id, user_id)
 
@@ -64,15 +238,9 @@ class ChatSessionManager:
         Args:
             session: The ChatSession to create
         """
-        user_id = session.user_id
-        
-        # Ensure user cache exists
-        if user_id not in self._session_cache:
-            self._session_cache[user_id] = {}
-        
-        # Add to user's cache
-        self._session_cache[user_id][session.session_id] = session
+        self._track(session)
         session.touch()
+        await self._enforce_budget()
 
     async def get_session(self, session_id: str, user_id: str) -> Optional[ChatSession]:
         """
@@ -87,21 +255,24 @@ class ChatSessionManager:
         """
         # Check user's cache first
         if user_id in self._session_cache and session_id in self._session_cache[user_id]:
-            return self._session_cache[user_id][session_id]
+            self._hits += 1
+            session = self._session_cache[user_id][session_id]
+            self._track(session)
+            return session
 
         # Try to load from storage
+        self._misses += 1
         try:
             session = self._loader.load_session_id(session_id, user_id)
-            
-            # Add to user's cache
-            if user_id not in self._session_cache:
-                self._session_cache[user_id] = {}
-            self._session_cache[user_id][session_id] = session
-            
-            return session
         except FileNotFoundError:
             return None
 
+        # Add to user's cache
+        self._track(session)
+        await self._enforce_budget()
+
+        return session
+
     async def update(self) -> None:
         """
         Asynchronously updates the cached session and user. Meant to sync in-memory changes.
@@ -109,8 +280,17 @@ class ChatSessionManager:
         pass
 
     async def release_session(self, session_id: str, user_id: str):
-        if user_id in self._session_cache and session_id in self._session_cache[user_id]:
-            del self._session_cache[user_id][session_id]
+        """
+        Drops a session from the cache. Pinned sessions stay cached until they are unpinned.
+
+        Args:
+            session_id: The session ID to release
+            user_id: The user ID who owns the session
+        """
+        if self.is_pinned(session_id, user_id):
+            return
+
+        self._untrack(session_id, user_id)
 
     async def flush(self, session_id: str, user_id: str) -> None:
         """
@@ -129,6 +309,7 @@ class ChatSessionManager:
             return
             
         await self._loader.save_session(session)
+        self._dirty.discard((user_id, session_id))
 
     async def flush_and_release(self, session_id: str, user_id: str) -> None:
         """
@@ -149,10 +330,7 @@ class ChatSessionManager:
             session: The ChatSession to flush
             touch: Whether to update the session's updated_at timestamp (default True)
         """
-        if session.user_id not in self._session_cache:
-            self._session_cache[session.user_id] = {}
-
-        self._session_cache[session.user_id][session.session_id] = session
+        self._track(session)
 
         if  len(session.messages) == 0:
             self.logger.warning(f"Session {session.session_id} for user {session.user_id} is empty or not found, skipping flush.")
@@ -162,6 +340,8 @@ class ChatSessionManager:
             session.touch()
 
         await self._loader.save_session(session)
+        self._dirty.discard((session.user_id, session.session_id))
+        await self._enforce_budget()
 
     async def flush_and_release_session(self, session: ChatSession, touch: bool = True) -> None:
         """
@@ -253,7 +433,8 @@ class ChatSessionManager:
             user_id: The user ID to clear cache for
         """
         if user_id in self._session_cache:
-            del self._session_cache[user_id]
+            for session_id in list(self._session_cache[user_id].keys()):
+                self._untrack(session_id, user_id)
             self.logger.debug(f"Cleared session cache for user {user_id}")
     
     async def get_all_users_with_sessions(self) -> List[str]:
@@ -294,12 +475,23 @@ class ChatSessionManager:
             Dictionary with cache statistics
         """
         total_sessions = sum(len(user_sessions) for user_sessions in self._session_cache.values())
-        
+        lookups = self._hits + self._misses
+
         return {
             "total_users_cached": len(self._session_cache),
             "total_sessions_cached": total_sessions,
             "users_with_sessions": [user_id for user_id in self._session_cache.keys()],
-            "sessions_per_user": {user_id: len(sessions) for user_id, sessions in self._session_cache.items()}
+            "sessions_per_user": {user_id: len(sessions) for user_id, sessions in self._session_cache.items()},
+            "estimated_bytes": self._cache_bytes,
+            "max_bytes": self.max_cache_bytes,
+            "max_sessions": self.max_cached_sessions,
+            "pinned_sessions": len(self._pins),
+            "dirty_sessions": len(self._dirty),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "eviction_flushes": self._eviction_flushes,
         }
 
     def filtered_session_meta(self, prefix: str) -> Dict:
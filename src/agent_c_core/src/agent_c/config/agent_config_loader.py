@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional, List, TypeVar
 
 from agent_c.models import ModelConfigurationFile
 from agent_c.config import ModelConfigurationLoader
+from agent_c.config.block_store import BlockStore
 from agent_c.config.config_loader import ConfigLoader
 from agent_c.util import SingletonCacheMeta, shared_cache_registry, CacheNames, to_snake_case
 from agent_c.models.agent_config import (
@@ -56,32 +57,18 @@ class AgentConfigLoader(ConfigLoader, metaclass=SingletonCacheMeta):
         self.agent_config_folder = Path(self.config_path).joinpath("agents")
         self.block_folder = Path(self.config_path).joinpath("blocks")
         self._agent_config_cache: Dict[str, AgentConfiguration] = {}
-        self._block_cache: Dict[str, str] = {}
+        self.block_store = BlockStore(self.block_folder)
         self._default_model = default_model
         self._migration_log: Dict[str, Dict[str, Any]] = {}
         self.load_agents()
-        self.load_blocks()
 
     async def get_block(self, block_key: str) -> Optional[str]:
-        """Retrieve a block by name from the cache."""
-        block = self._block_cache.get(block_key)
-        if not block:
-            self.load_blocks()
-
-        return self._block_cache.get(block_key.replace("blocks_", "block_"), None)
+        """Retrieve a block by name, reading its file only if it's new or changed."""
+        return await self.block_store.get(block_key)
 
     def load_blocks(self):
-        file_paths = glob.glob(os.path.join(self.block_folder, "**/*.md"), recursive=True)
-
-        for file_path in file_paths:
-            key = file_path.removeprefix(str(self.block_folder)).replace("\\", "/").removeprefix("/").removesuffix(".md").replace("/", "_")
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                    self._block_cache[f"block_{key}"] = content
-            except Exception as e:
-                self.logger.exception(f"Failed to read block file {file_path}: {e}", exc_info=True)
-
+        """Drop all cached blocks so each is read from disk again on its next request."""
+        self.block_store.reload()
 
     def load_agents(self):
         """Load all agent configurations with caching."""
@@ -0,0 +1,255 @@
+"""
+Instruction blocks loaded from a folder of markdown files.
+
+Each `.md` file below the folder is a block keyed by its relative path, `blocks/team/rules.md`
+becomes `block_team_rules`.  Blocks are read the first time they're asked for, and are only read
+again once their own file changes:
+
+- Every block remembers the modification time and size of the file it was read from.  When the
+  folder is checked, a block whose file changed is dropped and re-read on its next request, the
+  rest are left alone.
+- The folder is only walked again when a directory's modification time changes, i.e. when block
+  files are added, removed or renamed.
+- A key without a file is remembered as missing until the next walk, so a prompt referencing a
+  block that doesn't exist costs a dictionary lookup instead of a folder scan.
+
+When `watchdog` is installed, file system events tell the store what changed.  Otherwise the
+folder is polled at most once every `poll_interval` seconds, on the next request.
+"""
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple, Union, Any
+
+from agent_c.util.logging_utils import LoggingManager
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+# (mtime_ns, size) of a file or directory, None when it doesn't exist
+Signature = Optional[Tuple[int, int]]
+
+
+def _signature(path: Union[str, Path]) -> Signature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _BlockEventHandler(FileSystemEventHandler):
+    def __init__(self, store: 'BlockStore'):
+        super().__init__()
+        self.store = store
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory:
+            if event.event_type in ('created', 'deleted', 'moved'):
+                self.store.mark_rescan()
+            return
+
+        if event.event_type in ('modified', 'created', 'deleted', 'moved'):
+            self.store.mark_changed(event.src_path)
+        # Editors save by writing a temporary file and moving it over the block, the destination is what changed
+        if event.event_type == 'moved':
+            self.store.mark_changed(event.dest_path)
+        if event.event_type in ('created', 'deleted', 'moved'):
+            self.store.mark_rescan()
+
+
+class BlockStore:
+    """
+    Cache of the instruction blocks in a folder, kept in step with the files on disk.
+
+    Args:
+        block_folder: Folder holding the block files, it doesn't need to exist yet
+        poll_interval: Least number of seconds between checks of the folder when it isn't watched
+        watch: Use file system events when `watchdog` is available instead of polling
+    """
+
+    def __init__(self, block_folder: Union[str, Path], poll_interval: float = 2.0, watch: bool = True):
+        self.block_folder = Path(os.path.abspath(block_folder))
+        self.poll_interval = poll_interval
+        self.logger = LoggingManager(__name__).get_logger()
+
+        self._lock = threading.Lock()
+        self._paths: Dict[str, str] = {}
+        self._dir_signatures: Dict[str, Signature] = {}
+        self._blocks: Dict[str, Tuple[str, Signature]] = {}
+        self._missing: Set[str] = set()
+        self._changed_paths: Set[str] = set()
+        self._rescan_needed = False
+        self._last_check = time.monotonic()
+        self._stats = {'hits': 0, 'reads': 0, 'missing': 0, 'rescans': 0}
+
+        self._observer = None
+        if watch and Observer is not None:
+            self._start_watching()
+
+        self._apply_scan(self._scan())
+
+    @staticmethod
+    def normalize_key(block_key: str) -> str:
+        return block_key.replace("blocks_", "block_", 1) if block_key.startswith("blocks_") else block_key
+
+    def key_for_path(self, file_path: Union[str, Path]) -> str:
+        relative = os.path.relpath(file_path, self.block_folder).replace("\\", "/").removesuffix(".md")
+        return f"block_{relative.replace('/', '_')}"
+
+    @property
+    def watching(self) -> bool:
+        return self._observer is not None
+
+    async def get(self, block_key: str) -> Optional[str]:
+        """Return the content of a block, or None if there's no file for it."""
+        key = self.normalize_key(block_key)
+        await self._refresh()
+
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                self._stats['hits'] += 1
+                return block[0]
+
+            if key in self._missing:
+                self._stats['missing'] += 1
+                return None
+
+            path = self._paths.get(key)
+
+        if path is None:
+            with self._lock:
+                self._missing.add(key)
+                self._stats['missing'] += 1
+            return None
+
+        content, signature = await asyncio.to_thread(self._read, path)
+        with self._lock:
+            self._stats['reads'] += 1
+            if content is None:
+                self._missing.add(key)
+            elif self._paths.get(key) == path:
+                self._blocks[key] = (content, signature)
+
+        return content
+
+    def reload(self) -> None:
+        """Forget every cached block and walk the folder again."""
+        scan = self._scan()
+        with self._lock:
+            self._blocks.clear()
+        self._apply_scan(scan)
+
+    def mark_changed(self, file_path: str) -> None:
+        """Note that a block file changed, it's re-read on its next request."""
+        with self._lock:
+            self._changed_paths.add(os.path.abspath(file_path))
+
+    def mark_rescan(self) -> None:
+        """Note that block files were added or removed, the folder is walked again on the next request."""
+        with self._lock:
+            self._rescan_needed = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, files=len(self._paths), cached=len(self._blocks),
+                        known_missing=len(self._missing), watching=self.watching)
+
+    def close(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def _start_watching(self) -> None:
+        # A folder that doesn't exist yet is polled, so its creation is noticed
+        if not self.block_folder.is_dir():
+            return
+
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_BlockEventHandler(self), str(self.block_folder), recursive=True)
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            self.logger.warning(f"Could not watch {self.block_folder}, falling back to polling: {e}")
+
+    async def _refresh(self) -> None:
+        if self._observer is not None:
+            with self._lock:
+                changed, self._changed_paths = self._changed_paths, set()
+                rescan, self._rescan_needed = self._rescan_needed, False
+                if changed:
+                    for key in [key for key, path in self._paths.items() if path in changed]:
+                        self._blocks.pop(key, None)
+                        self._missing.discard(key)
+        else:
+            now = time.monotonic()
+            if now - self._last_check < self.poll_interval:
+                return
+            self._last_check = now
+            rescan = self._check_files()
+
+        if rescan:
+            self._apply_scan(await asyncio.to_thread(self._scan))
+
+    def _check_files(self) -> bool:
+        """Drop blocks whose file changed, returns True if the folder needs to be walked again."""
+        with self._lock:
+            blocks = {key: (self._paths[key], block[1]) for key, block in self._blocks.items()}
+            dir_signatures = dict(self._dir_signatures)
+
+        stale = [key for key, (path, signature) in blocks.items() if _signature(path) != signature]
+        rescan = any(_signature(folder) != signature for folder, signature in dir_signatures.items())
+
+        with self._lock:
+            for key in stale:
+                self._blocks.pop(key, None)
+        return rescan
+
+    def _scan(self) -> Tuple[Dict[str, str], Dict[str, Signature]]:
+        paths: Dict[str, str] = {}
+        dir_signatures: Dict[str, Signature] = {str(self.block_folder): _signature(self.block_folder)}
+        for dir_path, dir_names, file_names in os.walk(self.block_folder):
+            dir_names.sort()
+            for dir_name in dir_names:
+                folder = os.path.join(dir_path, dir_name)
+                dir_signatures[folder] = _signature(folder)
+            for file_name in sorted(file_names):
+                if file_name.endswith(".md"):
+                    path = os.path.abspath(os.path.join(dir_path, file_name))
+                    paths[self.key_for_path(path)] = path
+
+        return paths, dir_signatures
+
+    def _apply_scan(self, scan: Tuple[Dict[str, str], Dict[str, Signature]]) -> None:
+        paths, dir_signatures = scan
+        with self._lock:
+            blocks = {key: block[1] for key, block in self._blocks.items()}
+
+        # A file replaced in place keeps its path, so cached blocks are checked against their file as well
+        stale = {key for key, signature in blocks.items() if key in paths and _signature(paths[key]) != signature}
+        with self._lock:
+            for key in [key for key in self._blocks if key in stale or paths.get(key) != self._paths.get(key)]:
+                del self._blocks[key]
+            self._paths = paths
+            self._dir_signatures = dir_signatures
+            self._missing.clear()
+            self._stats['rescans'] += 1
+
+    def _read(self, path: str) -> Tuple[Optional[str], Signature]:
+        signature = _signature(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return file.read(), signature
+        except Exception as e:
+            self.logger.exception(f"Failed to read block file {path}: {e}", exc_info=True)
+            return None, None
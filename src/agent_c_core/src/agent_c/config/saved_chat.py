@@ -573,6 +573,22 @@ class SavedChatLoader(ConfigLoader):
         except Exception as e:
             self.logger.error(f"Failed to update index for session {session.session_id}: {e}")
 
+    async def purge_session(self, session_id: str, user_id: str) -> None:
+        """
+        Permanently remove a chat session file and its index entry, unlike `delete_session` nothing is kept.
+
+        Args:
+            session_id: The ID of the session to remove
+            user_id: The user ID to determine which subfolder to search
+        """
+        session_file = self._get_user_folder(user_id) / f"{session_id}.json"
+        session_file.unlink(missing_ok=True)
+
+        try:
+            await self._delete_index_entry(session_id)
+        except Exception as e:
+            self.logger.error(f"Failed to delete index for session {session_id}: {e}")
+
     async def delete_session(self, session_id: str, user_id: str) -> None:
         """
         Delete a chat session file by its ID from the user's subfolder.
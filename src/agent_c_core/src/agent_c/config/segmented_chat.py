@@ -0,0 +1,414 @@
+"""
+Append-only, segmented storage backend for chat sessions.
+
+The JSON backend in `SavedChatLoader` rewrites the entire session file every time a
+session is flushed.  This backend keeps the session header and the message history
+apart so that flushing a turn only writes the messages added since the last flush.
+
+Each session is stored in a `<session_id>.seg` folder inside the user's folder:
+
+- `session.json`:  The session without its messages, plus the store manifest.  Small and
+  rewritten atomically on every save.
+- `messages.idx`:  A fixed width record per message (segment number, byte offset, byte
+  length, crc32) used to find any message without scanning the log.
+- `segment_NNNNN.log`:  Append-only JSON lines logs holding the message bodies.  A new
+  segment is started once the active one grows past `segment_bytes`.
+
+Messages that change after being written (rewound sessions, rewritten system prompts)
+are appended again and their index record is repointed, leaving dead bytes behind.
+Once dead bytes make up more than `compaction_ratio` of the log the session is compacted
+into fresh segments.
+"""
+import datetime
+import json
+import os
+import shutil
+import struct
+import zlib
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
+
+from agent_c.config.saved_chat import SavedChatLoader
+from agent_c.models.chat_history.chat_session import ChatSession
+
+
+class SegmentedChatLoader(SavedChatLoader):
+    """
+    Chat session loader that persists messages as an append-only segment log.
+
+    Sessions saved by the JSON backend are still loaded, and are migrated to the
+    segmented format the first time they are saved.
+    """
+    STORE_SUFFIX = ".seg"
+    STORE_VERSION = 1
+    INDEX_RECORD = struct.Struct("<IQII")  # segment, offset, length, crc32
+
+    def __init__(self, config_path: Optional[str] = None, segment_bytes: int = 8 * 1024 * 1024,
+                 compaction_ratio: float = 0.5, compaction_min_bytes: int = 256 * 1024):
+        super().__init__(config_path)
+        self.segment_bytes: int = segment_bytes
+        self.compaction_ratio: float = compaction_ratio
+        self.compaction_min_bytes: int = compaction_min_bytes
+
+    def _get_session_folder(self, session_id: str, user_id: str) -> Path:
+        return self._get_user_folder(user_id) / f"{session_id}{self.STORE_SUFFIX}"
+
+    def _legacy_session_file(self, session_id: str, user_id: str) -> Path:
+        return self._get_user_folder(user_id) / f"{session_id}.json"
+
+    @staticmethod
+    def _segment_file(folder: Path, segment: int) -> Path:
+        return folder / f"segment_{segment:05d}.log"
+
+    @staticmethod
+    def _encode_message(message: Dict[str, Any]) -> bytes:
+        return json.dumps(message).encode("utf-8") + b"\n"
+
+    @staticmethod
+    def _empty_manifest() -> Dict[str, Any]:
+        return {"version": SegmentedChatLoader.STORE_VERSION, "message_count": 0, "active_segment": 0,
+                "segment_sizes": {"0": 0}, "live_bytes": 0, "dead_bytes": 0}
+
+    def _read_header(self, folder: Path) -> Dict[str, Any]:
+        with open(folder / "session.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_header(self, folder: Path, session_data: Dict[str, Any], manifest: Dict[str, Any]) -> None:
+        tmp_file = folder / "session.json.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"store": manifest, "session": session_data}, f, indent=4)
+
+        os.replace(tmp_file, folder / "session.json")
+
+    def _read_index(self, folder: Path, count: int, start: int = 0) -> List[Tuple[int, int, int, int]]:
+        """Read `count` index records starting at message `start`."""
+        record_size = self.INDEX_RECORD.size
+        with open(folder / "messages.idx", 'rb') as f:
+            f.seek(start * record_size)
+            data = f.read(count * record_size)
+
+        return [self.INDEX_RECORD.unpack_from(data, i * record_size) for i in range(len(data) // record_size)]
+
+    def _read_messages(self, folder: Path, records: List[Tuple[int, int, int, int]]) -> List[Dict[str, Any]]:
+        messages: List[Dict[str, Any]] = []
+        handles: Dict[int, Any] = {}
+        try:
+            for segment, offset, length, _ in records:
+                handle = handles.get(segment)
+                if handle is None:
+                    handle = handles[segment] = open(self._segment_file(folder, segment), 'rb')
+
+                handle.seek(offset)
+                messages.append(json.loads(handle.read(length)))
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+        return messages
+
+    def _append_messages(self, folder: Path, manifest: Dict[str, Any],
+                         encoded: List[bytes]) -> List[Tuple[int, int, int, int]]:
+        """Append encoded messages to the active segment, rolling segments as they fill."""
+        records: List[Tuple[int, int, int, int]] = []
+        sizes: Dict[str, int] = manifest["segment_sizes"]
+        segment: int = manifest["active_segment"]
+        handle = open(self._segment_file(folder, segment), 'ab')
+        try:
+            for data in encoded:
+                # Offsets come from the file itself so bytes left by an interrupted save are skipped over
+                offset = handle.seek(0, os.SEEK_END)
+                if offset > 0 and offset + len(data) > self.segment_bytes:
+                    handle.close()
+                    segment += 1
+                    handle = open(self._segment_file(folder, segment), 'ab')
+                    offset = handle.seek(0, os.SEEK_END)
+
+                records.append((segment, offset, len(data), zlib.crc32(data)))
+                handle.write(data)
+                sizes[str(segment)] = offset + len(data)
+                manifest["live_bytes"] += len(data)
+        finally:
+            handle.close()
+
+        manifest["active_segment"] = segment
+        return records
+
+    def _diverged_messages(self, folder: Path, manifest: Dict[str, Any], encoded: Dict[int, bytes],
+                           messages: List[Dict[str, Any]], offset: int = 0,
+                           changed_from: Optional[int] = 0) -> Tuple[int, List[int]]:
+        """
+        Find which stored messages no longer match the session.
+
+        Stored messages from `changed_from` (an index into `messages`) on are compared by crc32,
+        the ones before it are kept as they are, as are messages before `offset`, which weren't
+        loaded.  With `changed_from` None the session only appended messages and none are compared.
+
+        Returns:
+            The number of stored messages to keep, and the indexes of kept messages that changed.
+        """
+        stored = manifest["message_count"]
+        keep = min(stored, offset + len(messages))
+        start = keep if changed_from is None else offset + changed_from
+        if keep <= start:
+            return keep, []
+
+        def crc(i: int) -> int:
+            if i not in encoded:
+                encoded[i] = self._encode_message(messages[i - offset])
+            return zlib.crc32(encoded[i])
+
+        records = self._read_index(folder, keep - start, start)
+        return keep, [i for i, record in enumerate(records, start) if record[3] != crc(i)]
+
+    def _compact(self, folder: Path, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rewrite the live messages of a session into fresh segments and drop the old ones.
+        """
+        count = manifest["message_count"]
+        messages = self._read_messages(folder, self._read_index(folder, count))
+        old_segments = [int(s) for s in manifest["segment_sizes"].keys()]
+
+        compacted = self._empty_manifest()
+        compacted["active_segment"] = max(old_segments) + 1
+        compacted["segment_sizes"] = {str(compacted["active_segment"]): 0}
+        records = self._append_messages(folder, compacted, [self._encode_message(m) for m in messages])
+
+        tmp_index = folder / "messages.idx.tmp"
+        with open(tmp_index, 'wb') as f:
+            f.write(b"".join(self.INDEX_RECORD.pack(*r) for r in records))
+        os.replace(tmp_index, folder / "messages.idx")
+
+        compacted["message_count"] = count
+        for segment in old_segments:
+            self._segment_file(folder, segment).unlink(missing_ok=True)
+
+        self.logger.debug(f"Compacted session store {folder}, reclaimed {manifest['dead_bytes']} bytes")
+        return compacted
+
+    def _session_data(self, session: ChatSession) -> Dict[str, Any]:
+        return session.model_dump(exclude={'display_name', 'vendor', 'messages'})
+
+    def _write_session_store(self, session: ChatSession) -> None:
+        folder = self._get_session_folder(session.session_id, session.user_id)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        if (folder / "session.json").exists():
+            manifest = self._read_header(folder)["store"]
+        else:
+            manifest = self._empty_manifest()
+            open(folder / "messages.idx", 'wb').close()
+
+        # A session loaded with a message window holds the stored history from message_offset on
+        messages = session.messages
+        offset = session.message_offset
+        if offset > manifest["message_count"]:
+            raise ValueError(f"Session {session.session_id} was loaded from message {offset} but only "
+                             f"{manifest['message_count']} messages are stored, reload it before saving")
+
+        # Only the messages the session signalled as changed are compared, unless the store moved on since the
+        # session was loaded or last saved, or the session didn't come from the store at all
+        changed_from = session.messages_changed_from
+        if session.flushed_message_count != manifest["message_count"]:
+            changed_from = 0
+
+        encoded: Dict[int, bytes] = {}
+        keep, changed = self._diverged_messages(folder, manifest, encoded, messages, offset, changed_from)
+
+        with open(folder / "messages.idx", 'r+b') as index:
+            # Records past the manifest count are from dropped messages or an interrupted save
+            dropped = self._read_index(folder, manifest["message_count"] - keep, keep)
+            manifest["dead_bytes"] += sum(r[2] for r in dropped)
+            manifest["live_bytes"] -= sum(r[2] for r in dropped)
+            index.truncate(keep * self.INDEX_RECORD.size)
+
+            if changed:
+                old_records = {i: self._read_index(folder, 1, i)[0] for i in changed}
+                new_records = self._append_messages(folder, manifest, [encoded[i] for i in changed])
+                for i, record in zip(changed, new_records):
+                    index.seek(i * self.INDEX_RECORD.size)
+                    index.write(self.INDEX_RECORD.pack(*record))
+                    manifest["dead_bytes"] += old_records[i][2]
+                    manifest["live_bytes"] -= old_records[i][2]
+
+            appended = [encoded.get(i) or self._encode_message(messages[i - offset]) for i in range(keep, offset + len(messages))]
+            if appended:
+                records = self._append_messages(folder, manifest, appended)
+                index.seek(keep * self.INDEX_RECORD.size)
+                index.write(b"".join(self.INDEX_RECORD.pack(*r) for r in records))
+
+        manifest["message_count"] = offset + len(messages)
+
+        total_bytes = manifest["live_bytes"] + manifest["dead_bytes"]
+        if manifest["dead_bytes"] >= self.compaction_min_bytes and manifest["dead_bytes"] > total_bytes * self.compaction_ratio:
+            manifest = self._compact(folder, manifest)
+
+        self._write_header(folder, self._session_data(session), manifest)
+        session.flushed_message_count = manifest["message_count"]
+        session.messages_changed_from = None
+
+    async def save_session(self, session: ChatSession) -> None:
+        """
+        Save a chat session, writing only the messages added or changed since the last save.
+
+        Args:
+            session: ChatSession instance to save
+        """
+        self._write_session_store(session)
+
+        legacy_file = self._legacy_session_file(session.session_id, session.user_id)
+        if legacy_file.exists():
+            legacy_file.unlink()
+            self.logger.info(f"Migrated session {session.session_id} to segmented storage")
+
+        try:
+            await self._update_index_entry(session)
+        except Exception as e:
+            self.logger.error(f"Failed to update index for session {session.session_id}: {e}")
+
+    def _load_from_folder(self, folder: Path, message_window: Optional[int] = None) -> ChatSession:
+        header = self._read_header(folder)
+        count = header["store"]["message_count"]
+        start = 0 if message_window is None else max(count - message_window, 0)
+        session_data = header["session"]
+        session_data["messages"] = self._read_messages(folder, self._read_index(folder, count - start, start))
+        session = ChatSession.model_validate(session_data)
+        session.message_offset = start
+        session.flushed_message_count = count
+        session.messages_changed_from = None
+        return session
+
+    def load_session_id(self, session_id: str, user_id: str, message_window: Optional[int] = None) -> ChatSession:
+        """
+        Load a chat session by its ID.
+
+        Args:
+            session_id: The ID of the session to load
+            user_id: The user ID to determine which subfolder to search
+            message_window: If provided, only the most recent `message_window` messages are loaded,
+                            older ones can be paged in with `load_messages`.  The session's
+                            `message_offset` records where the window starts, saving it keeps
+                            the messages before the window.
+
+        Returns:
+            ChatSession instance with the loaded data
+
+        Raises:
+            FileNotFoundError: If the session doesn't exist in either format
+        """
+        folder = self._get_session_folder(session_id, user_id)
+        if (folder / "session.json").exists():
+            return self._load_from_folder(folder, message_window)
+
+        return super().load_session_id(session_id, user_id)
+
+    def load_messages(self, session_id: str, user_id: str, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Page in messages of a stored session without loading the rest of it.
+
+        Args:
+            session_id: The ID of the session
+            user_id: The user ID who owns the session
+            offset: The index of the first message to return
+            limit: The maximum number of messages to return, all remaining messages if None
+
+        Returns:
+            The requested messages in vendor format
+        """
+        folder = self._get_session_folder(session_id, user_id)
+        if not (folder / "session.json").exists():
+            return self.load_session_id(session_id, user_id).messages[offset:None if limit is None else offset + limit]
+
+        count = self._read_header(folder)["store"]["message_count"]
+        offset = min(max(offset, 0), count)
+        limit = count - offset if limit is None else min(limit, count - offset)
+        return self._read_messages(folder, self._read_index(folder, limit, offset))
+
+    def get_message_count(self, session_id: str, user_id: str) -> int:
+        """
+        Get the number of messages in a stored session from the manifest.
+        """
+        folder = self._get_session_folder(session_id, user_id)
+        if not (folder / "session.json").exists():
+            return len(self.load_session_id(session_id, user_id).messages)
+
+        return self._read_header(folder)["store"]["message_count"]
+
+    async def compact_session(self, session_id: str, user_id: str) -> None:
+        """
+        Compact a stored session regardless of how many dead bytes it has.
+        """
+        folder = self._get_session_folder(session_id, user_id)
+        header = self._read_header(folder)
+        self._write_header(folder, header["session"], self._compact(folder, header["store"]))
+
+    async def delete_session(self, session_id: str, user_id: str) -> None:
+        """
+        Delete a chat session by moving its store to the user's deleted folder.
+
+        Args:
+            session_id: The ID of the session to delete
+            user_id: The user ID to determine which subfolder to search
+
+        Raises:
+            FileNotFoundError: If the session doesn't exist
+        """
+        folder = self._get_session_folder(session_id, user_id)
+        if not folder.exists():
+            return await super().delete_session(session_id, user_id)
+
+        header = self._read_header(folder)
+        header["session"]["deleted_at"] = datetime.datetime.now().isoformat()
+        self._write_header(folder, header["session"], header["store"])
+
+        deleted_folder = self._get_user_folder(user_id) / "deleted"
+        deleted_folder.mkdir(parents=True, exist_ok=True)
+        target = deleted_folder / folder.name
+        if target.exists():
+            shutil.rmtree(target)
+        folder.rename(target)
+
+        try:
+            await self._delete_index_entry(session_id)
+        except Exception as e:
+            self.logger.error(f"Failed to delete index for session {session_id}: {e}")
+
+        self.logger.info(f"Deleted session store: {folder}")
+
+    def _session_ids_in_folder(self, user_folder: Path) -> List[str]:
+        ids = {f.stem for f in user_folder.glob("*.json")}
+        ids.update(f.name.removesuffix(self.STORE_SUFFIX) for f in user_folder.glob(f"*{self.STORE_SUFFIX}") if f.is_dir())
+        return list(ids)
+
+    def get_user_session_ids(self, user_id: str) -> List[str]:
+        user_folder = self._get_user_folder(user_id)
+        if not user_folder.exists():
+            return []
+
+        return self._session_ids_in_folder(user_folder)
+
+    @property
+    def session_id_list(self) -> List[str]:
+        if not self.save_file_folder.exists():
+            return []
+
+        all_sessions = []
+        for user_folder in self.save_file_folder.iterdir():
+            if user_folder.is_dir() and user_folder.name != "deleted":
+                all_sessions.extend(self._session_ids_in_folder(user_folder))
+
+        return all_sessions
+
+    async def _rebuild_index_for_user_folder(self, user_folder: Path, stats: dict) -> None:
+        await super()._rebuild_index_for_user_folder(user_folder, stats)
+
+        for folder in user_folder.glob(f"*{self.STORE_SUFFIX}"):
+            try:
+                session_data = self._read_header(folder)["session"]
+                session = ChatSession.model_validate(session_data)
+                await self._create_index_entry(session)
+                stats["indexed_sessions"] += 1
+                stats["users_processed"].add(session.user_id)
+            except Exception as e:
+                error_msg = f"Failed to index {folder}: {e}"
+                stats["errors"].append(error_msg)
+                self.logger.error(error_msg)
@@ -1,10 +1,50 @@
 from fnmatch import fnmatch
-from typing import Optional, List, Any, Union, Literal, Dict
+from typing import Optional, List, Any, Union, Literal, Dict, Sequence
 from pydantic import Field, ConfigDict, computed_field
 
 from agent_c.models.base import BaseModel
 from agent_c.models.completion import CompletionParams
 
+def filter_tool_schemas(schemas: Sequence[Dict[str, Any]], blocked_patterns: Sequence[str],
+                        allowed_patterns: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Filter tool schemas based on name patterns, see `AgentConfigurationBase.filter_allowed_tools`.
+
+    Args:
+        schemas: Tool schemas with 'name' keys
+        blocked_patterns: fnmatch patterns for tools to remove
+        allowed_patterns: fnmatch patterns for tools to keep even if blocked
+
+    Returns:
+        Filtered list of tools
+    """
+    if not blocked_patterns:
+        return list(schemas)
+
+    def matches_any_pattern(name: str, patterns: Sequence[str]) -> bool:
+        """Check if name matches any of the given patterns."""
+        return any(fnmatch(name, pattern) for pattern in patterns)
+
+    filtered_tools = []
+
+    for tool in schemas:
+        tool_name = tool.get("name", "")
+
+        # Check if tool matches any blocked pattern
+        is_blocked = matches_any_pattern(tool_name, blocked_patterns)
+
+        if is_blocked:
+            # If blocked, check if it's also allowed (allowed overrides blocked)
+            is_allowed = matches_any_pattern(tool_name, allowed_patterns)
+            if is_allowed:
+                filtered_tools.append(tool)
+            # If blocked and not allowed, skip this tool
+        else:
+            # If not blocked, keep the tool
+            filtered_tools.append(tool)
+
+    return filtered_tools
+
 class AgentCatalogEntry(BaseModel):
     """A catalog entry for an agent configuration"""
     name: str = Field(..., description="Name of the agent configuration")
@@ -59,29 +99,7 @@ class AgentConfigurationBase(BaseModel):
             # Result: run_pnpm, run_git, and other_tool remain
         """
 
-        def matches_any_pattern(name: str, patterns: List[str]) -> bool:
-            """Check if name matches any of the given patterns."""
-            return any(fnmatch(name, pattern) for pattern in patterns)
-
-        filtered_tools = []
-
-        for tool in schemas:
-            tool_name = tool.get("name", "")
-
-            # Check if tool matches any blocked pattern
-            is_blocked = matches_any_pattern(tool_name, self.blocked_tool_patterns)
-
-            if is_blocked:
-                # If blocked, check if it's also allowed (allowed overrides blocked)
-                is_allowed = matches_any_pattern(tool_name, self.allowed_tool_patterns)
-                if is_allowed:
-                    filtered_tools.append(tool)
-                # If blocked and not allowed, skip this tool
-            else:
-                # If not blocked, keep the tool
-                filtered_tools.append(tool)
-
-        return filtered_tools
+        return filter_tool_schemas(schemas, self.blocked_tool_patterns, self.allowed_tool_patterns)
 
 class AgentConfigurationV1(AgentConfigurationBase):
     """Version 1 of the Agent Configuration"""
@@ -47,6 +47,24 @@ class ChatSession(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Metadata associated with the session")
     messages: List[dict[str, Any]] = Field(default_factory=list, description="List of messages in the session")
     agent_config: Optional[CurrentAgentConfiguration] = Field(None, description="Configuration for the agent associated with the session")
+    message_offset: int = Field(0, exclude=True, description="Index in the stored history of the first message in `messages`, non zero when only a window of the session was loaded")
+    flushed_message_count: Optional[int] = Field(None, exclude=True, description="Number of messages in the store when the session was last loaded from or saved to an append-only store, None if it wasn't")
+    messages_changed_from: Optional[int] = Field(None, exclude=True, description="Lowest index in `messages` changed in place since the session was last saved, None when messages were only appended")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'messages':
+            self.mark_messages_changed(0)
+
+    def mark_messages_changed(self, index: int = 0) -> None:
+        """
+        Signals that the messages from `index` on may have been changed in place rather than only appended to.
+
+        Append-only stores only compare the messages added since the last save unless this is called.
+        Replacing `messages` as a whole signals it from the first message.
+        """
+        if self.messages_changed_from is None or index < self.messages_changed_from:
+            self.messages_changed_from = index
 
     def get_agent_memory_store(self) -> Dict[str, Any]:
         return self.metadata.get("_agent_memory", {})
@@ -1,6 +1,6 @@
 from .base import BaseEvent
 from .session_event import SessionEvent
-from .chat import CompletionEvent, InteractionEvent, MessageEvent, TextDeltaEvent, HistoryEvent, SystemMessageEvent
+from .chat import CompletionEvent, InteractionEvent, MessageEvent, TextDeltaEvent, HistoryEvent, HistoryAppendEvent, SystemMessageEvent
 from .render_media import RenderMediaEvent
 from .tool_calls import ToolCallEvent, ToolSelectDeltaEvent
 
@@ -1,3 +1,6 @@
+import json
+import zlib
+
 from pydantic import Field
 from typing import Optional, List, Dict, Any, Literal
 
@@ -57,6 +60,8 @@ class CompletionEvent(SessionEvent):
     - When `running` is False, the completion has completed.
         - The `stop_reason` indicates why the completion stopped, if available.
         - The `input_tokens` and `output_tokens` indicate the number of tokens used in the input and output, if available.
+        - The `cache_creation_tokens` and `cache_read_tokens` indicate the input tokens written to and read from
+          the vendor's prompt cache, if available.  These are not included in `input_tokens`.
     - The `completion_options` contains the options used for the completion call, in vendor format.  These can be ignored by most clients
     """
     def __init__(self, **data):
@@ -67,6 +72,8 @@ class CompletionEvent(SessionEvent):
     stop_reason: Optional[str] = Field(None, description="The reason the completion was stopped")
     input_tokens: Optional[int] = Field(0, description="The number of tokens in the input")
     output_tokens: Optional[int] = Field(0, description="The number of tokens in the output")
+    cache_creation_tokens: Optional[int] = Field(0, description="The number of input tokens written to the prompt cache")
+    cache_read_tokens: Optional[int] = Field(0, description="The number of input tokens read from the prompt cache")
 
 class MessageEvent(SessionEvent):
     """
@@ -153,6 +160,9 @@ class HistoryEvent(SessionEvent):
     Sent to notify the UI that the message history has been updated.
     It will contain the ENTIRE history of messages in vendor format
     Most clients should ignore this event, as they will maintain their own history by assembling deltas.
+
+    The runtime never mutates a message once it has been raised in a history event, so consumers may keep the
+    messages without copying them, as long as they don't mutate them either.
     """
     def __init__(self, **data):
         super().__init__(type = "history", **data)
@@ -171,6 +181,38 @@ class HistoryDeltaEvent(SessionEvent):
     vendor: str = Field(..., description="The vendor of the model being used for the user request, e.g., 'openai', 'anthropic', etc.")
     messages: List[dict] = Field(..., description="The list of messages that have been added to the history")
 
+class HistoryAppendEvent(SessionEvent):
+    """
+    Sent instead of a `HistoryEvent` when the agent runtime is in delta history mode.
+    It contains only the messages appended to the history since the last history event of the interaction.
+        - Consumers apply it by truncating their copy of the history to `start_index` and extending it with `messages`.
+        - `sequence` restarts at 1 with each interaction and increases by one with every event.
+        - `checksum` is a CRC32 chained from the previous event's checksum (0 when `sequence` is 1) over the
+          appended messages, see `HistoryAppendEvent.compute_checksum`.
+        - A consumer that detects a gap or checksum mismatch should ask the runtime for a full `HistoryEvent`.
+    """
+    def __init__(self, **data):
+        super().__init__(type = "history_append", **data)
+
+    vendor: str = Field(..., description="The vendor of the model being used for the user request, e.g., 'openai', 'anthropic', etc.")
+    messages: List[dict] = Field(..., description="The messages appended to the history, in vendor format")
+    start_index: int = Field(..., description="The index in the full history of the first message in `messages`")
+    total_messages: int = Field(..., description="The length of the full history once `messages` have been applied")
+    sequence: int = Field(..., description="The sequence number of this event within the interaction, starting at 1")
+    checksum: int = Field(..., description="Chained CRC32 of the appended messages")
+
+    @staticmethod
+    def compute_checksum(messages: List[dict], previous: int = 0) -> int:
+        """
+        Chain a CRC32 over the serialized messages starting from the previous checksum.
+        Cost is proportional to the size of the appended messages, not the full history.
+        """
+        checksum = previous
+        for message in messages:
+            checksum = zlib.crc32(json.dumps(message, sort_keys=True, default=str).encode("utf-8"), checksum)
+
+        return checksum
+
 class SubsessionStartedEvent(SessionEvent):
     """
     Set to notify the UI that a subsession has started.
@@ -1,7 +1,7 @@
 import platform
 import logging
 import datetime
-from typing import Any
+from typing import Any, ClassVar, Optional, Tuple
 from agent_c.prompting.prompt_section import PromptSection, property_bag_item
 
 
@@ -22,6 +22,8 @@ class CoreInstructionSection(PromptSection):
         data (Any): Keyword arguments passed during initialization.
                     Can contain 'template' to override the default instruction set.
     """
+    # Only the timestamp is dynamic, it's captured once per prompt builder
+    render_inputs: ClassVar[Optional[Tuple[str, ...]]] = ()
 
     def __init__(self, **data: Any) -> None:
         # Default template for the instructions
@@ -2,7 +2,7 @@ import os
 import platform
 import datetime
 
-from typing import Any,  Optional, TYPE_CHECKING
+from typing import Any,  Optional, ClassVar, Tuple, TYPE_CHECKING
 
 from agent_c.prompting.prompt_section import PromptSection, property_bag_item
 
@@ -17,6 +17,9 @@ class EnvironmentInfoSection(PromptSection):
     Args:
         **data (Any): Additional keyword arguments passed to the PromptSection during initialization.
     """
+    # The timestamp is captured once per prompt builder so the prompt stays stable across tool calls
+    render_inputs: ClassVar[Optional[Tuple[str, ...]]] = ("chat_session.session_id", "chat_session.session_name",
+                                                          "chat_user.user_name", "chat_user.groups")
 
     def __init__(self, **data: Any) -> None:
         """
@@ -1,11 +1,48 @@
 import re
-from typing import List, Dict, Any, Set, Optional, TYPE_CHECKING
+import copy
+from functools import lru_cache
+from typing import List, Dict, Any, Set, Optional, Tuple, FrozenSet, TYPE_CHECKING
 from agent_c.prompting.prompt_section import PromptSection
 from agent_c.util.logging_utils import LoggingManager
 
 if TYPE_CHECKING:
     from agent_c.models.chat_history import ChatSession
 
+# Combined pattern with three alternatives:
+# 1. ${var} - not preceded by $
+# 2. $var - not preceded by $, valid Python identifier
+# 3. {var} - standard format string
+_TEMPLATE_VAR_PATTERN = re.compile(r'(?<!\$)\$\{([^}]+)\}|(?<!\$)\$([a-zA-Z_][a-zA-Z0-9_]*)|\{([^}]+)\}')
+
+# Marks a context value that isn't present, so that a missing value never matches a cached one
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _template_variables(template: str) -> FrozenSet[str]:
+    matches = _TEMPLATE_VAR_PATTERN.findall(template)
+
+    # Flatten tuples (each match has 3 groups, only one is non-empty)and filter out empty strings
+    return frozenset(group for match in matches for group in match if group)
+
+
+def _context_value(data: Dict[str, Any], path: str) -> Any:
+    """
+    Look up a context value by key or dotted path, snapshotting containers so later in-place changes are detected.
+    """
+    value = data.get(path, _MISSING)
+    if value is _MISSING and '.' in path:
+        value = data
+        for part in path.split('.'):
+            value = value.get(part, _MISSING) if isinstance(value, dict) else getattr(value, part, _MISSING)
+            if value is _MISSING:
+                break
+
+    if isinstance(value, (list, dict, set)):
+        return copy.copy(value)
+
+    return value
+
 
 class PromptBuilder:
     """
@@ -28,6 +65,24 @@ class PromptBuilder:
         self.tool_sections: List[PromptSection] = tool_sections or []
         self.logger = LoggingManager(self.__class__.__name__).get_logger()
 
+        # Per section memos, keyed on id() with the section kept alive alongside so ids can't be reused:
+        # inputs: {id: (section, input_key, dynamic_properties, block_data)}
+        # renders: {id: (section, render_key, rendered)}
+        self._input_memo: Dict[int, Tuple[PromptSection, Tuple, Dict[str, Any], Dict[str, Any]]] = {}
+        self._render_memo: Dict[int, Tuple[PromptSection, Tuple, Optional[str]]] = {}
+        self._last_parts: Optional[List[str]] = None
+        self._last_prompt: Optional[str] = None
+        self.last_render_changed: bool = True
+
+    def invalidate(self) -> None:
+        """
+        Drop all memoized section output, forcing the next render to evaluate every section.
+        """
+        self._input_memo.clear()
+        self._render_memo.clear()
+        self._last_parts = None
+        self._last_prompt = None
+
     @staticmethod
     def _get_template_variables(template: str) -> Set[str]:
         """
@@ -47,16 +102,41 @@ class PromptBuilder:
         Returns:
             Set[str]: A set of variable names found in the template.
         """
-        # Combined pattern with three alternatives:
-        # 1. ${var} - not preceded by $
-        # 2. $var - not preceded by $, valid Python identifier
-        # 3. {var} - standard format string
-        pattern = r'(?<!\$)\$\{([^}]+)\}|(?<!\$)\$([a-zA-Z_][a-zA-Z0-9_]*)|\{([^}]+)\}'
+        return _template_variables(template)
 
-        matches = re.findall(pattern, template)
+    def _input_key(self, section: PromptSection, data: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Build the key for reusing a section's dynamic properties and blocks, or None if the section doesn't allow it.
 
-        # Flatten tuples (each match has 3 groups, only one is non-empty)and filter out empty strings
-        return {group for match in matches for group in match if group}
+        A section qualifies if it declares `render_inputs` or is static (no template variables and no dynamic
+        properties). The key covers the declared inputs and any template variables supplied by the context.
+        """
+        dynamic_names = section.get_dynamic_property_names()
+        template_vars = _template_variables(section.template)
+        if section.render_inputs is None and (dynamic_names or template_vars):
+            return None
+
+        context_vars = sorted(v for v in template_vars if v not in dynamic_names and not v.startswith("block"))
+        return (section.template,
+                tuple(_context_value(data, name) for name in section.render_inputs or ()),
+                tuple(_context_value(data, name) for name in context_vars))
+
+    @staticmethod
+    def _render_key(section: PromptSection, data: Dict[str, Any]) -> Tuple:
+        return section.template, tuple(_context_value(data, name) for name in sorted(_template_variables(section.template)))
+
+    async def _memoized_render(self, section: PromptSection, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Render a section, reusing the previous output if none of its template variables changed.
+        """
+        key = self._render_key(section, data)
+        memo = self._render_memo.get(id(section))
+        if memo is not None and memo[0] is section and memo[1] == key:
+            return memo[2]
+
+        rendered = await section.render(data)
+        self._render_memo[id(section)] = (section, key, rendered)
+        return rendered
 
     async def _render_section(self, section: PromptSection, data: Dict[str, Any]) -> str:
         """
@@ -113,9 +193,19 @@ class PromptBuilder:
 
         for section in all_sections:
             try:
+                input_key = self._input_key(section, data)
+                memo = self._input_memo.get(id(section))
+                if input_key is not None and memo is not None and memo[0] is section and memo[1] == input_key:
+                    data = data | memo[2] | memo[3]
+                    continue
+
                 dyn_data = await section.get_dynamic_properties(data)
                 data = data | dyn_data
+                known_keys = set(data.keys())
                 data = await self.load_blocks_for_template(section.template, data )
+                if input_key is not None:
+                    block_data = {key: value for key, value in data.items() if key not in known_keys}
+                    self._input_memo[id(section)] = (section, input_key, dyn_data, block_data)
             except Exception as e:
                 self.logger.exception(f"Error loading blocks for section '{section.section_type}': {e}")
                 if section.required:
@@ -127,7 +217,7 @@ class PromptBuilder:
         for section in all_sections:
             try:
                 if section.section_type in chat_meta.get("prompt_section_blocks", ''):
-                    data[f"blocks_{section.section_type}_section"] = section.render(data)
+                    data[f"blocks_{section.section_type}_section"] = await self._memoized_render(section, data)
             except Exception as e:
                 self.logger.exception(f"Error preparing block for section '{section.section_type}': {e}")
                 if section.required:
@@ -149,7 +239,7 @@ class PromptBuilder:
                     if section.section_type in chat_meta.get("prompt_section_blocks", '') or section.section_type in chat_meta.get("skip_prompt_sections", ''):
                         continue
 
-                    rendered_section: Optional[str] = await section.render(data)
+                    rendered_section: Optional[str] = await self._memoized_render(section, data)
                     if rendered_section is not None:
                         rendered_section += "\n\n"
                         if section.render_section_header:
@@ -164,7 +254,15 @@ class PromptBuilder:
 
                     await self.notifier.send_system_message(f"Error rendering section '{section.name}': {e}", "warning")
 
+        # Hand back the previous prompt object when nothing changed so callers comparing prompts short circuit
+        if self._last_parts == rendered_sections:
+            self.last_render_changed = False
+            return self._last_prompt
+
         result = "\n".join(rendered_sections)
+        self._last_parts = rendered_sections
+        self._last_prompt = result
+        self.last_render_changed = True
         return result
 
     async def load_blocks_for_template(self, template: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -176,7 +274,7 @@ class PromptBuilder:
         """
         template_vars = self._get_template_variables(template)
         for var in template_vars:
-            if var.startswith("block_") or var.startswith("blocks_") and var not in data:
+            if var.startswith(("block_", "blocks_")) and var not in data:
                 val = await self.block_loader.get_block(var)
 
                 if val is not None:
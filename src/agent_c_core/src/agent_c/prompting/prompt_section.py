@@ -2,7 +2,7 @@ import inspect
 from functools import wraps
 from string import Template
 
-from typing import Callable, Any, Dict, List, TYPE_CHECKING, Optional
+from typing import Callable, Any, Dict, List, TYPE_CHECKING, Optional, ClassVar, Tuple
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from agent_c.util import to_snake_case
@@ -49,6 +49,13 @@ class PromptSection(BaseModel):
     render_section_header: bool = True
     required: bool = False
 
+    # Context values (keys or dotted paths like `chat_session.session_name`) that the dynamic properties of
+    # the section depend on.  Declaring them allows the PromptBuilder to reuse the dynamic properties, blocks
+    # and rendered output of the section until one of them, or a template variable, changes.
+    # None means the section is evaluated on every render unless it is entirely static.
+    render_inputs: ClassVar[Optional[Tuple[str, ...]]] = None
+    _dynamic_property_name_cache: ClassVar[Dict[type, Tuple[str, ...]]] = {}
+
     def __init__(self, **data: Any):
         """
         Initialize the PromptSection with the provided data.
@@ -74,16 +81,22 @@ class PromptSection(BaseModel):
         Returns:
             List[str]: A list of dynamic property names.
         """
-        dynamic_prop_names: List[str] = []
-        for attr_name in dir(cls):
-            # Skip internal or special attributes
-            if attr_name.startswith('_'):
-                continue
+        cached = PromptSection._dynamic_property_name_cache.get(cls)
+        if cached is None:
+            dynamic_prop_names: List[str] = []
+            for attr_name in dir(cls):
+                # Skip internal or special attributes
+                if attr_name.startswith('_'):
+                    continue
+
+                attr = getattr(cls, attr_name, None)
+                if callable(attr) and getattr(attr, 'is_property_bag_item', False):
+                    dynamic_prop_names.append(attr_name)
 
-            attr = getattr(cls, attr_name)
-            if callable(attr) and getattr(attr, 'is_property_bag_item', False):
-                dynamic_prop_names.append(attr_name)
-        return dynamic_prop_names
+            cached = tuple(dynamic_prop_names)
+            PromptSection._dynamic_property_name_cache[cls] = cached
+
+        return list(cached)
 
     async def get_dynamic_properties(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -96,13 +109,9 @@ class PromptSection(BaseModel):
             Dict[str, Any]: A dictionary of dynamic property names and their values.
         """
         dynamic_props: Dict[str, Any] = {}
-        for attr_name in dir(self):
-            # Skip internal or special attributes
-            if attr_name.startswith('_'):
-                continue
-
+        for attr_name in self.get_dynamic_property_names():
             attr = getattr(self, attr_name)
-            if callable(attr) and getattr(attr, 'is_property_bag_item', False):
+            if callable(attr):
                 try:
                     sig = inspect.signature(attr)
                     # If it has exactly one parameter (excluding 'self'), pass data
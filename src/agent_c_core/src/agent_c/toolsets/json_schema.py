@@ -1,18 +1,30 @@
 import copy
-from typing import Callable, Dict, Union, Any
+from typing import Callable, Dict, Union, Any, Optional
 
+# Where a tool runs: on the event loop (the default), on the ToolChest thread pool, or on the ToolChest process pool.
+EXECUTION_MODES = ('event_loop', 'thread', 'process')
 
-def json_schema(description: str, params: Union[Dict[str, dict[str, Any]], None]) -> Callable:
+
+def json_schema(description: str, params: Union[Dict[str, dict[str, Any]], None], timeout: Optional[float] = None,
+                execution: str = 'event_loop') -> Callable:
     """
     A decorator to attach an OpenAI compatible JSON fields_wanted to a function. The fields_wanted contains
     information about the function's name, description, parameters, and required parameters.
 
+    Execution metadata that isn't part of the schema sent to the model is attached separately as `tool_metadata`.
+
 
     :param description: A description of the function.
     :param params: A dictionary containing information about the parameters of the function.
+    :param timeout: Optional number of seconds the tool call may run before the ToolChest abandons it.
+    :param execution: Where the tool runs, one of `EXECUTION_MODES`. Use 'thread' or 'process' for tools that do
+                      heavy synchronous work so they don't block the event loop, see `Toolset.call`.
     :return: The original function with an attached JSON fields_wanted.
     """
 
+    if execution not in EXECUTION_MODES:
+        raise ValueError(f"Unknown execution mode '{execution}', expected one of {EXECUTION_MODES}")
+
     def decorator(func: Callable) -> Callable:
         if params is None:
             parameters = None
@@ -50,6 +62,7 @@ def json_schema(description: str, params: Union[Dict[str, dict[str, Any]], None]
 
         # Attach the fields_wanted to the original function
         func.schema = schema
+        func.tool_metadata = {'timeout': timeout, 'execution': execution}
 
         # Return the original function
         return func
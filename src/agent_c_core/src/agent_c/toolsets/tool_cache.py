@@ -63,3 +63,7 @@ class ToolCache:
     def clear(self) -> None:
         """Clear the entire cache."""
         self.cache.clear()
+
+    def close(self) -> None:
+        """Close the underlying cache, releasing its file handles. It reopens on next use."""
+        self.cache.close()
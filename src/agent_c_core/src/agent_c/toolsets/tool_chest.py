@@ -1,12 +1,30 @@
+import os
 import asyncio
-import copy
 import json
+import threading
+import contextvars
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from typing import Type, List, Union, Dict, Any, Tuple, Optional
 from agent_c.toolsets.tool_set import Toolset
+from agent_c.util.dict import freeze
 from agent_c.util.logging_utils import LoggingManager
+from agent_c.models.agent_config import filter_tool_schemas
+
+# Depth of tool calls on the current task, calls made by tools (e.g. sub-agents) are not held to the
+# concurrency limits as waiting on a slot their parent call holds would deadlock
+_tool_call_depth: contextvars.ContextVar[int] = contextvars.ContextVar("tool_call_depth", default=0)
 
 
 class ToolChest:
+    # Executors for tools that run off the event loop, shared by every ToolChest in the process so the
+    # number of workers is bounded no matter how many sessions are active.  Sized by TOOL_THREAD_WORKERS
+    # and TOOL_PROCESS_WORKERS, created on first use.
+    _executors: Dict[str, Executor] = {}
+    _executor_lock = threading.Lock()
+
+    # Tool options that are per user and so never given to shared toolset instances, see `Toolset.shareable`
+    SHARED_TOOLSET_EXCLUDED_OPTS = ('tool_chest', 'workspaces')
+    _shared_toolset_lock: Optional[asyncio.Lock] = None
 
     def __init__(self, tool_opts: Dict[str, any]):
         self.logger = LoggingManager(__name__).get_logger()
@@ -18,17 +36,38 @@ class ToolChest:
         self._tool_name_to_instance_map: Dict[str, Toolset] = {}
         self.tool_cache = tool_opts.get('tool_cache')
 
+        # Converted tool schemas keyed on (toolset names, format, blocked patterns, allowed patterns).
+        # Bumping the version / clearing happens whenever the set of toolset instances changes.
+        self._schema_version: int = 0
+        self._inference_cache: Dict[Tuple, Tuple[Tuple[Toolset, ...], Tuple[Dict[str, Any], ...]]] = {}
+
+        # Tool execution limits, 0 disables a limit.  Toolsets can override the per toolset limit
+        # and declare timeouts for their tools, see `Toolset.get_tool_timeout`
+        self.max_concurrent_tool_calls: int = int(tool_opts.get('max_concurrent_tool_calls', os.environ.get("TOOL_MAX_CONCURRENCY", 8)))
+        self.max_concurrent_toolset_calls: int = int(tool_opts.get('max_concurrent_toolset_calls', os.environ.get("TOOL_MAX_CONCURRENCY_PER_TOOLSET", 4)))
+        self.default_tool_timeout: Optional[float] = float(tool_opts.get('default_tool_timeout', os.environ.get("TOOL_CALL_TIMEOUT", 0))) or None
+        self.cancel_poll_interval: float = 0.25
+        self._global_tool_semaphore: Optional[asyncio.Semaphore] = None
+        self._toolset_semaphores: Dict[str, asyncio.Semaphore] = {}
+
 
     @property
     def available_toolset_classes(self) -> List:
         return self.__available_toolset_classes
 
+    @property
+    def schema_version(self) -> int:
+        """Incremented every time the toolset registry changes and cached schemas are invalidated."""
+        return self._schema_version
+
     def _update_toolset_metadata(self):
         """
         Update tool sections, schemas, and maps based on active toolsets.
         """
         # Clear existing metadata
         self._tool_name_to_instance_map = {}
+        self._inference_cache = {}
+        self._schema_version += 1
         
         # Update with data from active toolsets
         for toolset in self.__toolset_instances.values():
@@ -78,6 +117,9 @@ class ToolChest:
             # Find the class for this toolset
             toolset_class = next((cls for cls in self.__available_toolset_classes
                                   if cls.__name__ == name), None)
+            if toolset_class is None and name in Toolset.lazy_toolsets:
+                # First use of a toolset from the manifest, its module is imported off the event loop
+                toolset_class = await asyncio.to_thread(Toolset.get_toolset_class, name)
 
             if not toolset_class:
                 self.logger.warning(f"Toolset class {name} not found in available toolsets")
@@ -119,6 +161,16 @@ class ToolChest:
             if hasattr(self, 'tool_cache') and self.tool_cache is not None:
                 local_tool_opts['tool_cache'] = self.tool_cache
 
+            if Toolset.is_shareable(name):
+                try:
+                    self.__toolset_instances[name] = await self._get_shared_toolset(toolset_class, local_tool_opts)
+                except Exception as e:
+                    self.logger.exception(f"Error creating shared toolset {name}: {str(e)}", stacklevel=2)
+                    success = False
+
+                activation_stack.remove(name)
+                continue
+
             # Create instance
             try:
                 # Store for use in other methods
@@ -160,6 +212,40 @@ class ToolChest:
         return success
 
 
+    async def _get_shared_toolset(self, toolset_class: Type[Toolset], tool_opts: Dict[str, Any]) -> Toolset:
+        """
+        Returns the process wide instance of a shareable toolset, creating and initializing it on first use.
+        """
+        name = toolset_class.__name__
+        if name in Toolset.shared_instances:
+            return Toolset.shared_instances[name]
+
+        if ToolChest._shared_toolset_lock is None:
+            ToolChest._shared_toolset_lock = asyncio.Lock()
+
+        async with ToolChest._shared_toolset_lock:
+            if name not in Toolset.shared_instances:
+                shared_opts = {key: value for key, value in tool_opts.items() if key not in self.SHARED_TOOLSET_EXCLUDED_OPTS}
+                toolset_obj = toolset_class(**shared_opts)
+                await toolset_obj.post_init()
+                Toolset.shared_instances[name] = toolset_obj
+                self.logger.info(f"Created shared toolset instance {name}")
+
+        return Toolset.shared_instances[name]
+
+    @classmethod
+    async def close_shared_toolsets(cls) -> None:
+        """
+        Close and drop the shared toolset instances, they're recreated if needed again.
+        """
+        instances = list(Toolset.shared_instances.items())
+        Toolset.shared_instances.clear()
+        for name, instance in instances:
+            try:
+                await instance.close()
+            except Exception as e:
+                LoggingManager(__name__).get_logger().exception(f"Error closing shared toolset {name}: {e}")
+
     async def activate_tool(self, tool_name: str, tool_opts: Optional[Dict[str, any]] = None) -> bool:
         """
         Activates a tool by name (backward compatibility method).
@@ -212,6 +298,25 @@ class ToolChest:
     async def init_tools(self, tool_opts: Dict[str, any]):
         self.__tool_opts = tool_opts
 
+    async def close(self) -> None:
+        """
+        Close every toolset instantiated for this ToolChest, used when the ToolChest is being discarded.
+        Shared toolset instances are left open.
+        Errors are logged rather than raised so one toolset can't keep the others open.
+        """
+        for name, instance in list(self.__toolset_instances.items()):
+            if Toolset.shared_instances.get(name) is instance:
+                continue
+
+            try:
+                await instance.close()
+            except Exception as e:
+                self.logger.exception(f"Error closing toolset {name}: {e}")
+
+        self.__toolset_instances = {}
+        self.__toolsets_awaiting_init = {}
+        self._update_toolset_metadata()
+
 
     async def call_tool_internal(self, function_id: str, function_args: Dict[str,Any], tool_context: Dict[str,Any]) -> Optional[str]:
         """
@@ -226,103 +331,217 @@ class ToolChest:
             Any: The result of the function call.
         """
         try:
-            full_args = copy.deepcopy(function_args)
-            full_args['tool_context'] = tool_context
-            return await self._execute_tool_call(function_id, full_args)
+            return await self._run_tool_call(function_id, function_args, tool_context)
         except Exception as e:
             self.logger.exception(f"Failed calling {function_id}. {e}", stacklevel=2)
             await tool_context['bridge'].send_system_message(f"# CRITICAL ERROR\n\nFailed calling {function_id}.\n{e}\n", "error")
             return None
 
+    @classmethod
+    def get_executor(cls, execution: str) -> Executor:
+        """
+        Returns the shared executor for an execution mode, 'thread' or 'process'.
+        """
+        with cls._executor_lock:
+            executor = cls._executors.get(execution)
+            if executor is None:
+                if execution == 'thread':
+                    workers = int(os.environ.get("TOOL_THREAD_WORKERS", min(32, (os.cpu_count() or 1) + 4)))
+                    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool_worker")
+                elif execution == 'process':
+                    workers = int(os.environ.get("TOOL_PROCESS_WORKERS", os.cpu_count() or 1))
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    raise ValueError(f"No executor for execution mode '{execution}'")
 
+                cls._executors[execution] = executor
+
+            return executor
+
+    @classmethod
+    def shutdown_executors(cls, wait: bool = True) -> None:
+        """
+        Shuts down the shared tool executors, they're recreated if needed again.
+        """
+        with cls._executor_lock:
+            executors = list(cls._executors.values())
+            cls._executors.clear()
+
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _semaphores_for(self, toolset: Optional[Toolset]) -> List[asyncio.Semaphore]:
+        """
+        Returns the semaphores a call to a tool on the toolset must hold, global first.
+        """
+        semaphores = []
+        if self.max_concurrent_tool_calls > 0:
+            if self._global_tool_semaphore is None:
+                self._global_tool_semaphore = asyncio.Semaphore(self.max_concurrent_tool_calls)
+            semaphores.append(self._global_tool_semaphore)
+
+        if toolset is not None:
+            limit = toolset.max_concurrent_calls if toolset.max_concurrent_calls is not None else self.max_concurrent_toolset_calls
+            if limit > 0:
+                name = toolset.__class__.__name__
+                if name not in self._toolset_semaphores:
+                    self._toolset_semaphores[name] = asyncio.Semaphore(limit)
+                semaphores.append(self._toolset_semaphores[name])
+
+        return semaphores
+
+    async def _run_tool_call(self, function_id: str, function_args: Dict[str, Any], tool_context: Dict[str, Any]) -> Any:
+        """
+        Run a single tool call within the concurrency limits and timeout for the tool.
+
+        Tools get a shallow copy of the arguments, they may add or remove keys but must not mutate the values in
+        place as those are shared with the tool call in the message history.
+
+        Raises:
+            asyncio.TimeoutError: If the tool doesn't complete within its timeout.
+        """
+        full_args = {**function_args, 'tool_context': tool_context}
+
+        toolset = self._tool_name_to_instance_map.get(function_id)
+        timeout = toolset.get_tool_timeout(function_id) if toolset is not None else None
+        if timeout is None:
+            timeout = self.default_tool_timeout
+
+        depth = _tool_call_depth.get()
+        semaphores = self._semaphores_for(toolset) if depth == 0 else []
+        acquired = []
+        token = _tool_call_depth.set(depth + 1)
+        try:
+            # Only the semaphores actually taken are released, a call cancelled while waiting holds none of the rest
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+
+            return await asyncio.wait_for(self._execute_tool_call(function_id, full_args), timeout)
+        finally:
+            _tool_call_depth.reset(token)
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+    @staticmethod
+    def _parse_tool_call(tool_call: dict, format_type: str) -> Tuple[dict, str, Dict[str, Any]]:
+        """
+        Returns the call as echoed back to the model, the function name and the arguments for a tool call.
+        """
+        # TODO: refactor this to common model and push the format back down
+        fn = tool_call['name']
+        if format_type == "claude":
+            return dict(tool_call), fn, tool_call['input']
+
+        # gpt - handle the case where the test provides Claude format but expects GPT processing
+        if 'arguments' in tool_call:
+            args = json.loads(tool_call['arguments'])
+        else:
+            # Fallback to 'input' if 'arguments' is not available
+            args = tool_call['input']
+            # Add 'arguments' field to the tool_call for compatibility
+            tool_call['arguments'] = json.dumps(args)
+
+        ai_call = {
+            "id": tool_call['id'],
+            "function": {"name": fn, "arguments": tool_call['arguments']},
+            'type': 'function'
+        }
+        return ai_call, fn, args
+
+    @staticmethod
+    def _format_tool_result(tool_call: dict, fn: str, content: Any, format_type: str) -> dict:
+        if format_type == "claude":
+            return {
+                "type": "tool_result",
+                "tool_use_id": tool_call['id'],
+                "content": content
+            }
+
+        return {
+            "role": "tool",
+            "tool_call_id": tool_call['id'],
+            "name": fn,
+            "content": content
+        }
+
+    async def _wait_for_tool_calls(self, tasks: List[asyncio.Task], client_wants_cancel: Optional[Any]) -> None:
+        """
+        Wait for the tool call tasks, cancelling the ones still running if the client asks to cancel.
+        """
+        pending = set(tasks)
+        try:
+            while pending:
+                _, pending = await asyncio.wait(pending, timeout=self.cancel_poll_interval if client_wants_cancel is not None else None)
+                if pending and client_wants_cancel is not None and client_wants_cancel.is_set():
+                    self.logger.info(f"Client requested cancellation, cancelling {len(pending)} running tool call(s)")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     async def call_tools(self, tool_calls: List[dict], tool_context: Dict[str,Any], format_type: str = "claude") -> List[dict]:
         """
         Execute multiple tool calls concurrently and return the results.
+
+        Calls are limited by the global and per toolset concurrency limits and each is subject to the
+        timeout for its tool.  If the client asks to cancel (`client_wants_cancel` in the tool context)
+        calls still running are cancelled; calls that completed keep their results and the others
+        report that they were cancelled, so every call still gets a result.
         
         Args:
             tool_calls (List[dict]): List of tool calls to execute.
+            tool_context (Dict[str, Any]): Context to pass to the tools.
             format_type (str): The format to use for the results ("claude" or "gpt").
             
         Returns:
             List[dict]: Tool call results formatted according to the agent type.
         """
-        async def make_call(tool_call: dict) -> Tuple[dict, dict]:
-            # Common logic for executing a tool call
-            # TODO: refactor this to common model and push the format back down
-            if format_type == "claude":
-                fn = tool_call['name']
-                args = tool_call['input']
-                ai_call = copy.deepcopy(tool_call)
-            else:  # gpt
-                fn = tool_call['name']
-                # Handle the case where the test provides Claude format but expects GPT processing
-                if 'arguments' in tool_call:
-                    args = json.loads(tool_call['arguments'])
-                elif 'input' in tool_call:
-                    # Fallback to 'input' if 'arguments' is not available
-                    args = tool_call['input']
-                    # Add 'arguments' field to the tool_call for compatibility
-                    tool_call['arguments'] = json.dumps(args)
-                ai_call = {
-                    "id": tool_call['id'],
-                    "function": {"name": fn, "arguments": tool_call['arguments']},
-                    'type': 'function'
-                }
-                
+        parsed: List[Tuple[dict, str, Any]] = []
+        tasks: List[Optional[asyncio.Task]] = []
+        for tool_call in tool_calls:
             try:
-
-                full_args = copy.deepcopy(args)
-                full_args['tool_context'] = tool_context
-                function_response = await self._execute_tool_call(fn, full_args)
-                
-                if format_type == "claude":
-                    call_resp = {
-                        "type": "tool_result", 
-                        "tool_use_id": tool_call['id'],
-                        "content": function_response
-                    }
-                else:  # gpt
-                    call_resp = {
-                        "role": "tool", 
-                        "tool_call_id": tool_call['id'], 
-                        "name": fn,
-                        "content": function_response
-                    }
+                ai_call, fn, args = self._parse_tool_call(tool_call, format_type)
             except Exception as e:
-                if format_type == "claude":
-                    call_resp = {
-                        "type": "tool_result", 
-                        "tool_use_id": tool_call['id'],
-                        "content": f"Exception: {e}"
-                    }
-                else:  # gpt
-                    call_resp = {
-                        "role": "tool", 
-                        "tool_call_id": tool_call['id'], 
-                        "name": fn,
-                        "content": f"Exception: {e}"
-                    }
-                    
-            return ai_call, call_resp
-
-        # Schedule all the calls concurrently
-        tasks = [make_call(tool_call) for tool_call in tool_calls]
-        completed_calls = await asyncio.gather(*tasks)
-
-        # Unpack the resulting ai_calls and resp_calls
-        ai_calls, results = zip(*completed_calls)
-        
+                parsed.append((tool_call, tool_call.get('name', 'unknown'), e))
+                tasks.append(None)
+                continue
+
+            parsed.append((ai_call, fn, None))
+            tasks.append(asyncio.create_task(self._run_tool_call(fn, args, tool_context)))
+
+        await self._wait_for_tool_calls([task for task in tasks if task is not None], tool_context.get('client_wants_cancel'))
+
+        ai_calls = []
+        results = []
+        for tool_call, (ai_call, fn, error), task in zip(tool_calls, parsed, tasks):
+            if error is not None:
+                content = f"Exception: {error}"
+            elif task.cancelled():
+                content = f"The call to {fn} was cancelled by the user before it completed."
+            elif isinstance(task.exception(), asyncio.TimeoutError):
+                self.logger.warning(f"Tool call {fn} timed out")
+                content = f"The call to {fn} timed out before it completed."
+            elif task.exception() is not None:
+                content = f"Exception: {task.exception()}"
+            else:
+                content = task.result()
+
+            ai_calls.append(ai_call)
+            results.append(self._format_tool_result(tool_call, fn, content, format_type))
+
         # Format the final result based on agent type
         if format_type == "claude":
             return [
-                {'role': 'assistant', 'content': list(ai_calls)},
-                {'role': 'user', 'content': list(results)}
+                {'role': 'assistant', 'content': ai_calls},
+                {'role': 'user', 'content': results}
             ]
         else:  # gpt
             return [
-                {'role': 'assistant', 'tool_calls': list(ai_calls), 'content': ''}
-            ] + list(results)
+                {'role': 'assistant', 'tool_calls': ai_calls, 'content': ''}
+            ] + results
             
     async def _execute_tool_call(self, function_id: str, function_args: Dict) -> Any:
         """
@@ -347,21 +566,47 @@ class ToolChest:
             await function_args['tool_context']['bridge'].send_error(f"CRITICAL ERROR: Failed calling {function_id} on {src_obj.name}. {e}")
             return f"HALT AND INFORM THE USER!!\n# CRITICAL ERROR!  THIS IS A HALT CONDITION\nImportant! Tell the user an error occurred calling {function_id} on {src_obj.name}. {e}\n\nHALT AND INFORM THE USER!!"
 
-    def get_inference_data(self, toolset_names: List[str], tool_format: str = "claude") -> Dict[str, Any]:
+    def get_inference_data(self, toolset_names: List[str], tool_format: str = "claude",
+                           blocked_tool_patterns: Optional[List[str]] = None,
+                           allowed_tool_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get inference data (schemas and prompt sections) for specified toolsets.
         Uses __toolset_instances rather than __active_toolset_instances to support
         on-the-fly tool usage without requiring activation.
+
+        Converted schemas are cached until the toolset registry changes, the schemas returned
+        are shared between callers and immutable (a tuple of FrozenDicts), use `dict(schema)`
+        if a caller needs to modify one.
         
         Args:
             toolset_names: List of toolset names to get inference data for
             tool_format: Format for tool schemas ("claude" or "openai")
+            blocked_tool_patterns: Optional patterns for tools to remove, see `AgentConfiguration.filter_allowed_tools`
+            allowed_tool_patterns: Optional patterns for tools to keep even if blocked
             
         Returns:
             Dictionary containing:
-                - 'schemas': List of tool schemas in the requested format
+                - 'schemas': Tuple of tool schemas in the requested format
                 - 'sections': List of PromptSection objects for the toolsets
         """
+        key = (tuple(toolset_names), tool_format.lower(), tuple(blocked_tool_patterns or ()), tuple(allowed_tool_patterns or ()))
+        cached = self._inference_cache.get(key)
+        if cached is None:
+            cached = self._build_inference_data(toolset_names, key[1], key[2], key[3])
+            self._inference_cache[key] = cached
+
+        valid_toolsets, schemas = cached
+
+        # Sections are collected on each call as toolsets are free to swap them out
+        sections = [toolset.section for toolset in valid_toolsets if toolset.section is not None]
+
+        return {
+            "schemas": schemas,
+            "sections": sections
+        }
+
+    def _build_inference_data(self, toolset_names: List[str], tool_format: str, blocked_tool_patterns: Tuple[str, ...],
+                              allowed_tool_patterns: Tuple[str, ...]) -> Tuple[Tuple[Toolset, ...], Tuple[Dict[str, Any], ...]]:
         # Validate and filter toolset names
         valid_toolsets = []
         for name in toolset_names:
@@ -369,35 +614,28 @@ class ToolChest:
                 valid_toolsets.append(self.__toolset_instances[name])
             else:
                 self.logger.warning(f"Requested toolset '{name}' not found in available toolsets")
-        
-        if not valid_toolsets:
-            return {"tools": [], "sections": []}
-            
+
         # Collect OpenAI-format schemas from the specified toolsets
         openai_schemas = []
         for toolset in valid_toolsets:
             openai_schemas.extend(toolset.tool_schemas)
-        
+
         # Convert to requested format
-        if tool_format.lower() == "claude":
+        if tool_format == "claude":
             schemas = []
             for schema in openai_schemas:
                 if "function" in schema:
-                    new_schema = copy.deepcopy(schema['function'])
-                    new_schema['input_schema'] = new_schema.pop('parameters')
+                    new_schema = dict(schema['function'])
+                    new_schema['input_schema'] = new_schema.pop('parameters', {'type': 'object', 'properties': {}})
                     schemas.append(new_schema)
                 else:
                     schemas.append(schema)
         else:  # Default to OpenAI format
             schemas = openai_schemas
-        
-        # Collect prompt sections
-        sections = [toolset.section for toolset in valid_toolsets if toolset.section is not None]
-        
-        return {
-            "schemas": schemas,
-            "sections": sections
-        }
+
+        schemas = filter_tool_schemas(schemas, blocked_tool_patterns, allowed_tool_patterns)
+
+        return tuple(valid_toolsets), freeze(schemas)
 
     def get_tool_sections(self, toolset_names: List[str]) -> List:
         # Validate and filter toolset names
@@ -2,7 +2,10 @@ import os
 import re
 import copy
 import yaml
+import asyncio
 import inspect
+import functools
+import importlib
 import markdown
 
 from typing import Union, List, Dict, Any, Optional
@@ -15,12 +18,37 @@ from agent_c.prompting.prompt_section import PromptSection
 from agent_c.models.events import RenderMediaEvent, MessageEvent, TextDeltaEvent, BaseEvent
 
 
+def _call_off_loop(function: Any, kwargs: Dict[str, Any]) -> Any:
+    """
+    Runs a tool function on an executor worker, coroutine functions get an event loop of their own.
+    """
+    result = function(**kwargs)
+    if inspect.isawaitable(result):
+        return asyncio.run(result)
+
+    return result
+
+
 class Toolset:
     tool_registry: List[Any] = []
     tool_sep: str = "_"
     tool_dependencies: Dict[str, List[str]] = {}
     client_tool_registry: List[ClientToolInfo] = None
 
+    # Toolsets known from a prebuilt manifest whose module hasn't been imported yet, by class name:
+    # {'module', 'description', 'schemas', 'required_tools', 'shareable'}.  The module is imported the first
+    # time the class is needed, see `register_lazy` and `get_toolset_class`
+    lazy_toolsets: Dict[str, Dict[str, Any]] = {}
+
+    # Toolsets that keep no per user state, getting everything user specific from the tool context, can
+    # set `shareable` so every ToolChest in the process uses a single instance of them.  Shared instances
+    # are created without a tool_chest or workspaces and can only depend on other shareable toolsets.
+    shareable: bool = False
+    shared_instances: Dict[str, 'Toolset'] = {}
+
+    # Runtime references that aren't sent along with a toolset to the process pool
+    process_excluded_state: tuple = ('tool_chest', 'tool_cache', 'section', 'streaming_callback', 'logger')
+
     @classmethod
     def register(cls, tool_cls: Any, required_tools: Optional[List[str]] = None) -> None:
         """
@@ -32,11 +60,64 @@ class Toolset:
         """
         if tool_cls not in cls.tool_registry:
             cls.tool_registry.append(tool_cls)
+            cls.lazy_toolsets.pop(tool_cls.__name__, None)
 
             # Store the required tools mapping if provided
             if required_tools:
                 cls.tool_dependencies[tool_cls.__name__] = required_tools
 
+    @classmethod
+    def register_lazy(cls, name: str, module: str, description: str = "", schemas: Optional[List[Dict[str, Any]]] = None,
+                      required_tools: Optional[List[str]] = None, shareable: bool = False) -> None:
+        """
+        Registers a toolset by name without importing it, the module is imported when the toolset is first needed.
+
+        Args:
+            name: The class name of the toolset.
+            module: The module that registers the toolset class when imported.
+            description: The toolset description shown in the tool catalog.
+            schemas: The tool schemas shown in the tool catalog.
+            required_tools: List of tool names that this tool requires.
+            shareable: Whether the toolset class is `shareable`.
+        """
+        if any(tool_cls.__name__ == name for tool_cls in cls.tool_registry):
+            return
+
+        cls.lazy_toolsets[name] = {'module': module, 'description': description, 'schemas': schemas or [],
+                                   'required_tools': required_tools or [], 'shareable': shareable}
+        if required_tools:
+            cls.tool_dependencies[name] = required_tools
+
+        cls.client_tool_registry = None
+
+    @classmethod
+    def get_toolset_class(cls, toolset_name: str) -> Optional[Any]:
+        """
+        Get a toolset class by name, importing its module if it was registered lazily.
+
+        Args:
+            toolset_name: The class name of the toolset.
+
+        Returns:
+            The toolset class, or None if there's no such toolset or its module failed to import.  A failed
+            import leaves the toolset registered with its `import_error`, it's tried again on the next call.
+        """
+        toolset_class = next((tool_cls for tool_cls in cls.tool_registry if tool_cls.__name__ == toolset_name), None)
+        if toolset_class is not None or toolset_name not in cls.lazy_toolsets:
+            return toolset_class
+
+        entry = cls.lazy_toolsets[toolset_name]
+        try:
+            importlib.import_module(entry['module'])
+        except Exception as e:
+            LoggingManager(__name__).get_logger().exception(f"Failed to import {entry['module']} for toolset {toolset_name}: {e}")
+            entry['import_error'] = f"{type(e).__name__}: {e}"
+            return None
+
+        # The module imported, a class it didn't register isn't in it anymore and is reported as missing
+        cls.lazy_toolsets.pop(toolset_name, None)
+        return next((tool_cls for tool_cls in cls.tool_registry if tool_cls.__name__ == toolset_name), None)
+
     @classmethod
     def get_client_registry(cls) -> List[ClientToolInfo]:
         """
@@ -47,10 +128,32 @@ class Toolset:
         """
         if not cls.client_tool_registry:
             cls.client_tool_registry = [ClientToolInfo.from_toolset(tool_class) for tool_class in cls.tool_registry]
+            cls.client_tool_registry.extend(ClientToolInfo(name=name, description=entry['description'] or "No description provided.",
+                                                           schemas=entry['schemas'])
+                                            for name, entry in cls.lazy_toolsets.items())
             cls.client_tool_registry.sort(key=lambda x: x.name.lower())
 
         return cls.client_tool_registry
 
+    @classmethod
+    def is_shareable(cls, toolset_name: str) -> bool:
+        """
+        Returns True if a single instance of the toolset can be shared by every ToolChest,
+        which requires it and all the toolsets it depends on to be shareable.
+
+        Args:
+            toolset_name: The name of the toolset to check.
+        """
+        toolset_class = next((tool_cls for tool_cls in cls.tool_registry if tool_cls.__name__ == toolset_name), None)
+        if toolset_class is None:
+            entry = cls.lazy_toolsets.get(toolset_name)
+            if entry is None or not entry['shareable']:
+                return False
+        elif not toolset_class.shareable:
+            return False
+
+        return all(cls.is_shareable(required) for required in cls.get_required_tools(toolset_name))
+
     @classmethod
     def get_required_tools(cls, toolset_name: str) -> List[str]:
         """
@@ -92,6 +195,8 @@ class Toolset:
                 streaming_callback (Callable[..., None]): A callback to be triggered after streaming events.
                 output_format (str): Format for output. Defaults to 'raw'.
                 tool_role (str): Defines the role of the tool (defaults to 'tool').
+                max_concurrent_calls (int): Limit on concurrent calls to this toolset, the ToolChest default if unset.
+                tool_timeout (float): Default timeout in seconds for tools that don't declare one.
         """
         # Initialize properties
         self.name: str = kwargs.get("name")
@@ -136,6 +241,10 @@ class Toolset:
         self.output_format: str = kwargs.get('output_format', 'raw')
         self.tool_role: str = kwargs.get('tool_role', 'tool')
 
+        # Execution limits applied by the ToolChest, None defers to the ToolChest defaults
+        self.max_concurrent_calls: Optional[int] = kwargs.get('max_concurrent_calls')
+        self.tool_timeout: Optional[float] = kwargs.get('tool_timeout')
+
     def _count_tokens(self, text: str, tool_context) -> int:
         if not text or len(text) == 0:
             return 0
@@ -159,6 +268,9 @@ class Toolset:
                 # Use the toolset safely
                 pass
         """
+        if not self.tool_chest and self.shareable:
+            return Toolset.shared_instances.get(toolset_name)
+
         if not self.tool_chest:
             raise RuntimeError(f"Toolset {self.name} attempted to access dependency {toolset_name} but no tool_chest is available")
 
@@ -182,6 +294,17 @@ class Toolset:
         """
         Calls a tool on this toolset with the given name and arguments.
 
+        Tools run where their `json_schema` execution mode says:
+            - 'event_loop': Awaited directly, the default.
+            - 'thread': On the ToolChest thread pool. Coroutine tools get an event loop of their own on the
+              worker thread, the streaming callback in the tool context is routed back to the calling loop,
+              anything else bound to that loop (e.g. the bridge) must not be awaited by the tool.
+            - 'process': On the ToolChest process pool, against a copy of the toolset without its runtime
+              references (see `process_excluded_state`) and without the tool context. Changes the tool makes
+              to the toolset are not seen by this instance.
+
+        Tools running off the event loop are not interrupted by timeouts or cancellation, their results are discarded.
+
         Args:
             tool_name (str): The name of the tool to call.
             args (dict[str, Any]): The arguments to pass to the tool.
@@ -191,7 +314,68 @@ class Toolset:
         """
         function_name = tool_name.removeprefix(self.prefix)
         function_to_call: Any = getattr(self, function_name)
-        return await function_to_call(**args)
+        execution = getattr(function_to_call, 'tool_metadata', {}).get('execution', 'event_loop')
+        if execution == 'event_loop':
+            return await function_to_call(**args)
+
+        from agent_c.toolsets.tool_chest import ToolChest
+
+        loop = asyncio.get_running_loop()
+        if execution == 'process':
+            args = {key: value for key, value in args.items() if key != 'tool_context'}
+        elif 'tool_context' in args:
+            args = dict(args, tool_context=self._thread_tool_context(args['tool_context'], loop))
+
+        executor = ToolChest.get_executor(execution)
+        return await loop.run_in_executor(executor, functools.partial(_call_off_loop, function_to_call, args))
+
+    @staticmethod
+    def _thread_tool_context(tool_context: Dict[str, Any], loop: asyncio.AbstractEventLoop) -> Dict[str, Any]:
+        """
+        Returns a copy of the tool context whose streaming callback runs on the given loop.
+        """
+        callback = tool_context.get('streaming_callback')
+        if callback is None:
+            return tool_context
+
+        async def streaming_callback(event: Any) -> None:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(callback(event), loop))
+
+        return dict(tool_context, streaming_callback=streaming_callback)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for key in self.process_excluded_state:
+            state.pop(key, None)
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        for key in self.process_excluded_state:
+            self.__dict__.setdefault(key, None)
+
+        self.logger = LoggingManager(self.__class__.__name__).get_logger()
+
+    def tool_metadata(self, tool_name: str) -> Dict[str, Any]:
+        """
+        Returns the execution metadata declared with `json_schema` for a tool.
+
+        Args:
+            tool_name (str): The name of the tool, with or without the toolset prefix.
+
+        Returns:
+            Dict[str, Any]: The metadata, empty if the tool is unknown.
+        """
+        function = getattr(self, tool_name.removeprefix(self.prefix), None)
+        return getattr(function, 'tool_metadata', None) or {}
+
+    def get_tool_timeout(self, tool_name: str) -> Optional[float]:
+        """
+        Returns the timeout for a tool: the one declared with `json_schema`, else the toolset default.
+        """
+        timeout = self.tool_metadata(tool_name).get('timeout')
+        return timeout if timeout is not None else self.tool_timeout
 
     def _yaml_dump(self, data: Any) -> str:
         """
@@ -369,6 +553,12 @@ class Toolset:
         """
         pass
 
+    async def close(self) -> None:
+        """
+        Optional method to release resources (connections, clients, handles) when the toolset is discarded.
+        """
+        pass
+
     @staticmethod
     def _validate_env_keys(needed_keys: List[str]) -> bool:
         """
@@ -42,3 +42,43 @@ def delete_nested(d: dict, path: str, sep: str = "."):
             return
         current = current[key]
     current.pop(keys[-1], None)
+
+
+class FrozenDict(dict):
+    """
+    A dict that refuses modification, used for structures shared between callers such as cached tool schemas.
+
+    It is still a dict, so it serializes to JSON and passes isinstance checks, and copying it returns the same
+    instance since there is nothing that could change.  Use `dict(frozen)` for a mutable shallow copy.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{self.__class__.__name__}' object is immutable")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDicts and lists to tuples."""
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
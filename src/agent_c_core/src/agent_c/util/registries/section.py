@@ -14,6 +14,8 @@ class SectionRegistry:
     """Registry for models with section_type field to enable polymorphic deserialization"""
     _model_registry: Dict[str, Type[PromptSection]] = {}
     _sections: Dict[str, PromptSection] = {}
+    # Prompt variables of section models whose module hasn't been imported yet, from the toolset manifest
+    _lazy_prompt_vars: Dict[str, List[str]] = {}
 
     @classmethod
     def register_section_class(cls, section_class: Type[PromptSection], section_type: str = None) -> Type[PromptSection]:
@@ -113,10 +115,15 @@ class SectionRegistry:
         keys.sort()
         return keys
 
+    @classmethod
+    def register_prompt_vars(cls, prompt_vars: Dict[str, List[str]]) -> None:
+        """Register the prompt variables of section models that will be registered when their module is imported"""
+        cls._lazy_prompt_vars.update(prompt_vars)
+
     @classmethod
     def prompt_vars(cls) -> Dict[str, List[str]]:
         """Get all registered section models"""
-        result = {}
+        result = dict(cls._lazy_prompt_vars)
         for key, model in cls._model_registry.items():
            prop_names = model.get_dynamic_property_names()
            if len(prop_names):
@@ -0,0 +1,120 @@
+"""
+Tests for Anthropic prompt cache breakpoint placement, using a recorded stream stand-in for the client.
+"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from agent_c.agents.claude import ClaudeChatAgent
+from agent_c.agents.prompt_cache import AnthropicPromptCacheStrategy
+from agent_c.models.events import CompletionEvent
+from agent_c.util.token_counter import TokenCounter
+
+
+class RecordedStream:
+    """Replays a list of recorded stream events."""
+    def __init__(self, events):
+        self.events = events
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for event in self.events:
+            yield event
+
+
+class RecordedClient:
+    """Stands in for AsyncAnthropic, recording the options of each request."""
+    def __init__(self, events):
+        self.requests = []
+        self.messages = SimpleNamespace(stream=self._stream)
+        self.beta = self
+        self._events = events
+
+    def _stream(self, **opts):
+        self.requests.append(opts)
+        return RecordedStream(self._events)
+
+
+def _text_response(text: str, cache_creation: int, cache_read: int):
+    usage = SimpleNamespace(input_tokens=10, output_tokens=5, cache_creation_input_tokens=cache_creation,
+                            cache_read_input_tokens=cache_read)
+    block = SimpleNamespace(type="text", text="", model_dump=lambda: {"type": "text", "text": ""})
+    return [SimpleNamespace(type="message_start", message=SimpleNamespace(usage=usage)),
+            SimpleNamespace(type="content_block_start", content_block=block),
+            SimpleNamespace(type="text", text=text),
+            SimpleNamespace(type="content_block_stop"),
+            SimpleNamespace(type="message_delta", delta=SimpleNamespace(stop_reason="end_turn")),
+            SimpleNamespace(type="message_stop", message=SimpleNamespace(usage=usage))]
+
+
+def _history(count: int):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"} for i in range(count)]
+
+
+def test_breakpoints_on_tools_system_and_history_tail():
+    strategy = AnthropicPromptCacheStrategy()
+    tools = ({"name": "a", "input_schema": {}}, {"name": "b", "input_schema": {}})
+    messages = _history(4)
+    opts = {"system": "prompt", "tools": tools, "messages": messages}
+
+    sent = strategy.apply(opts)
+
+    assert "cache_control" not in sent["tools"][0] and sent["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert sent["system"] == [{"type": "text", "text": "prompt", "cache_control": {"type": "ephemeral"}}]
+    assert sent["messages"][3]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert sent["messages"][1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert AnthropicPromptCacheStrategy.count_breakpoints(sent) == 4
+
+    # The history and the shared tool schemas are untouched
+    assert opts["messages"] is messages and messages == _history(4) and opts["system"] == "prompt"
+    assert all("cache_control" not in tool for tool in tools)
+
+
+def test_existing_breakpoints_and_thinking_blocks_respected():
+    strategy = AnthropicPromptCacheStrategy(ttl="1h")
+    pdf = {"type": "document", "source": {}, "cache_control": {"type": "ephemeral"}}
+    messages = [{"role": "user", "content": [pdf, {"type": "text", "text": "read this"}]},
+                {"role": "assistant", "content": [{"type": "thinking", "thinking": "hmm"}, {"type": "text", "text": "ok"}]}]
+
+    sent = strategy.apply({"system": "prompt", "messages": messages})
+
+    assert AnthropicPromptCacheStrategy.count_breakpoints(sent) == 3
+    assert "cache_control" not in sent["messages"][1]["content"][0]
+    assert sent["messages"][1]["content"][1]["cache_control"] == {"type": "ephemeral", "ttl": "1h"}
+    assert AnthropicPromptCacheStrategy(enabled=False).apply({"messages": messages})["messages"] is messages
+
+
+@pytest.mark.asyncio
+async def test_stream_requests_use_breakpoints_and_report_cache_usage():
+    events = []
+
+    async def record(event):
+        events.append(event)
+
+    client = RecordedClient(_text_response("hello", cache_creation=1200, cache_read=3400))
+    agent = ClaudeChatAgent(client=client, token_counter=TokenCounter(), streaming_callback=record, model_name="claude-test")
+    messages = _history(3)
+    completion_opts = {"model": "claude-test", "system": "prompt", "messages": messages, "max_tokens": 100}
+    callback_opts = {"session_id": "s1", "role": "assistant", "streaming_callback": record}
+
+    result, state = await agent._handle_claude_stream(completion_opts, None, None, messages, callback_opts, "i1",
+                                                      threading.Event(), {})
+
+    request = client.requests[0]
+    assert request["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert request["messages"][2]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert completion_opts["system"] == "prompt"
+    assert result[-1] == {"role": "assistant", "content": [{"type": "text", "text": "hello"}]}
+
+    completion_end = [e for e in events if isinstance(e, CompletionEvent) and not e.running][0]
+    assert completion_end.cache_creation_tokens == 1200
+    assert completion_end.cache_read_tokens == 3400
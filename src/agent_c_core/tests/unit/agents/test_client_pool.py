@@ -0,0 +1,85 @@
+"""
+Tests for the process wide LLM client pool and completion governor.
+"""
+import asyncio
+
+import pytest
+
+from agent_c.agents.client_pool import LLMClientPool
+from agent_c.agents.governor import CompletionGovernor
+
+
+class FakeClient:
+    def __init__(self, **opts):
+        self.opts = opts
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeRuntime:
+    @classmethod
+    def client(cls, **opts):
+        return FakeClient(**opts)
+
+    @classmethod
+    def http_client(cls, limits):
+        return ("http_client", limits)
+
+
+class OtherFakeRuntime(FakeRuntime):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_by_runtime_and_auth(monkeypatch):
+    monkeypatch.delenv("LLM_CLIENT_MAX_CONNECTIONS", raising=False)
+    monkeypatch.delenv("LLM_CLIENT_MAX_KEEPALIVE_CONNECTIONS", raising=False)
+    monkeypatch.delenv("LLM_CLIENT_KEEPALIVE_EXPIRY", raising=False)
+    await LLMClientPool.close_all()
+
+    first = LLMClientPool.get_client(FakeRuntime, api_key="a")
+    assert LLMClientPool.get_client(FakeRuntime, api_key="a") is first
+    assert LLMClientPool.get_client(FakeRuntime, api_key="b") is not first
+    assert LLMClientPool.get_client(OtherFakeRuntime, api_key="a") is not first
+    assert first.opts == {"api_key": "a"}
+    assert LLMClientPool.get_stats()["clients"] == 3
+
+    await LLMClientPool.close_all()
+    assert first.closed
+    assert LLMClientPool.get_stats()["clients"] == 0
+
+
+@pytest.mark.asyncio
+async def test_connection_limits_are_passed_to_pooled_clients(monkeypatch):
+    monkeypatch.setenv("LLM_CLIENT_MAX_CONNECTIONS", "7")
+    await LLMClientPool.close_all()
+
+    client = LLMClientPool.get_client(FakeRuntime)
+    name, limits = client.opts["http_client"]
+    assert limits.max_connections == 7
+
+    await LLMClientPool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_governor_caps_completions_per_model():
+    governor = CompletionGovernor(max_concurrent=0, max_concurrent_per_model=1)
+    slot = await governor.acquire("model-a")
+    other_model = await governor.acquire("model-b")
+
+    waiter = asyncio.create_task(governor.acquire("model-a"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert governor.get_stats()["waiting"] == 1
+
+    # Releasing twice only frees the slot once
+    slot.release()
+    slot.release()
+    second = await asyncio.wait_for(waiter, 1)
+    assert governor.get_stats()["in_flight_by_model"] == {"model-a": 1, "model-b": 1}
+
+    second.release()
+    other_model.release()
+    assert governor.get_stats()["in_flight"] == 0
@@ -0,0 +1,126 @@
+"""
+Tests for delta history mode in BaseAgent.
+"""
+import pytest
+
+from agent_c.agents.base import BaseAgent
+from agent_c.models.chat_history.chat_session import ChatSession
+from agent_c.models.events import HistoryEvent, HistoryAppendEvent
+
+
+class RecordingAgent(BaseAgent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, vendor="test")
+        self.events = []
+
+    async def record(self, event):
+        self.events.append(event)
+
+
+def _agent(delta: bool = True) -> RecordingAgent:
+    agent = RecordingAgent(history_delta_mode=delta)
+    agent.streaming_callback = agent.record
+    return agent
+
+
+def _apply(history, event):
+    del history[event.start_index:]
+    history.extend(event.messages)
+
+
+@pytest.mark.asyncio
+async def test_appends_only_new_messages():
+    agent = _agent()
+    session = ChatSession(session_id="s1", messages=[{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}])
+    messages = session.messages + [{"role": "user", "content": "do it"}]
+    opts = {"session_id": "s1", "role": "assistant"}
+
+    agent._start_history_tracking(messages, session, **opts)
+    messages.append({"role": "assistant", "content": [{"type": "tool_use"}]})
+    messages.append({"role": "user", "content": [{"type": "tool_result"}]})
+    await agent._raise_history_event(messages, **opts)
+    messages.append({"role": "assistant", "content": "done"})
+    await agent._raise_history_event(messages, **opts)
+
+    first, second = agent.events
+    assert isinstance(first, HistoryAppendEvent) and isinstance(second, HistoryAppendEvent)
+    assert first.start_index == 2 and len(first.messages) == 3 and first.sequence == 1
+    assert second.start_index == 5 and len(second.messages) == 1 and second.sequence == 2
+    assert first.checksum == HistoryAppendEvent.compute_checksum(first.messages)
+    assert second.checksum == HistoryAppendEvent.compute_checksum(second.messages, first.checksum)
+
+    history = list(session.messages)
+    _apply(history, first)
+    _apply(history, second)
+    assert history == messages
+
+
+@pytest.mark.asyncio
+async def test_full_history_when_not_tracking_or_resync_requested():
+    agent = _agent()
+    opts = {"session_id": "s1", "role": "assistant"}
+    messages = [{"role": "user", "content": "hi"}]
+
+    await agent._raise_history_event(messages, **opts)
+    assert isinstance(agent.events[-1], HistoryEvent)
+
+    agent._start_history_tracking(messages, None, **opts)
+    agent.request_full_history("s1")
+    await agent._raise_history_event(messages, **opts)
+    assert isinstance(agent.events[-1], HistoryEvent)
+
+    messages.append({"role": "assistant", "content": "hello"})
+    await agent._raise_history_event(messages, **opts)
+    event = agent.events[-1]
+    assert isinstance(event, HistoryAppendEvent)
+    assert event.sequence == 1 and event.start_index == 1 and event.total_messages == 2
+
+
+@pytest.mark.asyncio
+async def test_delta_mode_off_raises_full_history():
+    agent = _agent(delta=False)
+    opts = {"session_id": "s1", "role": "assistant"}
+    messages = [{"role": "user", "content": "hi"}]
+    agent._start_history_tracking(messages, None, **opts)
+    await agent._raise_history_event(messages, **opts)
+    assert isinstance(agent.events[-1], HistoryEvent)
+
+
+@pytest.mark.asyncio
+async def test_resync_requested_during_the_final_append_is_raised_after_it():
+    agent = _agent()
+    opts = {"session_id": "s1", "role": "assistant"}
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def out_of_sync_consumer(event):
+        agent.events.append(event)
+        if isinstance(event, HistoryAppendEvent):
+            agent.request_full_history(event.session_id)
+
+    agent.streaming_callback = out_of_sync_consumer
+    agent._start_history_tracking(messages, None, **opts)
+    messages.append({"role": "assistant", "content": "hello"})
+    await agent._raise_history_event(messages, **opts)
+    agent._end_history_tracking("s1")
+
+    append, full = agent.events
+    assert isinstance(append, HistoryAppendEvent)
+    assert isinstance(full, HistoryEvent) and full.messages == messages
+
+
+@pytest.mark.asyncio
+async def test_resync_requested_after_the_interaction_is_raised_with_the_next():
+    agent = _agent()
+    opts = {"session_id": "s1", "role": "assistant"}
+    messages = [{"role": "user", "content": "hi"}]
+
+    agent.request_full_history("s1")
+    agent._start_history_tracking(messages, None, **opts)
+    messages.append({"role": "assistant", "content": "hello"})
+    await agent._raise_history_event(messages, **opts)
+    messages.append({"role": "user", "content": "again"})
+    await agent._raise_history_event(messages, **opts)
+
+    full, append = agent.events
+    assert isinstance(full, HistoryEvent) and len(full.messages) == 2
+    assert isinstance(append, HistoryAppendEvent) and append.start_index == 2 and append.sequence == 1
@@ -0,0 +1,100 @@
+"""
+Tests for the bounded session cache in ChatSessionManager.
+"""
+import pytest
+
+from agent_c.chat.session_manager import ChatSessionManager
+from agent_c.models.chat_history.chat_session import ChatSession
+
+
+class MemoryChatLoader:
+    """Stands in for SavedChatLoader, keeping saved sessions in a dict."""
+    def __init__(self):
+        self.saved = {}
+        self.saves = 0
+
+    async def save_session(self, session: ChatSession) -> None:
+        self.saves += 1
+        self.saved[(session.user_id, session.session_id)] = session.model_copy(deep=True)
+
+    def load_session_id(self, session_id: str, user_id: str) -> ChatSession:
+        if (user_id, session_id) not in self.saved:
+            raise FileNotFoundError(session_id)
+        return self.saved[(user_id, session_id)].model_copy(deep=True)
+
+
+def _session(session_id: str, count: int = 4, size: int = 100) -> ChatSession:
+    return ChatSession(session_id=session_id, user_id="tester",
+                       messages=[{"role": "user", "content": "x" * size} for _ in range(count)])
+
+
+@pytest.fixture
+def manager():
+    return ChatSessionManager(loader=MemoryChatLoader(), max_cache_bytes=0, max_cached_sessions=2)
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_flushes_dirty_sessions(manager):
+    for name in ("a", "b"):
+        await manager.new_session(_session(name))
+    await manager.get_session("a", "tester")
+
+    await manager.new_session(_session("c"))
+
+    assert set(manager.get_cached_user_sessions("tester")) == {"a", "c"}
+    assert ("tester", "b") in manager._loader.saved
+
+    reloaded = await manager.get_session("b", "tester")
+    assert reloaded.messages == _session("b").messages
+
+    stats = manager.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 2
+    assert stats["eviction_flushes"] == 2
+
+
+@pytest.mark.asyncio
+async def test_clean_sessions_are_not_saved_on_eviction(manager):
+    session = _session("a")
+    await manager.flush_session(session)
+    await manager.new_session(_session("b"))
+    saves = manager._loader.saves
+
+    await manager.new_session(_session("c"))
+
+    assert "a" not in manager.get_cached_user_sessions("tester")
+    assert manager._loader.saves == saves
+
+
+@pytest.mark.asyncio
+async def test_pinned_sessions_are_never_evicted(manager):
+    pinned = _session("a")
+    await manager.pin_session(pinned)
+    for name in ("b", "c", "d"):
+        await manager.new_session(_session(name))
+
+    assert "a" in manager.get_cached_user_sessions("tester")
+    await manager.release_session("a", "tester")
+    assert "a" in manager.get_cached_user_sessions("tester")
+
+    await manager.unpin_session("a", "tester")
+    await manager.new_session(_session("e"))
+    assert "a" not in manager.get_cached_user_sessions("tester")
+    assert manager.get_cache_stats()["pinned_sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_tracks_message_growth():
+    manager = ChatSessionManager(loader=MemoryChatLoader(), max_cache_bytes=3 * ChatSessionManager.SESSION_OVERHEAD_BYTES)
+    session = _session("a", count=1)
+    await manager.new_session(session)
+    before = manager.get_cache_stats()["estimated_bytes"]
+
+    session.messages.append({"role": "assistant", "content": "y" * 1000})
+    await manager.flush_session(session)
+    assert manager.get_cache_stats()["estimated_bytes"] > before + 1000
+
+    await manager.new_session(_session("b", count=4, size=2000))
+    assert "a" not in manager.get_cached_user_sessions("tester")
+    assert manager.get_cache_stats()["estimated_bytes"] <= manager.max_cache_bytes
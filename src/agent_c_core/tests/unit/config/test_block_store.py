@@ -0,0 +1,161 @@
+"""
+Tests for the instruction block store.
+"""
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from agent_c.config.block_store import BlockStore, _BlockEventHandler
+
+
+@pytest.fixture
+def block_folder(tmp_path):
+    folder = tmp_path / "blocks"
+    (folder / "team").mkdir(parents=True)
+    (folder / "intro.md").write_text("Hello")
+    (folder / "team" / "rules.md").write_text("Be nice")
+    return folder
+
+
+def _polling_store(folder) -> BlockStore:
+    store = BlockStore(folder, watch=False)
+    store.poll_interval = 0
+    return store
+
+
+def _touch(path, content: str, offset_ns: int) -> None:
+    """Rewrites a file with a modification time that is guaranteed to differ."""
+    mtime = os.stat(path).st_mtime_ns + offset_ns
+    path.write_text(content)
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.mark.asyncio
+async def test_blocks_are_keyed_by_relative_path(block_folder):
+    store = _polling_store(block_folder)
+
+    assert await store.get("block_intro") == "Hello"
+    assert await store.get("block_team_rules") == "Be nice"
+    assert await store.get("blocks_team_rules") == "Be nice"
+
+
+@pytest.mark.asyncio
+async def test_blocks_are_read_once(block_folder):
+    store = _polling_store(block_folder)
+
+    for _ in range(3):
+        await store.get("block_intro")
+
+    stats = store.get_stats()
+    assert stats["reads"] == 1
+    assert stats["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_blocks_do_not_rescan_the_folder(block_folder):
+    store = _polling_store(block_folder)
+    rescans = store.get_stats()["rescans"]
+
+    for _ in range(3):
+        assert await store.get("block_nope") is None
+
+    assert store.get_stats()["rescans"] == rescans
+
+
+@pytest.mark.asyncio
+async def test_only_changed_blocks_are_read_again(block_folder):
+    store = _polling_store(block_folder)
+    await store.get("block_intro")
+    await store.get("block_team_rules")
+
+    _touch(block_folder / "team" / "rules.md", "Be very nice", 1_000_000)
+
+    assert await store.get("block_team_rules") == "Be very nice"
+    assert await store.get("block_intro") == "Hello"
+    assert store.get_stats()["reads"] == 3
+
+
+@pytest.mark.asyncio
+async def test_new_blocks_clear_the_missing_cache(block_folder):
+    store = _polling_store(block_folder)
+    assert await store.get("block_team_later") is None
+
+    (block_folder / "team" / "later.md").write_text("Now here")
+    team = block_folder / "team"
+    mtime = os.stat(team).st_mtime_ns + 1_000_000
+    os.utime(team, ns=(mtime, mtime))
+
+    assert await store.get("block_team_later") == "Now here"
+
+
+@pytest.mark.asyncio
+async def test_changes_wait_for_the_poll_interval(block_folder):
+    store = BlockStore(block_folder, poll_interval=3600, watch=False)
+    await store.get("block_intro")
+
+    _touch(block_folder / "intro.md", "Changed", 1_000_000)
+
+    assert await store.get("block_intro") == "Hello"
+    store.reload()
+    assert await store.get("block_intro") == "Changed"
+
+
+@pytest.mark.asyncio
+async def test_folder_created_later_is_found(tmp_path):
+    store = _polling_store(tmp_path / "blocks")
+    assert await store.get("block_intro") is None
+
+    (tmp_path / "blocks").mkdir()
+    (tmp_path / "blocks" / "intro.md").write_text("Hello")
+
+    assert await store.get("block_intro") == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_file_events_drop_changed_blocks(block_folder):
+    store = _polling_store(block_folder)
+    store._observer = object()  # stand in for a running watcher, events are fed by hand
+    await store.get("block_intro")
+
+    (block_folder / "intro.md").write_text("Changed")
+    assert await store.get("block_intro") == "Hello"
+
+    store.mark_changed(str(block_folder / "intro.md"))
+    assert await store.get("block_intro") == "Changed"
+
+    (block_folder / "new.md").write_text("New")
+    assert await store.get("block_new") is None
+    store.mark_rescan()
+    assert await store.get("block_new") == "New"
+    store._observer = None
+
+
+@pytest.mark.asyncio
+async def test_atomic_saves_replace_watched_blocks(block_folder):
+    store = _polling_store(block_folder)
+    store._observer = object()  # stand in for a running watcher, events are fed by hand
+    handler = _BlockEventHandler(store)
+    await store.get("block_intro")
+
+    temp = block_folder / ".intro.md.tmp"
+    temp.write_text("Saved")
+    os.replace(temp, block_folder / "intro.md")
+    handler.on_any_event(SimpleNamespace(event_type="moved", is_directory=False,
+                                         src_path=str(temp), dest_path=str(block_folder / "intro.md")))
+
+    assert await store.get("block_intro") == "Saved"
+    store._observer = None
+
+
+@pytest.mark.asyncio
+async def test_rescans_drop_blocks_replaced_in_place(block_folder):
+    store = _polling_store(block_folder)
+    store._observer = object()
+    await store.get("block_intro")
+
+    _touch(block_folder / "intro.md", "Replaced", 1_000_000)
+    store.mark_rescan()
+
+    assert await store.get("block_intro") == "Replaced"
+    store._observer = None
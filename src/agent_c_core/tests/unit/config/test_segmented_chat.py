@@ -0,0 +1,143 @@
+"""
+Tests for the append-only segmented chat session store.
+"""
+import json
+
+import pytest
+
+from agent_c.config.segmented_chat import SegmentedChatLoader
+from agent_c.models.chat_history.chat_session import ChatSession
+
+
+class NoIndexSegmentedChatLoader(SegmentedChatLoader):
+    """Skips the SQLite index, which isn't what these tests cover."""
+    async def _update_index_entry(self, session: ChatSession) -> None:
+        pass
+
+
+def _session(count: int) -> ChatSession:
+    return ChatSession(session_id="test-session", user_id="tester",
+                       messages=[{"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"} for i in range(count)])
+
+
+@pytest.fixture
+def loader(tmp_path):
+    return NoIndexSegmentedChatLoader(str(tmp_path), segment_bytes=200, compaction_min_bytes=0)
+
+
+def _segment_bytes(loader: SegmentedChatLoader, session: ChatSession) -> int:
+    folder = loader._get_session_folder(session.session_id, session.user_id)
+    return sum(f.stat().st_size for f in folder.glob("segment_*.log"))
+
+
+@pytest.mark.asyncio
+async def test_round_trip_and_append_only(loader):
+    session = _session(4)
+    await loader.save_session(session)
+    written = _segment_bytes(loader, session)
+
+    session.messages.append({"role": "user", "content": "message 4"})
+    await loader.save_session(session)
+    appended = _segment_bytes(loader, session) - written
+
+    assert appended == len(json.dumps(session.messages[-1]).encode("utf-8")) + 1
+    assert loader.load_session_id(session.session_id, session.user_id).messages == session.messages
+
+
+@pytest.mark.asyncio
+async def test_paging_and_windowed_load(loader):
+    session = _session(20)
+    await loader.save_session(session)
+
+    assert loader.get_message_count(session.session_id, session.user_id) == 20
+    assert loader.load_messages(session.session_id, session.user_id, 5, 3) == session.messages[5:8]
+    window = loader.load_session_id(session.session_id, session.user_id, message_window=4)
+    assert window.messages == session.messages[-4:]
+
+
+@pytest.mark.asyncio
+async def test_rewrites_truncation_and_compaction(loader):
+    session = _session(10)
+    await loader.save_session(session)
+
+    session.messages[0] = {"role": "system", "content": "a new system prompt"}
+    session.messages = session.messages[:6]
+    await loader.save_session(session)
+    assert loader.load_session_id(session.session_id, session.user_id).messages == session.messages
+
+    header = loader._read_header(loader._get_session_folder(session.session_id, session.user_id))
+    assert header["store"]["message_count"] == 6
+
+    await loader.compact_session(session.session_id, session.user_id)
+    assert loader.load_session_id(session.session_id, session.user_id).messages == session.messages
+    assert _segment_bytes(loader, session) == sum(len(json.dumps(m).encode("utf-8")) + 1 for m in session.messages)
+
+
+@pytest.mark.asyncio
+async def test_migrates_legacy_json(loader, tmp_path):
+    session = _session(3)
+    user_folder = loader._get_user_folder(session.user_id)
+    user_folder.mkdir(parents=True)
+    with open(user_folder / f"{session.session_id}.json", 'w', encoding='utf-8') as f:
+        json.dump(session.model_dump(exclude={'display_name', 'vendor'}), f)
+
+    loaded = loader.load_session_id(session.session_id, session.user_id)
+    assert loaded.messages == session.messages
+
+    await loader.save_session(loaded)
+    assert not (user_folder / f"{session.session_id}.json").exists()
+    assert loader.get_user_session_ids(session.user_id) == [session.session_id]
+    assert loader.load_session_id(session.session_id, session.user_id).messages == session.messages
+
+
+@pytest.mark.asyncio
+async def test_saving_a_windowed_session_keeps_older_messages(loader):
+    session = _session(20)
+    await loader.save_session(session)
+
+    window = loader.load_session_id(session.session_id, session.user_id, message_window=4)
+    assert window.message_offset == 16
+    window.messages.append({"role": "user", "content": "message 20"})
+    await loader.save_session(window)
+
+    full = loader.load_session_id(session.session_id, session.user_id)
+    assert full.message_offset == 0
+    assert full.messages == session.messages + [{"role": "user", "content": "message 20"}]
+
+
+@pytest.mark.asyncio
+async def test_rewritten_middle_messages_are_saved(loader):
+    session = _session(10)
+    await loader.save_session(session)
+
+    session.messages[5] = {"role": "assistant", "content": "[redacted]"}
+    session.mark_messages_changed(5)
+    await loader.save_session(session)
+
+    assert loader.load_session_id(session.session_id, session.user_id).messages[5] == {"role": "assistant", "content": "[redacted]"}
+
+
+@pytest.mark.asyncio
+async def test_appending_only_encodes_the_new_messages(loader, monkeypatch):
+    session = _session(10)
+    await loader.save_session(session)
+
+    encoded = []
+    encode = loader._encode_message
+    monkeypatch.setattr(loader, "_encode_message", lambda message: encoded.append(message) or encode(message))
+    session.messages.append({"role": "user", "content": "message 10"})
+    await loader.save_session(session)
+
+    assert encoded == [{"role": "user", "content": "message 10"}]
+    assert loader.load_session_id(session.session_id, session.user_id).messages == session.messages
+
+
+@pytest.mark.asyncio
+async def test_sessions_not_from_the_store_are_compared_in_full(loader):
+    await loader.save_session(_session(10))
+
+    session = _session(10)
+    session.messages[5] = {"role": "assistant", "content": "[redacted]"}
+    await loader.save_session(session)
+
+    assert loader.load_session_id(session.session_id, session.user_id).messages[5] == {"role": "assistant", "content": "[redacted]"}
@@ -0,0 +1,94 @@
+"""
+Tests for section memoization in PromptBuilder.
+"""
+from types import SimpleNamespace
+from typing import Any, ClassVar, Optional, Tuple
+
+import pytest
+
+from agent_c.prompting.prompt_builder import PromptBuilder
+from agent_c.prompting.prompt_section import PromptSection, property_bag_item
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.messages = []
+        self.block_requests = 0
+
+    async def send_system_message(self, message, severity):
+        self.messages.append((message, severity))
+
+    async def get_block(self, name):
+        self.block_requests += 1
+        return f"block text for {name}"
+
+
+class CountingSection(PromptSection):
+    render_inputs: ClassVar[Optional[Tuple[str, ...]]] = ("chat_session.session_name",)
+    calls: ClassVar[int] = 0
+
+    def __init__(self, **data: Any):
+        super().__init__(template="Name: ${session_label} ${block_memo_test}", name="Counting", **data)
+
+    @property_bag_item
+    async def session_label(self, context) -> str:
+        CountingSection.calls += 1
+        return context['chat_session'].session_name
+
+
+class UndeclaredSection(PromptSection):
+    calls: ClassVar[int] = 0
+
+    def __init__(self, **data: Any):
+        super().__init__(template="Count: ${call_count}", name="Undeclared", **data)
+
+    @property_bag_item
+    async def call_count(self) -> str:
+        UndeclaredSection.calls += 1
+        return "stable"
+
+
+def _context(name: str = "first") -> dict:
+    return {"chat_session": SimpleNamespace(session_name=name, metadata={})}
+
+
+@pytest.fixture
+def builder():
+    CountingSection.calls = 0
+    UndeclaredSection.calls = 0
+    notifier = RecordingNotifier()
+    return PromptBuilder(notifier, notifier, sections=[PromptSection(name="Static", template="Static text"),
+                                                       CountingSection(), UndeclaredSection()])
+
+
+@pytest.mark.asyncio
+async def test_unchanged_inputs_reuse_sections_and_prompt(builder):
+    first = await builder.render(_context())
+    second = await builder.render(_context())
+
+    assert second is first
+    assert builder.last_render_changed is False
+    assert "Name: first block text for block_memo_test" in first
+    assert CountingSection.calls == 1
+    assert UndeclaredSection.calls == 2
+    assert builder.block_loader.block_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_declared_input_change_rerenders(builder):
+    first = await builder.render(_context())
+    second = await builder.render(_context("second"))
+
+    assert builder.last_render_changed is True
+    assert "Name: second" in second and second != first
+    assert CountingSection.calls == 2
+
+    builder.invalidate()
+    await builder.render(_context("second"))
+    assert CountingSection.calls == 3
+
+
+def test_template_variables_are_cached():
+    template = "${a} $b {c} $$d"
+    assert PromptBuilder._get_template_variables(template) == {"a", "b", "c"}
+    assert PromptBuilder._get_template_variables(template) is PromptBuilder._get_template_variables(template)
@@ -0,0 +1,100 @@
+"""
+Tests for toolsets registered from a manifest and imported on first activation.
+"""
+import sys
+import textwrap
+
+import pytest
+
+from agent_c.toolsets.tool_chest import ToolChest
+from agent_c.toolsets.tool_set import Toolset
+
+MODULE = "lazy_toolset_module"
+
+SOURCE = textwrap.dedent('''
+    from agent_c.toolsets.json_schema import json_schema
+    from agent_c.toolsets.tool_set import Toolset
+
+
+    class LazyDemoTools(Toolset):
+        """Tools that are imported on first use."""
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, name="lazy_demo")
+
+        @json_schema("Says hello", {})
+        async def hello(self, **kwargs):
+            return "hello"
+
+
+    Toolset.register(LazyDemoTools)
+''')
+
+SCHEMAS = [{"type": "function", "function": {"name": "hello", "description": "Says hello"}}]
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    (tmp_path / f"{MODULE}.py").write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = list(Toolset.tool_registry)
+    yield MODULE
+    sys.modules.pop(MODULE, None)
+    Toolset.tool_registry[:] = registry
+    Toolset.lazy_toolsets.clear()
+    Toolset.tool_dependencies.pop("LazyDemoTools", None)
+    Toolset.client_tool_registry = None
+
+
+def test_lazy_toolsets_are_in_the_catalog_without_importing(lazy_module):
+    Toolset.register_lazy("LazyDemoTools", lazy_module, description="Tools that are imported on first use.", schemas=SCHEMAS)
+
+    catalog = {info.name: info for info in Toolset.get_client_registry()}
+
+    assert catalog["LazyDemoTools"].schemas == SCHEMAS
+    assert lazy_module not in sys.modules
+
+
+@pytest.mark.asyncio
+async def test_activation_imports_the_module(lazy_module):
+    Toolset.register_lazy("LazyDemoTools", lazy_module)
+    tool_chest = ToolChest({})
+
+    assert await tool_chest.activate_toolset("LazyDemoTools")
+
+    assert lazy_module in sys.modules
+    assert "LazyDemoTools" in tool_chest.available_tools
+    assert "LazyDemoTools" not in Toolset.lazy_toolsets
+
+
+@pytest.mark.asyncio
+async def test_toolsets_whose_module_fails_to_import_are_not_activated(lazy_module):
+    Toolset.register_lazy("BrokenTools", "no_such_toolset_module")
+    tool_chest = ToolChest({})
+
+    assert not await tool_chest.activate_toolset("BrokenTools")
+    assert Toolset.get_toolset_class("BrokenTools") is None
+    assert "ModuleNotFoundError" in Toolset.lazy_toolsets["BrokenTools"]["import_error"]
+
+
+@pytest.mark.asyncio
+async def test_failed_imports_are_retried(lazy_module, tmp_path):
+    (tmp_path / f"{lazy_module}.py").write_text("raise RuntimeError('not yet')")
+    Toolset.register_lazy("LazyDemoTools", lazy_module)
+    assert Toolset.get_toolset_class("LazyDemoTools") is None
+
+    (tmp_path / f"{lazy_module}.py").write_text(SOURCE)
+    sys.modules.pop(lazy_module, None)
+
+    assert await ToolChest({}).activate_toolset("LazyDemoTools")
+    assert "LazyDemoTools" not in Toolset.lazy_toolsets
+
+
+def test_lazy_shareable_and_dependencies_come_from_the_manifest(lazy_module):
+    Toolset.register_lazy("LazyDemoTools", lazy_module, shareable=True)
+    assert Toolset.is_shareable("LazyDemoTools")
+
+    Toolset.register_lazy("LazyDemoTools", lazy_module, required_tools=["UnknownTools"], shareable=True)
+    assert Toolset.get_required_tools("LazyDemoTools") == ["UnknownTools"]
+    assert not Toolset.is_shareable("LazyDemoTools")
+
+    assert lazy_module not in sys.modules
@@ -0,0 +1,93 @@
+"""
+Tests for sharing instances of shareable toolsets between ToolChests.
+"""
+import pytest
+
+from agent_c.toolsets.json_schema import json_schema
+from agent_c.toolsets.tool_chest import ToolChest
+from agent_c.toolsets.tool_set import Toolset
+
+
+class SharedStatelessTools(Toolset):
+    shareable = True
+    created = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="shared_stateless")
+        SharedStatelessTools.created += 1
+        self.closed = False
+        self.saw_workspaces = 'workspaces' in kwargs
+
+    @json_schema("Echoes", {"text": {"type": "string", "description": "Text to echo"}})
+    async def echo(self, **kwargs):
+        return kwargs.get("text")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class PerUserTools(Toolset):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="per_user")
+        self.closed = False
+
+    @json_schema("Does a user thing", {})
+    async def user_thing(self, **kwargs):
+        return "done"
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class DependsOnPerUserTools(Toolset):
+    shareable = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="depends_on_per_user")
+
+    @json_schema("Uses the per user tools", {})
+    async def dependent_thing(self, **kwargs):
+        return "done"
+
+
+Toolset.register(SharedStatelessTools)
+Toolset.register(PerUserTools)
+Toolset.register(DependsOnPerUserTools, required_tools=['PerUserTools'])
+
+
+@pytest.mark.asyncio
+async def test_shareable_toolsets_are_shared_between_chests():
+    await ToolChest.close_shared_toolsets()
+    SharedStatelessTools.created = 0
+    first = ToolChest({"workspaces": []})
+    second = ToolChest({"workspaces": []})
+
+    assert await first.activate_toolset(["SharedStatelessTools", "PerUserTools"])
+    assert await second.activate_toolset(["SharedStatelessTools", "PerUserTools"])
+
+    shared = first.available_tools["SharedStatelessTools"]
+    assert shared is second.available_tools["SharedStatelessTools"]
+    assert SharedStatelessTools.created == 1
+    assert shared.tool_chest is None and not shared.saw_workspaces
+    assert first.available_tools["PerUserTools"] is not second.available_tools["PerUserTools"]
+
+    # Closing a chest leaves the shared instance open for the others
+    per_user = first.available_tools["PerUserTools"]
+    await first.close()
+    assert per_user.closed and not shared.closed
+    assert await second.call_tool_internal("shared_stateless_echo", {"text": "hi"}, {}) == "hi"
+
+    await ToolChest.close_shared_toolsets()
+    assert shared.closed
+
+
+@pytest.mark.asyncio
+async def test_toolsets_depending_on_per_user_toolsets_are_not_shared():
+    assert Toolset.is_shareable("SharedStatelessTools")
+    assert not Toolset.is_shareable("DependsOnPerUserTools")
+
+    first = ToolChest({})
+    second = ToolChest({})
+    assert await first.activate_toolset("DependsOnPerUserTools")
+    assert await second.activate_toolset("DependsOnPerUserTools")
+    assert first.available_tools["DependsOnPerUserTools"] is not second.available_tools["DependsOnPerUserTools"]
@@ -0,0 +1,125 @@
+"""
+Tests for the concurrency limits, timeouts and cancellation in ToolChest.call_tools.
+"""
+import asyncio
+
+import pytest
+
+from agent_c.toolsets.json_schema import json_schema
+from agent_c.toolsets.tool_chest import ToolChest
+from agent_c.toolsets.tool_set import Toolset
+
+
+class SchedulerTools(Toolset):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="sched")
+        self.running = 0
+        self.peak = 0
+
+    @json_schema("Sleeps for a while", {"seconds": {"type": "number", "description": "How long"}})
+    async def nap(self, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(kwargs.get("seconds", 0.05))
+        finally:
+            self.running -= 1
+        return "rested"
+
+    @json_schema("Never finishes in time", {}, timeout=0.05)
+    async def stall(self, **kwargs):
+        await asyncio.sleep(5)
+        return "late"
+
+
+class FakeBridge:
+    async def send_system_message(self, *args, **kwargs):
+        pass
+
+    async def send_error(self, *args, **kwargs):
+        pass
+
+
+def _calls(*names):
+    return [{"id": f"call_{i}", "name": name, "input": {"seconds": 0.05}} for i, name in enumerate(names)]
+
+
+async def _chest() -> ToolChest:
+    tool_chest = ToolChest({"max_concurrent_tool_calls": 8, "max_concurrent_toolset_calls": 4, "default_tool_timeout": 0})
+    await tool_chest.add_tool_instance(SchedulerTools(tool_chest=tool_chest, max_concurrent_calls=2))
+    return tool_chest
+
+
+@pytest.mark.asyncio
+async def test_per_toolset_limit():
+    chest = await _chest()
+    tools = chest.available_tools["SchedulerTools"]
+    result = await chest.call_tools(_calls(*["sched_nap"] * 6), {"bridge": FakeBridge()})
+
+    assert tools.peak == 2
+    assert [r["content"] for r in result[1]["content"]] == ["rested"] * 6
+
+
+@pytest.mark.asyncio
+async def test_timeout_keeps_other_results():
+    chest = await _chest()
+    result = await chest.call_tools(_calls("sched_nap", "sched_stall"), {"bridge": FakeBridge()}, format_type="gpt")
+
+    assert result[0]["tool_calls"][1]["function"]["name"] == "sched_stall"
+    assert result[1]["content"] == "rested"
+    assert "timed out" in result[2]["content"]
+    assert [r["tool_call_id"] for r in result[1:]] == ["call_0", "call_1"]
+
+
+@pytest.mark.asyncio
+async def test_client_cancel_returns_partial_results():
+    chest = await _chest()
+    cancel = asyncio.Event()
+    calls = _calls("sched_nap", "sched_nap")
+    calls[1]["input"] = {"seconds": 5}
+    chest.cancel_poll_interval = 0.01
+
+    async def cancel_soon():
+        await asyncio.sleep(0.1)
+        cancel.set()
+
+    canceller = asyncio.create_task(cancel_soon())
+    result = await chest.call_tools(calls, {"bridge": FakeBridge(), "client_wants_cancel": cancel})
+    await canceller
+
+    contents = [r["content"] for r in result[1]["content"]]
+    assert contents[0] == "rested"
+    assert "cancelled by the user" in contents[1]
+    assert chest.available_tools["SchedulerTools"].running == 0
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_not_deep_copied():
+    chest = await _chest()
+    calls = _calls("sched_nap")
+    result = await chest.call_tools(calls, {"bridge": FakeBridge()})
+
+    # The echoed call shares its input with the original, the tool context stays out of both
+    echoed = result[0]["content"][0]
+    assert echoed is not calls[0] and echoed["input"] is calls[0]["input"]
+    assert "tool_context" not in calls[0]["input"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_while_waiting_releases_held_semaphores():
+    chest = await _chest()
+    toolset = chest.available_tools["SchedulerTools"]
+    global_semaphore, toolset_semaphore = chest._semaphores_for(toolset)
+    for _ in range(2):
+        await toolset_semaphore.acquire()
+
+    call = asyncio.create_task(chest._run_tool_call("sched_nap", {"seconds": 0}, {}))
+    await asyncio.sleep(0.01)
+    assert global_semaphore._value == 7
+
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    assert global_semaphore._value == 8
+    assert toolset_semaphore._value == 0
@@ -0,0 +1,81 @@
+"""
+Tests for the converted schema cache in ToolChest.get_inference_data.
+"""
+import pytest
+
+from agent_c.toolsets.json_schema import json_schema
+from agent_c.toolsets.tool_chest import ToolChest
+from agent_c.toolsets.tool_set import Toolset
+
+
+class SchemaCacheTools(Toolset):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="schema_cache")
+
+    @json_schema("Runs a thing", {"target": {"type": "string", "description": "What to run", "required": True}})
+    async def run_thing(self, **kwargs):
+        return "ran"
+
+    @json_schema("Other thing", {"target": {"type": "string", "description": "What to do"}})
+    async def other_thing(self, **kwargs):
+        return "done"
+
+
+class OtherSchemaCacheTools(Toolset):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="other_schema_cache")
+
+    @json_schema("Does more", {})
+    async def more(self, **kwargs):
+        return "more"
+
+
+@pytest.fixture
+def tool_chest():
+    return ToolChest({})
+
+
+@pytest.mark.asyncio
+async def test_schemas_are_cached_and_immutable(tool_chest):
+    await tool_chest.add_tool_instance(SchemaCacheTools(tool_chest=tool_chest))
+
+    first = tool_chest.get_inference_data(["SchemaCacheTools"], "claude")
+    second = tool_chest.get_inference_data(["SchemaCacheTools"], "claude")
+
+    assert first["schemas"] is second["schemas"]
+    assert {s["name"] for s in first["schemas"]} == {"schema_cache_run_thing", "schema_cache_other_thing"}
+    assert all("input_schema" in s for s in first["schemas"])
+    with pytest.raises(TypeError):
+        first["schemas"][0]["name"] = "changed"
+    with pytest.raises(TypeError):
+        first["schemas"][0]["input_schema"]["properties"]["target"]["type"] = "int"
+
+    # The toolset's own OpenAI schemas are untouched by the conversion
+    assert "parameters" in tool_chest.available_tools["SchemaCacheTools"].tool_schemas[0]["function"]
+    openai = tool_chest.get_inference_data(["SchemaCacheTools"], "openai")
+    assert "function" in openai["schemas"][0]
+
+
+@pytest.mark.asyncio
+async def test_allow_list_is_part_of_the_key(tool_chest):
+    await tool_chest.add_tool_instance(SchemaCacheTools(tool_chest=tool_chest))
+
+    unfiltered = tool_chest.get_inference_data(["SchemaCacheTools"], "claude")
+    blocked = tool_chest.get_inference_data(["SchemaCacheTools"], "claude", ["schema_cache_*"], ["*_run_thing"])
+
+    assert len(unfiltered["schemas"]) == 2
+    assert [s["name"] for s in blocked["schemas"]] == ["schema_cache_run_thing"]
+
+
+@pytest.mark.asyncio
+async def test_registry_changes_invalidate(tool_chest):
+    await tool_chest.add_tool_instance(SchemaCacheTools(tool_chest=tool_chest))
+    names = ["SchemaCacheTools", "OtherSchemaCacheTools"]
+    before = tool_chest.get_inference_data(names, "claude")
+    version = tool_chest.schema_version
+
+    await tool_chest.add_tool_instance(OtherSchemaCacheTools(tool_chest=tool_chest))
+    after = tool_chest.get_inference_data(names, "claude")
+
+    assert tool_chest.schema_version > version
+    assert len(after["schemas"]) == len(before["schemas"]) + 1
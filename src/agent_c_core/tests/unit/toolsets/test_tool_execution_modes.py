@@ -0,0 +1,71 @@
+"""
+Tests for running tools off the event loop via the json_schema execution mode.
+"""
+import os
+import threading
+
+import pytest
+
+from agent_c.toolsets.json_schema import json_schema
+from agent_c.toolsets.tool_chest import ToolChest
+from agent_c.toolsets.tool_set import Toolset
+
+
+class ExecutionModeTools(Toolset):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs, name="modes")
+        self.offset = 10
+
+    @json_schema("Runs on the loop", {})
+    async def on_loop(self, **kwargs):
+        return threading.get_ident()
+
+    @json_schema("Runs on a worker thread", {"note": {"type": "string", "description": "Sent back as an event"}}, execution="thread")
+    async def on_thread(self, **kwargs):
+        await kwargs['tool_context']['streaming_callback'](kwargs.get('note'))
+        return threading.get_ident()
+
+    @json_schema("Runs in a worker process", {"value": {"type": "integer", "description": "A number"}}, execution="process")
+    def in_process(self, **kwargs):
+        return os.getpid(), kwargs['value'] + self.offset, 'tool_context' in kwargs, self.tool_chest is None
+
+
+def test_unknown_execution_mode_is_rejected():
+    with pytest.raises(ValueError):
+        json_schema("Bad", {}, execution="gpu")
+
+
+@pytest.mark.asyncio
+async def test_thread_and_loop_modes():
+    tool_chest = ToolChest({})
+    await tool_chest.add_tool_instance(ExecutionModeTools(tool_chest=tool_chest))
+    toolset = tool_chest.available_tools["ExecutionModeTools"]
+    loop_thread = threading.get_ident()
+    events = []
+
+    async def streaming_callback(event):
+        events.append((event, threading.get_ident()))
+
+    tool_context = {"streaming_callback": streaming_callback}
+    assert await toolset.call("modes_on_loop", {"tool_context": tool_context}) == loop_thread
+    assert await toolset.call("modes_on_thread", {"note": "hello", "tool_context": tool_context}) != loop_thread
+
+    # The streaming callback is routed back to the calling loop
+    assert events == [("hello", loop_thread)]
+
+
+@pytest.mark.asyncio
+async def test_process_mode_runs_against_a_copy():
+    tool_chest = ToolChest({})
+    await tool_chest.add_tool_instance(ExecutionModeTools(tool_chest=tool_chest))
+    toolset = tool_chest.available_tools["ExecutionModeTools"]
+
+    try:
+        pid, value, had_context, detached = await toolset.call("modes_in_process", {"value": 5, "tool_context": {"bridge": object()}})
+    finally:
+        ToolChest.shutdown_executors()
+
+    assert pid != os.getpid()
+    assert value == 15
+    assert not had_context
+    assert detached
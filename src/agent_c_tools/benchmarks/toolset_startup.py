@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the time and memory it takes to make the toolsets available at startup.
+
+Each run is a fresh interpreter.  The eager column imports every toolset module, the way startup worked
+before the manifest, the lazy column registers the toolsets from a manifest built beforehand.  The
+activation table then shows, for the slowest toolsets, what importing one on its first activation costs.
+
+Usage:
+    python benchmarks/toolset_startup.py [--runs 3] [--top 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+EAGER = """
+import json, resource, time
+start = time.perf_counter()
+from agent_c_tools.toolset_manifest import _import, toolset_modules
+for module in toolset_modules():
+    _import(module)
+from agent_c.toolsets.tool_set import Toolset
+print(json.dumps({'seconds': time.perf_counter() - start, 'toolsets': len(Toolset.tool_registry),
+                  'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+LAZY = """
+import json, resource, time
+start = time.perf_counter()
+from agent_c_tools.toolset_manifest import register_toolsets
+from agent_c.toolsets.tool_set import Toolset
+stats = register_toolsets({path!r})
+print(json.dumps({'seconds': time.perf_counter() - start, 'toolsets': len(Toolset.tool_registry) + len(Toolset.lazy_toolsets),
+                  'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 'imported': stats['imported']}))
+"""
+
+ACTIVATE = """
+import json, time
+from agent_c_tools.toolset_manifest import register_toolsets
+from agent_c.toolsets.tool_set import Toolset
+register_toolsets({path!r})
+timings = {{}}
+for name in sorted(Toolset.lazy_toolsets):
+    if name in Toolset.lazy_toolsets:
+        start = time.perf_counter()
+        Toolset.get_toolset_class(name)
+        timings[name] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+def run(code: str) -> Any:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(label: str, samples: List[Dict[str, Any]]) -> None:
+    seconds = statistics.median(sample['seconds'] for sample in samples)
+    rss = statistics.median(sample['rss_kb'] for sample in samples) / 1024
+    print(f"{label:<8}{seconds * 1000:>12.0f}{rss:>12.1f}{samples[0]['toolsets']:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per mode")
+    parser.add_argument("--top", type=int, default=10, help="Toolsets shown in the activation table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "toolset_manifest.json")
+        run(f"from agent_c_tools.toolset_manifest import build_manifest; build_manifest({path!r}); print('{{}}')")
+
+        print(f"{'mode':<8}{'startup ms':>12}{'max RSS MB':>12}{'toolsets':>10}")
+        summarize("eager", [run(EAGER) for _ in range(args.runs)])
+        lazy = [run(LAZY.format(path=path)) for _ in range(args.runs)]
+        summarize("lazy", lazy)
+        if lazy[0]['imported']:
+            print(f"({lazy[0]['imported']} modules were imported at startup, the manifest doesn't cover them)")
+
+        timings = run(ACTIVATE.format(path=path))
+
+    print(f"\n{'first activation':<40}{'import ms':>12}")
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{name:<40}{seconds * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,4 @@
-# Register all tools for the agent
-
-from . import workspace
-from . import web
-from . import web_search
-from . import memory
-from . import think
-from . import user_bio
-from . import weather
-from . import random_number
-from . import xml_explorer  # XML Explorer toolset
-from . import json_explorer  # JSON Explorer toolset
-from . import css_explorer  # CSS Explorer toolset
-from . import mariadb  # MariaDB toolset
-from . import math  # Math toolset
-from . import workspace_planning  # Workspace Planning toolset
-from . import workspace_knowledge  # Workspace Knowledge toolset
-from . import workspace_sequential_thinking  # Workspace Sequential Thinking toolset
-from . import browser_playwright  # Browser Playwright toolset
-from . import insurance_demo  # Insurance Demo toolset
-from . import sars  # SARS toolset
-from agent_c.toolsets.claude_server_tools import ClaudeWebSearchTools, ClaudeWebFetchTools, ClaudeComputerUseTools, ClaudeCodeExecutionTools
-from .toolbelt.tool import ToolbeltTools
-from .microsoft_stream.tool import MicrosoftStreamTools
-from . import ace_proto
-
+# Toolsets register themselves with Toolset when their module is imported, this package imports none of
+# them so that using one tool doesn't load the dependencies of all the others.  Import the toolsets you
+# need, `agent_c_tools.tools.full` for all of them, or use `agent_c_tools.toolset_manifest` to register
+# every toolset and import each one the first time it's activated.
@@ -4,11 +4,13 @@ Provides AI agents with comprehensive source code analysis capabilities across
 multiple programming languages using the ACE Proto (ts_tool) library.
 """
 
+import asyncio
+import os
 import re
-from typing import Optional, cast, Dict, Any, Tuple
+from typing import Optional, cast, Dict, Any, List, Tuple
 from datetime import datetime
 
-from agent_c.toolsets import Toolset, json_schema
+from agent_c.toolsets import Toolset, ToolChest, json_schema
 from agent_c_tools.helpers.path_helper import os_file_system_path
 from agent_c_tools.helpers.token_helper import is_content_too_large
 from agent_c_tools.helpers.validate_kwargs import validate_required_fields
@@ -20,6 +22,11 @@ try:
 except ImportError:
     ace_proto = None
 
+try:
+    from ts_tool.core.symbol_index import SymbolIndex
+except ImportError:
+    SymbolIndex = None
+
 
 class AceProtoTools(Toolset):
     """
@@ -28,8 +35,13 @@ class AceProtoTools(Toolset):
     including Python, JavaScript, TypeScript, Java, C#, Go, Rust, and more.
     
     All analysis results are automatically saved to the code_explorer folder for future reference.
+    Your agent can also search a workspace wide symbol index to find where symbols are defined and
+    which files import a module.
     """
 
+    # Where the symbol index of a workspace is stored, relative to the workspace root
+    SYMBOL_INDEX_PATH = 'code_explorer/symbol_index.json'
+
     def __init__(self, **kwargs):
         """Initialize the ACE Proto toolset.
         
@@ -38,6 +50,7 @@ class AceProtoTools(Toolset):
         """
         super().__init__(**kwargs, name='agent_code_explorer', use_prefix=False)
         self.workspace_tools: Optional[WorkspaceTools] = None
+        self._symbol_indexes: Dict[str, Any] = {}
         
         # Verify ACE Proto is available
         if ace_proto is None:
@@ -273,6 +286,63 @@ class AceProtoTools(Toolset):
         else:
             return f"Analysis saved to {save_path}"
 
+    async def _get_symbol_index(self, path: str, refresh: bool) -> Tuple[Optional[str], Optional[Any], Optional[str], str]:
+        """Get the symbol index of a workspace, updating it first if asked or if it was never built.
+
+        Args:
+            path: UNC path of the workspace or of a folder in it
+            refresh: Whether to bring the index up to date with the files first
+
+        Returns:
+            Tuple of (error_message, index, workspace_name, folder prefix of the path)
+        """
+        if SymbolIndex is None:
+            return "ERROR: The installed ACE Proto (ts_tool) has no symbol index", None, None, ''
+
+        error, workspace_obj, relative_path = self.workspace_tools.validate_and_get_workspace_path(path)
+        if error:
+            return f"ERROR: {error}", None, None, ''
+
+        root = getattr(workspace_obj, 'workspace_root', None)
+        if root is None:
+            return f"ERROR: The symbol index needs a local workspace, {workspace_obj.name} isn't one", None, None, ''
+
+        index = self._symbol_indexes.get(workspace_obj.name)
+        if index is None:
+            index = SymbolIndex(str(root), os.path.join(str(root), self.SYMBOL_INDEX_PATH))
+            self._symbol_indexes[workspace_obj.name] = index
+
+        if refresh or index.updated_at is None:
+            # Walking the workspace blocks, parsing the changed files runs in the shared process pool
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(ToolChest.get_executor('thread'), index.update, ToolChest.get_executor('process'))
+
+        prefix = (relative_path or '').strip('/')
+        return None, index, workspace_obj.name, f"{prefix}/" if prefix else ''
+
+    def _format_symbols(self, title: str, symbols: List[Dict[str, Any]], workspace_name: str) -> str:
+        """Format symbol index results as a markdown list.
+
+        Args:
+            title: Heading of the list
+            symbols: Symbols returned by the index
+            workspace_name: Name of the indexed workspace
+
+        Returns:
+            Markdown list of the symbols with their locations
+        """
+        if not symbols:
+            return f"## {title}\n\nNo symbols found."
+
+        lines = [f"## {title}", ""]
+        for symbol in symbols:
+            line = (f"- {symbol['kind']} `{symbol['qualified_name']}` "
+                    f"//{workspace_name}/{symbol['path']}:{symbol['line']}-{symbol['end_line']}")
+            if symbol.get('signature'):
+                line += f" `{symbol['signature']}`"
+            lines.append(line)
+        return "\n".join(lines)
+
     # ===== Tool Methods =====
     @json_schema(
         description="Analyze a source code file and extract complete structure including all classes, functions, methods, and variables with full details. Results are saved for future reference.",
@@ -343,6 +413,8 @@ class AceProtoTools(Toolset):
 
             params = {
                 "code": code,
+                # Lets ts_tool reparse the file incrementally after it changes
+                "source_id": file_path,
                 "format": 'markdown',
                 "style": "compact" if compact else "standard",
             }
@@ -436,6 +508,7 @@ class AceProtoTools(Toolset):
 
             params = {
                 "code": code,
+                "source_id": file_path,
                 "format": 'markdown'
             }
             if language:
@@ -535,6 +608,7 @@ class AceProtoTools(Toolset):
 
             params = {
                 "code": code,
+                "source_id": file_path,
                 "entity_type": entity_type,
                 "entity_name": entity_name,
                 "detail_level": detail_level,
@@ -622,6 +696,7 @@ class AceProtoTools(Toolset):
 
             params = {
                 "code": code,
+                "source_id": file_path,
                 "entity_type": entity_type,
                 "entity_name": entity_name,
             }
@@ -707,6 +782,7 @@ class AceProtoTools(Toolset):
 
             params = {
                 "code": code,
+                "source_id": file_path,
                 "entity_type": entity_type,
                 "entity_name": entity_name,
             }
@@ -798,6 +874,7 @@ class AceProtoTools(Toolset):
 
             params = {
                 "code": code,
+                "source_id": file_path,
                 "entity_type": entity_type,
                 "entity_name": entity_name,
             }
@@ -859,6 +936,7 @@ class AceProtoTools(Toolset):
 
             params = {
                 "code": code,
+                "source_id": file_path,
                 "format": 'markdown'
             }
             if language:
@@ -874,6 +952,213 @@ class AceProtoTools(Toolset):
             return f"ERROR: {str(e)}"
 
 
+    @json_schema(
+        description="Build or update the symbol index of a workspace. The index covers every Python, JavaScript, Java, C# and PL/SQL file and is updated incrementally, only changed files are parsed again. The search tools update it automatically, use this to build it ahead of time or to see its statistics.",
+        params={
+            "path": {
+                "type": "string",
+                "description": "UNC path of the workspace to index (e.g., //workspace)",
+                "required": True
+            }
+        }
+    )
+    async def update_symbol_index(self, **kwargs) -> str:
+        """Build or update the symbol index of a workspace.
+
+        Returns:
+            Markdown statistics of the index and the update
+        """
+        try:
+            success, message = validate_required_fields(kwargs=kwargs, required_fields=['path'])
+            if not success:
+                return message
+
+            error, index, workspace_name, _ = await self._get_symbol_index(kwargs.get("path"), refresh=True)
+            if error:
+                return error
+
+            stats = index.get_stats()
+            update = stats['last_update']
+            lines = [
+                f"## Symbol index of //{workspace_name}",
+                "",
+                f"- {stats['files']} files, {stats['symbols']} symbols",
+                f"- Updated in {update['seconds']:.2f}s: {update['parsed']} files parsed, {update['removed']} removed",
+            ]
+            for language, counts in sorted(stats['languages'].items()):
+                lines.append(f"- {language}: {counts['files']} files, {counts['symbols']} symbols")
+            if update['errors']:
+                lines.append(f"- {len(update['errors'])} files could not be indexed: {', '.join(sorted(update['errors'])[:10])}")
+            return "\n".join(lines)
+
+        except Exception as e:
+            self.logger.error(f"Error in update_symbol_index: {str(e)}")
+            return f"ERROR: {str(e)}"
+
+    @json_schema(
+        description="Find where a class, function, method or variable is defined anywhere in a workspace, using the workspace symbol index. Much faster than searching files one at a time.",
+        params={
+            "name": {
+                "type": "string",
+                "description": "Name of the symbol. Methods may be qualified as ClassName.method_name",
+                "required": True
+            },
+            "path": {
+                "type": "string",
+                "description": "UNC path of the workspace, or of a folder in it to limit the results to (e.g., //workspace/src)",
+                "required": True
+            },
+            "kind": {
+                "type": "string",
+                "description": "Optional kind of symbol to find",
+                "enum": ["class", "method", "function", "variable"],
+                "required": False
+            },
+            "refresh": {
+                "type": "boolean",
+                "description": "If True (default), picks up changed files before searching.",
+                "required": False,
+                "default": True
+            }
+        }
+    )
+    async def find_symbol_definition(self, **kwargs) -> str:
+        """Find where a symbol is defined in a workspace.
+
+        Returns:
+            Markdown list of the definitions with their locations
+        """
+        try:
+            success, message = validate_required_fields(kwargs=kwargs, required_fields=['name', 'path'])
+            if not success:
+                return message
+
+            name = kwargs.get("name")
+            error, index, workspace_name, prefix = await self._get_symbol_index(kwargs.get("path"), kwargs.get("refresh", True))
+            if error:
+                return error
+
+            symbols = index.find_definition(name, kwargs.get("kind"), path_prefix=prefix)
+            return self._format_symbols(f"Definitions of {name}", symbols, workspace_name)
+
+        except Exception as e:
+            self.logger.error(f"Error in find_symbol_definition: {str(e)}")
+            return f"ERROR: {str(e)}"
+
+    @json_schema(
+        description="List the symbols of a workspace whose names match a pattern, using the workspace symbol index.",
+        params={
+            "pattern": {
+                "type": "string",
+                "description": "Glob pattern such as 'get_*' or '*Manager', or text the names must contain. Case insensitive.",
+                "required": True
+            },
+            "path": {
+                "type": "string",
+                "description": "UNC path of the workspace, or of a folder in it to limit the results to (e.g., //workspace/src)",
+                "required": True
+            },
+            "kind": {
+                "type": "string",
+                "description": "Optional kind of symbol to list",
+                "enum": ["class", "method", "function", "variable"],
+                "required": False
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of symbols to return. Defaults to 50.",
+                "required": False,
+                "default": 50
+            },
+            "refresh": {
+                "type": "boolean",
+                "description": "If True (default), picks up changed files before searching.",
+                "required": False,
+                "default": True
+            }
+        }
+    )
+    async def search_symbols(self, **kwargs) -> str:
+        """List the symbols of a workspace matching a pattern.
+
+        Returns:
+            Markdown list of the matching symbols with their locations
+        """
+        try:
+            success, message = validate_required_fields(kwargs=kwargs, required_fields=['pattern', 'path'])
+            if not success:
+                return message
+
+            pattern = kwargs.get("pattern")
+            limit = kwargs.get("limit", 50)
+            error, index, workspace_name, prefix = await self._get_symbol_index(kwargs.get("path"), kwargs.get("refresh", True))
+            if error:
+                return error
+
+            symbols = index.search(pattern, kwargs.get("kind"), limit=limit, path_prefix=prefix)
+            return self._format_symbols(f"Symbols matching {pattern}", symbols, workspace_name)
+
+        except Exception as e:
+            self.logger.error(f"Error in search_symbols: {str(e)}")
+            return f"ERROR: {str(e)}"
+
+    @json_schema(
+        description="Find the files of a workspace that import a module, package or name, using the workspace symbol index.",
+        params={
+            "module": {
+                "type": "string",
+                "description": "Module, package or imported name, such as 'os.path', 'react' or 'ToolChest'",
+                "required": True
+            },
+            "path": {
+                "type": "string",
+                "description": "UNC path of the workspace, or of a folder in it to limit the results to (e.g., //workspace/src)",
+                "required": True
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of import statements to return. Defaults to 100.",
+                "required": False,
+                "default": 100
+            },
+            "refresh": {
+                "type": "boolean",
+                "description": "If True (default), picks up changed files before searching.",
+                "required": False,
+                "default": True
+            }
+        }
+    )
+    async def find_importers(self, **kwargs) -> str:
+        """Find the files of a workspace importing a module.
+
+        Returns:
+            Markdown list of the import statements with their files
+        """
+        try:
+            success, message = validate_required_fields(kwargs=kwargs, required_fields=['module', 'path'])
+            if not success:
+                return message
+
+            module = kwargs.get("module")
+            limit = kwargs.get("limit", 100)
+            error, index, workspace_name, prefix = await self._get_symbol_index(kwargs.get("path"), kwargs.get("refresh", True))
+            if error:
+                return error
+
+            imports = index.find_importers(module, limit=limit, path_prefix=prefix)
+            if not imports:
+                return f"## Importers of {module}\n\nNo files import {module}."
+
+            lines = [f"## Importers of {module}", ""]
+            lines.extend(f"- //{workspace_name}/{item['path']}: `{item['import']}`" for item in imports)
+            return "\n".join(lines)
+
+        except Exception as e:
+            self.logger.error(f"Error in find_importers: {str(e)}")
+            return f"ERROR: {str(e)}"
+
+
     # Removing for now, as we can control this via prompt, but leaving code here for future reference
     # @json_schema(
     #     description="List all programming languages supported by the code analyzer. Use this to check if a specific language can be analyzed.",
@@ -1,3 +1,4 @@
+import os
 import threading
 
 from datetime import datetime
@@ -12,12 +13,13 @@ from agent_c.models.events.chat import  SubsessionEndedEvent, SubsessionStartedE
 from agent_c.util.slugs import MnemonicSlugs
 from agent_c.toolsets.tool_set import Toolset
 from agent_c.models.agent_config import AgentConfiguration
-from agent_c_tools.tools.agent_assist.expiring_session_cache import AsyncExpiringCache
+from agent_c_tools.tools.agent_assist.session_store import AgentSessionStore
 from agent_c_tools.tools.think.prompt import ThinkSection
 from agent_c.prompting.prompt_builder import PromptBuilder
 from agent_c_tools.tools.workspace.tool import WorkspaceTools
 from agent_c.agents.gpt import BaseAgent, GPTChatAgent, AzureGPTChatAgent
 from agent_c.agents.claude import ClaudeChatAgent, ClaudeBedrockChatAgent
+from agent_c.agents.client_pool import LLMClientPool
 from agent_c.prompting.basic_sections.persona import DynamicPersonaSection
 from agent_c_tools.tools.agent_assist.prompt import AssistantBehaviorSection
 
@@ -36,7 +38,12 @@ class AgentAssistToolBase(Toolset):
         super().__init__( **kwargs)
         self.agent_loader = AgentConfigLoader()
         self.model_config_loader = ModelConfigurationLoader()
-        self.session_cache = AsyncExpiringCache(default_ttl=kwargs.get('agent_session_ttl', 300))
+        # Sub-agent sessions are spilled apart from the user's saved chats so they don't show up in the chat list,
+        # the store is shared by the agent toolsets of every tool chest so its limits hold for the process
+        self.session_cache = AgentSessionStore.shared(os.path.join(self.agent_loader.config_path, "sub_agent_sessions"),
+                                                      ttl=kwargs.get('agent_session_ttl'),
+                                                      max_sessions=kwargs.get('agent_session_max_sessions'),
+                                                      max_bytes=kwargs.get('agent_session_max_bytes'))
         self.model_configs: Dict[str, Any] = self.model_config_loader.flattened_config()
         self.runtime_cache: Dict[str, BaseAgent] = {}
         self._model_name = kwargs.get('agent_assist_model_name', 'claude-3-7-sonnet-latest')
@@ -55,7 +62,7 @@ class AgentAssistToolBase(Toolset):
         await self._raise_event(event, streaming_callback)
 
     async def _streaming_callback_for_subagent(self,  parent_streaming_callback, parent_session_id, event: SessionEvent):
-        if event.type not in [ 'history_delta', 'history'] and parent_streaming_callback is not None:
+        if event.type not in [ 'history_delta', 'history', 'history_append'] and parent_streaming_callback is not None:
             await parent_streaming_callback(event)
 
     async def post_init(self):
@@ -73,7 +80,7 @@ class AgentAssistToolBase(Toolset):
         runtime_cls = self.__vendor_agent_map[model_config["vendor"]]
 
         auth_info = agent_config.agent_params.auth.model_dump() if agent_config.agent_params.auth is not None else  {}
-        client = runtime_cls.client(**auth_info)
+        client = LLMClientPool.get_client(runtime_cls, **auth_info)
         await self.tool_chest.activate_toolset(agent_config.tools)
 
         return runtime_cls(model_name=model_config["id"], client=client)
@@ -183,10 +190,12 @@ class AgentAssistToolBase(Toolset):
                                              chat_params['streaming_callback'])
             return None
 
-    async def _new_agent_session(self, agent: AgentConfiguration, user_session_id: str, agent_session_id: str) -> Dict[str, Any]:
+    async def _new_agent_session(self, agent: AgentConfiguration, user_session_id: str, agent_session_id: str,
+                                 user_id: Optional[str] = None) -> Dict[str, Any]:
         metadata = {'persona_name': agent.name}
         session = {'user_session_id': user_session_id, 'messages': [], 'metadata': metadata,
-                   'created_at': datetime.now(), 'agent_key': agent.key, 'session_id': agent_session_id}
+                   'created_at': datetime.now(), 'agent_key': agent.key, 'session_id': agent_session_id,
+                   'user_id': user_id, 'agent_config': agent}
 
         await self.session_cache.set(agent_session_id, session)
         return  session
@@ -211,9 +220,10 @@ class AgentAssistToolBase(Toolset):
         if agent_session_id is None:
             agent_session_id = MnemonicSlugs.generate_slug(2)
 
-        session = self.session_cache.get(agent_session_id)
+        session = await self.session_cache.get(agent_session_id, tool_context.get('user_id'))
         if session is None:
-            session = await self._new_agent_session(agent, user_session_id, agent_session_id=agent_session_id)
+            session = await self._new_agent_session(agent, user_session_id, agent_session_id=agent_session_id,
+                                                    user_id=tool_context.get('user_id'))
 
 
         chat_params = await self.__chat_params(agent,
@@ -264,28 +274,9 @@ class AgentAssistToolBase(Toolset):
 
         return agent_session_id, messages
 
-    def get_session_info(self, agent_session_id: str) -> Optional[Dict[str, Any]]:
-        return self.session_cache.get(agent_session_id)
+    async def get_session_info(self, agent_session_id: str, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return await self.session_cache.get(agent_session_id, user_id)
 
     def list_active_sessions(self, user_session_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all active sessions."""
-        active_ids = self.session_cache.list_active()
-        sessions = []
-
-        for agent_session_id in active_ids:
-            session = self.session_cache.get(agent_session_id)
-            if session:  # Just in case it expired between list and get
-                if session['user_session_id'] == user_session_id or user_session_id is None:
-                    sessions.append({
-                        'agent_session_id': agent_session_id,
-                        'user_session_id': session['user_session_id'],
-                        'created_at': session.get('created_at'),
-                        'last_activity': session.get('last_activity', session.get('created_at')),
-                        'message_count': len(session.get('messages', [])),
-                        'agent_key': session.get('agent_key'),
-                        'metadata': session.get('metadata', {}),
-                        'messages': session.get('messages', []),
-                    })
-
-        return sessions
-
+        """List the sessions of a user session, or all of them, including the ones spilled to storage."""
+        return self.session_cache.list_sessions(user_session_id)
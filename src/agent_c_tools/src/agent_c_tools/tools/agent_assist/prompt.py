@@ -83,7 +83,7 @@ class AgentAssistSection(PromptSection):
             for ses in agent_sessions:
                 agent: AgentConfigurationV2 = self.tool.agent_loader.catalog.get(ses['agent_key'])
                 try:
-                    sess_list.append(f"- `{ses['session_id']}` with {agent.name}. {len(ses['messages'])} messages")
+                    sess_list.append(f"- `{ses['agent_session_id']}` with {agent.name}. {ses['message_count']} messages")
                 except Exception:
                     pass
 
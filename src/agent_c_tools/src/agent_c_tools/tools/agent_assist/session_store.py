@@ -0,0 +1,310 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from agent_c.config.saved_chat import SavedChatLoader
+from agent_c.models.agent_config import CurrentAgentConfiguration
+from agent_c.models.chat_history.chat_session import ChatSession
+from agent_c.util.logging_utils import LoggingManager
+from agent_c.util.string import to_snake_case
+
+# Session IDs come from the model when it resumes a session, only slugs are looked up on disk
+_SESSION_ID_PATTERN = re.compile(r"^[\w-]+$")
+
+# (user_id, agent_session_id), the same slug can be picked for sessions of different users
+SessionKey = Tuple[Optional[str], str]
+
+
+class AgentSessionStore:
+    """
+    Store of sub-agent chat sessions, keyed by user and bounded in time, count and memory.
+
+    Sessions are dictionaries holding the `messages` of the chat along with `user_session_id`, `user_id`,
+    `agent_key`, `agent_config`, `metadata` and `created_at`.  A session stays in memory for `ttl` seconds after
+    it was last used, and the least recently used sessions are evicted once there are more than `max_sessions`
+    or their messages are estimated over `max_bytes`.  The agent toolsets of every tool chest share the store
+    returned by `shared`, so the limits hold for the process rather than for each toolset instance.
+
+    Evicted and expired sessions are spilled to the `SavedChatLoader` storage, when one is given, and loaded back
+    the next time they're asked for, so a parent agent can resume a sub-agent session after it was evicted or
+    the server restarted.
+
+    A summary of every session, in memory or spilled, is indexed by the user session it belongs to, so listing
+    the sessions of a chat doesn't look at any other.  Spilled sessions are deleted from the storage once there
+    are more than `max_spilled` of them or they were spilled over `spill_retention` seconds ago, files left by an
+    earlier run are deleted by age.
+    """
+    _shared: Dict[str, "AgentSessionStore"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ttl: Optional[int] = None, max_sessions: Optional[int] = None, max_bytes: Optional[int] = None,
+                 loader: Optional[SavedChatLoader] = None, max_spilled: Optional[int] = None,
+                 spill_retention: Optional[int] = None):
+        self.ttl = ttl if ttl is not None else int(os.environ.get("AGENT_SESSION_TTL", 300))
+        self.max_sessions = max_sessions if max_sessions is not None else int(os.environ.get("AGENT_SESSION_MAX_SESSIONS", 200))
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.environ.get("AGENT_SESSION_MAX_BYTES", 256 * 1024 * 1024))
+        self.max_spilled = max_spilled if max_spilled is not None else int(os.environ.get("AGENT_SESSION_MAX_SPILLED", 5000))
+        self.spill_retention = spill_retention if spill_retention is not None else int(os.environ.get("AGENT_SESSION_SPILL_RETENTION", 7 * 24 * 3600))
+        self.loader = loader
+        self.logger = LoggingManager(__name__).get_logger()
+
+        # (user_id, agent_session_id) -> (expires_at, estimated bytes, session), least recently used first
+        self._sessions: "OrderedDict[SessionKey, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self._summaries: Dict[SessionKey, Dict[str, Any]] = {}
+        self._by_user_session: Dict[str, Dict[SessionKey, None]] = {}
+        # (user_id, agent_session_id) -> when it was spilled, oldest first
+        self._spilled: "OrderedDict[SessionKey, float]" = OrderedDict()
+        self._loader_ready = False
+        self._next_sweep = 0.0
+        self._lock = asyncio.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'restored': 0, 'spilled': 0, 'spill_errors': 0, 'purged': 0}
+
+    @classmethod
+    def shared(cls, spill_path: str, **kwargs: Any) -> "AgentSessionStore":
+        """
+        The process wide store spilling under `spill_path`, created with the limits of the first caller.
+
+        Args:
+            spill_path: The folder of the `SavedChatLoader` sessions are spilled to.
+            **kwargs: The limits passed to the constructor when the store is created.
+        """
+        with cls._shared_lock:
+            store = cls._shared.get(spill_path)
+            if store is None:
+                store = cls._shared[spill_path] = cls(loader=SavedChatLoader(spill_path), **kwargs)
+
+            return store
+
+    async def get(self, agent_session_id: str, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return a session, loading it from the spill storage if it's no longer in memory.
+
+        Args:
+            agent_session_id: The ID of the sub-agent session.
+            user_id: The user the session belongs to, the sessions of other users aren't returned.
+        """
+        key = (user_id, agent_session_id)
+        async with self._lock:
+            await self._evict(time.monotonic())
+            entry = self._sessions.get(key)
+            if entry is not None:
+                self._stats['hits'] += 1
+                self._touch(key, entry[1], entry[2])
+                return entry[2]
+
+            self._stats['misses'] += 1
+            session = await self._restore(agent_session_id, user_id)
+            if session is not None:
+                self._stats['restored'] += 1
+                await self._store(key, session)
+
+            return session
+
+    async def set(self, agent_session_id: str, session: Dict[str, Any]) -> None:
+        """Add or update a session of the user in its `user_id`, evicting the least recently used ones if the store is over its limits."""
+        async with self._lock:
+            await self._store((session.get('user_id'), agent_session_id), session)
+
+    def list_sessions(self, user_session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Summaries of the sessions of a user session, or of every session when user_session_id is None."""
+        if user_session_id is None:
+            return [dict(summary) for summary in self._summaries.values()]
+
+        return [dict(self._summaries[key]) for key in self._by_user_session.get(user_session_id, {})]
+
+    def list_active(self) -> List[str]:
+        return [agent_session_id for _, agent_session_id in self._sessions]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self._stats, sessions=len(self._sessions), bytes=self._bytes, spilled_sessions=len(self._spilled),
+                    users=len({user_id for user_id, _ in self._sessions}))
+
+    async def flush(self) -> None:
+        """Spill every session in memory, e.g. before shutdown."""
+        async with self._lock:
+            while self._sessions:
+                await self._spill_oldest()
+
+    async def _store(self, key: SessionKey, session: Dict[str, Any]) -> None:
+        old = self._sessions.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+
+        session['last_activity'] = datetime.now()
+        size = self._estimate_size(session)
+        self._bytes += size
+        self._touch(key, size, session)
+        self._index(key, session, spilled=False)
+        self._spilled.pop(key, None)
+
+        await self._evict(time.monotonic(), keep=key)
+
+    def _touch(self, key: SessionKey, size: int, session: Dict[str, Any]) -> None:
+        self._sessions[key] = (time.monotonic() + self.ttl, size, session)
+        self._sessions.move_to_end(key)
+
+    async def _evict(self, now: float, keep: Optional[SessionKey] = None) -> None:
+        """Spill expired sessions, then the least recently used ones while over the limits, never the one being stored."""
+        while self._sessions:
+            key, (expires_at, _, _) = next(iter(self._sessions.items()))
+            over_limits = len(self._sessions) > self.max_sessions or self._bytes > self.max_bytes
+            if key == keep or (expires_at > now and not over_limits):
+                break
+
+            await self._spill_oldest()
+
+    async def _spill_oldest(self) -> None:
+        key, (_, size, session) = self._sessions.popitem(last=False)
+        self._bytes -= size
+
+        if self.loader is None:
+            self._forget(key)
+            return
+
+        try:
+            if not self._loader_ready:
+                await self.loader.initialize_database()
+                self._loader_ready = True
+
+            await self.loader.save_session(self._to_chat_session(key[1], session))
+            self._stats['spilled'] += 1
+        except Exception as e:
+            self._stats['spill_errors'] += 1
+            self.logger.exception(f"Failed to spill sub-agent session {key[1]}, it can't be resumed: {e}")
+            self._forget(key)
+            return
+
+        self._index(key, session, spilled=True)
+        self._spilled[key] = time.time()
+        await self._purge_spilled()
+
+    async def _purge_spilled(self) -> None:
+        """Delete the oldest spilled sessions past `max_spilled` or `spill_retention`, and old files of earlier runs."""
+        cutoff = time.time() - self.spill_retention
+        while self._spilled:
+            key, spilled_at = next(iter(self._spilled.items()))
+            if len(self._spilled) <= self.max_spilled and spilled_at > cutoff:
+                break
+
+            del self._spilled[key]
+            self._forget(key)
+            await self._purge(key)
+
+        if time.monotonic() >= self._next_sweep:
+            self._next_sweep = time.monotonic() + min(self.spill_retention, 3600)
+            tracked = {self._spill_file(key) for key in self._spilled}
+            for user_id, agent_session_id in await asyncio.to_thread(self._expired_files, cutoff, tracked):
+                await self._purge((user_id, agent_session_id))
+
+    async def _purge(self, key: SessionKey) -> None:
+        try:
+            await self.loader.purge_session(key[1], self._spill_user(key[0]))
+            self._stats['purged'] += 1
+        except Exception as e:
+            self.logger.exception(f"Failed to delete spilled sub-agent session {key[1]}: {e}")
+
+    def _expired_files(self, cutoff: float, tracked: Set[Path]) -> List[SessionKey]:
+        """The (user folder, session ID) of the spilled session files last written before `cutoff`."""
+        expired = []
+        for session_file in self.loader.save_file_folder.glob("*/*.json"):
+            try:
+                if session_file not in tracked and session_file.stat().st_mtime < cutoff:
+                    expired.append((session_file.parent.name, session_file.stem))
+            except FileNotFoundError:
+                continue
+
+        return expired
+
+    def _spill_file(self, key: SessionKey) -> Path:
+        # The loader keeps the sessions of a user in a folder named after the snake cased user ID
+        return self.loader.save_file_folder / to_snake_case(self._spill_user(key[0])) / f"{key[1]}.json"
+
+    @staticmethod
+    def _spill_user(user_id: Optional[str]) -> str:
+        return user_id or "admin"
+
+    async def _restore(self, agent_session_id: str, user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        if self.loader is None or not _SESSION_ID_PATTERN.match(agent_session_id):
+            return None
+
+        try:
+            chat_session = await asyncio.to_thread(self.loader.load_session_id, agent_session_id, self._spill_user(user_id))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.exception(f"Failed to load spilled sub-agent session {agent_session_id}: {e}")
+            return None
+
+        session = self._from_chat_session(chat_session)
+        # Sessions without a user are spilled under the "admin" folder, keep them keyed under the caller's user_id
+        session['user_id'] = user_id
+        return session
+
+    def _index(self, key: SessionKey, session: Dict[str, Any], spilled: bool) -> None:
+        user_session_id = session.get('user_session_id')
+        self._summaries[key] = {
+            'agent_session_id': key[1],
+            'user_session_id': user_session_id,
+            'user_id': session.get('user_id'),
+            'created_at': session.get('created_at'),
+            'last_activity': session.get('last_activity', session.get('created_at')),
+            'message_count': len(session.get('messages', [])),
+            'agent_key': session.get('agent_key'),
+            'metadata': session.get('metadata', {}),
+            'spilled': spilled,
+        }
+        self._by_user_session.setdefault(user_session_id, {})[key] = None
+
+    def _forget(self, key: SessionKey) -> None:
+        summary = self._summaries.pop(key, None)
+        if summary is None:
+            return
+
+        sessions = self._by_user_session.get(summary['user_session_id'])
+        if sessions is not None:
+            sessions.pop(key, None)
+            if not sessions:
+                del self._by_user_session[summary['user_session_id']]
+
+    @staticmethod
+    def _estimate_size(session: Dict[str, Any]) -> int:
+        return len(json.dumps(session.get('messages', []), default=str))
+
+    @staticmethod
+    def _to_chat_session(agent_session_id: str, session: Dict[str, Any]) -> ChatSession:
+        created_at = session.get('created_at')
+        chat_session = ChatSession(session_id=agent_session_id,
+                                   user_id=AgentSessionStore._spill_user(session.get('user_id')),
+                                   messages=session.get('messages', []),
+                                   metadata={'user_session_id': session.get('user_session_id'),
+                                             'agent_key': session.get('agent_key'),
+                                             'session_metadata': session.get('metadata', {})})
+        if isinstance(created_at, datetime):
+            chat_session.created_at = created_at.isoformat()
+
+        # Older configurations aren't saved, restored sessions look the agent up by key instead
+        agent_config = session.get('agent_config')
+        if isinstance(agent_config, CurrentAgentConfiguration):
+            chat_session.agent_config = agent_config
+
+        return chat_session
+
+    @staticmethod
+    def _from_chat_session(chat_session: ChatSession) -> Dict[str, Any]:
+        metadata = chat_session.metadata or {}
+        return {'session_id': chat_session.session_id,
+                'user_session_id': metadata.get('user_session_id'),
+                'user_id': chat_session.user_id,
+                'messages': chat_session.messages,
+                'metadata': metadata.get('session_metadata', {}),
+                'created_at': datetime.fromisoformat(chat_session.created_at),
+                'agent_key': metadata.get('agent_key') or (chat_session.agent_config.key if chat_session.agent_config else None),
+                'agent_config': chat_session.agent_config}
@@ -50,7 +50,7 @@ class AgentTeamSection(PromptSection):
             if len(agent_sessions):
                 for ses in agent_sessions:
                     agent_config: AgentConfiguration = self.tool.agent_loader.catalog.get(ses['agent_key'])
-                    sess_list.append(f"- `{ses['agent_session_id']}` with {agent_config.name}. {len(ses['messages'])} messages")
+                    sess_list.append(f"- `{ses['agent_session_id']}` with {agent_config.name}. {ses['message_count']} messages")
 
                 return f"\n\n## Active Team Sessions:\n\n{"\n".join(sess_list)}\n\n"
         except Exception as e:
@@ -7,6 +7,7 @@ class BridgeTools(Toolset):
     session properties and user interface interactions. This toolset allows agents to 
     control aspects of their session presentation and communicate directly with the bridge.
     """
+    shareable = True
 
     def __init__(self, **kwargs):
         """
@@ -0,0 +1,165 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from agent_c.util.logging_utils import LoggingManager
+
+# (mtime_ns, size) of the database file and its write-ahead log, None for a file that doesn't exist
+Signature = Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _Database:
+    __slots__ = ('identity', 'idle', 'schema_signature', 'schema')
+
+    def __init__(self, identity: Tuple[int, int]) -> None:
+        self.identity = identity
+        self.idle: List[sqlite3.Connection] = []
+        self.schema_signature: Optional[Signature] = None
+        self.schema: Dict[Any, Any] = {}
+
+
+class ReadOnlySQLiteConnections:
+    """
+    Cache of read-only SQLite connections and schema metadata, per database file.
+
+    Connections are opened with a `mode=ro` URI, `query_only` and memory mapped I/O of `mmap_bytes`, and are
+    handed out to one caller at a time, at most `max_idle` of them are kept open per database.  A database
+    file that's replaced, i.e. has another inode, gets new connections.  The least recently used databases
+    are closed once more than `max_databases` are open.
+
+    Schema metadata is kept until the database file or its write-ahead log changes mtime or size.
+    """
+
+    def __init__(self, max_databases: Optional[int] = None, max_idle: Optional[int] = None,
+                 mmap_bytes: Optional[int] = None) -> None:
+        self.max_databases = max_databases or int(os.environ.get("DATABASE_QUERY_MAX_OPEN_DATABASES", 16))
+        self.max_idle = max_idle or int(os.environ.get("DATABASE_QUERY_MAX_IDLE_CONNECTIONS", 4))
+        self.mmap_bytes = mmap_bytes if mmap_bytes is not None else int(os.environ.get("DATABASE_QUERY_MMAP_BYTES", 256 * 1024 * 1024))
+        self.logger = LoggingManager(__name__).get_logger()
+        self._databases: "OrderedDict[str, _Database]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._opened = 0
+        self._reused = 0
+        self._schema_hits = 0
+        self._schema_misses = 0
+
+    @contextmanager
+    def connection(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection to a database file, it's kept for reuse when the block exits."""
+        db_path = os.path.abspath(db_path)
+        identity = self._identity(db_path)
+        conn = self._checkout(db_path, identity)
+        try:
+            yield conn
+        except Exception:
+            conn.close()
+            raise
+        else:
+            self._checkin(db_path, identity, conn)
+
+    def cached_schema(self, db_path: str, key: Any, loader: Callable[[], Any]) -> Any:
+        """Return schema metadata for a database, calling loader when the database changed since it was cached."""
+        db_path = os.path.abspath(db_path)
+        signature = (_file_signature(db_path), _file_signature(f"{db_path}-wal"))
+        identity = self._identity(db_path)
+        with self._lock:
+            database = self._database(db_path, identity)
+            if database.schema_signature != signature:
+                database.schema_signature = signature
+                database.schema = {}
+            elif key in database.schema:
+                self._schema_hits += 1
+                return database.schema[key]
+            self._schema_misses += 1
+
+        value = loader()
+        with self._lock:
+            database = self._databases.get(db_path)
+            if database is not None and database.schema_signature == signature:
+                database.schema[key] = value
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'databases': len(self._databases),
+                    'idle_connections': sum(len(database.idle) for database in self._databases.values()),
+                    'opened': self._opened,
+                    'reused': self._reused,
+                    'schema_hits': self._schema_hits,
+                    'schema_misses': self._schema_misses}
+
+    def close(self) -> None:
+        with self._lock:
+            databases = list(self._databases.values())
+            self._databases.clear()
+
+        for database in databases:
+            self._close_all(database.idle)
+
+    @staticmethod
+    def _identity(db_path: str) -> Tuple[int, int]:
+        # Raises FileNotFoundError for a missing database, read-only connections can't create one
+        stat = os.stat(db_path)
+        return stat.st_dev, stat.st_ino
+
+    def _database(self, db_path: str, identity: Tuple[int, int]) -> _Database:
+        """The entry for a database, callers hold the lock."""
+        database = self._databases.get(db_path)
+        if database is not None and database.identity != identity:
+            self._close_all(database.idle)
+            database = None
+
+        if database is None:
+            database = self._databases[db_path] = _Database(identity)
+            while len(self._databases) > self.max_databases:
+                _, evicted = self._databases.popitem(last=False)
+                self._close_all(evicted.idle)
+
+        self._databases.move_to_end(db_path)
+        return database
+
+    def _checkout(self, db_path: str, identity: Tuple[int, int]) -> sqlite3.Connection:
+        with self._lock:
+            database = self._database(db_path, identity)
+            if database.idle:
+                self._reused += 1
+                return database.idle.pop()
+            self._opened += 1
+
+        conn = sqlite3.connect(f"{Path(db_path).as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        try:
+            conn.execute(f"PRAGMA mmap_size = {int(self.mmap_bytes)}")
+            conn.execute("PRAGMA query_only = ON")
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _checkin(self, db_path: str, identity: Tuple[int, int], conn: sqlite3.Connection) -> None:
+        with self._lock:
+            database = self._databases.get(db_path)
+            if database is not None and database.identity == identity and len(database.idle) < self.max_idle:
+                database.idle.append(conn)
+                return
+
+        conn.close()
+
+    def _close_all(self, connections: List[sqlite3.Connection]) -> None:
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing SQLite connection: {e}")
+        connections.clear()
@@ -1,13 +1,25 @@
+import asyncio
+import base64
+import binascii
+import functools
 import json
-import sqlite3
+import os
 import sqlparse
-import pandas as pd
-from typing import List, Dict, Any, Union
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Union
 from sqlparse.sql import IdentifierList, Identifier, Function
 from sqlparse.tokens import Keyword
 
-from agent_c.toolsets import Toolset, json_schema
-from ...helpers.path_helper import create_unc_path, os_file_system_path
+from agent_c.toolsets import Toolset, ToolChest, json_schema
+from ...helpers.path_helper import create_unc_path, ensure_file_extension, os_file_system_path, os_path
+from .sqlite_reader import ReadOnlySQLiteConnections
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
 
 
 class DatabaseQueryTools(Toolset):
@@ -18,6 +30,14 @@ class DatabaseQueryTools(Toolset):
     """
     DEMO_DB_NAME = 'demo_agent_data.db'
     DATA_FOLDER = 'data_demo'
+    # Rows in a page of query results, the agent follows the page token for more
+    MAX_ROWS = int(os.environ.get("DATABASE_QUERY_MAX_ROWS", 1000))
+    # Rows read from SQLite at a time when streaming or spooling results
+    BATCH_SIZE = int(os.environ.get("DATABASE_QUERY_BATCH_SIZE", 1000))
+    # Most rows spooled to a parquet file, 0 for no limit
+    MAX_SPOOL_ROWS = int(os.environ.get("DATABASE_QUERY_MAX_SPOOL_ROWS", 0))
+    # Read-only connections and schema metadata shared by every instance of the toolset
+    connections = ReadOnlySQLiteConnections()
     ALLOWED_FUNCTIONS = {
         'COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'GROUP_CONCAT',
         'TOTAL', 'AVG', 'COUNT', 'GROUP_CONCAT', 'MAX', 'MIN',
@@ -36,11 +56,11 @@ class DatabaseQueryTools(Toolset):
             if isinstance(token, IdentifierList):
                 for identifier in token.get_identifiers():
                     if isinstance(identifier, Function):
-                        if identifier.get_name().upper() not in self.allowed_functions:
+                        if identifier.get_name().upper() not in self.ALLOWED_FUNCTIONS:
                             return f"Unsupported function: {identifier.get_name()}"
             elif isinstance(token, Identifier):
                 if isinstance(token.tokens[0], Function):
-                    if token.tokens[0].get_name().upper() not in self.allowed_functions:
+                    if token.tokens[0].get_name().upper() not in self.ALLOWED_FUNCTIONS:
                         return f"Unsupported function: {token.tokens[0].get_name()}"
             elif token.ttype is Keyword:
                 if token.value.upper() == 'SELECT':
@@ -81,21 +101,126 @@ class DatabaseQueryTools(Toolset):
         # If we've passed all checks, return None (indicating no issues)
         return None
 
-    def _load_to_dataframe(self, results: List[Dict[str, Any]]) -> str:
+    async def _run(self, func, *args):
+        """Run a blocking SQLite call on the shared tool thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(ToolChest.get_executor('thread'), functools.partial(func, *args))
+
+    async def _load_to_dataframe(self, parquet_path: str) -> str:
         try:
-            df = pd.DataFrame(results)
-            self.dataframe_tool.dataframe = df
-            return f"Data successfully loaded into DataframeTools. {self.dataframe_tool._standardized_result()}"
+            return await self._run(self.dataframe_tool._load_data_from_file, parquet_path)
         except Exception as e:
             return f"Error loading data into DataframeTools: {str(e)}"
 
-    def _execute_query(self, db_path: str, query: str) -> List[Dict[str, Any]]:
-        with sqlite3.connect(db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query)
-            results = [dict(row) for row in cursor.fetchall()]
-        return results
+    def _execute_query(self, db_path: str, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        """Run a metadata query, whose results are small, and return every row."""
+        with self.connections.connection(db_path) as conn:
+            cursor = conn.execute(query, params)
+            try:
+                columns = [column[0] for column in cursor.description]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+    def _fetch_page(self, db_path: str, query: str, offset: int, max_rows: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Stream a page of rows, reading batches until the page and one more row are in hand.
+
+        Returns:
+            The rows of the page and the offset of the next page, None when there are no more rows
+        """
+        rows: List[Dict[str, Any]] = []
+        more = False
+        with self.connections.connection(db_path) as conn:
+            cursor = conn.execute(query)
+            try:
+                columns = [column[0] for column in cursor.description]
+                skipped = 0
+                while not more:
+                    batch = cursor.fetchmany(self.BATCH_SIZE)
+                    if not batch:
+                        break
+
+                    if skipped < offset:
+                        skip = min(offset - skipped, len(batch))
+                        skipped += skip
+                        batch = batch[skip:]
+
+                    room = max_rows - len(rows)
+                    rows.extend(dict(zip(columns, row)) for row in batch[:room])
+                    more = len(batch) > room
+            finally:
+                # Closing the cursor ends the statement, releasing its read lock on the database
+                cursor.close()
+
+        return rows, offset + len(rows) if more else None
+
+    def _spool_to_parquet(self, db_path: str, query: str, parquet_path: str) -> Dict[str, Any]:
+        """
+        Write every row of a query to a parquet file, a batch at a time.
+
+        The column types are taken from the first batch, columns it only has NULLs for are written as text.
+        """
+        row_count = 0
+        truncated = False
+        writer = None
+        schema = None
+        with self.connections.connection(db_path) as conn:
+            cursor = conn.execute(query)
+            try:
+                columns = [column[0] for column in cursor.description]
+                while True:
+                    batch = cursor.fetchmany(self.BATCH_SIZE)
+                    if not batch:
+                        break
+
+                    if self.MAX_SPOOL_ROWS and row_count + len(batch) > self.MAX_SPOOL_ROWS:
+                        batch = batch[:self.MAX_SPOOL_ROWS - row_count]
+                        truncated = True
+                        if not batch:
+                            break
+
+                    values = list(zip(*batch))
+                    if schema is None:
+                        inferred = pa.Table.from_arrays([pa.array(column) for column in values], names=columns).schema
+                        schema = pa.schema([pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+                                            for field in inferred])
+                        writer = pq.ParquetWriter(parquet_path, schema)
+
+                    try:
+                        table = pa.Table.from_arrays([pa.array(column, type=field.type) for column, field in zip(values, schema)],
+                                                     schema=schema)
+                    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                        raise ValueError(f"Column values change type after row {row_count}, CAST the columns in the query "
+                                         f"to a single type: {e}")
+
+                    writer.write_table(table)
+                    row_count += len(batch)
+                    if truncated:
+                        break
+
+                if writer is None:
+                    schema = pa.schema([pa.field(name, pa.string()) for name in columns])
+                    writer = pq.ParquetWriter(parquet_path, schema)
+            finally:
+                cursor.close()
+                if writer is not None:
+                    writer.close()
+
+        return {"row_count": row_count, "columns": columns, "truncated": truncated}
+
+    @staticmethod
+    def _encode_page_token(query: str, offset: int) -> str:
+        payload = json.dumps({"query": query, "offset": offset}).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    @staticmethod
+    def _decode_page_token(token: str) -> Tuple[str, int]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            return payload["query"], int(payload["offset"])
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise ValueError("Invalid page_token, run the query again to get a new one.")
 
     async def _set_db_path(self, workspace_name: str, file_path: str) -> str:
         unc_path = create_unc_path(workspace_name, file_path)
@@ -109,7 +234,8 @@ class DatabaseQueryTools(Toolset):
         return self.db_path
 
     @json_schema(
-        description="Execute a read-only SQL query on the specified database.",
+        description="Execute a read-only SQL query on the specified database.  Results are returned a page at a time, "
+                    "when there are more rows the result includes a next_page_token, pass it back to get the next page.",
         params={
             'workspace_name': {
                 'type': 'string',
@@ -124,14 +250,38 @@ class DatabaseQueryTools(Toolset):
             },
             'query': {
                 'type': 'string',
-                'description': 'The SQL query to execute (SELECT statements only).',
-                'required': True
+                'description': 'The SQL query to execute (SELECT statements only). Not needed with a page_token.',
+                'required': False
+            },
+            'page_token': {
+                'type': 'string',
+                'description': 'The next_page_token of a previous result, to get the next page of that query.',
+                'required': False
+            },
+            'max_rows': {
+                'type': 'integer',
+                'description': f'Most rows to return in this page, at most {MAX_ROWS}.',
+                'required': False,
+                'default': MAX_ROWS
             },
             'load_to_dataframe': {
                 'type': 'boolean',
-                'description': 'If true, loads the query results into the DataframeTools.',
+                'description': 'If true, loads every row of the query results into the DataframeTools instead of returning them.',
+                'required': False,
+                'default': False
+            },
+            'spool_to_parquet': {
+                'type': 'boolean',
+                'description': 'If true, writes every row of the query results to a parquet file in the workspace instead of '
+                               'returning them. Use this for large results.',
                 'required': False,
                 'default': False
+            },
+            'parquet_path': {
+                'type': 'string',
+                'description': 'Relative path in the workspace of the parquet file to write. If not provided, a new file '
+                               'in the data folder is used.',
+                'required': False
             }
         }
     )
@@ -144,8 +294,17 @@ class DatabaseQueryTools(Toolset):
                 await self._set_db_path(workspace_name,file_path)
 
             load_to_dataframe = kwargs.get('load_to_dataframe', False)
-
-            query = kwargs['query'].strip()
+            spool_to_parquet = kwargs.get('spool_to_parquet', False) or load_to_dataframe
+            max_rows = max(1, min(int(kwargs.get('max_rows') or self.MAX_ROWS), self.MAX_ROWS))
+            offset = 0
+
+            if kwargs.get('page_token'):
+                try:
+                    query, offset = self._decode_page_token(kwargs['page_token'])
+                except ValueError as e:
+                    return json.dumps({"error": str(e)})
+            else:
+                query = (kwargs.get('query') or '').strip()
 
             if not query.lower().startswith('select'):
                 return json.dumps({"error": "Only SELECT queries are allowed for read-only operations."})
@@ -155,21 +314,51 @@ class DatabaseQueryTools(Toolset):
             if validation_error:
                 return json.dumps({"error": validation_error})
 
-            results = self._execute_query(self.db_path, query)
+            if spool_to_parquet:
+                return await self._spool_query(query, workspace_name, kwargs.get('parquet_path'), load_to_dataframe)
 
-            message = f"Query executed successfully on {self.DEMO_DB_NAME}. {len(results)} rows returned."
+            results, next_offset = await self._run(self._fetch_page, self.db_path, query, offset, max_rows)
 
-            if load_to_dataframe:
-                df_message = self._load_to_dataframe(results)
-                message += f" {df_message}"
+            message = f"Query executed successfully on {self.DEMO_DB_NAME}. {len(results)} rows returned."
+            response = {"results": results, "message": message}
+            if next_offset is not None:
+                response["next_page_token"] = self._encode_page_token(query, next_offset)
+                response["message"] += f" These are rows {offset + 1} to {next_offset}, use the next_page_token for more."
 
-            return json.dumps({
-                "results": results if not load_to_dataframe else "Data loaded to DataframeTools",
-                "message": message
-            })
+            return json.dumps(response, default=str)
         except Exception as e:
             return json.dumps({"error": f"Error executing query: {str(e)}"})
 
+    async def _spool_query(self, query: str, workspace_name: str, parquet_path: Optional[str], load_to_dataframe: bool) -> str:
+        if pa is None:
+            return json.dumps({"error": "Writing query results to parquet requires the pyarrow package."})
+
+        parquet_path = parquet_path or f"{self.DATA_FOLDER}/query_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+        unc_path = create_unc_path(workspace_name, ensure_file_extension(parquet_path, 'parquet'))
+        error, full_path = os_path(self.workspace_tool, unc_path, mkdirs=True)
+        if error:
+            return json.dumps({"error": f"Invalid parquet path: {error}"})
+
+        try:
+            spooled = await self._run(self._spool_to_parquet, self.db_path, query, full_path)
+        except Exception:
+            # Don't leave a partial file behind
+            if os.path.exists(full_path):
+                os.remove(full_path)
+            raise
+
+        message = f"Query executed successfully on {self.DEMO_DB_NAME}. {spooled['row_count']} rows written to {unc_path}."
+        if spooled['truncated']:
+            message += f" The results were cut off at {self.MAX_SPOOL_ROWS} rows."
+
+        response = {"results": "Data written to parquet", "parquet_path": unc_path,
+                    "row_count": spooled['row_count'], "columns": spooled['columns'], "message": message}
+        if load_to_dataframe:
+            response["results"] = "Data loaded to DataframeTools"
+            response["message"] += f" {await self._load_to_dataframe(full_path)}"
+
+        return json.dumps(response)
+
     @json_schema(
         description="Get the list of tables in the specified database.",
         params={
@@ -195,9 +384,8 @@ class DatabaseQueryTools(Toolset):
                 await self._set_db_path(workspace_name, file_path)
 
             query = "SELECT name FROM sqlite_master WHERE type='table';"
-            results = self._execute_query(self.db_path, query)
-
-            tables = [row['name'] for row in results]
+            tables = await self._run(self.connections.cached_schema, self.db_path, ('tables',),
+                                     lambda: [row['name'] for row in self._execute_query(self.db_path, query)])
 
             return json.dumps({
                 "tables": tables,
@@ -236,15 +424,14 @@ class DatabaseQueryTools(Toolset):
 
             table_name = kwargs['table_name']
 
-            query = f"PRAGMA table_info('{table_name}');"
-            results = self._execute_query(self.db_path, query)
-
-            schema = [{
-                "column_name": row['name'],
-                "data_type": row['type'],
-                "is_nullable": not row['notnull'],
-                "is_primary_key": bool(row['pk'])
-            } for row in results]
+            query = "SELECT * FROM pragma_table_info(?);"
+            schema = await self._run(self.connections.cached_schema, self.db_path, ('schema', table_name),
+                                     lambda: [{
+                                         "column_name": row['name'],
+                                         "data_type": row['type'],
+                                         "is_nullable": not row['notnull'],
+                                         "is_primary_key": bool(row['pk'])
+                                     } for row in self._execute_query(self.db_path, query, (table_name,))])
 
             return json.dumps({
                 "schema": schema,
@@ -1,11 +1,14 @@
 import io
 import re
+import asyncio
 import os
 import json
 import time
 import random
 import string
 import logging
+import functools
+import threading
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -14,13 +17,29 @@ from datetime import datetime
 from sklearn.linear_model import LinearRegression
 from scipy.stats import pearsonr, spearmanr, kendalltau
 
-from agent_c.toolsets import json_schema, Toolset
+from agent_c.toolsets import json_schema, Toolset, ToolChest
 from ...helpers.media_file_html_helper import get_file_html
 from ...helpers.path_helper import ensure_file_extension, create_unc_path, os_file_system_path
 
 from .prompt import DataframeToolsSection
 from ...helpers.dataframe_in_memory import create_excel_in_memory
 
+def _holds_dataframe_lock(method):
+    """
+    Runs a tool with the toolset's dataframe lock held.
+
+    Tools running on the thread pool share `dataframe` and `temp_dataframe` with each other,
+    parallel calls take turns instead of replacing a frame another call is still working on.
+    The loaders parse without the lock and only take it to publish the new frame.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, **kwargs):
+        with self._dataframe_lock:
+            return await method(self, **kwargs)
+
+    return wrapper
+
+
 class DataframeTools(Toolset):
     """
     Gives your agent powerful data analysis capabilities to work with spreadsheets, CSV files, and databases.
@@ -33,6 +52,7 @@ class DataframeTools(Toolset):
         super().__init__(**kwargs, name='dataframe')
         self.dataframe = None
         self.temp_dataframe = None
+        self._dataframe_lock = threading.Lock()
         self.file_path = None
         self.section = DataframeToolsSection()
         self.workspace_tool = self.tool_chest.available_tools.get('WorkspaceTools')
@@ -99,28 +119,30 @@ class DataframeTools(Toolset):
         # self.logger.info(f'Loading data from file: {file_path}')
         try:
             if file_extension == '.csv':
-                self.dataframe = pd.read_csv(file_path, parse_dates=True)
+                dataframe = pd.read_csv(file_path, parse_dates=True)
             elif file_extension in ['.xlsx', '.xls']:
-                self.dataframe = pd.read_excel(file_path, parse_dates=True)
+                dataframe = pd.read_excel(file_path, parse_dates=True)
             elif file_extension == '.pkl':
-                self.dataframe = pd.read_pickle(file_path, parse_dates=True)
+                dataframe = pd.read_pickle(file_path, parse_dates=True)
             elif file_extension == '.json':
-                self.dataframe = pd.read_json(file_path)
+                dataframe = pd.read_json(file_path)
             elif file_extension in ['.h5', '.hdf5']:
-                self.dataframe = pd.read_hdf(file_path, parse_dates=True)
+                dataframe = pd.read_hdf(file_path, parse_dates=True)
             elif file_extension == '.feather':
-                self.dataframe = pd.read_feather(file_path, parse_dates=True)
+                dataframe = pd.read_feather(file_path, parse_dates=True)
             elif file_extension == '.parquet':
-                self.dataframe = pd.read_parquet(file_path, parse_dates=True)
+                dataframe = pd.read_parquet(file_path)
             else:
                 return f"Unsupported file type: {file_extension}"
 
-            if self.dataframe is None:
+            if dataframe is None:
                 return f'Error loading from file: {file_path}'
 
             self.logger.info(f"Data loaded from file: {file_path}\n")
 
-            return self._standardized_result(message=f"DataFrame loaded successfully from file: {file_path}")
+            with self._dataframe_lock:
+                self.dataframe = dataframe
+                return self._standardized_result(message=f"DataFrame loaded successfully from file: {file_path}")
         except Exception as e:
             self.logger.error(f'Error loading from file: {e}')
             return f'Error loading from a file: {e}'
@@ -141,27 +163,29 @@ class DataframeTools(Toolset):
             
             # Use the appropriate pandas read method based on file extension
             if file_extension == '.csv':
-                self.dataframe = pd.read_csv(bytes_io, parse_dates=True)
+                dataframe = pd.read_csv(bytes_io, parse_dates=True)
             elif file_extension in ['.xlsx', '.xls']:
-                self.dataframe = pd.read_excel(bytes_io, parse_dates=True)
+                dataframe = pd.read_excel(bytes_io, parse_dates=True)
             elif file_extension == '.pkl':
-                self.dataframe = pd.read_pickle(bytes_io)
+                dataframe = pd.read_pickle(bytes_io)
             elif file_extension == '.json':
-                self.dataframe = pd.read_json(bytes_io)
+                dataframe = pd.read_json(bytes_io)
             elif file_extension in ['.h5', '.hdf5']:
                 # HDF5 requires a filename, not possible with just bytes
                 return f"HDF5 files must be loaded from a file path, not from bytes"
             elif file_extension == '.feather':
-                self.dataframe = pd.read_feather(bytes_io)
+                dataframe = pd.read_feather(bytes_io)
             elif file_extension == '.parquet':
-                self.dataframe = pd.read_parquet(bytes_io)
+                dataframe = pd.read_parquet(bytes_io)
             else:
                 return f"Unsupported file type: {file_extension}"
 
-            if self.dataframe is None:
+            if dataframe is None:
                 return f'Error loading from bytes'
 
-            return self._standardized_result(message=f"DataFrame loaded successfully from bytes. {f'Loaded from: {file_path}' if file_path else ''}")
+            with self._dataframe_lock:
+                self.dataframe = dataframe
+                return self._standardized_result(message=f"DataFrame loaded successfully from bytes. {f'Loaded from: {file_path}' if file_path else ''}")
         except Exception as e:
             self.logger.error(f'Error loading from bytes: {e}')
             return f'Error loading from bytes: {e}'
@@ -194,7 +218,9 @@ class DataframeTools(Toolset):
             # Use read_bytes_internal to get the file content as bytes
             file_extension = Path(os_path).suffix.lower()
             # Use our new method to load from bytes
-            return self._load_data_from_bytes(file_bytes, file_extension, file_path)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(ToolChest.get_executor('thread'),
+                                              functools.partial(self._load_data_from_bytes, file_bytes, file_extension, file_path))
         except Exception as e:
             self.logger.error(f'Error reading file bytes from workspace: {e}')
             return f'Error reading file from workspace: {e}'
@@ -213,7 +239,8 @@ class DataframeTools(Toolset):
                 'description': 'The file extension (e.g., ".csv", ".xlsx") to determine the file type',
                 'required': True
             },
-        }
+        },
+        execution='thread'
     )
     async def load_data_from_bytes(self, **kwargs):
         import base64
@@ -282,8 +309,10 @@ class DataframeTools(Toolset):
                 'description': 'The key for storing the DataFrame in the tool_cache',
                 'required': True
             },
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def load_cached_dataframe(self, **kwargs)->str:
         try:
             data_key = kwargs.get('data_key', None)
@@ -312,8 +341,10 @@ class DataframeTools(Toolset):
                 'description': 'Convert JSON string into a DataFrame',
                 'required': True
             },
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def json_to_dataframe(self, **kwargs)->str:
         json_data = kwargs.get('json_data', '')
 
@@ -357,8 +388,10 @@ class DataframeTools(Toolset):
                 'required': False,
                 'default': False
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def add_column(self, **kwargs):
         # this always modifies the class's dataframe because adding a column doesn't really affect anything else you would do with a dataframe
         column_name = kwargs.get('column_name')
@@ -429,8 +462,10 @@ class DataframeTools(Toolset):
                 'description': 'The name of the column to drop',
                 'required': True
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def drop_column(self, **kwargs):
         # this always modifies the class's dataframe because dropping a column doesn't normally impact the size of the dataframe
         column_name = kwargs.get('column_name')
@@ -456,8 +491,10 @@ class DataframeTools(Toolset):
                 'description': 'A dictionary mapping old column names to new names',
                 'required': True
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def rename_columns(self, **kwargs):
         # this always modifies the class's dataframe because renaming a column doesn't really affect anything else you would do with a dataframe or its size
         renaming_map = kwargs.get('renaming_map')
@@ -486,8 +523,10 @@ class DataframeTools(Toolset):
                 'required': False,
                 'default': True
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def sort_dataframe(self, **kwargs):
         # this always modifies the class's dataframe because sorting doesn't really affect anything else you would do with a dataframe or its size
         by = kwargs.get('by')
@@ -515,8 +554,10 @@ class DataframeTools(Toolset):
                                 'age > 30'"' for rows where the age column is greater than 30.""",
                 'required': True
             },
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def filter_dataframe(self, **kwargs):
         # this will copy the main dataframe and filter it.  If it can return the filtered dataframe, it will, otherwise it will store it in cache
         # this leaves teh original class dataframe untouched
@@ -599,8 +640,10 @@ class DataframeTools(Toolset):
                     }
                 },
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def group_by_and_agg(self, **kwargs):
         # this will copy the main dataframe to perform group by and aggregate functions on it.
         # If it can return the modified dataframe, it will, otherwise it will store it in cache
@@ -688,8 +731,10 @@ class DataframeTools(Toolset):
                     }
                 },
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def agg(self, **kwargs):
         # this will copy the main dataframe to perform aggregate functions on it.
         # If it can return the modified dataframe, it will, otherwise it will store it in cache
@@ -735,8 +780,10 @@ class DataframeTools(Toolset):
 
     @json_schema(
         description='Get summary statistics for the DataFrame.',
-        params={}
+        params={},
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def summarize_dataframe(self, **kwargs):
         try:
             summary = self.dataframe.describe().to_json()
@@ -762,8 +809,10 @@ class DataframeTools(Toolset):
                 'required': False,
                 'default': 'pearson'
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def calculate_correlations(self, **kwargs):
         if self.dataframe is None or self.dataframe.empty:
             return 'No DataFrame is loaded or it is empty. Please load data file first before calculating correlations.'
@@ -830,8 +879,10 @@ class DataframeTools(Toolset):
                 'description': 'List of column names to partial out for partial correlation.',
                 'required': False
             }
-        }
+        },
+        execution='thread'
     )
+    @_holds_dataframe_lock
     async def calculate_complex_correlation(self, **kwargs):
         if self.dataframe is None or self.dataframe.empty:
             return 'No DataFrame is loaded or it is empty. Please load data file first before calculating correlations.'
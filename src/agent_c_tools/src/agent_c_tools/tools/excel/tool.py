@@ -5,11 +5,13 @@ Each method is under 25 lines and focuses solely on interface responsibilities.
 """
 
 
+import asyncio
+import functools
 import json
 import yaml
 from typing import Any, Dict, List, Optional, cast
 
-from agent_c.toolsets import Toolset, json_schema
+from agent_c.toolsets import Toolset, ToolChest, json_schema
 from agent_c_tools.helpers.validate_kwargs import validate_required_fields
 from agent_c_tools.tools.workspace.tool import WorkspaceTools
 
@@ -38,6 +40,17 @@ class ExcelTools(Toolset):
         if not self.workspace_tool:
             self.logger.error("WorkspaceTools dependency not available")
 
+    async def _run_on_workbook(self, func, *args, **kwargs):
+        """
+        Run a blocking workbook call on the shared tool thread pool.
+
+        The write lock is held for the duration, so appends and reserved writes on the event loop never
+        change the workbook while a worker is loading, saving or reading it.
+        """
+        loop = asyncio.get_running_loop()
+        async with self.concurrency_manager.get_write_lock():
+            return await loop.run_in_executor(ToolChest.get_executor('thread'), functools.partial(func, *args, **kwargs))
+
     def _validate_workbook_loaded(self) -> Optional[str]:
         """Check if workbook is loaded and return error JSON if not."""
         if not self.workbook_manager.has_workbook():
@@ -100,7 +113,7 @@ class ExcelTools(Toolset):
                 return yaml.dump({'success': False, 'error': 'Could not resolve file path'}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
             # Load using business logic
-            result = self.workbook_manager.load_workbook(os_path, read_only)
+            result = await self._run_on_workbook(self.workbook_manager.load_workbook, os_path, read_only)
             if result.success:
                 self._reset_concurrency_tracking(result.sheets)
 
@@ -140,7 +153,7 @@ class ExcelTools(Toolset):
             unc_path = ensure_file_extension(kwargs.get('path'), 'xlsx')
             tool_context = kwargs.get('tool_context', {})
 
-            save_result, workbook_bytes = self.workbook_manager.save_workbook(unc_path)
+            save_result, workbook_bytes = await self._run_on_workbook(self.workbook_manager.save_workbook, unc_path)
             if not save_result.success or not workbook_bytes:
                 return yaml.dump(save_result.to_dict(), default_flow_style=False, sort_keys=False, allow_unicode=True)
 
@@ -359,10 +372,11 @@ class ExcelTools(Toolset):
             if len(records) > reservation.row_count:
                 return yaml.dump({'success': False, 'error': f'Too many records for reservation'}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
-            workbook = self.workbook_manager.get_workbook()
-            result = await self.excel_operations.write_to_reserved_rows(
-                workbook, records, reservation.sheet_name, reservation.start_row, reservation.row_count
-            )
+            async with self.concurrency_manager.get_write_lock():
+                workbook = self.workbook_manager.get_workbook()
+                result = await self.excel_operations.write_to_reserved_rows(
+                    workbook, records, reservation.sheet_name, reservation.start_row, reservation.row_count
+                )
 
             if result.success:
                 self.concurrency_manager.complete_reservation(reservation_id, len(records))
@@ -398,7 +412,8 @@ class ExcelTools(Toolset):
 
         try:
             workbook = self.workbook_manager.get_workbook()
-            result = self.excel_operations.read_sheet_data(
+            result = await self._run_on_workbook(
+                self.excel_operations.read_sheet_data,
                 workbook=workbook,
                 sheet_name=kwargs.get('sheet_name', 'Sheet'),
                 start_row=kwargs.get('start_row', 1),
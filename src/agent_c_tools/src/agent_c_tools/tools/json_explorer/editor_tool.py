@@ -49,7 +49,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.create_backup(relative_path)
+        return await workspace.document_cache.run_exclusive(editor.create_backup, relative_path)
 
     @json_schema(
         'Validate that a JSON file is well-formed and parseable.',
@@ -73,7 +73,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.validate_json(relative_path)
+        return await workspace.document_cache.run_exclusive(editor.validate_json, relative_path)
 
     @json_schema(
         'Set or update a value at a specific JSONPath.',
@@ -116,7 +116,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.set_value(relative_path, jsonpath, value, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.set_value, relative_path, jsonpath, value, preview=preview)
 
     @json_schema(
         'Add a new key-value pair to an object at the specified JSONPath.',
@@ -165,7 +165,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.add_to_object(relative_path, jsonpath, key, value, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.add_to_object, relative_path, jsonpath, key, value, preview=preview)
 
     @json_schema(
         'Remove a key from an object at the specified JSONPath.',
@@ -209,7 +209,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.remove_key(relative_path, jsonpath, key, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.remove_key, relative_path, jsonpath, key, preview=preview)
 
     @json_schema(
         'Append a value to an array at the specified JSONPath.',
@@ -252,7 +252,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.append_to_array(relative_path, jsonpath, value, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.append_to_array, relative_path, jsonpath, value, preview=preview)
 
     @json_schema(
         'Insert a value at a specific index in an array at the specified JSONPath.',
@@ -301,7 +301,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.insert_into_array(relative_path, jsonpath, index, value, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.insert_into_array, relative_path, jsonpath, index, value, preview=preview)
 
     @json_schema(
         'Remove an item at a specific index from an array at the specified JSONPath.',
@@ -345,7 +345,7 @@ class JsonEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         editor = JSONEditor(workspace)
-        return await editor.remove_from_array(relative_path, jsonpath, index, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.remove_from_array, relative_path, jsonpath, index, preview=preview)
 
 
 # Register the toolset
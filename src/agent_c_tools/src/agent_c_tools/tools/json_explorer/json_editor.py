@@ -39,14 +39,13 @@ class JSONEditor:
         return result
 
     def _load_json_file(self, file_path: str) -> tuple[Optional[Dict], Optional[str]]:
-        """Load a JSON file from the workspace."""
+        """Load a JSON file from the workspace, the data is the workspace's cached copy and is edited in place."""
         try:
             full_path = self.workspace.full_path(file_path, mkdirs=False)
             if not full_path:
                 return None, f'Invalid file path: {file_path}'
 
-            with open(full_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self.workspace.document_cache.get_json(full_path)
 
             return data, None
 
@@ -60,14 +59,13 @@ class JSONEditor:
             return None, error_msg
 
     def _save_json_file(self, file_path: str, data: Any) -> Optional[str]:
-        """Save data to a JSON file."""
+        """Save data to a JSON file, writing through the workspace's document cache."""
         try:
             full_path = self.workspace.full_path(file_path, mkdirs=False)
             if not full_path:
                 return f'Invalid file path: {file_path}'
 
-            with open(full_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.workspace.document_cache.write_json(full_path, data)
 
             return None
 
@@ -76,6 +74,16 @@ class JSONEditor:
             self.logger.error(error_msg)
             return error_msg
 
+    def _working_copy(self, data: Any, preview: bool) -> Any:
+        """Edits change the cached data in place and are written through, previews must not change it."""
+        return copy.deepcopy(data) if preview else data
+
+    def _discard_cached(self, file_path: str) -> None:
+        """Drop the cached data of a file after a failed edit, it may have been partly changed."""
+        full_path = self.workspace.full_path(file_path, mkdirs=False)
+        if full_path:
+            self.workspace.document_cache.invalidate(full_path)
+
     def _find_parent_and_key(self, data: Any, jsonpath: str) -> tuple[Optional[Any], Optional[Union[str, int]], Optional[str]]:
         """Find the parent container and key/index for a given JSONPath."""
         try:
@@ -257,8 +265,8 @@ class JSONEditor:
                     default_flow_style=False, sort_keys=False, allow_unicode=True
                 )
 
-            # Make a deep copy for preview or modification
-            modified_data = copy.deepcopy(data)
+            # Edit the cached data in place, or a copy of it for a preview
+            modified_data = self._working_copy(data, preview)
 
             # Parse JSONPath and find matches
             jsonpath_expr = jsonpath_parse(jsonpath)
@@ -320,6 +328,7 @@ class JSONEditor:
                 default_flow_style=False, sort_keys=False, allow_unicode=True
             )
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error setting value: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -344,8 +353,8 @@ class JSONEditor:
                     default_flow_style=False, sort_keys=False, allow_unicode=True
                 )
 
-            # Make a deep copy
-            modified_data = copy.deepcopy(data)
+            # Edit the cached data in place, or a copy of it for a preview
+            modified_data = self._working_copy(data, preview)
 
             # Parse JSONPath and find matches
             jsonpath_expr = jsonpath_parse(jsonpath)
@@ -416,6 +425,7 @@ class JSONEditor:
                 default_flow_style=False, sort_keys=False, allow_unicode=True
             )
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error adding to object: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -439,8 +449,8 @@ class JSONEditor:
                     default_flow_style=False, sort_keys=False, allow_unicode=True
                 )
 
-            # Make a deep copy
-            modified_data = copy.deepcopy(data)
+            # Edit the cached data in place, or a copy of it for a preview
+            modified_data = self._working_copy(data, preview)
 
             # Parse JSONPath and find matches
             jsonpath_expr = jsonpath_parse(jsonpath)
@@ -506,6 +516,7 @@ class JSONEditor:
                 default_flow_style=False, sort_keys=False, allow_unicode=True
             )
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error removing key: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -529,8 +540,8 @@ class JSONEditor:
                     default_flow_style=False, sort_keys=False, allow_unicode=True
                 )
 
-            # Make a deep copy
-            modified_data = copy.deepcopy(data)
+            # Edit the cached data in place, or a copy of it for a preview
+            modified_data = self._working_copy(data, preview)
 
             # Parse JSONPath and find matches
             jsonpath_expr = jsonpath_parse(jsonpath)
@@ -596,6 +607,7 @@ class JSONEditor:
                 default_flow_style=False, sort_keys=False, allow_unicode=True
             )
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error appending to array: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -620,8 +632,8 @@ class JSONEditor:
                     default_flow_style=False, sort_keys=False, allow_unicode=True
                 )
 
-            # Make a deep copy
-            modified_data = copy.deepcopy(data)
+            # Edit the cached data in place, or a copy of it for a preview
+            modified_data = self._working_copy(data, preview)
 
             # Parse JSONPath and find matches
             jsonpath_expr = jsonpath_parse(jsonpath)
@@ -695,6 +707,7 @@ class JSONEditor:
                 default_flow_style=False, sort_keys=False, allow_unicode=True
             )
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error inserting into array: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -718,8 +731,8 @@ class JSONEditor:
                     default_flow_style=False, sort_keys=False, allow_unicode=True
                 )
 
-            # Make a deep copy
-            modified_data = copy.deepcopy(data)
+            # Edit the cached data in place, or a copy of it for a preview
+            modified_data = self._working_copy(data, preview)
 
             # Parse JSONPath and find matches
             jsonpath_expr = jsonpath_parse(jsonpath)
@@ -793,6 +806,7 @@ class JSONEditor:
                 default_flow_style=False, sort_keys=False, allow_unicode=True
             )
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error removing from array: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -29,8 +29,7 @@ class JSONNavigator:
             if not full_path:
                 return None, f'Invalid file path: {file_path}'
 
-            with open(full_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self.workspace.document_cache.get_json(full_path)
 
             return data, None
 
@@ -76,7 +76,7 @@ class JsonExplorerTools(Toolset):
             return json.dumps({'error': error})
 
         navigator = JSONNavigator(workspace)
-        result = await navigator.get_structure(relative_path, max_depth, sample_count)
+        result = await workspace.document_cache.run_exclusive(navigator.get_structure, relative_path, max_depth, sample_count)
 
         # Check if content is too large and save to file if needed
         if is_content_too_large(content=result, tool_context=tool_context, max_tokens=token_limit):
@@ -157,7 +157,7 @@ class JsonExplorerTools(Toolset):
             return json.dumps({'error': error})
 
         navigator = JSONNavigator(workspace)
-        result = await navigator.jsonpath_query(relative_path, jsonpath, limit)
+        result = await workspace.document_cache.run_exclusive(navigator.jsonpath_query, relative_path, jsonpath, limit)
 
         # Check if content is too large and save to file if needed
         if is_content_too_large(content=result, tool_context=tool_context, max_tokens=token_limit):
@@ -258,7 +258,7 @@ class JsonExplorerTools(Toolset):
                 output_relative_path = output_path
 
         navigator = JSONNavigator(workspace)
-        result = await navigator.extract_subtree(relative_path, jsonpath, max_depth, output_relative_path)
+        result = await workspace.document_cache.run_exclusive(navigator.extract_subtree, relative_path, jsonpath, max_depth, output_relative_path)
 
         # Check if content is too large and save to file if needed (only if no output_path was specified)
         if not output_path and is_content_too_large(content=result, tool_context=tool_context, max_tokens=token_limit):
@@ -325,7 +325,7 @@ class JsonExplorerTools(Toolset):
             return json.dumps({'error': error})
 
         navigator = JSONNavigator(workspace)
-        result = await navigator.get_value(relative_path, jsonpath)
+        result = await workspace.document_cache.run_exclusive(navigator.get_value, relative_path, jsonpath)
 
         return result
 
@@ -1,24 +1,33 @@
 from datetime import datetime
+import base64
+import binascii
+import functools
+import hashlib
 import os
 import subprocess
 import sys
+import threading
 import time
+from contextlib import contextmanager
 
 import mysql.connector
+from mysql.connector import pooling
 import json
 import pandas as pd
 import decimal
 import asyncio
 import logging
 import yaml
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 import sqlparse
 from sqlparse.sql import IdentifierList, Identifier, Function
 from sqlparse.tokens import Keyword, DML
 
+from agent_c.toolsets.tool_chest import ToolChest
 from agent_c.toolsets.tool_set import Toolset
 from agent_c.toolsets.json_schema import json_schema
+from agent_c.util.logging_utils import LoggingManager
 from ...helpers.media_file_html_helper import get_file_html
 from ..workspace import WorkspaceTools
 from ...helpers.dataframe_in_memory import create_excel_in_memory
@@ -34,6 +43,104 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
+# Limits of a single page of query results, the agent follows the page token for more
+MAX_ROWS = int(os.environ.get("MARIADB_MAX_ROWS", 500))
+MAX_RESULT_BYTES = int(os.environ.get("MARIADB_MAX_RESULT_BYTES", 256 * 1024))
+# Most rows written when saving query results to the workspace
+MAX_EXPORT_ROWS = int(os.environ.get("MARIADB_MAX_EXPORT_ROWS", 100_000))
+FETCH_BATCH_SIZE = 200
+# ER_DUP_FIELDNAME, raised for a derived table whose query returns two columns with the same name
+DUPLICATE_COLUMN_ERROR = 1060
+
+
+class MariaDBPool:
+    """
+    Connection pool and schema cache for one database, shared by every connector configured for it.
+
+    The pool holds `MARIADB_POOL_SIZE` connections, callers wait on the event loop up to `MARIADB_POOL_TIMEOUT`
+    seconds for a free one before their database call is handed to the tool thread pool, see `run`.  Table
+    lists and schemas are cached for `MARIADB_SCHEMA_CACHE_TTL` seconds.
+    """
+    _pools: Dict[str, 'MariaDBPool'] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, name: str, config: Dict[str, Any]):
+        self.name = name
+        self.config = config
+        self.size = int(os.environ.get("MARIADB_POOL_SIZE", 5))
+        self.timeout = float(os.environ.get("MARIADB_POOL_TIMEOUT", 30))
+        self.schema_ttl = float(os.environ.get("MARIADB_SCHEMA_CACHE_TTL", 300))
+        self._pool: Optional[pooling.MySQLConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._slots = asyncio.Semaphore(self.size)
+        self._schema_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._schema_lock = threading.Lock()
+
+    @classmethod
+    def for_config(cls, config: Dict[str, Any]) -> 'MariaDBPool':
+        """Get the pool for a connection configuration, creating it on first use."""
+        key = json.dumps({k: config.get(k) for k in sorted(config)}, default=str)
+        name = f"mariadb_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+        with cls._pools_lock:
+            pool = cls._pools.get(name)
+            if pool is None:
+                pool = cls._pools[name] = cls(name, dict(config))
+            return pool
+
+    async def run(self, func, *args):
+        """
+        Run a blocking database call on the shared tool thread pool once a connection is free.
+
+        The wait for a connection happens here, on the event loop, so a busy database doesn't hold tool
+        threads other toolsets need.  The connection slot is only given back once the call has finished on
+        its thread, even when the caller is cancelled.
+        """
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No database connection became free within {self.timeout:.0f} seconds") from None
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = ToolChest.get_executor('thread').submit(functools.partial(func, *args))
+        except Exception:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._slots.release))
+        return await asyncio.wrap_future(future)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for a call made through `run`, it's returned to the pool when the block exits."""
+        conn = self._get_pool().get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _get_pool(self) -> pooling.MySQLConnectionPool:
+        # Created on first use so a connector can be configured before the server is reachable
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = pooling.MySQLConnectionPool(pool_name=self.name, pool_size=self.size, pool_reset_session=True,
+                                                         use_pure=True, consume_results=True, **self.config)
+            return self._pool
+
+    def cached(self, key: Tuple, loader, refresh: bool = False) -> Any:
+        """Return the cached schema metadata for a key, calling loader when it's missing, expired or refresh is set."""
+        now = time.monotonic()
+        with self._schema_lock:
+            entry = self._schema_cache.get(key)
+            if entry is not None and not refresh and entry[0] > now:
+                return entry[1]
+
+        value = loader()
+        with self._schema_lock:
+            self._schema_cache[key] = (now + self.schema_ttl, value)
+        return value
+
+
 class MariaDBConnector:
     """
     Helper class for connecting to and querying a MariaDB database.
@@ -67,7 +174,7 @@ class MariaDBConnector:
         # Override defaults with any provided kwargs
         self.config = self.DEFAULT_CONFIG.copy()
         self.config.update(kwargs)
-
+        self.logger = LoggingManager(__name__).get_logger()
 
     def _validate_subqueries_and_functions(self, stmt):
         """
@@ -127,39 +234,33 @@ class MariaDBConnector:
         # If we've passed all checks, return None (indicating no issues)
         return None
 
-    def connect(self):
-        """
-        Establish a connection to the MariaDB database.
-        """
-        try:
-            conn_config = self.config.copy()
-            conn_config['use_pure'] = True
-            safe_config = {k: v for k, v in conn_config.items() if k != 'password'}
-            self.logger.debug(f"Attempting connection with: {safe_config}")
-            conn = mysql.connector.connect(**conn_config)
-            return conn
-        except mysql.connector.Error as e:
-            error_msg = f"Error connecting to MariaDB: {e}"
-            self.logger.error(error_msg)
-            raise Exception(error_msg)
-        except Exception as e:
-            error_msg = f"Unexpected connection error: {e}"
-            self.logger.error(error_msg)
-            raise Exception(error_msg)
+    @property
+    def pool(self) -> 'MariaDBPool':
+        """The pool shared by every connector to the same database."""
+        return MariaDBPool.for_config(self.config)
 
-    async def execute_query(self, query: str):
+    async def _run(self, func, *args):
+        """Run a blocking database call on the shared tool thread pool, once one of the pool's connections is free."""
+        return await self.pool.run(func, *args)
+
+    async def execute_query(self, query: str, offset: int = 0, max_rows: Optional[int] = None,
+                            max_bytes: Optional[int] = MAX_RESULT_BYTES):
         """
-        Execute a read-only SQL query on the database.
+        Execute a read-only SQL query on the database and return one page of its results.
 
         Args:
             query: SQL query to execute (SELECT statements only)
+            offset: Number of result rows to skip, from the page token of the previous page
+            max_rows: Most rows to return, MAX_ROWS by default
+            max_bytes: Most bytes of JSON encoded rows to return, None for no limit
 
         Returns:
-            Query results
+            Dictionary with the rows and the offset of the next page, None when there are no more rows,
+            or an error
         """
         try:
             # Validate the SQL query
-            query = query.strip()
+            query = query.strip().rstrip(';').strip()
             if not query.lower().startswith('select'):
                 return {"error": "Only SELECT queries are allowed for read-only operations."}
 
@@ -167,39 +268,104 @@ class MariaDBConnector:
             if validation_error:
                 return {"error": validation_error}
 
-            # Execute the query
-            conn = self.connect()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
-            conn.close()
-
-            self.logger.debug(f"Query executed successfully. {len(results)} rows returned.")
+            rows, next_offset = await self._run(self._fetch_page, query, offset, max_rows or MAX_ROWS, max_bytes)
+            self.logger.debug(f"Query executed successfully. {len(rows)} rows returned from offset {offset}.")
 
-            return results
+            return {"rows": rows, "next_offset": next_offset}
         except Exception as e:
             error_msg = f"Error executing query: {str(e)}"
             self.logger.error(error_msg)
             return {"error": error_msg}
 
-    async def get_tables(self) -> Dict[str, Any]:
+    def _fetch_page(self, query: str, offset: int, max_rows: int, max_bytes: Optional[int]) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Read a page of rows, the server skips the rows before the offset and stops after the rows of this
+        page and one more, which tells us whether there's a next page.
+        """
+        with self.pool.connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                try:
+                    cursor.execute(self.paged_query(query, offset, max_rows + 1))
+                    skip = 0
+                except mysql.connector.Error as e:
+                    # A query with its own LIMIT is paged as a derived table, which can't have duplicate column names
+                    if e.errno != DUPLICATE_COLUMN_ERROR:
+                        raise
+                    # The pool resets session variables when the connection is returned
+                    cursor.execute("SET SESSION sql_select_limit = %s", (offset + max_rows + 1,))
+                    cursor.execute(query)
+                    skip = offset
+                rows, more = self.take_page(self._stream_rows(cursor, skip), max_rows, max_bytes)
+            finally:
+                # Unread rows are discarded by the connection (consume_results)
+                cursor.close()
+
+        return rows, offset + len(rows) if more else None
+
+    @staticmethod
+    def paged_query(query: str, offset: int, limit: int) -> str:
+        """
+        The query restricted to `limit` rows from `offset` by the server.
+
+        A query without a LIMIT of its own gets one appended.  Wrapping it in a derived table would lose its
+        ORDER BY, which MariaDB ignores in a derived table without a LIMIT.  A query with its own LIMIT is
+        wrapped, its ORDER BY and LIMIT then apply before the page is taken.
+        """
+        window = f"LIMIT {int(limit)} OFFSET {int(offset)}"
+        query = query.strip().rstrip(';').rstrip()
+        statement = sqlparse.parse(query)[0]
+        if not any(token.ttype is Keyword and token.normalized == 'LIMIT' for token in statement.tokens):
+            return f"{query} {window}"
+
+        return f"SELECT * FROM ({query}) AS _page {window}"
+
+    @staticmethod
+    def _stream_rows(cursor, offset: int = 0):
+        skipped = 0
+        while True:
+            batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not batch:
+                return
+
+            for row in batch:
+                if skipped < offset:
+                    skipped += 1
+                else:
+                    yield row
+
+    @staticmethod
+    def take_page(rows, max_rows: int, max_bytes: Optional[int]) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Take rows until max_rows or max_bytes of JSON is reached, at least one row is always taken.
+
+        Returns:
+            The rows taken and whether any rows were left
+        """
+        page: List[Dict[str, Any]] = []
+        size = 0
+        for row in rows:
+            row_size = len(json.dumps(row, cls=DecimalEncoder, default=str))
+            if len(page) >= max_rows or (page and max_bytes and size + row_size > max_bytes):
+                return page, True
+
+            page.append(row)
+            size += row_size
+
+        return page, False
+
+    async def get_tables(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get a list of all tables in the database.
 
+        Args:
+            refresh: Read the tables from the database even if they're cached
+
         Returns:
             Dictionary containing list of tables and status message
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute("SHOW TABLES;")
-            results = cursor.fetchall()
-            cursor.close()
-            conn.close()
-
-            # Extract table names from results (SHOW TABLES returns a list of tuples)
-            tables = [row[0] for row in results]
+            tables = await self._run(self.pool.cached, ('tables',), self._read_tables, refresh)
 
             return {
                 "tables": tables,
@@ -210,57 +376,72 @@ class MariaDBConnector:
             self.logger.error(error_msg)
             return {"error": error_msg}
 
-    async def get_table_schema(self, table_name: str) -> Dict[str, Any]:
+    def _read_tables(self) -> List[str]:
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SHOW TABLES;")
+            results = cursor.fetchall()
+            cursor.close()
+
+        # Extract table names from results (SHOW TABLES returns a list of tuples)
+        return [row[0] for row in results]
+
+    async def get_table_schema(self, table_name: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get the schema details for a specific table.
 
         Args:
             table_name: Name of the table to get schema for
+            refresh: Read the schema from the database even if it's cached
 
         Returns:
             Dictionary with table schema information
         """
         try:
-            conn = self.connect()
+            schema = await self._run(self.pool.cached, ('schema', table_name),
+                                     functools.partial(self._read_table_schema, table_name), refresh)
+
+            return {
+                "schema": schema,
+                "message": f"Successfully retrieved schema for table '{table_name}'."
+            }
+        except Exception as e:
+            error_msg = f"Error retrieving table schema: {str(e)}"
+            self.logger.error(error_msg)
+            return {"error": error_msg}
+
+    def _read_table_schema(self, table_name: str) -> List[Dict[str, Any]]:
+        with self.pool.connection() as conn:
             cursor = conn.cursor(dictionary=True)
 
             # Get table columns
-            cursor.execute(f"DESCRIBE `{table_name}`;")
+            quoted_name = table_name.replace('`', '``')
+            cursor.execute(f"DESCRIBE `{quoted_name}`;")
             columns = cursor.fetchall()
 
             # Get primary keys
-            cursor.execute(f"""
+            cursor.execute("""
                 SELECT k.COLUMN_NAME
                 FROM information_schema.table_constraints t
                 JOIN information_schema.key_column_usage k
                 USING(constraint_name,table_schema,table_name)
                 WHERE t.constraint_type='PRIMARY KEY'
                 AND t.table_schema=DATABASE()
-                AND t.table_name='{table_name}';
-            """)
+                AND t.table_name=%s;
+            """, (table_name,))
             primary_keys = [row['COLUMN_NAME'] for row in cursor.fetchall()]
 
             cursor.close()
-            conn.close()
-
-            # Format the schema in a more readable way
-            schema = [{
-                "column_name": col['Field'],
-                "data_type": col['Type'],
-                "is_nullable": col['Null'] == 'YES',
-                "is_primary_key": col['Field'] in primary_keys,
-                "default": col['Default'],
-                "extra": col['Extra']
-            } for col in columns]
 
-            return {
-                "schema": schema,
-                "message": f"Successfully retrieved schema for table '{table_name}'."
-            }
-        except Exception as e:
-            error_msg = f"Error retrieving table schema: {str(e)}"
-            self.logger.error(error_msg)
-            return {"error": error_msg}
+        # Format the schema in a more readable way
+        return [{
+            "column_name": col['Field'],
+            "data_type": col['Type'],
+            "is_nullable": col['Null'] == 'YES',
+            "is_primary_key": col['Field'] in primary_keys,
+            "default": col['Default'],
+            "extra": col['Extra']
+        } for col in columns]
 
     async def get_database_info(self) -> Dict[str, Any]:
         """
@@ -270,7 +451,14 @@ class MariaDBConnector:
             Dictionary with database server information
         """
         try:
-            conn = self.connect()
+            return await self._run(self._read_database_info)
+        except Exception as e:
+            error_msg = f"Error retrieving database info: {str(e)}"
+            self.logger.error(error_msg)
+            return {"error": error_msg}
+
+    def _read_database_info(self) -> Dict[str, Any]:
+        with self.pool.connection() as conn:
             cursor = conn.cursor(dictionary=True)
 
             # Server version
@@ -296,22 +484,17 @@ class MariaDBConnector:
             size_info = cursor.fetchone()
 
             cursor.close()
-            conn.close()
 
-            return {
-                "database_name": self.config['database'],
-                "server_version": version,
-                "character_set": charset,
-                "collation": collation,
-                "size_mb": size_info['size_mb'] if size_info else None,
-                "host": self.config['host'],
-                "user": self.config['user'],
-                "message": "Successfully retrieved database information."
-            }
-        except Exception as e:
-            error_msg = f"Error retrieving database info: {str(e)}"
-            self.logger.error(error_msg)
-            return {"error": error_msg}
+        return {
+            "database_name": self.config['database'],
+            "server_version": version,
+            "character_set": charset,
+            "collation": collation,
+            "size_mb": size_info['size_mb'] if size_info else None,
+            "host": self.config['host'],
+            "user": self.config['user'],
+            "message": "Successfully retrieved database information."
+        }
 
     def to_json(self, data):
         """
@@ -504,12 +687,24 @@ class MariadbTools(Toolset):
             return f"ERROR: {error_msg}"
 
     @json_schema(
-        description="Execute a SQL query on the MariaDB database",
+        description="Execute a SQL query on the MariaDB database.  Results are returned a page at a time, when there are "
+                    "more rows the result includes a next_page_token, pass it back to get the next page.",
         params={
             "query": {
                 "type": "string",
-                "description": "SQL query to execute (SELECT statements only)",
-                "required": True
+                "description": "SQL query to execute (SELECT statements only).  Not needed with a page_token.",
+                "required": False
+            },
+            "page_token": {
+                "type": "string",
+                "description": "The next_page_token of a previous result, to get the next page of that query.",
+                "required": False
+            },
+            "max_rows": {
+                "type": "integer",
+                "description": f"Most rows to return in this page, at most {MAX_ROWS}.",
+                "required": False,
+                "default": MAX_ROWS
             },
             'workspace_name': {
                 'type': 'string',
@@ -524,7 +719,7 @@ class MariadbTools(Toolset):
             },
             'force_save': {
                 'type': 'boolean',
-                'description': 'Flag force saving file.',
+                'description': f'Flag force saving file.  Saves every remaining row of the query, up to {MAX_EXPORT_ROWS}.',
                 'required': False,
                 'default': False
             },
@@ -537,33 +732,49 @@ class MariadbTools(Toolset):
         Args:
             kwargs:
                 query: SQL query to execute (SELECT statements only)
+                page_token: Token of the next page from a previous result
+                max_rows: Most rows to return in this page
                 workspace_name: The name of the workspace to save records if desired
                 file_path: Relative path to save the file in the workspace
                 force_save: Flag force saving file
 
         Returns:
-            String with query results and status
+            String with a page of query results and status
         """
         try:
             query = kwargs.get("query")
+            offset = 0
+            max_rows = min(int(kwargs.get("max_rows") or MAX_ROWS), MAX_ROWS)
             workspace_name = kwargs.get("workspace_name", "project")
             file_path = kwargs.get('file_path', f'mariadb_query_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx')
             force_save = kwargs.get("force_save", False)
             tool_context = kwargs.get('tool_context', None)
 
+            if kwargs.get("page_token"):
+                try:
+                    query, offset = self._decode_page_token(kwargs["page_token"])
+                except ValueError as e:
+                    return f"ERROR: {e}"
+
             if not query:
                 return "ERROR: Query cannot be empty."
 
             if self.connector is None:
                 await self._get_connector()
-            
-            # Run the query in a thread pool to avoid blocking
-            result = await self.connector.execute_query(query)
+
+            if force_save:
+                # The rows being saved are fetched in one go, the response shows the first page of them
+                result = await self.connector.execute_query(query, offset, MAX_EXPORT_ROWS, max_bytes=None)
+            else:
+                result = await self.connector.execute_query(query, offset, max_rows)
 
             # Check for errors in result
-            if isinstance(result, dict) and "error" in result:
+            if "error" in result:
                 return f"ERROR: {result['error']}"
 
+            rows = result["rows"]
+            next_offset = result["next_offset"]
+
             await self._raise_render_media(
                 sent_by_class=self.__class__.__name__,
                 sent_by_function='execute_query',
@@ -572,56 +783,89 @@ class MariadbTools(Toolset):
                 tool_context=tool_context
             )
 
+            response = {"status": "success"}
             if force_save:
                 try:
-                    df = pd.DataFrame(result)
-                    if tool_context is None or 'agent_runtime' not in tool_context:
-                        self.logger.debug("No tool_context or agent_runtime available, cannot check token count for response size.")
-                        force_save = True
-                    else:
-                        response_size = tool_context['agent_runtime'].count_tokens(df.to_json())
-                        force_save = True if response_size > 25000 else force_save
-
-                    if force_save:
-                        file_path = ensure_file_extension(file_path, 'xlsx')
-                        unc_path = create_unc_path(workspace_name, file_path)
-
-                        excel_buffer = create_excel_in_memory(df)
-
-                        save_result = await self.workspace_tool.internal_write_bytes(
-                            path=unc_path,
-                            mode='write',
-                            data=excel_buffer.getvalue()
-                        )
-                        os_path = os_file_system_path(self.workspace_tool, unc_path)
-
-                        await self._raise_render_media(
-                            sent_by_class=self.__class__.__name__,
-                            sent_by_function='execute_query',
-                            content_type="text/html",
-                            content=get_file_html(os_path, unc_path),
-                            tool_context=tool_context,
-                        )
-                        self.logger.debug(save_result)
+                    df = pd.DataFrame(rows)
+                    file_path = ensure_file_extension(file_path, 'xlsx')
+                    unc_path = create_unc_path(workspace_name, file_path)
+
+                    excel_buffer = create_excel_in_memory(df)
+
+                    save_result = await self.workspace_tool.internal_write_bytes(
+                        path=unc_path,
+                        mode='write',
+                        data=excel_buffer.getvalue()
+                    )
+                    os_path = os_file_system_path(self.workspace_tool, unc_path)
+
+                    await self._raise_render_media(
+                        sent_by_class=self.__class__.__name__,
+                        sent_by_function='execute_query',
+                        content_type="text/html",
+                        content=get_file_html(os_path, unc_path),
+                        tool_context=tool_context,
+                    )
+                    self.logger.debug(save_result)
+                    response["saved_file"] = unc_path
+                    response["saved_rows"] = len(rows)
+                    if next_offset is not None:
+                        response["message"] = f"Saved the first {len(rows)} rows, the query returned more than the export limit."
                 except Exception as df_error:
                     self.logger.debug(f"Error converting result to DataFrame: {df_error}")
                     # Continue with normal result return even if save fails
-            
-            return yaml.dump(result, allow_unicode=True)
+
+                rows, more = MariaDBConnector.take_page(rows, max_rows, MAX_RESULT_BYTES)
+                if more or next_offset is not None:
+                    next_offset = offset + len(rows)
+
+            response["row_count"] = len(rows)
+            response["rows"] = rows
+            if next_offset is not None:
+                response["next_page_token"] = self._encode_page_token(query, next_offset)
+                response.setdefault("message", f"Returned rows {offset + 1} to {offset + len(rows)}, "
+                                               f"use the next_page_token for more.")
+
+            return yaml.dump(response, allow_unicode=True)
             
         except Exception as e:
             error_msg = f"Error executing query: {str(e)}"
             self.logger.error(error_msg)
             return f"ERROR: {error_msg}"
 
+    @staticmethod
+    def _encode_page_token(query: str, offset: int) -> str:
+        """The token carries the query itself, so pages can be fetched from any connection and after a restart."""
+        payload = json.dumps({"query": query, "offset": offset}).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    @staticmethod
+    def _decode_page_token(token: str) -> Tuple[str, int]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            return payload["query"], int(payload["offset"])
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise ValueError("Invalid page_token, run the query again to get a new one.")
+
     @json_schema(
         description="Get a list of all tables in the MariaDB database",
-        params={}
+        params={
+            "refresh": {
+                "type": "boolean",
+                "description": "Read from the database instead of the schema cache, after the schema was changed.",
+                "required": False,
+                "default": False
+            }
+        }
     )
     async def get_tables(self, **kwargs) -> str:
         """
         Get a list of all tables in the MariaDB database.
-        
+
+        Args:
+            kwargs:
+                refresh: Read the tables from the database instead of the schema cache
+
         Returns:
             String with list of tables and status
         """
@@ -630,7 +874,7 @@ class MariadbTools(Toolset):
                 await self._get_connector()
                 
             # Run in thread pool to avoid blocking
-            result = await self.connector.get_tables()
+            result = await self.connector.get_tables(kwargs.get("refresh", False))
             
             if "error" in result:
                 return f"ERROR: {result['error']}"
@@ -655,6 +899,12 @@ class MariadbTools(Toolset):
                 "type": "string",
                 "description": "Name of the table to get schema for",
                 "required": True
+            },
+            "refresh": {
+                "type": "boolean",
+                "description": "Read from the database instead of the schema cache, after the schema was changed.",
+                "required": False,
+                "default": False
             }
         }
     )
@@ -665,6 +915,7 @@ class MariadbTools(Toolset):
         Args:
             kwargs:
                 table_name: Name of the table to get schema for
+                refresh: Read the schema from the database instead of the schema cache
             
         Returns:
             String with table schema information
@@ -680,7 +931,7 @@ class MariadbTools(Toolset):
                 await self._get_connector()
                 
             # Run in thread pool to avoid blocking
-            result = await self.connector.get_table_schema(table_name)
+            result = await self.connector.get_table_schema(table_name, kwargs.get("refresh", False))
             
             if "error" in result:
                 return f"ERROR: {result['error']}"
@@ -5,11 +5,14 @@ This module now uses the new DocRegistry + LinkRewriter architecture
 for cleaner, more maintainable markdown processing.
 """
 
+import asyncio
+import inspect
 import json
 import logging
 from pathlib import Path
 from typing import Optional
 
+from agent_c.toolsets.tool_chest import ToolChest
 from agent_c.toolsets.tool_set import Toolset
 from agent_c.toolsets.json_schema import json_schema
 from .helpers.doc_registry import DocRegistry
@@ -64,6 +67,16 @@ class MarkdownToHtmlReportTools(Toolset):
         self.notification_sender = NotificationSender()
         self.response_builder = ResponseBuilder()
 
+    @staticmethod
+    async def _run(func, *args):
+        """Run a blocking render or conversion on the shared tool thread pool, driving it there if it is a coroutine."""
+        def call():
+            result = func(*args)
+            return asyncio.run(result) if inspect.iscoroutine(result) else result
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(ToolChest.get_executor('thread'), call)
+
     @json_schema(
         description="Generate an interactive HTML viewer for markdown files in a workspace directory",
         params={
@@ -159,7 +172,7 @@ class MarkdownToHtmlReportTools(Toolset):
 
                 # NEW: Render markdown to HTML (eliminates need for JS safety processing)
                 logger.info("Rendering markdown to HTML...")
-                registry, render_stats = render_registry_to_html(registry)
+                registry, render_stats = await self._run(render_registry_to_html, registry)
                 logger.info(f"HTML rendering stats: {render_stats}")
 
                 # Log warnings if any
@@ -287,7 +300,7 @@ class MarkdownToHtmlReportTools(Toolset):
 
             # NEW: Render markdown to HTML (eliminates need for JS safety processing)
             logger.info("Rendering markdown to HTML...")
-            registry, render_stats = render_registry_to_html(registry)
+            registry, render_stats = await self._run(render_registry_to_html, registry)
             logger.info(f"HTML rendering stats: {render_stats}")
 
             # Log warnings if any
@@ -438,7 +451,7 @@ class MarkdownToHtmlReportTools(Toolset):
                 raise ValueError(f"Error reading file: {file_content}")
 
             # Convert markdown to Word document
-            docx_content_bytes = await self.docx_converter.convert_to_docx(
+            docx_content_bytes = await self._run(self.docx_converter.convert_to_docx,
                 file_content, style, include_toc, page_break_level)
 
             try:
@@ -527,7 +540,7 @@ class MarkdownToHtmlReportTools(Toolset):
 
             # NEW: Render markdown to HTML
             logger.info("Rendering single file to HTML...")
-            registry, render_stats = render_registry_to_html(registry)
+            registry, render_stats = await self._run(render_registry_to_html, registry)
             logger.info(f"HTML rendering stats: {render_stats}")
 
             # Create simple UI tree
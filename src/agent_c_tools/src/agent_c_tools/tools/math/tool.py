@@ -6,7 +6,8 @@ import io
 import numpy as np
 import sympy as sp
 from scipy import integrate, optimize, stats
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from base64 import b64encode
 from typing import List, Dict, Union, Optional, Any
 import yaml
@@ -24,6 +25,7 @@ class MathTools(Toolset):
     arithmetic to advanced calculus, statistics, and create visual graphs to help you understand
     mathematical concepts and results.
     """
+    shareable = True
     
     def __init__(self, **kwargs):
         """
@@ -196,7 +198,8 @@ class MathTools(Toolset):
                 "description": "Upper bound of integration (optional)",
                 "required": False
             }
-        }
+        },
+        execution="process"
     )
     async def integrate_symbolic(self, **kwargs) -> str:
         """
@@ -254,7 +257,8 @@ class MathTools(Toolset):
                 "description": "Upper bound of integration",
                 "required": True
             }
-        }
+        },
+        execution="process"
     )
     async def integrate_numeric(self, **kwargs) -> str:
         """
@@ -296,7 +300,8 @@ class MathTools(Toolset):
                 "description": "Variable to solve for, e.g., \"x\"",
                 "required": True
             }
-        }
+        },
+        execution="process"
     )
     async def solve_equation(self, **kwargs) -> str:
         """
@@ -346,7 +351,8 @@ class MathTools(Toolset):
                 "description": "List of variables, e.g., [\"x\", \"y\"]",
                 "required": True
             }
-        }
+        },
+        execution="process"
     )
     async def solve_system(self, **kwargs) -> str:
         """
@@ -502,7 +508,8 @@ class MathTools(Toolset):
                 "description": "Upper bound of the search range",
                 "required": True
             }
-        }
+        },
+        execution="process"
     )
     async def find_minimum(self, **kwargs) -> str:
         """
@@ -555,7 +562,8 @@ class MathTools(Toolset):
                 "description": "Upper bound of the search range",
                 "required": True
             }
-        }
+        },
+        execution="process"
     )
     async def find_root(self, **kwargs) -> str:
         """
@@ -685,7 +693,8 @@ class MathTools(Toolset):
                 "description": "Number of sampling points",
                 "required": False
             }
-        }
+        },
+        execution="thread"
     )
     async def plot_function(self, **kwargs) -> str:
         """
@@ -716,20 +725,21 @@ class MathTools(Toolset):
             f = create_safe_function(expression)
             y_values = [f(x_val) for x_val in x_values]
             
-            # Create image
-            plt.figure(figsize=(10, 6))
-            plt.plot(x_values, y_values)
-            plt.grid(True)
-            plt.title(f"y = {expression}")
-            plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            plt.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            plt.xlabel('x')
-            plt.ylabel('y')
+            # Create image, on a figure of its own as pyplot's global state isn't safe on the thread pool
+            fig = Figure(figsize=(10, 6))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+            ax.plot(x_values, y_values)
+            ax.grid(True)
+            ax.set_title(f"y = {expression}")
+            ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+            ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+            ax.set_xlabel('x')
+            ax.set_ylabel('y')
             
             # Convert image to binary data
             buffer = io.BytesIO()
-            plt.savefig(buffer, format='png')
-            plt.close()
+            fig.savefig(buffer, format='png')
             buffer.seek(0)
             
             # Get binary data and base64 encode it
@@ -753,7 +763,6 @@ class MathTools(Toolset):
             return f"Plot created for y = {expression}"
         
         except Exception as e:
-            plt.close()
             return f"ERROR: Error when plotting function: {str(e)}"
     
     @json_schema(
@@ -786,7 +795,8 @@ class MathTools(Toolset):
                 "description": "Number of sampling points",
                 "required": False
             }
-        }
+        },
+        execution="thread"
     )
     async def plot_multiple_functions(self, **kwargs) -> str:
         """
@@ -821,30 +831,32 @@ class MathTools(Toolset):
             # Generate x values
             x_values = np.linspace(x_min, x_max, points)
             
-            plt.figure(figsize=(10, 6))
+            # A figure of its own, pyplot's global state isn't safe on the thread pool
+            fig = Figure(figsize=(10, 6))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
             
             # Plot each function
             for i, expr in enumerate(expressions):
                 try:
                     f = create_safe_function(expr)
                     y_values = [f(x_val) for x_val in x_values]
-                    plt.plot(x_values, y_values, label=labels[i])
+                    ax.plot(x_values, y_values, label=labels[i])
                 except Exception as e:
                     self.logger.error(f"Error plotting function '{expr}': {str(e)}")
                     return f"Error when plotting function '{expr}': {str(e)}"
             
-            plt.grid(True)
-            plt.title("Function Comparison")
-            plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            plt.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            plt.xlabel('x')
-            plt.ylabel('y')
-            plt.legend()
+            ax.grid(True)
+            ax.set_title("Function Comparison")
+            ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+            ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+            ax.set_xlabel('x')
+            ax.set_ylabel('y')
+            ax.legend()
             
             # Convert image to binary data
             buffer = io.BytesIO()
-            plt.savefig(buffer, format='png')
-            plt.close()
+            fig.savefig(buffer, format='png')
             buffer.seek(0)
             
             # Get binary data and base64 encode it
@@ -867,7 +879,6 @@ class MathTools(Toolset):
             
             return f"Plot created comparing {len(expressions)} functions"
         except Exception as e:
-            plt.close()
             return f"ERROR: {str(e)}"
 
     # ------ Statistics Analysis Tools ------
@@ -10,6 +10,7 @@ class RandomNumberTools(Toolset):
     and any situation where you need unpredictable values. Your agent can generate random numbers
     within specified ranges and use seeds for reproducible results.
     """
+    shareable = True
 
     def __init__(self, **kwargs):
         """
@@ -6,6 +6,8 @@ class ThinkTools(Toolset):
     to work through difficult problems step-by-step, organize its thoughts, and maintain context for
     multi-step tasks without cluttering the main conversation.
     """
+    shareable = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs, name='think', use_prefix=False)
 
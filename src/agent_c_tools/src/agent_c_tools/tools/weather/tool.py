@@ -12,6 +12,7 @@ class WeatherTools(Toolset):
     Your agent can check current conditions, temperature, humidity, and weather patterns to help you
     plan activities, make travel decisions, or simply stay informed about the weather.
     """
+    shareable = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs, name='weather', use_prefix=False)
@@ -9,6 +9,8 @@ from .engine import BaseWebSearchEngine
 from .models import SearchResult, SearchResponse, WebSearchConfig
 from .registry import EngineRegistry
 from .router import EngineRouter
+from .latency import EngineLatencyTracker, LatencyHistogram
+from .result_cache import SearchResultCache
 from .validator import ParameterValidator
 from .standardizer import ResponseStandardizer
 from .error_handler import ErrorHandler
@@ -29,6 +31,9 @@ __all__ = [
     'WebSearchConfig',
     'EngineRegistry',
     'EngineRouter',
+    'EngineLatencyTracker',
+    'LatencyHistogram',
+    'SearchResultCache',
     'ParameterValidator',
     'ResponseStandardizer',
     'ErrorHandler',
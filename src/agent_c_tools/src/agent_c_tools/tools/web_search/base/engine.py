@@ -8,8 +8,10 @@ web search system.
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
+import asyncio
 import time
 from datetime import datetime
+from agent_c.toolsets.tool_chest import ToolChest
 from agent_c.util.structured_logging import get_logger
 
 from .models import (
@@ -27,6 +29,11 @@ class BaseWebSearchEngine(ABC):
     All search engine implementations must inherit from this class and
     implement the required abstract methods to ensure consistent behavior
     across the unified web search system.
+
+    Async callers use `execute_search_async`.  Engines whose backend has an
+    async client override `_execute_search_async`, otherwise the blocking
+    `_execute_search` is run on the shared tool thread pool so it never
+    blocks the event loop.
     """
     
     def __init__(self, config: WebSearchConfig):
@@ -87,12 +94,29 @@ class BaseWebSearchEngine(ABC):
         """
         pass
     
+    async def _execute_search_async(self, params: SearchParameters) -> Dict[str, Any]:
+        """
+        Execute the actual search request without blocking the event loop.
+        
+        The default runs `_execute_search` on the shared tool thread pool.
+        Engines with an async client should override this.
+        
+        Args:
+            params: Validated and normalized search parameters
+            
+        Returns:
+            Raw search results from the engine
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(ToolChest.get_executor('thread'), self._execute_search, params)
+    
     def execute_search(self, params: SearchParameters) -> SearchResponse:
         """
         Execute a search with standardized error handling and response formatting.
         
-        This is the main entry point for search execution. It handles validation,
-        error handling, and response standardization.
+        This is the main entry point for synchronous search execution. It handles
+        validation, error handling, and response standardization.  Async callers
+        should use `execute_search_async`.
         
         Args:
             params: Validated search parameters
@@ -103,50 +127,87 @@ class BaseWebSearchEngine(ABC):
         start_time = time.time()
         
         try:
-            # Validate that engine supports the search type
-            if not self.supports_search_type(params.search_type):
-                raise EngineException(
-                    f"Engine {self.engine_name} does not support search type: {params.search_type.value}"
-                )
-            
-            # Check engine availability
-            if not self.is_available():
-                raise EngineException(f"Engine {self.engine_name} is not available")
+            self._validate_search_request(params, self.is_available())
             
             # Execute the search
             raw_results = self._execute_search(params)
             
-            # Standardize the response
-            response = self._standardize_response(raw_results, params, start_time)
+            return self._completed_response(raw_results, params, start_time)
             
-            logger.info(
-                f"Search completed successfully: engine={self.engine_name}, "
-                f"query='{params.query}', results={len(response.results)}, "
-                f"time={response.execution_time:.2f}s"
-            )
+        except Exception as e:
+            return self._failed_response(e, params, start_time)
+    
+    async def execute_search_async(self, params: SearchParameters) -> SearchResponse:
+        """
+        Execute a search without blocking the event loop.
+        
+        Availability checks and the search itself run off the event loop, the
+        error handling and response are the same as `execute_search`.
+        
+        Args:
+            params: Validated search parameters
             
-            return response
+        Returns:
+            Standardized SearchResponse object
+        """
+        start_time = time.time()
+        
+        try:
+            self._validate_search_request(params, await self.is_available_async())
             
-        except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(
-                f"Search failed: engine={self.engine_name}, "
-                f"query='{params.query}', error={str(e)}"
-            )
+            # Execute the search
+            raw_results = await self._execute_search_async(params)
+            
+            return self._completed_response(raw_results, params, start_time)
             
-            return SearchResponse(
-                success=False,
-                engine_used=self.engine_name,
-                search_type=params.search_type.value,
-                query=params.query,
-                execution_time=execution_time,
-                results=[],
-                error={
-                    'type': type(e).__name__,
-                    'message': str(e),
-                    'engine': self.engine_name
-                }
+        except Exception as e:
+            return self._failed_response(e, params, start_time)
+    
+    def _validate_search_request(self, params: SearchParameters, is_available: bool) -> None:
+        """Raise an EngineException if the engine can't handle the request."""
+        # Validate that engine supports the search type
+        if not self.supports_search_type(params.search_type):
+            raise EngineException(
+                f"Engine {self.engine_name} does not support search type: {params.search_type.value}"
             )
+        
+        # Check engine availability
+        if not is_available:
+            raise EngineException(f"Engine {self.engine_name} is not available")
+    
+    def _completed_response(self, raw_results: Dict[str, Any], params: SearchParameters, start_time: float) -> SearchResponse:
+        """Standardize the raw results of a completed search."""
+        response = self._standardize_response(raw_results, params, start_time)
+        
+        logger.info(
+            f"Search completed successfully: engine={self.engine_name}, "
+            f"query='{params.query}', results={len(response.results)}, "
+            f"time={response.execution_time:.2f}s"
+        )
+        
+        return response
+    
+    def _failed_response(self, e: Exception, params: SearchParameters, start_time: float) -> SearchResponse:
+        """Build the response for a failed search."""
+        execution_time = time.time() - start_time
+        logger.error(
+            f"Search failed: engine={self.engine_name}, "
+            f"query='{params.query}', error={str(e)}"
+        )
+        
+        return SearchResponse(
+            success=False,
+            engine_used=self.engine_name,
+            search_type=params.search_type.value,
+            query=params.query,
+            execution_time=execution_time,
+            results=[],
+            error={
+                'type': type(e).__name__,
+                'message': str(e),
+                'engine': self.engine_name
+            }
+        )
     
     def _standardize_response(
         self, 
@@ -274,6 +335,23 @@ class BaseWebSearchEngine(ABC):
             )
             return False
     
+    async def is_available_async(self) -> bool:
+        """
+        Check if the engine is available for use without blocking the event loop.
+        
+        Cached availability is returned directly, a fresh check runs on the
+        shared tool thread pool.
+        
+        Returns:
+            True if engine is available, False otherwise
+        """
+        if (self._last_health_check and
+            (datetime.now() - self._last_health_check).total_seconds() < 300):
+            return self._health_status.is_available if self._health_status else False
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(ToolChest.get_executor('thread'), self.is_available)
+    
     def supports_search_type(self, search_type: SearchType) -> bool:
         """
         Check if the engine supports a specific search type.
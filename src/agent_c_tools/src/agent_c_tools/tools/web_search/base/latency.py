@@ -0,0 +1,137 @@
+"""
+Per engine latency tracking for web search routing.
+
+This module provides fixed bucket latency histograms for each search engine
+so the router can rank engines by observed latency and decide when a hedged
+request should be sent to a second engine.
+"""
+
+import bisect
+from typing import Any, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with log spaced buckets from 10ms to about a minute.
+
+    Counts are halved once `max_samples` have been recorded so the histogram
+    follows the recent behavior of the engine rather than its whole history.
+    """
+
+    BUCKET_BOUNDS: List[float] = [0.01 * 1.25 ** i for i in range(40)]
+
+    def __init__(self, max_samples: int = 1000):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            max_samples: Number of samples after which older samples are decayed
+        """
+        self.max_samples = max_samples
+        self._counts: List[float] = [0.0] * (len(self.BUCKET_BOUNDS) + 1)
+        self._count = 0.0
+        self.total_samples = 0
+        self.failures = 0
+        self.last_latency: Optional[float] = None
+
+    @property
+    def count(self) -> float:
+        """The number of samples currently weighted in the histogram."""
+        return self._count
+
+    def record(self, seconds: float, success: bool = True) -> None:
+        """Record the latency of a single request."""
+        self._counts[bisect.bisect_left(self.BUCKET_BOUNDS, seconds)] += 1
+        self._count += 1
+        self.total_samples += 1
+        self.last_latency = seconds
+        if not success:
+            self.failures += 1
+
+        if self._count >= self.max_samples:
+            self._counts = [count / 2 for count in self._counts]
+            self._count /= 2
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """
+        Get the latency at a quantile, the upper bound of the bucket it falls in.
+
+        Args:
+            quantile: Quantile between 0 and 1, e.g. 0.95 for the 95th percentile
+
+        Returns:
+            Latency in seconds or None if nothing has been recorded
+        """
+        if not self._count:
+            return None
+
+        target = quantile * self._count
+        cumulative = 0.0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if count and cumulative >= target:
+                return self.BUCKET_BOUNDS[min(index, len(self.BUCKET_BOUNDS) - 1)]
+
+        return self.BUCKET_BOUNDS[-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'samples': self.total_samples,
+            'failures': self.failures,
+            'p50': self.percentile(0.5),
+            'p90': self.percentile(0.9),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+            'last': self.last_latency
+        }
+
+
+class EngineLatencyTracker:
+    """Keeps a latency histogram for each search engine."""
+
+    def __init__(self, max_samples: int = 1000):
+        """
+        Initialize the tracker.
+
+        Args:
+            max_samples: Passed to each engine's LatencyHistogram
+        """
+        self.max_samples = max_samples
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, engine_name: str, seconds: float, success: bool = True) -> None:
+        """Record the latency of a request to an engine."""
+        histogram = self._histograms.get(engine_name)
+        if histogram is None:
+            histogram = self._histograms[engine_name] = LatencyHistogram(self.max_samples)
+
+        histogram.record(seconds, success)
+
+    def percentile(self, engine_name: str, quantile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Get the latency of an engine at a quantile.
+
+        Returns:
+            Latency in seconds, or None if fewer than `min_samples` were recorded
+        """
+        histogram = self._histograms.get(engine_name)
+        if histogram is None or histogram.count < min_samples:
+            return None
+
+        return histogram.percentile(quantile)
+
+    def sort_by_latency(self, engine_names: List[str], quantile: float = 0.5) -> List[str]:
+        """
+        Sort engines fastest first by their latency at a quantile.
+
+        The sort is stable and engines without samples keep their place after
+        the measured ones, so preference order breaks ties.
+        """
+        measured = [name for name in engine_names if self.percentile(name, quantile) is not None]
+        unmeasured = [name for name in engine_names if name not in measured]
+        return sorted(measured, key=lambda name: self.percentile(name, quantile)) + unmeasured
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latency statistics of every engine."""
+        return {name: histogram.to_dict() for name, histogram in self._histograms.items()}
@@ -0,0 +1,173 @@
+"""
+Shared result cache for web search requests.
+
+This module provides a TTL + LRU cache of successful search responses keyed on
+the normalized search parameters and the engine serving them, with coalescing
+of identical concurrent requests so parallel agents hit the backend once.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from agent_c.util.structured_logging import get_logger
+
+from .models import SearchParameters, SearchResponse
+
+logger = get_logger(__name__)
+
+
+class SearchResultCache:
+    """
+    TTL + LRU cache of search responses with request coalescing.
+
+    Entries expire after the `cache_ttl` of the engine that produced them and the
+    least recently used entries are evicted beyond `max_entries`.  Only successful
+    responses are cached.  While a search is in flight, identical requests wait
+    for its response instead of starting their own.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of cached responses, defaults to the
+                WEB_SEARCH_CACHE_MAX_ENTRIES env var or 512.  0 disables caching.
+        """
+        if max_entries is None:
+            max_entries = int(os.environ.get("WEB_SEARCH_CACHE_MAX_ENTRIES", 512))
+
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[SearchResponse, float]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(params: SearchParameters, engine_name: str) -> str:
+        """
+        Build the cache key for a request from its normalized parameters.
+
+        Queries are compared case and whitespace insensitively, domain lists
+        in any order.  The requested engine is replaced by the one serving the
+        request so explicit and auto-routed requests share entries.
+        """
+        key = params.to_dict()
+        key['engine'] = engine_name
+        key['query'] = re.sub(r'\s+', ' ', params.query.strip().lower())
+        for domain_key in ('include_domains', 'exclude_domains'):
+            if domain_key in key:
+                key[domain_key] = sorted(domain.lower() for domain in key[domain_key])
+
+        return json.dumps(key, sort_keys=True, default=str)
+
+    def get(self, key: str) -> Optional[SearchResponse]:
+        """Get a cached response if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        response, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: SearchResponse, ttl: float) -> None:
+        """Cache a response for `ttl` seconds, failed responses are not cached."""
+        if not response.success or ttl <= 0 or self.max_entries <= 0:
+            return
+
+        self._entries[key] = (response, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def get_or_search(
+        self,
+        params: SearchParameters,
+        engine_name: str,
+        ttl: float,
+        search: Callable[[], Awaitable[SearchResponse]]
+    ) -> SearchResponse:
+        """
+        Return the cached response for a request, or run the search and cache its response.
+
+        Args:
+            params: Validated search parameters
+            engine_name: Name of the engine serving the request
+            ttl: Seconds to cache the response, usually the engine's `cache_ttl`
+            search: Runs the search when there is no cached or in flight response
+
+        Returns:
+            The cached, shared or new SearchResponse
+        """
+        key = self.make_key(params, engine_name)
+        response = self.get(key)
+        if response is not None:
+            self._hits += 1
+            logger.debug(f"Search cache hit: engine={engine_name}, query='{params.query}'")
+            return response
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+
+                # The request we were waiting on was cancelled, not us, so run the search ourselves
+                return await self.get_or_search(params, engine_name, ttl, search)
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await search()
+            self.put(key, response, ttl)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve the exception so it isn't reported as unhandled when nobody is waiting
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    def clear(self) -> None:
+        """Clear all cached responses."""
+        self._entries.clear()
+        logger.info("Cleared search result cache")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get statistics about the result cache."""
+        now = time.monotonic()
+        valid_entries = sum(1 for _, expires_at in self._entries.values() if now < expires_at)
+        lookups = self._hits + self._misses
+        return {
+            'total_entries': len(self._entries),
+            'valid_entries': valid_entries,
+            'max_entries': self.max_entries,
+            'in_flight': len(self._in_flight),
+            'hits': self._hits,
+            'misses': self._misses,
+            'coalesced': self._coalesced,
+            'evictions': self._evictions,
+            'hit_rate': self._hits / lookups if lookups else 0.0
+        }
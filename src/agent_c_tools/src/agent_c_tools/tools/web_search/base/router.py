@@ -7,12 +7,16 @@ engine availability.
 """
 
 import re
-from typing import Dict, List, Optional, Pattern, Tuple
+import time
+import asyncio
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 from datetime import datetime
 from agent_c.util.structured_logging import get_logger
 
-from .models import SearchType, SearchParameters
+from .models import SearchType, SearchParameters, SearchResponse
 from .registry import EngineRegistry
+from .latency import EngineLatencyTracker
+from .standardizer import ResponseStandardizer
 
 logger = get_logger(__name__)
 
@@ -87,7 +91,7 @@ class QueryAnalyzer:
                 for pattern in config['patterns']
             ]
     
-    def analyze_query(self, query: str) -> Dict[str, any]:
+    def analyze_query(self, query: str) -> Dict[str, Any]:
         """
         Analyze a query to determine characteristics and preferences.
         
@@ -144,7 +148,22 @@ class QueryAnalyzer:
 
 
 class EngineRouter:
-    """Routes search requests to the most appropriate engine."""
+    """
+    Routes search requests to the most appropriate engine.
+    
+    Requests are routed in one of three modes:
+        - single: the most appropriate engine serves the request.
+        - fanout: several healthy engines are queried concurrently and their
+          results merged and de-duplicated, for research style requests.
+        - hedged: the most appropriate engine serves the request, if it takes
+          longer than its usual latency at `hedge_percentile` the request is
+          also sent to the fastest other engine and the first success wins.
+    
+    Searches run through the router record the latency of each engine, which
+    sets the hedge delay and picks the backup engine of hedged requests.
+    """
+    
+    ROUTING_MODES = ('single', 'fanout', 'hedged')
     
     # Search type to engine preferences mapping
     SEARCH_TYPE_PREFERENCES = {
@@ -159,15 +178,32 @@ class EngineRouter:
         SearchType.FINANCIAL: ['seeking_alpha', 'newsapi', 'google']
     }
     
-    def __init__(self, registry: EngineRegistry):
+    def __init__(
+        self, 
+        registry: EngineRegistry,
+        fanout_max_engines: int = 3,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_default_delay: float = 2.0
+    ):
         """
         Initialize the engine router.
         
         Args:
             registry: Engine registry for checking availability
+            fanout_max_engines: Maximum number of engines queried by a fanout request
+            hedge_percentile: Latency percentile of the primary engine after which a hedged request is sent
+            hedge_min_samples: Samples needed before an engine's own latency sets its hedge delay
+            hedge_default_delay: Hedge delay in seconds for engines with too few samples
         """
         self.registry = registry
         self.query_analyzer = QueryAnalyzer()
+        self.latency = EngineLatencyTracker()
+        self.standardizer = ResponseStandardizer()
+        self.fanout_max_engines = fanout_max_engines
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_default_delay = hedge_default_delay
         self._routing_cache: Dict[str, Tuple[str, datetime]] = {}
         self._cache_ttl = 300  # 5 minutes
     
@@ -246,6 +282,201 @@ class EngineRouter:
             f"No engines available for search type: {params.search_type.value}"
         )
     
+    def route_fanout_request(
+        self,
+        params: SearchParameters,
+        available_engines: Optional[List[str]] = None,
+        max_engines: Optional[int] = None
+    ) -> List[str]:
+        """
+        Route a search request to several engines to be queried concurrently.
+        
+        Engines are chosen in preference order, an explicitly requested engine
+        first, then the preferences for the search type and the query, then
+        any other engine supporting the search type.
+        
+        Args:
+            params: Search parameters including query and preferences
+            available_engines: Optional list of available engines to consider
+            max_engines: Maximum number of engines, defaults to `fanout_max_engines`
+            
+        Returns:
+            Names of the selected engines in preference order
+            
+        Raises:
+            EngineUnavailableException: If no suitable engines are available
+        """
+        if available_engines is None:
+            available_engines = self.registry.get_healthy_engines()
+        
+        analysis = self.query_analyzer.analyze_query(params.query)
+        ordered = (
+            ([params.engine] if params.engine != "auto" else []) +
+            self.SEARCH_TYPE_PREFERENCES.get(params.search_type, []) +
+            analysis['preferred_engines'] +
+            available_engines
+        )
+        
+        selected = []
+        for engine_name in ordered:
+            if engine_name in selected or engine_name not in available_engines:
+                continue
+            engine = self.registry.get_engine(engine_name)
+            if engine and engine.supports_search_type(params.search_type):
+                selected.append(engine_name)
+        
+        if not selected:
+            from .engine import EngineUnavailableException
+            raise EngineUnavailableException(
+                f"No engines available for search type: {params.search_type.value}"
+            )
+        
+        selected = selected[:max_engines or self.fanout_max_engines]
+        logger.info(f"Using fanout engines: {selected}")
+        return selected
+    
+    def route_hedged_request(
+        self,
+        params: SearchParameters,
+        available_engines: Optional[List[str]] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Route a search request to a primary engine and a backup for hedging.
+        
+        The primary engine is the one `route_search_request` selects, the
+        backup is the fastest other engine supporting the search type.
+        
+        Args:
+            params: Search parameters including query and preferences
+            available_engines: Optional list of available engines to consider
+            
+        Returns:
+            Tuple of the primary engine name and the backup engine name, or None
+            if no other engine supports the search type
+            
+        Raises:
+            EngineUnavailableException: If no suitable engines are available
+        """
+        if available_engines is None:
+            available_engines = self.registry.get_healthy_engines()
+        
+        primary = self.route_search_request(params, available_engines)
+        others = [
+            engine_name for engine_name in
+            self.route_fanout_request(params, available_engines, max_engines=len(available_engines))
+            if engine_name != primary
+        ]
+        backup = self.latency.sort_by_latency(others)[0] if others else None
+        
+        logger.info(f"Using hedged engines: primary={primary}, backup={backup}")
+        return primary, backup
+    
+    def get_hedge_delay(self, engine_name: str) -> float:
+        """Get how long to wait on an engine before sending a hedged request, in seconds."""
+        delay = self.latency.percentile(engine_name, self.hedge_percentile, self.hedge_min_samples)
+        return delay if delay is not None else self.hedge_default_delay
+    
+    async def execute_search(self, engine_name: str, params: SearchParameters) -> SearchResponse:
+        """
+        Execute a search on one engine and record its latency.
+        
+        Args:
+            engine_name: Name of the engine to search
+            params: Validated search parameters
+            
+        Returns:
+            Standardized SearchResponse object
+        """
+        engine = self.registry.get_engine(engine_name)
+        if not engine:
+            from .engine import EngineUnavailableException
+            raise EngineUnavailableException(f"Engine {engine_name} not available")
+        
+        start_time = time.monotonic()
+        try:
+            response = await engine.execute_search_async(params)
+        except asyncio.CancelledError:
+            # A hedged request that lost, its elapsed time is a lower bound of its latency
+            self.latency.record(engine_name, time.monotonic() - start_time)
+            raise
+        
+        self.latency.record(engine_name, time.monotonic() - start_time, response.success)
+        return response
+    
+    async def execute_fanout(self, params: SearchParameters, engine_names: List[str]) -> SearchResponse:
+        """
+        Query several engines concurrently and merge their results.
+        
+        Args:
+            params: Validated search parameters
+            engine_names: Engines to query, in preference order
+            
+        Returns:
+            Merged and de-duplicated SearchResponse
+        """
+        start_time = time.monotonic()
+        responses = await asyncio.gather(*[self.execute_search(name, params) for name in engine_names])
+        
+        return self.standardizer.merge_responses(
+            list(responses), params.query, params.search_type, params.max_results,
+            time.monotonic() - start_time, mode="fanout"
+        )
+    
+    async def execute_hedged(
+        self,
+        params: SearchParameters,
+        primary: str,
+        backup: Optional[str]
+    ) -> SearchResponse:
+        """
+        Query the primary engine, and the backup as well if the primary is slow.
+        
+        The backup is queried once the primary has taken longer than its hedge
+        delay or if it fails first.  The first successful response wins and the
+        other request is cancelled.
+        
+        Args:
+            params: Validated search parameters
+            primary: Engine to query first
+            backup: Engine to hedge with, None to only query the primary
+            
+        Returns:
+            The first successful SearchResponse, or the primary's failure
+        """
+        delay = self.get_hedge_delay(primary)
+        primary_task = asyncio.create_task(self.execute_search(primary, params))
+        pending = {primary_task}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if backup is None or (done and primary_task.result().success):
+                return self._hedged_response(await primary_task, delay, hedged=False)
+            
+            logger.info(f"Hedging search with {backup}, {primary} took longer than {delay:.2f}s or failed")
+            pending.add(asyncio.create_task(self.execute_search(backup, params)))
+            failure = primary_task.result() if done else None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    response = task.result()
+                    if response.success:
+                        return self._hedged_response(response, delay, hedged=True)
+                    if task is primary_task or failure is None:
+                        failure = response
+            
+            return self._hedged_response(failure, delay, hedged=True)
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def _hedged_response(response: SearchResponse, delay: float, hedged: bool) -> SearchResponse:
+        response.metadata = dict(response.metadata or {}, mode='hedged', hedged=hedged, hedge_delay=delay)
+        return response
+    
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latency statistics of every engine searched through the router."""
+        return self.latency.get_stats()
+    
     def _get_optimized_engine_for_search_type(
         self, 
         search_type: SearchType, 
@@ -353,7 +584,7 @@ class EngineRouter:
     def get_routing_recommendations(
         self, 
         params: SearchParameters
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         Get detailed routing recommendations for a search request.
         
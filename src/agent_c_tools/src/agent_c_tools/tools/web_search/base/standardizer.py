@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
 import re
+from urllib.parse import urlparse
 from agent_c.util.structured_logging import get_logger
 
 from .models import SearchResult, SearchResponse, SearchType
@@ -97,7 +98,107 @@ class ResponseStandardizer:
                     'engine': engine_name
                 }
             )
-    
+
+    def merge_responses(
+        self,
+        responses: List[SearchResponse],
+        query: str,
+        search_type: SearchType,
+        max_results: int,
+        execution_time: float,
+        mode: str = "fanout"
+    ) -> SearchResponse:
+        """
+        Merge the responses of several engines into one de-duplicated response.
+
+        Results are interleaved by rank, the top result of each engine first,
+        and a result whose URL (or title, without one) was already returned by
+        another engine is dropped and its engine noted in the kept result's
+        metadata.
+
+        Args:
+            responses: Responses from each engine, in engine preference order
+            query: Original search query
+            search_type: Type of search that was performed
+            max_results: Maximum number of merged results
+            execution_time: Wall clock time of the whole request
+            mode: Routing mode recorded in the response metadata
+
+        Returns:
+            Merged SearchResponse, failed only if every engine failed
+        """
+        successful = [response for response in responses if response.success]
+        engines = {
+            response.engine_used: {
+                'success': response.success,
+                'results': len(response.results),
+                'execution_time': response.execution_time
+            }
+            for response in responses
+        }
+
+        if not successful:
+            return SearchResponse(
+                success=False,
+                engine_used="+".join(engines),
+                search_type=search_type.value,
+                query=query,
+                execution_time=execution_time,
+                results=[],
+                error={
+                    'type': 'AllEnginesFailed',
+                    'message': f"All engines failed: {', '.join(engines)}",
+                    'engine_errors': {response.engine_used: response.error for response in responses}
+                },
+                metadata={'mode': mode, 'engines': engines}
+            )
+
+        merged: List[SearchResult] = []
+        seen: Dict[str, SearchResult] = {}
+        duplicates = 0
+        for rank in range(max(len(response.results) for response in successful)):
+            for response in successful:
+                if rank >= len(response.results):
+                    continue
+
+                result = response.results[rank]
+                key = self._dedupe_key(result)
+                if key in seen:
+                    duplicates += 1
+                    also_found_by = seen[key].metadata.setdefault('also_found_by', [])
+                    if response.engine_used not in also_found_by:
+                        also_found_by.append(response.engine_used)
+                    continue
+
+                result.metadata = dict(result.metadata or {}, engine=response.engine_used)
+                seen[key] = result
+                merged.append(result)
+
+        return SearchResponse(
+            success=True,
+            engine_used="+".join(response.engine_used for response in successful),
+            search_type=search_type.value,
+            query=query,
+            execution_time=execution_time,
+            results=merged[:max_results],
+            total_results=len(merged),
+            metadata={'mode': mode, 'engines': engines, 'duplicates_removed': duplicates}
+        )
+
+    def _dedupe_key(self, result: SearchResult) -> str:
+        """Normalize a result's URL, or title without one, for de-duplication."""
+        if not result.url:
+            return "title:" + re.sub(r'\s+', ' ', result.title.strip().lower())
+
+        # Paths and queries can be case sensitive, only the host is normalized
+        parsed = urlparse(result.url.strip())
+        netloc = parsed.netloc.lower()
+        netloc = netloc[4:] if netloc.startswith('www.') else netloc
+        key = netloc + parsed.path.rstrip('/')
+        if parsed.query:
+            key += '?' + parsed.query
+        return key
+
     def _standardize_duckduckgo_response(
         self, 
         raw_response: Any, 
@@ -7,12 +7,14 @@ for the unified web search system, including engine-specific performance
 analysis, concurrent search testing, and optimization recommendations.
 """
 
+import argparse
 import asyncio
 import json
+import random
 import time
 import statistics
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 from dataclasses import dataclass, asdict
 import sys
@@ -21,7 +23,10 @@ import os
 # Add the web_search directory to the path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from web_search_tools import WebSearchTools
+from base.engine import BaseWebSearchEngine
+from base.models import EngineCapabilities, SearchParameters, SearchType, WebSearchConfig
+from base.registry import EngineRegistry
+from base.router import EngineRouter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -63,6 +68,8 @@ class WebSearchPerformanceBenchmark:
     """Comprehensive performance benchmarking for WebSearchTools"""
     
     def __init__(self):
+        from agent_c_tools.tools.web_search.tool import WebSearchTools
+        
         self.search_tools = WebSearchTools()
         self.metrics: List[PerformanceMetrics] = []
         self.test_queries = {
@@ -587,9 +594,160 @@ class WebSearchPerformanceBenchmark:
         logger.info(f"Benchmark results saved to {filename}")
         return filename
 
+class StubSearchEngine(BaseWebSearchEngine):
+    """
+    Search engine with simulated latency and results, for benchmarking routing
+    modes without API keys.
+    
+    Each search blocks for a latency drawn around `median_latency`, or
+    `tail_latency` for a `tail_rate` fraction of searches, the way a legacy
+    engine blocks its thread.  The first `shared_results` results are the same
+    for every stub engine so fanout de-duplication has something to do.
+    """
+    
+    def __init__(self, name: str, median_latency: float, tail_latency: float, tail_rate: float,
+                 shared_results: int = 3, seed: int = 0):
+        self.median_latency = median_latency
+        self.tail_latency = tail_latency
+        self.tail_rate = tail_rate
+        self.shared_results = shared_results
+        self._random = random.Random(seed)
+        super().__init__(WebSearchConfig(
+            engine_name=name,
+            capabilities=EngineCapabilities(search_types=[SearchType.WEB, SearchType.RESEARCH])
+        ))
+    
+    def _initialize_engine(self) -> None:
+        pass
+    
+    def _execute_search(self, params: SearchParameters) -> Dict[str, Any]:
+        if self._random.random() < self.tail_rate:
+            latency = self.tail_latency
+        else:
+            latency = self._random.lognormvariate(0, 0.25) * self.median_latency
+        time.sleep(latency)
+        
+        results = []
+        for i in range(params.max_results):
+            owner = "shared" if i < self.shared_results else self.engine_name
+            results.append({
+                'title': f"{params.query} result {i} from {owner}",
+                'url': f"https://{owner}.example.com/{params.query.replace(' ', '-')}/{i}",
+                'snippet': f"Simulated result {i}"
+            })
+        return {'results': results}
+    
+    def _check_availability(self) -> bool:
+        return True
+
+
+class RoutingModeBenchmark:
+    """
+    Benchmarks the single, fanout and hedged routing modes of EngineRouter
+    against stub engines with known latency distributions.
+    """
+    
+    STUB_ENGINES = [
+        # name, median latency, tail latency, tail rate
+        ('stub_primary', 0.08, 0.8, 0.04),
+        ('stub_secondary', 0.10, 0.5, 0.02),
+        ('stub_tertiary', 0.15, 1.0, 0.03)
+    ]
+    
+    def __init__(self, requests: int = 100, warmup: int = 40, concurrency: int = 4):
+        self.requests = requests
+        self.warmup = warmup
+        self.concurrency = concurrency
+        self.registry = EngineRegistry()
+        for seed, (name, median, tail, tail_rate) in enumerate(self.STUB_ENGINES):
+            self.registry.register_engine_instance(name, StubSearchEngine(name, median, tail, tail_rate, seed=seed))
+        self.router = EngineRouter(self.registry, hedge_min_samples=20)
+    
+    async def run(self) -> Dict[str, Any]:
+        """Warm the latency histograms up, then benchmark each routing mode."""
+        logger.info(f"Warming up latency histograms with {self.warmup} requests per engine")
+        for name, *_ in self.STUB_ENGINES:
+            await self._run_requests(self.warmup, lambda params, name=name: self.router.execute_search(name, params))
+        
+        results = {
+            'stub_engines': {name: {'median_latency': median, 'tail_latency': tail, 'tail_rate': tail_rate}
+                             for name, median, tail, tail_rate in self.STUB_ENGINES},
+            'modes': {}
+        }
+        for mode in EngineRouter.ROUTING_MODES:
+            logger.info(f"Benchmarking routing mode: {mode}")
+            results['modes'][mode] = await self._benchmark_mode(mode)
+        
+        results['engine_latency'] = self.router.get_latency_stats()
+        return results
+    
+    async def _benchmark_mode(self, mode: str) -> Dict[str, Any]:
+        async def search(params: SearchParameters):
+            if mode == 'fanout':
+                return await self.router.execute_fanout(params, self.router.route_fanout_request(params))
+            if mode == 'hedged':
+                primary, backup = self.router.route_hedged_request(params)
+                return await self.router.execute_hedged(params, primary, backup)
+            return await self.router.execute_search(self.router.route_search_request(params), params)
+        
+        timings = await self._run_requests(self.requests, search)
+        latencies = sorted(latency for latency, _ in timings)
+        responses = [response for _, response in timings]
+        
+        return {
+            'requests': len(timings),
+            'success_rate': sum(1 for response in responses if response.success) / len(responses),
+            'p50': latencies[int(0.50 * (len(latencies) - 1))],
+            'p95': latencies[int(0.95 * (len(latencies) - 1))],
+            'p99': latencies[int(0.99 * (len(latencies) - 1))],
+            'mean': statistics.mean(latencies),
+            'average_result_count': statistics.mean(len(response.results) for response in responses),
+            'hedged_requests': sum(1 for response in responses if response.metadata.get('hedged')),
+            'duplicates_removed': sum(response.metadata.get('duplicates_removed', 0) for response in responses)
+        }
+    
+    async def _run_requests(self, count: int, search) -> List[Tuple[float, Any]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def timed(i: int):
+            params = SearchParameters(query=f"benchmark query {i}", search_type=SearchType.RESEARCH)
+            async with semaphore:
+                start_time = time.monotonic()
+                response = await search(params)
+                return time.monotonic() - start_time, response
+        
+        return await asyncio.gather(*[timed(i) for i in range(count)])
+
+
+async def run_routing_mode_benchmark(requests: int):
+    """Run the routing mode benchmark against stub engines and print a summary"""
+    
+    print("🚀 Starting EngineRouter routing mode benchmark against stub engines")
+    print("=" * 60)
+    
+    results = await RoutingModeBenchmark(requests=requests).run()
+    
+    print(f"\n{'mode':<8} {'p50':>7} {'p95':>7} {'p99':>7} {'results':>8} {'hedged':>7} {'dupes':>6}")
+    for mode, stats in results['modes'].items():
+        print(f"{mode:<8} {stats['p50']:>7.3f} {stats['p95']:>7.3f} {stats['p99']:>7.3f} "
+              f"{stats['average_result_count']:>8.1f} {stats['hedged_requests']:>7} {stats['duplicates_removed']:>6}")
+    
+    return results
+
+
 async def main():
     """Run the comprehensive benchmark suite"""
     
+    parser = argparse.ArgumentParser(description="WebSearchTools performance benchmarks")
+    parser.add_argument("--routing-modes", action="store_true",
+                        help="Benchmark the single, fanout and hedged routing modes against stub engines")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per routing mode")
+    args = parser.parse_args()
+    
+    if args.routing_modes:
+        await run_routing_mode_benchmark(args.requests)
+        return
+    
     print("🚀 Starting WebSearchTools Performance Benchmark Suite")
     print("=" * 60)
     
@@ -7,20 +7,23 @@ different search providers.
 """
 
 import json
-from typing import Dict, List, Optional, Any, Union
+import asyncio
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable, Awaitable
 from datetime import datetime
 from agent_c.util.structured_logging import get_logger
 
-from agent_c.toolsets import json_schema, Toolset
+from agent_c.toolsets import json_schema, Toolset, ToolChest
 
 from .base.models import (
     SearchParameters, SearchType, SafeSearchLevel, SearchDepth,
     SearchResponse, WebSearchConfig, EngineCapabilities
 )
+from .base.engine import BaseWebSearchEngine
 from .base.registry import get_global_registry
 from .base.router import EngineRouter
 from .base.validator import ParameterValidator
 from .base.error_handler import ErrorHandler
+from .base.result_cache import SearchResultCache
 from .base.config_manager import get_config_manager, validate_web_search_configuration
 from .engines import (
     create_google_serp_engine, create_tavily_engine,
@@ -38,6 +41,7 @@ class WebSearchTools(Toolset):
     This toolset automatically routes search requests to the most appropriate
     engine based on query analysis, search type, and engine availability.
     """
+    shareable = True
     
     def __init__(self, **kwargs):
         """Initialize the unified web search toolset."""
@@ -49,6 +53,7 @@ class WebSearchTools(Toolset):
         self.validator = ParameterValidator()
         self.error_handler = ErrorHandler()
         self.config_manager = get_config_manager()
+        self.result_cache = SearchResultCache()
         
         # Register all available engines
         self._register_engines()
@@ -189,6 +194,13 @@ class WebSearchTools(Toolset):
                 'default': 1,
                 'minimum': 1
             },
+            'mode': {
+                'type': 'string',
+                'enum': ['single', 'fanout', 'hedged'],
+                'description': 'Routing mode. "single" uses one engine, "fanout" queries several engines at once and merges their results, "hedged" retries on a second engine when the first is slow.',
+                'required': False,
+                'default': 'single'
+            },
             'include_images': {
                 'type': 'boolean',
                 'description': 'Include image results where supported.',
@@ -208,15 +220,18 @@ class WebSearchTools(Toolset):
             # Validate and normalize parameters
             params = self._build_search_parameters(kwargs)
             
-            # Route to appropriate engine
-            engine_name = self.router.route_search_request(params)
-            engine = self.registry.get_engine(engine_name)
+            mode = kwargs.get('mode', 'single')
+            if mode not in EngineRouter.ROUTING_MODES:
+                raise ValueError(f"Unknown routing mode: {mode}, expected one of {', '.join(EngineRouter.ROUTING_MODES)}")
             
-            if not engine:
-                raise Exception(f"Engine {engine_name} not available")
+            # Route to appropriate engines, off the event loop as it may refresh engine health checks
+            loop = asyncio.get_running_loop()
+            cache_name, cache_ttl, search = await loop.run_in_executor(
+                ToolChest.get_executor('thread'), self._route_search, params, mode
+            )
             
-            # Execute search
-            response = engine.execute_search(params)
+            # Execute search, identical requests share cached and in flight responses
+            response = await self.result_cache.get_or_search(params, cache_name, cache_ttl, search)
             
             # Convert to JSON for return
             return json.dumps(response.to_dict(), indent=2, default=str)
@@ -383,6 +398,13 @@ class WebSearchTools(Toolset):
                 'items': {'type': 'string'},
                 'description': 'Domains to exclude from research.',
                 'required': False
+            },
+            'mode': {
+                'type': 'string',
+                'enum': ['single', 'fanout', 'hedged'],
+                'description': 'Routing mode. "single" uses one engine, "fanout" queries several engines at once and merges their results, "hedged" retries on a second engine when the first is slow.',
+                'required': False,
+                'default': 'single'
             }
         }
     )
@@ -633,7 +655,9 @@ class WebSearchTools(Toolset):
                     'healthy_engines': self.registry.get_healthy_engines(),
                     'configured_engines': self.registry.get_engines_with_api_keys(),
                     'health_status': {name: status.to_dict() for name, status in health_status.items()},
-                    'registry_stats': self.registry.get_registry_stats()
+                    'registry_stats': self.registry.get_registry_stats(),
+                    'engine_latency_stats': self.router.get_latency_stats(),
+                    'result_cache_stats': self.result_cache.get_cache_stats()
                 }
                 
                 # Add setup instructions for missing configurations
@@ -659,6 +683,39 @@ class WebSearchTools(Toolset):
                 'suggestion': 'Check your environment variables and API key configuration'
             }, indent=2)
     
+    def _route_search(self, params: SearchParameters, mode: str) -> Tuple[str, int, Callable[[], Awaitable[SearchResponse]]]:
+        """
+        Route a search request in a routing mode.
+        
+        Args:
+            params: Validated search parameters
+            mode: One of EngineRouter.ROUTING_MODES
+            
+        Returns:
+            Tuple of the name the response is cached under, its cache TTL and
+            a callable running the search
+        """
+        if mode == 'fanout':
+            engine_names = self.router.route_fanout_request(params)
+            cache_ttl = min(self._get_engine(name).config.cache_ttl for name in engine_names)
+            return f"fanout:{'+'.join(engine_names)}", cache_ttl, lambda: self.router.execute_fanout(params, engine_names)
+        
+        if mode == 'hedged':
+            primary, backup = self.router.route_hedged_request(params)
+            cache_ttl = self._get_engine(primary).config.cache_ttl
+            return f"hedged:{primary}", cache_ttl, lambda: self.router.execute_hedged(params, primary, backup)
+        
+        engine_name = self.router.route_search_request(params)
+        cache_ttl = self._get_engine(engine_name).config.cache_ttl
+        return engine_name, cache_ttl, lambda: self.router.execute_search(engine_name, params)
+    
+    def _get_engine(self, engine_name: str) -> BaseWebSearchEngine:
+        """Get a registered engine, raising if it isn't available."""
+        engine = self.registry.get_engine(engine_name)
+        if not engine:
+            raise Exception(f"Engine {engine_name} not available")
+        return engine
+    
     def _build_search_parameters(self, kwargs: Dict[str, Any]) -> SearchParameters:
         """
         Build and validate SearchParameters from kwargs.
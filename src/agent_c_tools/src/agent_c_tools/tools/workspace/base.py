@@ -10,6 +10,7 @@ from yaml import FullLoader
 
 from agent_c.models import BaseModel
 from agent_c.util.logging_utils import LoggingManager
+from agent_c_tools.tools.workspace.util.document_cache import ParsedDocumentCache
 
 class WorkspaceDataEntry(BaseModel):
     name: Optional[str] = Field(None, description="The name of the workspace to add.")
@@ -47,6 +48,7 @@ class BaseWorkspace:
         write_status (str): A textual representation of the read/write status.
         max_filename_length (int): The maximum length of filenames in the workspace.
                                   A value of -1 indicates no specific limit.
+        document_cache (ParsedDocumentCache): Parsed XML and JSON documents shared by the explorer tools.
     """
 
     supports_run_command: bool = False
@@ -63,6 +65,7 @@ class BaseWorkspace:
                       - 'read_only' (bool): If the workspace should be read-only.
         """
         self._block_cache: Dict[str, str] = {}
+        self.document_cache: ParsedDocumentCache = ParsedDocumentCache()
         self.entry = entry
         self.name: str = self.entry.name
         self.meta_file_path: str = kwargs.get('meta_file_path', '.agent_c.meta.yaml')
@@ -281,6 +284,14 @@ class BaseWorkspace:
 
         return self._block_cache.get(block_key.replace("blocks_", "block_"), None)
 
+    async def close(self) -> None:
+        """
+        Release cached state and any clients held by the workspace when it's discarded.
+        Subclasses holding clients should close them and call this.
+        """
+        self._block_cache = {}
+        self._metadata = None
+
     async def safe_metadata(self, key: str) -> Any:
         async with self._metadata_lock:
             if self._metadata is None:
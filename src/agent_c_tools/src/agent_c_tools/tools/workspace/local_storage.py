@@ -12,6 +12,7 @@ import glob
 from pathlib import Path
 from typing import Optional, Union, Tuple, Callable, TypeVar, List, Dict
 
+from agent_c.config.block_store import BlockStore
 from agent_c.util.logging_utils import LoggingManager
 from agent_c.util.token_counter import TokenCounter
 from agent_c_tools.tools.workspace.base import BaseWorkspace, WorkspaceDataEntry
@@ -53,6 +54,8 @@ class LocalStorageWorkspace(BaseWorkspace):
 
         self.workspace_root: Path = self._resolve_path(entry.path_or_bucket)
         self.block_folder: Path = self.workspace_root.joinpath('.agentc', 'blocks')
+        # Polled rather than watched, a user can have many workspaces open
+        self.block_store: BlockStore = BlockStore(self.block_folder, watch=False)
         self.valid: bool = self.workspace_root is not None
         self.allow_symlinks: bool = os.environ.get('WORKSPACE_ALLOW_SYMLINKS', 'true').lower() == 'true'
         self.logger = LoggingManager(__name__).get_logger()
@@ -69,17 +72,10 @@ class LocalStorageWorkspace(BaseWorkspace):
         )
 
     async def load_blocks(self):
-        if self.block_folder.exists():
-            file_paths = glob.glob(os.path.join(self.block_folder, "**/*.md"), recursive=True)
-
-            for file_path in file_paths:
-                key = file_path.removeprefix(str(self.block_folder)).replace("\\", "/").removeprefix("/").removesuffix(".md").replace("/", "_")
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        content = file.read()
-                        self._block_cache[f"block_{key}"] = content
-                except Exception as e:
-                    self.logger.exception(f"Failed to read block file {file_path}: {e}", exc_info=True)
+        await asyncio.to_thread(self.block_store.reload)
+
+    async def get_block(self, block_key: str) -> Optional[str]:
+        return await self.block_store.get(block_key)
 
 
     @staticmethod
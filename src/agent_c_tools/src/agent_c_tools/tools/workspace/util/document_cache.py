@@ -0,0 +1,221 @@
+import asyncio
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agent_c.toolsets.tool_chest import ToolChest
+from agent_c.util.logging_utils import LoggingManager
+
+
+class _CachedDocument:
+    __slots__ = ('kind', 'document', 'mtime_ns', 'size', 'cost')
+
+    def __init__(self, kind: str, document: Any, mtime_ns: int, size: int, cost: int) -> None:
+        self.kind = kind
+        self.document = document
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.cost = cost
+
+
+class _DocumentBudget:
+    """Estimated bytes of the documents held by the caches sharing a budget, least recently used first."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._order: "OrderedDict[Tuple[int, str], Tuple[ParsedDocumentCache, _CachedDocument]]" = OrderedDict()
+
+    def add(self, cache: 'ParsedDocumentCache', full_path: str, entry: _CachedDocument) -> List[Tuple['ParsedDocumentCache', str, _CachedDocument]]:
+        """Counts a document and returns the least recently used ones to evict to get back under the budget."""
+        with self._lock:
+            self._order[(id(cache), full_path)] = (cache, entry)
+            self.bytes += entry.cost
+            evicted = []
+            while self.bytes > self.max_bytes:
+                (_, path), (owner, victim) = self._order.popitem(last=False)
+                self.bytes -= victim.cost
+                evicted.append((owner, path, victim))
+
+            return evicted
+
+    def touch(self, cache: 'ParsedDocumentCache', full_path: str) -> None:
+        with self._lock:
+            key = (id(cache), full_path)
+            if key in self._order:
+                self._order.move_to_end(key)
+
+    def remove(self, cache: 'ParsedDocumentCache', full_path: str, entry: _CachedDocument) -> None:
+        with self._lock:
+            key = (id(cache), full_path)
+            counted = self._order.get(key)
+            if counted is not None and counted[1] is entry:
+                del self._order[key]
+                self.bytes -= entry.cost
+
+
+class ParsedDocumentCache:
+    """
+    LRU cache of parsed XML trees and JSON documents for the files of a workspace.
+
+    Entries are keyed on the full path of the file and only served while the file's mtime and size match
+    the ones it was parsed from, so a file changed by anything else is parsed again.  Editors change the
+    cached document in place and save it with `write_xml` / `write_json`, which write the file and keep
+    the entry current.
+
+    The memory of a parsed document is estimated as a multiple of its file size.  The caches of every workspace
+    share one budget of `PARSED_DOCUMENT_CACHE_MAX_BYTES` for the whole process, the least recently used
+    documents of any workspace are evicted once the estimates exceed it.  A cache created with its own
+    `max_bytes` gets a budget of its own.  A document estimated over the budget on its own is returned
+    without being cached.
+
+    `run_exclusive` runs the explorer tools' parsing and editing on the shared tool thread pool, one call at a
+    time, so the event loop stays free and two edits never change the same cached document at once.
+    """
+    # Rough size of a parsed document relative to its file
+    XML_SIZE_FACTOR = 3
+    JSON_SIZE_FACTOR = 6
+
+    _shared_budget: Optional[_DocumentBudget] = None
+    _shared_budget_lock = threading.Lock()
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self._budget = _DocumentBudget(max_bytes) if max_bytes is not None else self._process_budget()
+        self.logger = LoggingManager(__name__).get_logger()
+        self._entries: "OrderedDict[str, _CachedDocument]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._work_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._budget.max_bytes
+
+    @classmethod
+    def _process_budget(cls) -> _DocumentBudget:
+        with cls._shared_budget_lock:
+            if cls._shared_budget is None:
+                cls._shared_budget = _DocumentBudget(int(os.environ.get("PARSED_DOCUMENT_CACHE_MAX_BYTES", 512 * 1024 * 1024)))
+
+            return cls._shared_budget
+
+    async def run_exclusive(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs a navigator or editor call on the tool thread pool, alone among the calls run for this workspace."""
+        def call() -> Any:
+            with self._work_lock:
+                result = function(*args, **kwargs)
+                # The navigators and editors are coroutines that never await, drive them on the worker
+                return asyncio.run(result) if inspect.iscoroutine(result) else result
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(ToolChest.get_executor('thread'), call)
+
+    def get_xml(self, full_path: str) -> Any:
+        """Returns the parsed lxml ElementTree of an XML file, callers editing it must save it with `write_xml`."""
+        from lxml import etree
+        return self._get(full_path, 'xml', etree.parse, self.XML_SIZE_FACTOR)
+
+    def get_json(self, full_path: str) -> Any:
+        """Returns the parsed contents of a JSON file, callers editing it must save it with `write_json`."""
+        def load(path: str) -> Any:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        return self._get(full_path, 'json', load, self.JSON_SIZE_FACTOR)
+
+    def write_xml(self, full_path: str, tree: Any) -> None:
+        """Writes an lxml ElementTree to a file and caches it as the file's parsed tree."""
+        try:
+            tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+        except Exception:
+            self.invalidate(full_path)
+            raise
+
+        self._store(full_path, 'xml', tree, self.XML_SIZE_FACTOR)
+
+    def write_json(self, full_path: str, data: Any) -> None:
+        """Writes data to a JSON file and caches it as the file's parsed contents."""
+        try:
+            with open(full_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception:
+            self.invalidate(full_path)
+            raise
+
+        self._store(full_path, 'json', data, self.JSON_SIZE_FACTOR)
+
+    def invalidate(self, full_path: Optional[str] = None) -> None:
+        """Drops the cached document of a file, or of every file if no path is given."""
+        with self._lock:
+            for path in ([full_path] if full_path is not None else list(self._entries)):
+                entry = self._entries.pop(path, None)
+                if entry is not None:
+                    self._bytes -= entry.cost
+                    self._budget.remove(self, path, entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the number and estimated size of the cached documents and the hit rate."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'documents': len(self._entries),
+                'bytes': self._bytes,
+                'budget_bytes': self._budget.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+            }
+
+    def _get(self, full_path: str, kind: str, load: Callable[[str], Any], size_factor: int) -> Any:
+        stat = os.stat(full_path)
+        with self._lock:
+            entry = self._entries.get(full_path)
+            if entry is not None and entry.kind == kind and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._entries.move_to_end(full_path)
+                self._budget.touch(self, full_path)
+                self._hits += 1
+                return entry.document
+
+            self._misses += 1
+            # Parse under the lock so concurrent callers share a single parse of the file
+            document = load(full_path)
+            evicted = self._put(full_path, _CachedDocument(kind, document, stat.st_mtime_ns, stat.st_size, stat.st_size * size_factor))
+
+        self._evict(evicted)
+        return document
+
+    def _store(self, full_path: str, kind: str, document: Any, size_factor: int) -> None:
+        stat = os.stat(full_path)
+        with self._lock:
+            evicted = self._put(full_path, _CachedDocument(kind, document, stat.st_mtime_ns, stat.st_size, stat.st_size * size_factor))
+
+        self._evict(evicted)
+
+    def _put(self, full_path: str, entry: _CachedDocument) -> List[Tuple['ParsedDocumentCache', str, _CachedDocument]]:
+        self.invalidate(full_path)
+        if entry.cost > self.max_bytes:
+            self.logger.debug(f"Not caching {full_path}, its parsed size of about {entry.cost} bytes is over the cache budget")
+            return []
+
+        self._entries[full_path] = entry
+        self._bytes += entry.cost
+        return self._budget.add(self, full_path, entry)
+
+    @staticmethod
+    def _evict(evicted: List[Tuple['ParsedDocumentCache', str, _CachedDocument]]) -> None:
+        # Called without holding a cache lock, the documents may belong to the cache of another workspace
+        for cache, full_path, entry in evicted:
+            with cache._lock:
+                if cache._entries.get(full_path) is entry:
+                    del cache._entries[full_path]
+                    cache._bytes -= entry.cost
+                    cache._evictions += 1
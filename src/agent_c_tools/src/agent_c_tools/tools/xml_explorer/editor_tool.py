@@ -55,7 +55,7 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.create_backup(relative_path)
+        return await workspace.document_cache.run_exclusive(editor.create_backup, relative_path)
 
     @json_schema(
         'Validate that an XML file is well-formed.',
@@ -86,7 +86,7 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.validate_xml(relative_path)
+        return await workspace.document_cache.run_exclusive(editor.validate_xml, relative_path)
 
     @json_schema(
         'Add a new element to an XML file at a specified location.',
@@ -161,7 +161,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.add_element(
+        return await workspace.document_cache.run_exclusive(
+            editor.add_element,
             relative_path,
             parent_xpath,
             element_name,
@@ -215,7 +216,7 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.remove_element(relative_path, xpath, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.remove_element, relative_path, xpath, preview=preview)
 
     @json_schema(
         'Replace existing element(s) with new element(s) in an XML file.',
@@ -298,7 +299,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.replace_element(
+        return await workspace.document_cache.run_exclusive(
+            editor.replace_element,
             relative_path,
             xpath,
             new_element_name,
@@ -391,7 +393,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.insert_at_position(
+        return await workspace.document_cache.run_exclusive(
+            editor.insert_at_position,
             relative_path,
             reference_xpath,
             element_name,
@@ -468,7 +471,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.set_attribute(
+        return await workspace.document_cache.run_exclusive(
+            editor.set_attribute,
             relative_path,
             xpath,
             attribute_name,
@@ -536,7 +540,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.remove_attribute(
+        return await workspace.document_cache.run_exclusive(
+            editor.remove_attribute,
             relative_path,
             xpath,
             attribute_name,
@@ -604,7 +609,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.set_text(
+        return await workspace.document_cache.run_exclusive(
+            editor.set_text,
             relative_path,
             xpath,
             text_content,
@@ -664,7 +670,7 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.add_namespace(relative_path, prefix, uri, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.add_namespace, relative_path, prefix, uri, preview=preview)
 
     @json_schema(
         'Set the namespace of existing element(s) in an XML file.',
@@ -718,7 +724,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.set_namespace(
+        return await workspace.document_cache.run_exclusive(
+            editor.set_namespace,
             relative_path,
             xpath,
             namespace_uri,
@@ -786,7 +793,8 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.add_comment(
+        return await workspace.document_cache.run_exclusive(
+            editor.add_comment,
             relative_path,
             parent_xpath,
             comment_text,
@@ -839,7 +847,7 @@ class XmlEditorTools(Toolset):
             return yaml.dump({'error': error}, default_flow_style=False, sort_keys=False)
 
         editor = XMLEditor(workspace)
-        return await editor.remove_comment(relative_path, xpath, preview=preview)
+        return await workspace.document_cache.run_exclusive(editor.remove_comment, relative_path, xpath, preview=preview)
 
 
 # Register the toolset
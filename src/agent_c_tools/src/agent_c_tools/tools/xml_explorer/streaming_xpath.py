@@ -0,0 +1,372 @@
+import re
+from collections import deque
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
+
+
+class UnsupportedXPathError(ValueError):
+    """Raised for XPath expressions outside the subset StreamingXPath can evaluate."""
+    pass
+
+
+class _Condition:
+    """A single test inside a predicate, on an attribute or the element's text."""
+
+    def __init__(self, target: str, name: Optional[str], op: str, value: Optional[str] = None):
+        self.target = target  # 'attr' or 'text'
+        self.name = name
+        self.op = op  # 'exists', '=', '!=', 'contains' or 'starts-with'
+        self.value = value
+
+    def evaluate(self, elem: etree._Element) -> bool:
+        if self.target == 'attr':
+            actual = elem.get(self.name)
+            if actual is None:
+                return False
+        else:
+            actual = elem.text or ''
+
+        if self.op == 'exists':
+            return True
+        if self.op == '=':
+            return actual == self.value
+        if self.op == '!=':
+            return actual != self.value
+        if self.op == 'contains':
+            return self.value in actual
+        return actual.startswith(self.value)
+
+
+class _Step:
+    """A location step, an element name test with its predicates."""
+
+    def __init__(self, descendant: bool, name: Optional[str], conditions: List[_Condition]):
+        self.descendant = descendant
+        self.name = name  # None for '*'
+        self.conditions = conditions
+        self.has_text_conditions = any(condition.target == 'text' for condition in conditions)
+
+    def matches(self, elem: etree._Element, check_text: bool) -> bool:
+        if self.name is not None:
+            tag = elem.tag
+            if not isinstance(tag, str):
+                return False
+            # As in XPath, a name without a prefix only matches elements in no namespace
+            if tag != self.name:
+                return False
+
+        return all(condition.evaluate(elem) for condition in self.conditions
+                   if check_text or condition.target != 'text')
+
+
+class StreamingXPath:
+    """
+    Evaluates a subset of XPath incrementally with `iterparse`, so memory stays bounded regardless of file size.
+
+    Supported expressions are element paths of name tests (or `*`) joined by `/` and `//`, either absolute
+    (`/root/item`, `//item`) or relative to the root element (`./item`, `.//item`, `item/child`), optionally
+    ending in `/@attribute` or `/text()`.  Each step may have predicates testing attributes or the element's
+    text, combined with `and`:
+
+        [@id]  [@id='42']  [@id!='42']  [contains(@name, 'x')]  [starts-with(@name, 'x')]
+        [text()='x']  [contains(text(), 'x')]  [starts-with(text(), 'x')]
+
+    Text tests only apply to the last step and see the text of the element before its first child.  Names
+    can't have namespace prefixes and, as on the parsed tree, only match elements and attributes in no
+    namespace.  Positional predicates, functions and other axes aren't supported.
+
+    Elements are cleared as soon as they've been checked, apart from the subtrees of elements that may be
+    matches, which are kept until they end so they can be returned whole.  Matches are yielded in document
+    order, as by `xpath()`, so a match is held back until every match it's nested in has ended.  Element
+    queries that match the root element are refused, keeping the root would keep the whole document.
+    """
+
+    # Prefixed names need the namespaces of the query, which only the tree mode takes
+    _NAME = r"([A-Za-z_][\w.\-]*)"
+    _LITERAL = r"""(?:'([^']*)'|"([^"]*)"|(-?\d+(?:\.\d+)?))"""
+    _TARGET = r"(?:@" + _NAME + r"|(text)\(\))"
+    _COMPARISON = re.compile(r"^\s*" + _TARGET + r"\s*(!=|=)\s*" + _LITERAL + r"\s*$")
+    _FUNCTION = re.compile(r"^\s*(contains|starts-with)\(\s*" + _TARGET + r"\s*,\s*" + _LITERAL + r"\s*\)\s*$")
+    _EXISTS = re.compile(r"^\s*@" + _NAME + r"\s*$")
+    _STEP = re.compile(r"^(\*|" + _NAME + r")((?:\[.*\])*)$", re.DOTALL)
+
+    def __init__(self, expression: str):
+        """
+        Compile an expression.
+
+        Args:
+            expression: XPath expression in the supported subset
+
+        Raises:
+            UnsupportedXPathError: If the expression is outside the supported subset
+        """
+        self.expression = expression
+        self.result_type = 'element'  # 'element', 'attribute' or 'text'
+        self.result_name: Optional[str] = None
+        self.context_depth, self.steps = self._parse(expression.strip())
+        if any(step.has_text_conditions for step in self.steps[:-1]):
+            raise UnsupportedXPathError("Text tests are only supported on the last step of a streaming query")
+        if self.result_type == 'element' and self.context_depth == -1 and len(self.steps) == 1 and not self.steps[0].descendant:
+            raise UnsupportedXPathError("Streaming can't return the root element, it would hold the whole document")
+
+    @classmethod
+    def is_supported(cls, expression: str) -> bool:
+        """Returns True if the expression can be evaluated by streaming."""
+        try:
+            cls(expression)
+            return True
+        except UnsupportedXPathError:
+            return False
+
+    def iter_matches(self, source: Union[str, BinaryIO], limit: Optional[int] = None) -> Iterator[Union[etree._Element, str]]:
+        """
+        Yields matching elements, or attribute values or text for expressions ending in `/@name` or `/text()`.
+
+        A yielded element is cleared once iteration resumes, convert it before asking for the next match.
+        Parsing stops as soon as `limit` matches have been found.
+
+        Args:
+            source: Path or binary file object of the XML document
+            limit: Maximum number of matches, None for all
+
+        Raises:
+            UnsupportedXPathError: If an element query matches the root element
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        stack: List[etree._Element] = []
+        capture_depth: Optional[int] = None
+        # Possible matches in document order as [ended, value], and the one of each open element by depth
+        candidates: "deque[list]" = deque()
+        open_candidates: Dict[int, list] = {}
+        found = 0
+
+        for event, elem in etree.iterparse(source, events=('start', 'end'), huge_tree=True):
+            if event == 'start':
+                stack.append(elem)
+                # Text tests can only be checked at the end, the match takes its place in document order now
+                if self._matches(stack, check_text=False):
+                    if self.result_type == 'element':
+                        if len(stack) == 1:
+                            raise UnsupportedXPathError("Streaming can't return the root element, it would hold the whole document")
+                        # Keep the subtree of a possible match until it ends, it's returned whole
+                        if capture_depth is None:
+                            capture_depth = len(stack)
+                    candidate = [False, None]
+                    candidates.append(candidate)
+                    open_candidates[len(stack)] = candidate
+                continue
+
+            candidate = open_candidates.pop(len(stack), None)
+            if candidate is not None:
+                candidate[0] = True
+                if self._matches(stack, check_text=True):
+                    candidate[1] = self._result_value(elem)
+
+            # Matches nested in a pending one wait for it, their elements are inside its kept subtree
+            while candidates and candidates[0][0]:
+                _, value = candidates.popleft()
+                if value is not None:
+                    yield value
+                    found += 1
+                    if limit is not None and found >= limit:
+                        return
+
+            if capture_depth == len(stack):
+                capture_depth = None
+            stack.pop()
+
+            if capture_depth is None:
+                elem.clear(keep_tail=True)
+                # Drop the ended siblings before this one so the parent doesn't hold on to them
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
+
+    def _result_value(self, elem: etree._Element) -> Optional[Union[etree._Element, str]]:
+        if self.result_type == 'attribute':
+            return elem.get(self.result_name)
+        if self.result_type == 'text':
+            return elem.text
+        return elem
+
+    def _matches(self, stack: List[etree._Element], check_text: bool) -> bool:
+        """Checks if the path of steps matches the element at the top of the stack."""
+        last = len(self.steps) - 1
+        memo: Dict[Tuple[int, int], bool] = {}
+
+        def match(k: int, j: int) -> bool:
+            key = (k, j)
+            if key not in memo:
+                step = self.steps[k]
+                if not step.matches(stack[j], check_text and k == last):
+                    memo[key] = False
+                elif k == 0:
+                    memo[key] = j > self.context_depth if step.descendant else j == self.context_depth + 1
+                elif step.descendant:
+                    memo[key] = any(match(k - 1, i) for i in range(j - 1, -1, -1))
+                else:
+                    memo[key] = j > 0 and match(k - 1, j - 1)
+            return memo[key]
+
+        return match(last, len(stack) - 1)
+
+    def _parse(self, expression: str) -> Tuple[int, List[_Step]]:
+        # The context is the document (-1) for absolute paths, otherwise the root element (0) as the
+        # explorer tools evaluate XPath on the root element
+        if expression.startswith('/'):
+            context_depth = -1
+        else:
+            context_depth = 0
+            if expression.startswith('.'):
+                expression = expression[1:]
+                if not expression.startswith('/'):
+                    raise UnsupportedXPathError(f"Unsupported XPath for streaming: {self.expression}")
+            else:
+                expression = '/' + expression
+
+        parts = self._split_steps(expression)
+        if not parts:
+            raise UnsupportedXPathError(f"Unsupported XPath for streaming: {self.expression}")
+
+        separator, last = parts[-1]
+        if separator == '/' and last == 'text()':
+            self.result_type = 'text'
+            parts = parts[:-1]
+        elif separator == '/' and last.startswith('@'):
+            match = re.fullmatch(self._NAME, last[1:])
+            if not match:
+                raise UnsupportedXPathError(f"Unsupported attribute in streaming XPath: {last}")
+            self.result_type = 'attribute'
+            self.result_name = match.group(1)
+            parts = parts[:-1]
+
+        if not parts:
+            raise UnsupportedXPathError(f"Unsupported XPath for streaming: {self.expression}")
+
+        return context_depth, [self._parse_step(separator == '//', text) for separator, text in parts]
+
+    def _split_steps(self, expression: str) -> List[Tuple[str, str]]:
+        """Splits a path into (separator, step) pairs, ignoring separators in predicates and literals."""
+        parts: List[Tuple[str, str]] = []
+        depth = 0
+        quote = None
+        i = 0
+        start = 0
+        separator = None
+        while i < len(expression):
+            char = expression[i]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in ('"', "'"):
+                quote = char
+            elif char == '[':
+                depth += 1
+            elif char == ']':
+                depth -= 1
+            elif char == '/' and depth == 0:
+                if separator is not None:
+                    parts.append((separator, expression[start:i]))
+                separator = '//' if expression.startswith('//', i) else '/'
+                i += len(separator)
+                start = i
+                continue
+            i += 1
+
+        if quote or depth:
+            raise UnsupportedXPathError(f"Unbalanced brackets or quotes in XPath: {self.expression}")
+        if separator is not None:
+            parts.append((separator, expression[start:]))
+        if any(not text for _, text in parts):
+            raise UnsupportedXPathError(f"Unsupported XPath for streaming: {self.expression}")
+
+        return parts
+
+    def _parse_step(self, descendant: bool, text: str) -> _Step:
+        match = self._STEP.match(text.strip())
+        if not match:
+            raise UnsupportedXPathError(f"Unsupported step in streaming XPath: {text}")
+
+        name = None if match.group(1) == '*' else match.group(2)
+        conditions = []
+        for predicate in self._split_predicates(match.group(3)):
+            for clause in self._split_clauses(predicate):
+                conditions.append(self._parse_condition(clause))
+
+        return _Step(descendant, name, conditions)
+
+    def _split_predicates(self, text: str) -> List[str]:
+        predicates = []
+        depth = 0
+        quote = None
+        start = 0
+        for i, char in enumerate(text):
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in ('"', "'"):
+                quote = char
+            elif char == '[':
+                if depth == 0:
+                    start = i + 1
+                depth += 1
+            elif char == ']':
+                depth -= 1
+                if depth == 0:
+                    predicates.append(text[start:i])
+        return predicates
+
+    @staticmethod
+    def _split_clauses(predicate: str) -> List[str]:
+        """Splits a predicate on `and`, ignoring it inside literals and function calls."""
+        clauses = []
+        depth = 0
+        quote = None
+        start = 0
+        i = 0
+        while i < len(predicate):
+            char = predicate[i]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in ('"', "'"):
+                quote = char
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif depth == 0 and char.isspace():
+                match = re.match(r"\s+and\s+", predicate[i:])
+                if match:
+                    clauses.append(predicate[start:i])
+                    i += match.end()
+                    start = i
+                    continue
+            i += 1
+
+        clauses.append(predicate[start:])
+        return clauses
+
+    def _parse_condition(self, clause: str) -> _Condition:
+        match = self._EXISTS.match(clause)
+        if match:
+            return _Condition('attr', match.group(1), 'exists')
+
+        match = self._COMPARISON.match(clause)
+        if match:
+            attr_name, text, op = match.group(1), match.group(2), match.group(3)
+            return _Condition('text' if text else 'attr', attr_name, op, self._literal(match.groups()[3:6]))
+
+        match = self._FUNCTION.match(clause)
+        if match:
+            function, attr_name, text = match.group(1), match.group(2), match.group(3)
+            return _Condition('text' if text else 'attr', attr_name, function, self._literal(match.groups()[3:6]))
+
+        raise UnsupportedXPathError(f"Unsupported predicate in streaming XPath: [{clause}]")
+
+    @staticmethod
+    def _literal(groups: Tuple[Optional[str], ...]) -> str:
+        return next(group for group in groups if group is not None)
@@ -73,7 +73,7 @@ class XmlExplorerTools(Toolset):
             return json.dumps({'error': error})
 
         navigator = XMLNavigator(workspace)
-        result = await navigator.get_structure(relative_path, max_depth, sample_count)
+        result = await workspace.document_cache.run_exclusive(navigator.get_structure, relative_path, max_depth, sample_count)
 
         # Check if content is too large and save to file if needed
         if is_content_too_large(content=result, tool_context=tool_context, max_tokens=token_limit):
@@ -122,6 +122,13 @@ class XmlExplorerTools(Toolset):
                 'description': 'Max results to return.',
                 'required': False
             },
+            'mode': {
+                'type': 'string',
+                'description': "'tree' runs full XPath on the parsed file, 'streaming' scans the file without loading it and stops at the limit (element paths with attribute/text predicates only), 'auto' streams very large files when the XPath allows it.",
+                'enum': ['auto', 'tree', 'streaming'],
+                'required': False,
+                'default': 'auto'
+            },
             'token_limit': {
                 'type': 'integer',
                 'description': 'Maximum tokens before saving to file. Defaults to 25000.',
@@ -137,6 +144,7 @@ class XmlExplorerTools(Toolset):
             path (str): UNC-style path (//WORKSPACE/path) to the file to query
             xpath (str): XPath query to execute on the XML file.
             limit (int, optional): Maximum number of results to return. Defaults to 10.
+            mode (str, optional): 'auto', 'tree' or 'streaming'. Defaults to 'auto'.
             token_limit (int, optional): Maximum tokens before saving to file. Defaults to 25000.
 
         Returns:
@@ -144,6 +152,7 @@ class XmlExplorerTools(Toolset):
         """
         xpath: str = kwargs['xpath']
         limit: int = kwargs.get('limit', 10)
+        mode: str = kwargs.get('mode', 'auto')
         token_limit: int = kwargs.get('token_limit', 25000)
         unc_path = kwargs.get('path', '')
         tool_context = kwargs.get('tool_context', {})
@@ -153,7 +162,7 @@ class XmlExplorerTools(Toolset):
             return json.dumps({'error': error})
 
         navigator = XMLNavigator(workspace)
-        result = await navigator.xpath_query(relative_path, xpath, limit)
+        result = await workspace.document_cache.run_exclusive(navigator.xpath_query, relative_path, xpath, limit, mode=mode)
 
         # Check if content is too large and save to file if needed
         if is_content_too_large(content=result, tool_context=tool_context, max_tokens=token_limit):
@@ -202,6 +211,13 @@ class XmlExplorerTools(Toolset):
                 'description': 'Optional path to save the extracted subtree.',
                 'required': False
             },
+            'mode': {
+                'type': 'string',
+                'description': "'tree' runs full XPath on the parsed file, 'streaming' scans the file without loading it and stops at the first match (element paths with attribute/text predicates only), 'auto' streams very large files when the XPath allows it.",
+                'enum': ['auto', 'tree', 'streaming'],
+                'required': False,
+                'default': 'auto'
+            },
             'token_limit': {
                 'type': 'integer',
                 'description': 'Maximum tokens before saving to file. Defaults to 25000.',
@@ -217,6 +233,7 @@ class XmlExplorerTools(Toolset):
             path (str): UNC-style path (//WORKSPACE/path) to the file to extract from
             xpath (str): XPath to the root element of the subtree to extract.
             output_path (str, optional): UNC-style path to save the extracted subtree.
+            mode (str, optional): 'auto', 'tree' or 'streaming'. Defaults to 'auto'.
             token_limit (int, optional): Maximum tokens before saving to file. Defaults to 25000.
 
         Returns:
@@ -224,6 +241,7 @@ class XmlExplorerTools(Toolset):
         """
         xpath: str = kwargs['xpath']
         output_path: Optional[str] = kwargs.get('output_path')
+        mode: str = kwargs.get('mode', 'auto')
         token_limit: int = kwargs.get('token_limit', 25000)
         unc_path = kwargs.get('path', '')
         tool_context = kwargs.get('tool_context', {})
@@ -248,7 +266,7 @@ class XmlExplorerTools(Toolset):
                 output_relative_path = output_path
 
         navigator = XMLNavigator(workspace)
-        result = await navigator.extract_subtree(relative_path, xpath, output_relative_path)
+        result = await workspace.document_cache.run_exclusive(navigator.extract_subtree, relative_path, xpath, output_relative_path, mode=mode)
         
         # Check if content is too large and save to file if needed (only if no output_path was specified)
         if not output_path and is_content_too_large(content=result, tool_context=tool_context, max_tokens=token_limit):
@@ -44,6 +44,12 @@ class XMLEditor:
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         })
 
+    def _discard_cached(self, file_path: str):
+        """Drop the cached tree of a file after a failed edit, it may have been partly changed"""
+        full_path = self.workspace.full_path(file_path, mkdirs=False)
+        if full_path:
+            self.workspace.document_cache.invalidate(full_path)
+
     async def create_backup(self, file_path: str) -> str:
         """
         Create a backup of the XML file before making modifications.
@@ -115,7 +121,7 @@ class XMLEditor:
                 )
 
             # Attempt to parse the XML file
-            tree = etree.parse(full_path)
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Count elements and attributes
@@ -189,8 +195,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find parent element(s)
@@ -240,7 +246,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and elements_added > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             result = self._create_result(
                 True,
@@ -264,6 +270,7 @@ class XMLEditor:
             return yaml.dump(result, default_flow_style=False, sort_keys=False)
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error adding element: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -291,8 +298,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find elements to remove
@@ -332,7 +339,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and elements_removed > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             return yaml.dump(
                 self._create_result(
@@ -349,6 +356,7 @@ class XMLEditor:
             )
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error removing element: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -391,8 +399,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find elements to replace
@@ -435,11 +443,6 @@ class XMLEditor:
                 if text:
                     new_elem.text = text
 
-                # Preserve children if requested
-                if preserve_children:
-                    for child in elem:
-                        new_elem.append(child)
-
                 replacement_details.append({
                     'old_tag': elem.tag,
                     'new_tag': new_element_name,
@@ -449,6 +452,11 @@ class XMLEditor:
                 })
 
                 if not preview:
+                    # Preserve children if requested, moving them leaves the cached tree changed so not in preview
+                    if preserve_children:
+                        for child in list(elem):
+                            new_elem.append(child)
+
                     # Replace element
                     parent.replace(elem, new_elem)
 
@@ -456,7 +464,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and elements_replaced > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             result = self._create_result(
                 True,
@@ -481,6 +489,7 @@ class XMLEditor:
             return yaml.dump(result, default_flow_style=False, sort_keys=False)
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error replacing element: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -533,8 +542,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find reference element(s)
@@ -597,7 +606,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and elements_inserted > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             result = self._create_result(
                 True,
@@ -622,6 +631,7 @@ class XMLEditor:
             return yaml.dump(result, default_flow_style=False, sort_keys=False)
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error inserting element: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -660,8 +670,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find elements
@@ -709,7 +719,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and attributes_set > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             result = self._create_result(
                 True,
@@ -730,6 +740,7 @@ class XMLEditor:
             return yaml.dump(result, default_flow_style=False, sort_keys=False)
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error setting attribute: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -766,8 +777,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find elements
@@ -815,7 +826,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and attributes_removed > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             return yaml.dump(
                 self._create_result(
@@ -833,6 +844,7 @@ class XMLEditor:
             )
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error removing attribute: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -869,8 +881,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find elements
@@ -916,7 +928,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and text_modified > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             return yaml.dump(
                 self._create_result(
@@ -935,6 +947,7 @@ class XMLEditor:
             )
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error setting text: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -969,8 +982,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Get current namespaces
@@ -996,7 +1009,7 @@ class XMLEditor:
 
                 # Create new tree and write
                 new_tree = etree.ElementTree(new_root)
-                new_tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, new_tree)
 
             return yaml.dump(
                 self._create_result(
@@ -1014,6 +1027,7 @@ class XMLEditor:
             )
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error adding namespace: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -1048,8 +1062,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find elements
@@ -1106,7 +1120,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and namespaces_set > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             return yaml.dump(
                 self._create_result(
@@ -1124,6 +1138,7 @@ class XMLEditor:
             )
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error setting namespace: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -1170,8 +1185,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find parent element(s)
@@ -1237,7 +1252,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and comments_added > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             return yaml.dump(
                 self._create_result(
@@ -1256,6 +1271,7 @@ class XMLEditor:
             )
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error adding comment: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
@@ -1289,8 +1305,8 @@ class XMLEditor:
                     default_flow_style=False, sort_keys=False
                 )
 
-            # Parse the XML file
-            tree = etree.parse(full_path)
+            # Get the parsed XML file, edits change it in place and are written through
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find comments to remove
@@ -1329,7 +1345,7 @@ class XMLEditor:
 
             # Save changes if not in preview mode
             if not preview and comments_removed > 0:
-                tree.write(full_path, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self.workspace.document_cache.write_xml(full_path, tree)
 
             return yaml.dump(
                 self._create_result(
@@ -1346,6 +1362,7 @@ class XMLEditor:
             )
 
         except Exception as e:
+            self._discard_cached(file_path)
             error_msg = f'Error removing comment: {str(e)}'
             self.logger.error(error_msg)
             return yaml.dump(
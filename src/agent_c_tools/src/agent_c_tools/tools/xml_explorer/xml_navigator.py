@@ -1,17 +1,29 @@
 import json
+import os
 import yaml
 from lxml import etree
 import xml.etree.ElementTree as ET
 
 from typing import Optional, List
 
+from .streaming_xpath import StreamingXPath, UnsupportedXPathError
+
 
 class XMLNavigator:
-    """A tool to navigate large XML files without loading the entire file into memory"""
+    """
+    A tool to navigate large XML files without loading the entire file into memory
+
+    XPath queries and subtree extraction need the whole tree, they use the parsed tree cached in the
+    workspace's document cache so repeated queries against a file only parse it once.  Files over
+    `XML_STREAMING_THRESHOLD_BYTES` are queried by streaming instead when the XPath is in the subset
+    StreamingXPath supports, stopping at the result limit without building the tree.
+    """
+    QUERY_MODES = ('auto', 'tree', 'streaming')
 
     def __init__(self, workspace):
         self.workspace = workspace
         self.logger = workspace.logger
+        self.streaming_threshold = int(os.environ.get("XML_STREAMING_THRESHOLD_BYTES", 128 * 1024 * 1024))
 
     async def get_structure(self, file_path: str, max_depth: int = 3, sample_count: int = 5) -> str:
         """
@@ -94,7 +106,49 @@ class XMLNavigator:
         return result
 
 
-    async def xpath_query(self, file_path: str, xpath: str, limit: int = 10, format: str = "yaml") -> str:
+    def _use_streaming(self, full_path: str, xpath: str, mode: str) -> bool:
+        """
+        Decide whether to evaluate a query by streaming the file rather than on its parsed tree.
+
+        Raises:
+            ValueError: For an unknown mode
+            UnsupportedXPathError: If streaming was asked for an XPath outside the streaming subset
+        """
+        mode = mode.lower()
+        if mode not in self.QUERY_MODES:
+            raise ValueError(f"Unknown query mode '{mode}', expected one of {', '.join(self.QUERY_MODES)}")
+
+        if mode == 'streaming':
+            StreamingXPath(xpath)
+            return True
+        if mode == 'tree':
+            return False
+
+        return os.path.getsize(full_path) > self.streaming_threshold and StreamingXPath.is_supported(xpath)
+
+    def _match_to_result(self, elem, format: str):
+        """Convert an XPath match to a serializable result."""
+        # Handle different node types
+        if isinstance(elem, etree._Element):
+            if format.lower() == "yaml":
+                # For YAML, convert to hierarchical dict structure
+                return self._xml_to_dict(elem)
+
+            # For JSON, use flat structure with metadata
+            return {
+                'tag': elem.tag,
+                'attributes': dict(elem.attrib),
+                'text': elem.text.strip() if elem.text else None,
+                'children': [{'tag': child.tag, 'attributes': dict(child.attrib)} for child in elem]
+            }
+        elif isinstance(elem, str):
+            # For text nodes or attribute values
+            return {'value': elem}
+
+        # For other types (like numbers from count() functions)
+        return {'value': str(elem)}
+
+    async def xpath_query(self, file_path: str, xpath: str, limit: int = 10, format: str = "yaml", mode: str = "auto") -> str:
         """
         Execute an XPath query on the XML file and return matching elements in JSON or YAML format.
 
@@ -103,6 +157,7 @@ class XMLNavigator:
             xpath: XPath query to execute
             limit: Maximum number of results to return
             format: Output format for XML elements ("json" or "yaml"), defaults to "yaml"
+            mode: "tree" to query the parsed file, "streaming" to stream it, or "auto" to stream large files
 
         Returns:
             JSON string with query results
@@ -113,46 +168,45 @@ class XMLNavigator:
             if not full_path:
                 return json.dumps({'error': f'Invalid file path: {file_path}'})
 
-            # Parse the XML file with lxml instead of ElementTree
-            tree = etree.parse(full_path)
-            root = tree.getroot()
+            streaming = self._use_streaming(full_path, xpath, mode)
+            if streaming:
+                try:
+                    # Each match is converted before the parser moves on and clears it
+                    with open(full_path, 'rb') as f:
+                        results = [self._match_to_result(match, format)
+                                   for match in StreamingXPath(xpath).iter_matches(f, limit + 1)]
+                except UnsupportedXPathError:
+                    # The query matched the root element, only the tree mode can return it
+                    if mode.lower() != 'auto':
+                        raise
+                    streaming = False
+
+            if streaming:
+                # Parsing stopped one match past the limit, the total number of matches isn't known
+                count = None
+                truncated = len(results) > limit
+                results = results[:limit]
+            else:
+                # Get the parsed XML file with lxml instead of ElementTree, cached for the workspace
+                tree = self.workspace.document_cache.get_xml(full_path)
+                root = tree.getroot()
 
-            # Use xpath() method instead of findall() for full XPath support
-            matches = root.xpath(xpath)
-
-            # Limit results
-            matches = matches[:limit]
-
-            # Convert results to serializable format
-            results = []
-            for elem in matches:
-                # Handle different node types
-                if isinstance(elem, etree._Element):
-                    if format.lower() == "yaml":
-                        # For YAML, convert to hierarchical dict structure
-                        result = self._xml_to_dict(elem)
-                    else:
-                        # For JSON, use flat structure with metadata
-                        result = {
-                            'tag': elem.tag,
-                            'attributes': dict(elem.attrib),
-                            'text': elem.text.strip() if elem.text else None,
-                            'children': [{'tag': child.tag, 'attributes': dict(child.attrib)} for child in elem]
-                        }
-                elif isinstance(elem, str):
-                    # For text nodes or attribute values
-                    result = {'value': elem}
-                else:
-                    # For other types (like numbers from count() functions)
-                    result = {'value': str(elem)}
-
-                results.append(result)
+                # Use xpath() method instead of findall() for full XPath support
+                matches = root.xpath(xpath)
+
+                # Limit results and convert them to serializable format
+                results = [self._match_to_result(elem, format) for elem in matches[:limit]]
+                count = len(matches)
+                truncated = count > limit
 
             response = {
                 'success': True,
                 'query': xpath,
-                'count': len(matches),
-                'format': format.lower()
+                'count': count,
+                'returned': len(results),
+                'truncated': truncated,
+                'format': format.lower(),
+                'mode': 'streaming' if streaming else 'tree'
             }
 
             # If output format is YAML, convert results to YAML string
@@ -163,12 +217,15 @@ class XMLNavigator:
 
             return json.dumps(response)
 
+        except UnsupportedXPathError as e:
+            return json.dumps({'error': f'{str(e)}. Use mode "tree" for full XPath support'})
         except Exception as e:
             error_msg = f'Error executing XPath query: {str(e)}'
             self.logger.error(error_msg)
             return json.dumps({'error': error_msg})
 
-    async def extract_subtree(self, file_path: str, xpath: str, output_path: Optional[str] = None, format: str = "yaml") -> str:
+    async def extract_subtree(self, file_path: str, xpath: str, output_path: Optional[str] = None, format: str = "yaml",
+                              mode: str = "auto") -> str:
         """
         Extract a subtree from the XML file, convert to YAML (or keep as XML), and optionally save it to a new file.
 
@@ -177,6 +234,7 @@ class XMLNavigator:
             xpath: XPath to the root element of the subtree to extract
             output_path: Optional path to save the extracted subtree
             format: Output format ("yaml" or "xml"), defaults to "yaml"
+            mode: "tree" to search the parsed file, "streaming" to stream it, or "auto" to stream large files
 
         Returns:
             JSON string with the extracted subtree in specified format or status message
@@ -187,8 +245,21 @@ class XMLNavigator:
             if not full_path:
                 return json.dumps({'error': f'Invalid file path: {file_path}'})
 
-            # Parse the XML file with lxml
-            tree = etree.parse(full_path)
+            if self._use_streaming(full_path, xpath, mode):
+                try:
+                    # Stop parsing at the first match, the subtree is converted before the file is closed
+                    with open(full_path, 'rb') as f:
+                        subtree_elements = list(StreamingXPath(xpath).iter_matches(f, limit=1))
+                        if not subtree_elements:
+                            return json.dumps({'error': f'No element matches XPath: {xpath}'})
+                        return self._write_subtree(subtree_elements[0], output_path, format)
+                except UnsupportedXPathError:
+                    # The query matched the root element, only the tree mode can return it
+                    if mode.lower() != 'auto':
+                        raise
+
+            # Get the parsed XML file with lxml, cached for the workspace
+            tree = self.workspace.document_cache.get_xml(full_path)
             root = tree.getroot()
 
             # Find the first element matching the XPath using xpath() method
@@ -198,57 +269,61 @@ class XMLNavigator:
                 return json.dumps({'error': f'No element matches XPath: {xpath}'})
 
             # Get the first matching element
-            subtree_root = subtree_elements[0]
-
-            # Check if we got a proper element (not a string or number)
-            if not isinstance(subtree_root, etree._Element):
-                return json.dumps({'error': f'XPath result is not an element: {type(subtree_root)}'})
-
-            if format.lower() == "xml":
-                # Keep as XML
-                result_str = etree.tostring(subtree_root, encoding='utf-8', xml_declaration=False, pretty_print=True).decode('utf-8')
-                result_format = "xml"
-            else:
-                # Convert XML to Python dict
-                xml_dict = self._xml_to_dict(subtree_root)
-
-                # Convert dict to YAML
-                result_str = yaml.dump(xml_dict, default_flow_style=False, sort_keys=False)
-                result_format = "yaml"
-
-            # Write to output file if specified
-            if output_path:
-                # Get the full output path
-                full_output_path = self.workspace.full_path(output_path)
-                if not full_output_path:
-                    return json.dumps({'error': f'Invalid output path: {output_path}'})
-
-                # Change file extension based on format if it's .xml
-                if full_output_path.endswith('.xml') and result_format == "yaml":
-                    full_output_path = full_output_path[:-4] + '.yaml'
-
-                # Write to the output file
-                with open(full_output_path, 'w', encoding='utf-8') as f:
-                    f.write(result_str)
-
-                return json.dumps({
-                    'success': True,
-                    'message': f'Subtree extracted to {full_output_path} as {result_format.upper()}',
-                    'size': len(result_str)
-                })
-            else:
-                # Return the subtree in the specified format if no output path is specified
-                return json.dumps({
-                    'success': True,
-                    'format': result_format,
-                    'subtree': result_str
-                })
+            return self._write_subtree(subtree_elements[0], output_path, format)
 
+        except UnsupportedXPathError as e:
+            return json.dumps({'error': f'{str(e)}. Use mode "tree" for full XPath support'})
         except Exception as e:
             error_msg = f'Error extracting subtree: {str(e)}'
             self.logger.error(error_msg)
             return json.dumps({'error': error_msg})
 
+    def _write_subtree(self, subtree_root, output_path: Optional[str], format: str) -> str:
+        """Convert an extracted subtree to YAML or XML and return it or save it to output_path."""
+        # Check if we got a proper element (not a string or number)
+        if not isinstance(subtree_root, etree._Element):
+            return json.dumps({'error': f'XPath result is not an element: {type(subtree_root)}'})
+
+        if format.lower() == "xml":
+            # Keep as XML
+            result_str = etree.tostring(subtree_root, encoding='utf-8', xml_declaration=False, pretty_print=True).decode('utf-8')
+            result_format = "xml"
+        else:
+            # Convert XML to Python dict
+            xml_dict = self._xml_to_dict(subtree_root)
+
+            # Convert dict to YAML
+            result_str = yaml.dump(xml_dict, default_flow_style=False, sort_keys=False)
+            result_format = "yaml"
+
+        # Write to output file if specified
+        if output_path:
+            # Get the full output path
+            full_output_path = self.workspace.full_path(output_path)
+            if not full_output_path:
+                return json.dumps({'error': f'Invalid output path: {output_path}'})
+
+            # Change file extension based on format if it's .xml
+            if full_output_path.endswith('.xml') and result_format == "yaml":
+                full_output_path = full_output_path[:-4] + '.yaml'
+
+            # Write to the output file
+            with open(full_output_path, 'w', encoding='utf-8') as f:
+                f.write(result_str)
+
+            return json.dumps({
+                'success': True,
+                'message': f'Subtree extracted to {full_output_path} as {result_format.upper()}',
+                'size': len(result_str)
+            })
+        else:
+            # Return the subtree in the specified format if no output path is specified
+            return json.dumps({
+                'success': True,
+                'format': result_format,
+                'subtree': result_str
+            })
+
     def _extract_structure(self, context, max_depth: int, sample_count: int) -> dict:
         """Extract structural information from XML using iterative parsing"""
         root_info = {}
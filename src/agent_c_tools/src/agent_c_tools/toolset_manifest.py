@@ -0,0 +1,221 @@
+"""
+Prebuilt manifest of the toolsets, so they can be offered without importing them.
+
+Importing every toolset module pulls in pandas, sympy, openpyxl, lxml, playwright, matplotlib, the
+Google and Salesforce clients and more, whether or not an agent ever uses them.  The manifest records
+for each toolset class the module that registers it, its description, tool schemas, required toolsets
+and whether it's shareable, along with the prompt variables of the section models those modules
+define.  `register_toolsets` registers the manifest entries with `Toolset.register_lazy`, so a
+toolset's module is only imported when a ToolChest first activates it.
+
+Build the manifest after installing or changing toolsets:
+
+    python -m agent_c_tools.toolset_manifest [--output PATH]
+
+The build exits with an error when any toolset module fails to import.
+
+The manifest also records a fingerprint of the source of every module it covers.  Modules whose
+source changed since it was built, and tool modules it doesn't know about, are imported at startup
+as before.  Without a manifest every toolset is imported.
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from agent_c.models.client_tool_info import ClientToolInfo
+from agent_c.toolsets.tool_set import Toolset
+from agent_c.util.logging_utils import LoggingManager
+from agent_c.util.registries.section import SectionRegistry
+from agent_c_tools import discovered_tools
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "toolset_manifest.json")
+
+# Modules imported for the toolsets in addition to the discovered tool modules
+TOOLSET_MODULES = ["agent_c_tools.tools.in_process", "agent_c_tools.tools.standalone"]
+
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), "tools")
+
+logger = LoggingManager(__name__).get_logger()
+
+
+def manifest_path() -> str:
+    return os.environ.get("TOOLSET_MANIFEST_PATH", DEFAULT_MANIFEST_PATH)
+
+
+def toolset_modules() -> List[str]:
+    """The modules that, once imported, have registered every toolset."""
+    return sorted(set(discovered_tools.values())) + TOOLSET_MODULES
+
+
+def _module_file(module_name: str) -> Optional[str]:
+    """Find the source file of a module without importing it or its parent packages."""
+    parts = module_name.split(".")
+    top_level = importlib.import_module(parts[0])
+    for root in getattr(top_level, "__path__", []):
+        base = os.path.join(root, *parts[1:])
+        for candidate in (f"{base}.py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                return candidate
+
+    return None
+
+
+def _fingerprint(module_name: str, package_digests: Dict[str, str]) -> Optional[str]:
+    """
+    Hash of the source a module's toolsets are built from.
+
+    Modules in a tool package cover every source file of the package, since a toolset's schemas can come
+    from any of them, other modules cover just their own file.  Package hashes are kept in package_digests
+    as several modules can share one.
+    """
+    module_file = _module_file(module_name)
+    if module_file is None:
+        return None
+
+    relative = os.path.relpath(module_file, TOOLS_DIR)
+    if relative.startswith("..") or os.sep not in relative:
+        return _digest(os.path.dirname(module_file), [module_file])
+
+    root = os.path.join(TOOLS_DIR, relative.split(os.sep)[0])
+    if root not in package_digests:
+        files = sorted(os.path.join(folder, name) for folder, _, names in os.walk(root)
+                       for name in names if name.endswith(".py"))
+        package_digests[root] = _digest(root, files)
+
+    return package_digests[root]
+
+
+def _digest(root: str, files: List[str]) -> str:
+    digest = hashlib.sha1()
+    for path in files:
+        digest.update(os.path.relpath(path, root).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def _import(module_name: str) -> bool:
+    try:
+        importlib.import_module(module_name)
+        return True
+    except Exception as e:
+        logger.exception(f"Failed to import toolset module {module_name}: {e}")
+        return False
+
+
+def build_manifest(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Import every toolset module and write the manifest describing the toolsets they register.
+
+    Args:
+        path: Where to write the manifest, `manifest_path()` by default.
+
+    Returns:
+        The manifest that was written.
+    """
+    modules = [module for module in toolset_modules() if _import(module)]
+
+    toolsets: Dict[str, Dict[str, Any]] = {}
+    for tool_cls in Toolset.tool_registry:
+        info = ClientToolInfo.from_toolset(tool_cls)
+        toolsets[tool_cls.__name__] = {'module': tool_cls.__module__,
+                                       'description': info.description,
+                                       'schemas': info.schemas,
+                                       'required_tools': Toolset.get_required_tools(tool_cls.__name__),
+                                       'shareable': bool(tool_cls.shareable)}
+
+    package_digests: Dict[str, str] = {}
+    covered = set(modules) | {entry['module'] for entry in toolsets.values()}
+    manifest = {'version': MANIFEST_VERSION,
+                'toolsets': dict(sorted(toolsets.items())),
+                'modules': {module: _fingerprint(module, package_digests) for module in sorted(covered)},
+                'prompt_vars': SectionRegistry.prompt_vars()}
+
+    path = path or manifest_path()
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(temp_path, path)
+
+    return manifest
+
+
+def load_manifest(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Read the manifest, None if there isn't a usable one."""
+    path = path or manifest_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable toolset manifest {path}: {e}")
+        return None
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        logger.warning(f"Ignoring toolset manifest {path}, it was built by another version, rebuild it with "
+                       f"'python -m agent_c_tools.toolset_manifest'")
+        return None
+
+    return manifest
+
+
+def register_toolsets(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Make every toolset available, registering those covered by the manifest without importing them.
+
+    Args:
+        path: The manifest to use, `manifest_path()` by default.
+
+    Returns:
+        Counts of the toolsets registered lazily and the modules imported, with the time taken.
+    """
+    start = time.perf_counter()
+    manifest = load_manifest(path)
+    if manifest is None:
+        logger.info("No toolset manifest found, importing all toolsets. Build one with 'python -m agent_c_tools.toolset_manifest'")
+        imported = [module for module in toolset_modules() if _import(module)]
+        return {'lazy': 0, 'imported': len(imported), 'seconds': time.perf_counter() - start}
+
+    known = manifest['modules']
+    package_digests: Dict[str, str] = {}
+    stale = [module for module, fingerprint in known.items() if _fingerprint(module, package_digests) != fingerprint]
+    unknown = [module for module in toolset_modules() if module not in known]
+    if stale or unknown:
+        logger.info(f"Toolset manifest is out of date, importing {', '.join(stale + unknown)}. "
+                    f"Rebuild it with 'python -m agent_c_tools.toolset_manifest'")
+
+    lazy = 0
+    for name, entry in manifest['toolsets'].items():
+        if entry['module'] not in stale:
+            Toolset.register_lazy(name, **entry)
+            lazy += 1
+
+    SectionRegistry.register_prompt_vars(manifest.get('prompt_vars', {}))
+    imported = [module for module in stale + unknown if _import(module)]
+    return {'lazy': lazy, 'imported': len(imported), 'seconds': time.perf_counter() - start}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the toolset manifest used to load toolsets on first use.")
+    parser.add_argument("--output", default=None, help=f"Where to write the manifest (default: {manifest_path()})")
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.output)
+    print(f"Wrote {len(manifest['toolsets'])} toolsets from {len(manifest['modules'])} modules to {args.output or manifest_path()}")
+    missing = [module for module in toolset_modules() if module not in manifest['modules']]
+    if missing:
+        # Fail the build rather than ship a manifest without these toolsets
+        print(f"Could not import {', '.join(missing)}, their toolsets are missing from the manifest", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Tests for the expiring, bounded sub-agent session store of the agent assist tools."""
+import time
+from datetime import datetime
+
+import pytest
+from agent_c.config.saved_chat import SavedChatLoader
+from agent_c_tools.tools.agent_assist.session_store import AgentSessionStore
+
+
+def make_session(agent_session_id, user_session_id="parent-session", messages=2):
+    return {'session_id': agent_session_id, 'user_session_id': user_session_id, 'user_id': "tester",
+            'messages': [{'role': 'user', 'content': f"message {n}"} for n in range(messages)],
+            'metadata': {'persona_name': "Helper"}, 'created_at': datetime.now(), 'agent_key': "helper"}
+
+
+@pytest.fixture
+def loader(tmp_path):
+    return SavedChatLoader(str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_sessions_are_spilled_and_restored(loader):
+    store = AgentSessionStore(ttl=300, max_sessions=2, loader=loader)
+    for agent_session_id in ("first", "second", "third"):
+        await store.set(agent_session_id, make_session(agent_session_id))
+
+    assert store.list_active() == ["second", "third"]
+    assert store.get_stats()['spilled'] == 1
+
+    restored = await store.get("first", "tester")
+    assert restored['messages'] == make_session("first")['messages']
+    assert restored['user_session_id'] == "parent-session" and restored['agent_key'] == "helper"
+    assert store.list_active() == ["third", "first"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_over_the_byte_budget_are_spilled(loader):
+    store = AgentSessionStore(ttl=300, max_sessions=50, max_bytes=1000, loader=loader)
+    await store.set("small", make_session("small"))
+    await store.set("large", make_session("large", messages=40))
+
+    assert store.list_active() == ["large"]
+    assert (await store.get("small", "tester")) is not None
+
+
+@pytest.mark.asyncio
+async def test_expired_sessions_are_spilled_on_access(loader):
+    store = AgentSessionStore(ttl=0, max_sessions=50, loader=loader)
+    await store.set("idle", make_session("idle"))
+    time.sleep(0.01)
+
+    await store.set("busy", make_session("busy"))
+
+    assert store.list_active() == ["busy"]
+    assert [summary['spilled'] for summary in store.list_sessions("parent-session")] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_listed_per_user_session(loader):
+    store = AgentSessionStore(ttl=300, max_sessions=1, loader=loader)
+    await store.set("mine", make_session("mine", messages=3))
+    await store.set("theirs", make_session("theirs", user_session_id="other-session"))
+
+    sessions = store.list_sessions("parent-session")
+    assert [(summary['agent_session_id'], summary['message_count'], summary['spilled']) for summary in sessions] == [("mine", 3, True)]
+    assert len(store.list_sessions()) == 2
+
+
+@pytest.mark.asyncio
+async def test_sessions_spilled_before_a_restart_are_found_by_id(loader):
+    store = AgentSessionStore(ttl=300, max_sessions=50, loader=loader)
+    await store.set("saved", make_session("saved"))
+    await store.flush()
+
+    restarted = AgentSessionStore(ttl=300, max_sessions=50, loader=loader)
+    assert (await restarted.get("saved", "tester"))['messages'] == make_session("saved")['messages']
+    assert (await restarted.get("missing", "tester")) is None
+    assert (await restarted.get("../saved", "tester")) is None
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_dropped_without_a_loader():
+    store = AgentSessionStore(ttl=300, max_sessions=1)
+    await store.set("first", make_session("first"))
+    await store.set("second", make_session("second"))
+
+    assert (await store.get("first", "tester")) is None
+    assert [summary['agent_session_id'] for summary in store.list_sessions()] == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_kept_apart_per_user(loader):
+    store = AgentSessionStore(ttl=300, max_sessions=50, loader=loader)
+    await store.set("same-slug", make_session("same-slug"))
+    await store.set("same-slug", dict(make_session("same-slug", messages=5), user_id="someone-else"))
+
+    assert len((await store.get("same-slug", "tester"))['messages']) == 2
+    assert len((await store.get("same-slug", "someone-else"))['messages']) == 5
+    assert (await store.get("same-slug", "intruder")) is None
+    assert store.get_stats()['users'] == 2
+
+
+def test_toolsets_share_one_store_per_spill_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(AgentSessionStore, "_shared", {})
+    store = AgentSessionStore.shared(str(tmp_path / "spill"), max_sessions=3)
+
+    assert AgentSessionStore.shared(str(tmp_path / "spill"), max_sessions=10) is store
+    assert store.max_sessions == 3
+    assert AgentSessionStore.shared(str(tmp_path / "other")) is not store
+
+
+@pytest.mark.asyncio
+async def test_spilled_sessions_past_the_limit_are_deleted(loader):
+    store = AgentSessionStore(ttl=300, max_sessions=1, max_spilled=1, loader=loader)
+    for agent_session_id in ("first", "second", "third"):
+        await store.set(agent_session_id, make_session(agent_session_id))
+
+    assert (await store.get("first", "tester")) is None
+    assert (await store.get("second", "tester")) is not None
+    assert sorted(path.stem for path in loader.save_file_folder.glob("*/*.json")) == ["second", "third"]
+    assert store.get_stats()['purged'] == 1
+
+
+@pytest.mark.asyncio
+async def test_spilled_sessions_are_deleted_after_the_retention(loader):
+    earlier = AgentSessionStore(ttl=300, max_sessions=50, loader=loader)
+    await earlier.set("left-over", make_session("left-over"))
+    await earlier.flush()
+
+    store = AgentSessionStore(ttl=300, max_sessions=1, spill_retention=0, loader=loader)
+    time.sleep(0.01)
+    await store.set("first", make_session("first"))
+    await store.set("second", make_session("second"))
+
+    assert list(loader.save_file_folder.glob("*/*.json")) == []
+    assert [summary['agent_session_id'] for summary in store.list_sessions()] == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_without_a_user_are_restored_under_the_same_key(loader):
+    store = AgentSessionStore(ttl=300, max_sessions=50, loader=loader)
+    await store.set("anonymous", dict(make_session("anonymous"), user_id=None))
+    await store.flush()
+
+    restored = await store.get("anonymous")
+    assert restored['user_id'] is None
+    await store.set("anonymous", restored)
+
+    stats = store.get_stats()
+    assert stats['sessions'] == 1 and stats['bytes'] == AgentSessionStore._estimate_size(restored)
+    assert [summary['user_id'] for summary in store.list_sessions()] == [None]
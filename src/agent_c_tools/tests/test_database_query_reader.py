@@ -0,0 +1,133 @@
+"""Tests for the read-only SQLite connections, paging and parquet spooling of DatabaseQueryTools."""
+import json
+import os
+import sqlite3
+
+import pytest
+from agent_c_tools.tools.database_query.sqlite_reader import ReadOnlySQLiteConnections
+from agent_c_tools.tools.database_query.tool import DatabaseQueryTools
+
+
+def make_db(path, rows=250):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, note TEXT)")
+        conn.executemany("INSERT INTO items VALUES (?, ?, NULL)", [(n, f"item {n}") for n in range(rows)])
+    conn.close()
+    return str(path)
+
+
+def bump_mtime(path):
+    mtime = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+
+
+def make_tools(connections, batch_size=100):
+    # Only the query helpers are exercised, they need none of the toolset's runtime
+    tools = object.__new__(DatabaseQueryTools)
+    tools.connections = connections
+    tools.BATCH_SIZE = batch_size
+    return tools
+
+
+def test_connections_are_reused_and_read_only(tmp_path):
+    db_path = make_db(tmp_path / "data.db")
+    connections = ReadOnlySQLiteConnections()
+
+    for _ in range(3):
+        with connections.connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 250
+
+    with pytest.raises(sqlite3.OperationalError):
+        with connections.connection(db_path) as conn:
+            conn.execute("DELETE FROM items")
+
+    stats = connections.get_stats()
+    assert stats["opened"] == 1 and stats["reused"] == 3
+    connections.close()
+
+
+def test_missing_databases_are_not_created(tmp_path):
+    connections = ReadOnlySQLiteConnections()
+
+    with pytest.raises(FileNotFoundError):
+        with connections.connection(str(tmp_path / "missing.db")):
+            pass
+
+    assert not (tmp_path / "missing.db").exists()
+
+
+def test_schema_is_cached_until_the_file_changes(tmp_path):
+    db_path = make_db(tmp_path / "data.db")
+    connections = ReadOnlySQLiteConnections()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return ["items"]
+
+    for _ in range(3):
+        assert connections.cached_schema(db_path, ("tables",), loader) == ["items"]
+    assert len(loads) == 1
+
+    bump_mtime(db_path)
+    connections.cached_schema(db_path, ("tables",), loader)
+    assert len(loads) == 2
+
+
+def test_replaced_databases_get_new_connections(tmp_path):
+    db_path = make_db(tmp_path / "data.db")
+    connections = ReadOnlySQLiteConnections()
+    with connections.connection(db_path) as conn:
+        conn.execute("SELECT 1")
+
+    make_db(tmp_path / "new.db", rows=5)
+    os.replace(tmp_path / "new.db", db_path)
+
+    with connections.connection(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 5
+    assert connections.get_stats()["opened"] == 2
+
+
+def test_pages_follow_on_from_the_offset(tmp_path):
+    tools = make_tools(ReadOnlySQLiteConnections())
+    db_path = make_db(tmp_path / "data.db")
+
+    rows, next_offset = tools._fetch_page(db_path, "SELECT id, name FROM items ORDER BY id", 0, 120)
+    assert [row["id"] for row in rows] == list(range(120)) and next_offset == 120
+
+    rows, next_offset = tools._fetch_page(db_path, "SELECT id, name FROM items ORDER BY id", 240, 120)
+    assert [row["id"] for row in rows] == list(range(240, 250)) and next_offset is None
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_rows", [-5, 1])
+async def test_max_rows_below_one_still_pages_a_row_at_a_time(tmp_path, max_rows):
+    tools = make_tools(ReadOnlySQLiteConnections())
+    tools.db_path = make_db(tmp_path / "data.db")
+
+    response = json.loads(await tools.execute_query(query="SELECT id FROM items ORDER BY id", max_rows=max_rows))
+
+    assert response["results"] == [{"id": 0}]
+    assert DatabaseQueryTools._decode_page_token(response["next_page_token"])[1] == 1
+
+def test_page_tokens_round_trip():
+    token = DatabaseQueryTools._encode_page_token("SELECT * FROM items", 120)
+
+    assert DatabaseQueryTools._decode_page_token(token) == ("SELECT * FROM items", 120)
+    with pytest.raises(ValueError):
+        DatabaseQueryTools._decode_page_token("not a token")
+
+
+def test_results_are_spooled_to_parquet(tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    tools = make_tools(ReadOnlySQLiteConnections())
+    db_path = make_db(tmp_path / "data.db")
+    parquet_path = str(tmp_path / "items.parquet")
+
+    spooled = tools._spool_to_parquet(db_path, "SELECT * FROM items", parquet_path)
+
+    assert spooled == {"row_count": 250, "columns": ["id", "name", "note"], "truncated": False}
+    df = pd.read_parquet(parquet_path)
+    assert len(df) == 250 and df["name"].iloc[249] == "item 249"
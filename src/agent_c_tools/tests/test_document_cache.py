@@ -0,0 +1,140 @@
+"""Tests for the parsed-document cache shared by the XML and JSON explorer tools."""
+import asyncio
+import json
+import os
+import threading
+import time
+
+import pytest
+from agent_c_tools.tools.workspace.util.document_cache import ParsedDocumentCache
+
+
+def write_json(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def test_json_is_parsed_once_while_the_file_is_unchanged(tmp_path):
+    """Repeated loads of an unchanged file return the cached document."""
+    cache = ParsedDocumentCache()
+    full_path = write_json(tmp_path / "data.json", {"items": [1, 2, 3]})
+
+    first = cache.get_json(full_path)
+    second = cache.get_json(full_path)
+
+    assert first is second
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_json_changed_on_disk_is_parsed_again(tmp_path):
+    """A file whose mtime or size changed is parsed again."""
+    cache = ParsedDocumentCache()
+    full_path = write_json(tmp_path / "data.json", {"value": 1}, mtime_ns=1_000_000_000)
+    assert cache.get_json(full_path) == {"value": 1}
+
+    write_json(tmp_path / "data.json", {"value": 2}, mtime_ns=2_000_000_000)
+
+    assert cache.get_json(full_path) == {"value": 2}
+
+
+def test_write_through_keeps_the_entry_current(tmp_path):
+    """Documents edited in place and written through are served without parsing."""
+    cache = ParsedDocumentCache()
+    full_path = write_json(tmp_path / "data.json", {"items": []})
+
+    data = cache.get_json(full_path)
+    data["items"].append("new")
+    cache.write_json(full_path, data)
+
+    assert cache.get_json(full_path) is data
+    with open(full_path, encoding='utf-8') as f:
+        assert json.load(f) == {"items": ["new"]}
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_least_recently_used_documents_are_evicted(tmp_path):
+    """Documents are evicted least recently used first once over the memory budget."""
+    paths = [write_json(tmp_path / f"{name}.json", {"name": name * 20}) for name in "abc"]
+    cost = os.stat(paths[0]).st_size * ParsedDocumentCache.JSON_SIZE_FACTOR
+    cache = ParsedDocumentCache(max_bytes=cost * 2)
+
+    cache.get_json(paths[0])
+    cache.get_json(paths[1])
+    cache.get_json(paths[0])
+    cache.get_json(paths[2])
+
+    stats = cache.get_stats()
+    assert stats["documents"] == 2 and stats["evictions"] == 1
+    cache.get_json(paths[0])
+    assert cache.get_stats()["hits"] == 2
+
+
+
+def test_workspaces_share_one_budget_for_the_process(tmp_path, monkeypatch):
+    """Documents of every workspace count against one budget, the least recently used of any workspace go first."""
+    paths = [write_json(tmp_path / f"{name}.json", {"name": name * 20}) for name in "abc"]
+    cost = os.stat(paths[0]).st_size * ParsedDocumentCache.JSON_SIZE_FACTOR
+    monkeypatch.setattr(ParsedDocumentCache, "_shared_budget", None)
+    monkeypatch.setenv("PARSED_DOCUMENT_CACHE_MAX_BYTES", str(cost * 2))
+    first, second = ParsedDocumentCache(), ParsedDocumentCache()
+
+    first.get_json(paths[0])
+    second.get_json(paths[1])
+    first.get_json(paths[0])
+    second.get_json(paths[2])
+
+    assert second.get_stats()["budget_bytes"] == cost * 2
+    assert first.get_stats()["documents"] == 1
+    assert second.get_stats()["documents"] == 1 and second.get_stats()["evictions"] == 1
+    first.invalidate()
+    assert second.get_stats()["budget_bytes"] == cost
+
+def test_documents_over_the_budget_are_not_cached(tmp_path):
+    """A document larger than the whole budget is returned but not cached."""
+    cache = ParsedDocumentCache(max_bytes=10)
+    full_path = write_json(tmp_path / "big.json", {"data": "x" * 100})
+
+    assert cache.get_json(full_path) == {"data": "x" * 100}
+    assert cache.get_stats()["documents"] == 0
+
+
+def test_xml_trees_are_cached_and_written_through(tmp_path):
+    """Parsed XML trees are shared and edits written through stay cached."""
+    etree = pytest.importorskip("lxml.etree")
+    cache = ParsedDocumentCache()
+    path = tmp_path / "data.xml"
+    path.write_text("<root><item id='1'/></root>", encoding='utf-8')
+
+    tree = cache.get_xml(str(path))
+    assert cache.get_xml(str(path)) is tree
+
+    etree.SubElement(tree.getroot(), "item", id="2")
+    cache.write_xml(str(path), tree)
+
+    assert cache.get_xml(str(path)) is tree
+    assert len(etree.parse(str(path)).getroot().xpath("//item")) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_exclusive_runs_calls_one_at_a_time_off_the_loop():
+    """Explorer calls run on a worker thread, never overlap, and coroutines are driven to their result."""
+    cache = ParsedDocumentCache()
+    loop_thread = threading.get_ident()
+    running = []
+    overlaps = []
+
+    async def explore(value):
+        overlaps.append(bool(running))
+        running.append(threading.get_ident())
+        time.sleep(0.01)
+        running.pop()
+        return value
+
+    results = await asyncio.gather(*(cache.run_exclusive(explore, value) for value in range(4)))
+
+    assert results == [0, 1, 2, 3]
+    assert not any(overlaps)
+    assert await cache.run_exclusive(threading.get_ident) != loop_thread
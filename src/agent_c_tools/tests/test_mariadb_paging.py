@@ -0,0 +1,175 @@
+"""Tests for the pooled, paged query results and schema cache of the MariaDB tools."""
+import asyncio
+import re
+import threading
+
+import mysql.connector
+import pytest
+from agent_c_tools.tools.mariadb.tool import MariaDBConnector, MariaDBPool, MariadbTools
+
+
+class FakeCursor:
+    """Unbuffered cursor stand in, honouring LIMIT/OFFSET and sql_select_limit the way the server does."""
+    def __init__(self, rows, duplicate_columns=False):
+        self.rows = rows
+        self.duplicate_columns = duplicate_columns
+        self.position = 0
+        self.sent = 0
+        self.end = len(rows)
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        if "sql_select_limit" in query:
+            self.end = min(params[0], len(self.rows))
+            return
+        if self.duplicate_columns and "_page" in query:
+            raise mysql.connector.Error(msg="Duplicate column name 'id'", errno=1060)
+
+        window = re.search(r"LIMIT (\d+) OFFSET (\d+)$", query)
+        if window:
+            limit, offset = int(window.group(1)), int(window.group(2))
+            self.position = min(offset, len(self.rows))
+            self.end = min(offset + limit, len(self.rows))
+
+    def fetchmany(self, size):
+        end = min(self.position + size, self.end)
+        batch = self.rows[self.position:end]
+        self.position = end
+        self.sent += len(batch)
+        return batch
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, rows, duplicate_columns=False):
+        self.cursor_ = FakeCursor(rows, duplicate_columns)
+        self.closed = False
+
+    def cursor(self, **kwargs):
+        return self.cursor_
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool:
+    def __init__(self, rows):
+        self.rows = rows
+        self.duplicate_columns = False
+        self.connections = []
+
+    def get_connection(self):
+        self.connections.append(FakeConnection(self.rows, self.duplicate_columns))
+        return self.connections[-1]
+
+
+@pytest.fixture
+def connector():
+    connector = MariaDBConnector(database="paging_test")
+    connector.pool._pool = FakePool([{"id": n, "name": f"row {n}"} for n in range(1000)])
+    yield connector
+    MariaDBPool._pools.pop(connector.pool.name, None)
+
+
+@pytest.mark.asyncio
+async def test_only_the_page_is_read_from_the_server(connector):
+    result = await connector.execute_query("SELECT * FROM items;", 0, 100)
+
+    assert [row["id"] for row in result["rows"]] == list(range(100))
+    assert result["next_offset"] == 100
+    connection = connector.pool._pool.connections[-1]
+    assert connection.cursor_.sent == 101
+    assert connection.closed
+
+
+@pytest.mark.asyncio
+async def test_the_server_skips_rows_before_the_offset(connector):
+    result = await connector.execute_query("SELECT * FROM items ORDER BY id", 900, 50)
+
+    assert [row["id"] for row in result["rows"]] == list(range(900, 950))
+    cursor = connector.pool._pool.connections[-1].cursor_
+    assert cursor.queries == ["SELECT * FROM items ORDER BY id LIMIT 51 OFFSET 900"]
+    assert cursor.sent == 51
+
+
+def test_queries_with_their_own_limit_are_wrapped():
+    assert (MariaDBConnector.paged_query("SELECT * FROM t ORDER BY a LIMIT 300", 100, 51)
+            == "SELECT * FROM (SELECT * FROM t ORDER BY a LIMIT 300) AS _page LIMIT 51 OFFSET 100")
+    assert (MariaDBConnector.paged_query("SELECT * FROM t WHERE id IN (SELECT id FROM u LIMIT 5)", 0, 11)
+            == "SELECT * FROM t WHERE id IN (SELECT id FROM u LIMIT 5) LIMIT 11 OFFSET 0")
+    assert MariaDBConnector.paged_query("SELECT * FROM t;\n", 20, 11) == "SELECT * FROM t LIMIT 11 OFFSET 20"
+
+
+@pytest.mark.asyncio
+async def test_duplicate_columns_fall_back_to_skipping_rows(connector):
+    connector.pool._pool.duplicate_columns = True
+    result = await connector.execute_query("SELECT a.id, b.id FROM a JOIN b LIMIT 1000", 100, 50)
+
+    assert [row["id"] for row in result["rows"]] == list(range(100, 150))
+    assert result["next_offset"] == 150
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_connection_holds_no_thread(connector, monkeypatch):
+    monkeypatch.setattr(connector.pool, "_slots", asyncio.Semaphore(1))
+    monkeypatch.setattr(connector.pool, "timeout", 0.2)
+    release = threading.Event()
+    busy = asyncio.ensure_future(connector.pool.run(release.wait))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(TimeoutError):
+        await connector.pool.run(lambda: None)
+
+    # A cancelled caller's connection is only free once its call has finished
+    busy.cancel()
+    await asyncio.sleep(0.05)
+    assert connector.pool._slots.locked()
+    release.set()
+    assert await connector.pool.run(lambda: "free") == "free"
+
+
+@pytest.mark.asyncio
+async def test_the_last_page_has_no_next_offset(connector):
+    result = await connector.execute_query("SELECT * FROM items", 950, 100)
+
+    assert [row["id"] for row in result["rows"]] == list(range(950, 1000))
+    assert result["next_offset"] is None
+
+
+@pytest.mark.asyncio
+async def test_pages_stop_at_the_byte_limit(connector):
+    result = await connector.execute_query("SELECT * FROM items", 0, 500, max_bytes=1000)
+
+    assert 0 < len(result["rows"]) < 500
+    assert result["next_offset"] == len(result["rows"])
+
+
+def test_page_tokens_round_trip():
+    token = MariadbTools._encode_page_token("SELECT * FROM items", 200)
+
+    assert MariadbTools._decode_page_token(token) == ("SELECT * FROM items", 200)
+    with pytest.raises(ValueError):
+        MariadbTools._decode_page_token("not a token")
+
+
+def test_schema_metadata_is_cached_until_refreshed(connector):
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return ["items"]
+
+    for _ in range(3):
+        assert connector.pool.cached(("tables",), loader) == ["items"]
+    assert len(loads) == 1
+
+    connector.pool.cached(("tables",), loader, refresh=True)
+    assert len(loads) == 2
+
+
+def test_connectors_to_the_same_database_share_a_pool(connector):
+    assert MariaDBConnector(database="paging_test").pool is connector.pool
+    assert MariaDBConnector(database="other").pool is not connector.pool
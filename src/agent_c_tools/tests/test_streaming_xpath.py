@@ -0,0 +1,185 @@
+"""Tests for the streaming XPath subset used by the XML explorer on very large files."""
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+etree = pytest.importorskip("lxml.etree")
+
+from agent_c_tools.tools.xml_explorer.streaming_xpath import StreamingXPath, UnsupportedXPathError
+from agent_c_tools.tools.xml_explorer.xml_navigator import XMLNavigator
+
+CATALOG = """<?xml version="1.0"?>
+<catalog>
+  <section name="tools">
+    <item id="1" kind="hammer">Claw hammer<part>head</part></item>
+    <item id="2" kind="saw">Hand saw</item>
+  </section>
+  <section name="parts">
+    <item id="3" kind="nail">Box of nails</item>
+    <group><item id="4" kind="screw">Wood screws</item></group>
+  </section>
+</catalog>
+"""
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / "catalog.xml"
+    path.write_text(CATALOG, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("xpath", [
+    "//item",
+    "/catalog/section/item",
+    "./section/item[@kind!='saw']",
+    ".//item[@id]",
+    "section[@name='parts']//item",
+    "//section[@name='tools']/item[starts-with(@kind, 'ha') and contains(text(), 'hammer')]",
+    "//item[text()='Wood screws']",
+    "//*[@kind='nail']",
+    "//item/@kind",
+    "//section[@name='tools']/item/text()",
+])
+def test_matches_agree_with_lxml(catalog, xpath):
+    """Streaming matches are the ones lxml finds on the parsed tree."""
+    root = etree.parse(catalog).getroot()
+
+    def key(match):
+        return match if isinstance(match, str) else (match.get("id"), match.text)
+
+    expected = [key(match) for match in root.xpath(xpath)]
+    actual = [key(match) for match in StreamingXPath(xpath).iter_matches(catalog)]
+
+    assert actual == expected and expected
+
+
+@pytest.mark.parametrize("xpath", ["/root/item/@id", "//item/@id", "//*/@id"])
+def test_namespaced_documents_agree_with_lxml(tmp_path, xpath):
+    """Names without a prefix only match elements in no namespace, as they do on the parsed tree."""
+    path = tmp_path / "namespaced.xml"
+    path.write_text('<a:root xmlns:a="urn:a"><a:item id="1"/><item id="2"/><b xmlns="urn:b"><item id="3"/></b></a:root>',
+                    encoding="utf-8")
+
+    assert list(StreamingXPath(xpath).iter_matches(str(path))) == etree.parse(str(path)).getroot().xpath(xpath)
+
+
+def test_and_inside_literals_is_not_a_separator(tmp_path):
+    """Predicates are only split on `and` outside of quotes."""
+    path = tmp_path / "notes.xml"
+    path.write_text("<root><note kind='salt and pepper'>a</note><note kind='salt'>b</note></root>", encoding="utf-8")
+    xpath = "//note[@kind='salt and pepper' and text()='a']"
+
+    assert [note.text for note in StreamingXPath(xpath).iter_matches(str(path))] == ["a"]
+
+
+def test_matched_elements_keep_their_subtree(catalog):
+    """Matches are returned whole, their children aren't cleared before they're yielded."""
+    matches = [etree.tostring(match) for match in StreamingXPath("//item[@id='1']").iter_matches(catalog)]
+
+    assert len(matches) == 1 and b"<part>head</part>" in matches[0]
+
+
+def test_parsing_stops_at_the_limit(tmp_path):
+    """Only the beginning of the file is parsed when the limit is reached early."""
+    path = tmp_path / "truncated.xml"
+    # The document is cut off, parsing it to the end would fail
+    path.write_text("<root>" + "<row n='x'/>" * 1000 + "<row", encoding="utf-8")
+
+    matches = list(StreamingXPath("//row").iter_matches(str(path), limit=5))
+
+    assert len(matches) == 5
+
+
+def test_ended_elements_are_released(tmp_path):
+    """Elements that ended are removed from the tree so memory doesn't grow with the file."""
+    path = tmp_path / "rows.xml"
+    path.write_text("<root>" + "".join(f"<row n='{i}'><v>{i}</v></row>" for i in range(500)) + "</root>", encoding="utf-8")
+
+    for match in StreamingXPath("/root/row[@n='499']").iter_matches(str(path)):
+        # Only the previous row, dropped once the match has been returned, is still attached
+        assert len(match.getparent()) == 2
+
+
+@pytest.mark.parametrize("xpath", [
+    "//item[1]",
+    "//item[last()]",
+    "//section[text()='x']/item",
+    "//item/following-sibling::item",
+    "count(//item)",
+    "//item | //section",
+    "//a:item",
+    "//item[@a:id]",
+    "/catalog",
+    "/*",
+])
+def test_unsupported_expressions_are_rejected(xpath):
+    """Expressions outside the subset raise instead of returning wrong results."""
+    assert not StreamingXPath.is_supported(xpath)
+    with pytest.raises(UnsupportedXPathError):
+        StreamingXPath(xpath)
+
+
+NESTED = """<root>
+  <section id="outer"><title>A</title>
+    <section id="inner"><section id="innermost"/></section>
+  </section>
+  <section id="last"/>
+</root>
+"""
+
+
+@pytest.mark.parametrize("xpath", ["//section", "//*[@id]", "//section/@id", "//section[@id]//section"])
+def test_nested_matches_come_in_document_order(tmp_path, xpath):
+    """Matches inside other matches come after them, as from xpath(), not when their subtree ends."""
+    path = tmp_path / "nested.xml"
+    path.write_text(NESTED, encoding="utf-8")
+
+    def key(match):
+        return match if isinstance(match, str) else match.get("id")
+
+    expected = [key(match) for match in etree.parse(str(path)).getroot().xpath(xpath)]
+    assert [key(match) for match in StreamingXPath(xpath).iter_matches(str(path))] == expected
+    assert [key(match) for match in StreamingXPath(xpath).iter_matches(str(path), limit=1)] == expected[:1]
+
+
+def test_matching_the_root_element_is_refused(catalog):
+    """The root element would hold the whole document, element queries matching it are refused."""
+    with pytest.raises(UnsupportedXPathError):
+        list(StreamingXPath("//*").iter_matches(catalog))
+
+    assert list(StreamingXPath("//catalog/section/@name").iter_matches(catalog)) == ["tools", "parts"]
+
+
+@pytest.fixture
+def navigator(tmp_path, monkeypatch):
+    monkeypatch.setenv("XML_STREAMING_THRESHOLD_BYTES", "0")
+    (tmp_path / "catalog.xml").write_text(CATALOG, encoding="utf-8")
+    cache = SimpleNamespace(get_xml=lambda full_path: etree.parse(full_path))
+    workspace = SimpleNamespace(logger=logging.getLogger(__name__), document_cache=cache,
+                                full_path=lambda path, mkdirs=True: str(tmp_path / path))
+    return XMLNavigator(workspace)
+
+
+@pytest.mark.asyncio
+async def test_streamed_queries_report_truncation_instead_of_a_count(navigator):
+    """The total of a streamed query isn't known, it says whether matches were left out instead."""
+    streamed = json.loads(await navigator.xpath_query("catalog.xml", "//item", limit=2, format="json", mode="streaming"))
+    tree = json.loads(await navigator.xpath_query("catalog.xml", "//item", limit=2, format="json", mode="tree"))
+    complete = json.loads(await navigator.xpath_query("catalog.xml", "//item", limit=4, format="json", mode="streaming"))
+
+    assert (streamed['count'], streamed['returned'], streamed['truncated']) == (None, 2, True)
+    assert (tree['count'], tree['returned'], tree['truncated']) == (4, 2, True)
+    assert (complete['returned'], complete['truncated']) == (4, False)
+
+
+@pytest.mark.asyncio
+async def test_auto_mode_uses_the_tree_when_the_root_matches(navigator):
+    """A query matching the root element falls back to the parsed tree in auto mode."""
+    result = json.loads(await navigator.xpath_query("catalog.xml", "//*", limit=1, format="json"))
+    subtree = json.loads(await navigator.extract_subtree("catalog.xml", "//*", format="xml"))
+
+    assert result['mode'] == 'tree' and result['results'][0]['tag'] == "catalog"
+    assert subtree['subtree'].startswith("<catalog>")
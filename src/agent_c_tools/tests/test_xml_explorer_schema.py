@@ -0,0 +1,16 @@
+"""Tests that the XML explorer toolset imports and describes its query modes."""
+import pytest
+
+pytest.importorskip("lxml.etree")
+
+from agent_c_tools.tools.xml_explorer.tool import XmlExplorerTools
+
+
+@pytest.mark.parametrize("method", [XmlExplorerTools.query, XmlExplorerTools.extract])
+def test_mode_param_schema(method):
+    mode = method.schema['function']['parameters']['properties']['mode']
+
+    assert mode['enum'] == ['auto', 'tree', 'streaming']
+    assert mode['default'] == 'auto'
+    assert mode['description'].startswith("'tree' runs full XPath")
+    assert 'mode' not in method.schema['function']['parameters'].get('required', [])
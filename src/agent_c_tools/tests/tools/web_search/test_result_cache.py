@@ -0,0 +1,113 @@
+"""
+Unit tests for the async engine interface and the shared search result cache.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Dict
+
+from base.engine import BaseWebSearchEngine
+from base.models import SearchParameters, SearchResponse, SearchType, WebSearchConfig
+from base.result_cache import SearchResultCache
+
+
+class BlockingEngine(BaseWebSearchEngine):
+    """Legacy engine whose search blocks the calling thread."""
+
+    def _initialize_engine(self) -> None:
+        self.calls = 0
+        self.threads = set()
+
+    def _execute_search(self, params: SearchParameters) -> Dict[str, Any]:
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        time.sleep(0.05)
+        return {'results': [{'title': params.query, 'url': 'https://example.com', 'snippet': ''}]}
+
+    def _check_availability(self) -> bool:
+        return True
+
+
+def make_response(query: str, success: bool = True) -> SearchResponse:
+    return SearchResponse(success=success, engine_used="test", search_type="web", query=query,
+                          execution_time=0.0, results=[])
+
+
+class TestSearchResultCache:
+    """Test suite for SearchResultCache."""
+
+    def test_key_normalizes_parameters(self):
+        """Equivalent requests share a key, different ones don't."""
+        first = SearchParameters(query="  Python   Asyncio ", include_domains=["b.com", "A.com"])
+        second = SearchParameters(query="python asyncio", engine="tavily", include_domains=["a.com", "b.com"])
+        other = SearchParameters(query="python asyncio", max_results=5)
+
+        assert SearchResultCache.make_key(first, "tavily") == SearchResultCache.make_key(second, "tavily")
+        assert SearchResultCache.make_key(first, "tavily") != SearchResultCache.make_key(first, "google_serp")
+        assert SearchResultCache.make_key(other, "tavily") != SearchResultCache.make_key(second, "tavily")
+
+    def test_ttl_and_lru_eviction(self):
+        """Entries expire after their TTL and the least recently used are evicted."""
+        cache = SearchResultCache(max_entries=2)
+        cache.put("a", make_response("a"), ttl=60)
+        cache.put("b", make_response("b"), ttl=60)
+        cache.get("a")
+        cache.put("c", make_response("c"), ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+        cache.put("expired", make_response("expired"), ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("expired") is None
+
+        cache.put("failed", make_response("failed", success=False), ttl=60)
+        assert cache.get("failed") is None
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        """Identical concurrent requests run the search once, later ones hit the cache."""
+        async def run():
+            cache = SearchResultCache()
+            calls = 0
+
+            async def search():
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.05)
+                return make_response("q")
+
+            params = SearchParameters(query="q")
+            responses = await asyncio.gather(*[cache.get_or_search(params, "test", 60, search) for _ in range(5)])
+            cached = await cache.get_or_search(params, "test", 60, search)
+            return calls, responses, cached, cache.get_cache_stats()
+
+        calls, responses, cached, stats = asyncio.run(run())
+        assert calls == 1
+        assert all(response is responses[0] for response in responses) and cached is responses[0]
+        assert stats['coalesced'] == 4 and stats['hits'] == 1 and stats['misses'] == 1
+
+
+class TestAsyncEngineExecution:
+    """Test suite for running legacy engines off the event loop."""
+
+    def test_blocking_engine_runs_off_the_event_loop(self):
+        """A blocking engine doesn't stall other tasks on the loop."""
+        async def run():
+            engine = BlockingEngine(WebSearchConfig(engine_name="blocking"))
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            ticker_task = asyncio.create_task(ticker())
+            response = await engine.execute_search_async(SearchParameters(query="q", search_type=SearchType.WEB))
+            ticker_task.cancel()
+            return engine, response, ticks
+
+        engine, response, ticks = asyncio.run(run())
+        assert response.success and response.results[0].title == "q"
+        assert threading.get_ident() not in engine.threads
+        assert ticks > 3
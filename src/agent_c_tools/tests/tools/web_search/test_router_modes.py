@@ -0,0 +1,170 @@
+"""
+Unit tests for the fanout and hedged routing modes of EngineRouter.
+"""
+import asyncio
+from typing import Any, Dict
+
+from base.engine import BaseWebSearchEngine
+from base.latency import LatencyHistogram
+from base.models import EngineCapabilities, SearchParameters, SearchResponse, SearchResult, SearchType, WebSearchConfig
+from base.registry import EngineRegistry
+from base.router import EngineRouter
+from base.standardizer import ResponseStandardizer
+
+
+class DelayedEngine(BaseWebSearchEngine):
+    """Engine answering after a fixed delay with results on its own and shared URLs."""
+
+    def __init__(self, name: str, delay: float, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        super().__init__(WebSearchConfig(engine_name=name, capabilities=EngineCapabilities(search_types=[SearchType.WEB])))
+
+    def _initialize_engine(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+
+    def _execute_search(self, params: SearchParameters) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def _execute_search_async(self, params: SearchParameters) -> Dict[str, Any]:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.engine_name} failed")
+        return {'results': [
+            {'title': 'Shared', 'url': 'https://www.example.com/shared/', 'snippet': ''},
+            {'title': self.engine_name, 'url': f'https://{self.engine_name}.com/page', 'snippet': ''}
+        ]}
+
+    def _check_availability(self) -> bool:
+        return True
+
+
+def make_router(*engines: DelayedEngine, **kwargs) -> EngineRouter:
+    registry = EngineRegistry()
+    for engine in engines:
+        registry.register_engine_instance(engine.engine_name, engine)
+    return EngineRouter(registry, **kwargs)
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_percentiles_follow_the_distribution(self):
+        """Percentiles land in the buckets holding the samples."""
+        histogram = LatencyHistogram()
+        for _ in range(95):
+            histogram.record(0.1)
+        for _ in range(5):
+            histogram.record(2.0, success=False)
+
+        assert 0.1 <= histogram.percentile(0.5) < 0.13
+        assert 0.1 <= histogram.percentile(0.95) < 0.13
+        assert 2.0 <= histogram.percentile(0.99) < 2.5
+        assert histogram.to_dict()['failures'] == 5
+
+    def test_old_samples_decay(self):
+        """Recent samples outweigh old ones once max_samples is reached."""
+        histogram = LatencyHistogram(max_samples=100)
+        for _ in range(99):
+            histogram.record(2.0)
+        for _ in range(400):
+            histogram.record(0.1)
+
+        assert histogram.percentile(0.95) < 0.13
+
+
+class TestMergeResponses:
+    """Test suite for merging fanout responses."""
+
+    def test_results_are_interleaved_and_deduplicated(self):
+        """Results alternate between engines and duplicate URLs are dropped."""
+        def response(engine, urls, success=True):
+            results = [SearchResult(title=url, url=url, snippet='') for url in urls]
+            return SearchResponse(success=success, engine_used=engine, search_type='web', query='q',
+                                  execution_time=0.1, results=results)
+
+        merged = ResponseStandardizer().merge_responses(
+            [response('a', ['https://a.com/1', 'https://www.shared.com/x/']),
+             response('b', ['https://shared.com/x', 'https://b.com/1']),
+             response('c', [], success=False)],
+            'q', SearchType.WEB, max_results=10, execution_time=0.2
+        )
+
+        assert merged.success and merged.engine_used == 'a+b'
+        assert [result.url for result in merged.results] == ['https://a.com/1', 'https://shared.com/x', 'https://b.com/1']
+        assert merged.metadata['duplicates_removed'] == 1
+        assert merged.results[1].metadata['also_found_by'] == ['a']
+        assert merged.metadata['engines']['c']['success'] is False
+
+    def test_only_the_host_is_case_insensitive_when_deduplicating(self):
+        """URLs differing in host case are duplicates, ones differing in path or query case are not."""
+        results = [SearchResult(title=url, url=url, snippet='') for url in
+                   ['https://Docs.Example.com/Page?id=A', 'https://docs.example.com/Page?id=A',
+                    'https://docs.example.com/page?id=A', 'https://docs.example.com/Page?id=a']]
+        merged = ResponseStandardizer().merge_responses(
+            [SearchResponse(success=True, engine_used='a', search_type='web', query='q', execution_time=0.1, results=results)],
+            'q', SearchType.WEB, max_results=10, execution_time=0.2
+        )
+
+        assert [result.url for result in merged.results] == [results[0].url, results[2].url, results[3].url]
+        assert merged.metadata['duplicates_removed'] == 1
+
+
+class TestRoutingModes:
+    """Test suite for fanout and hedged requests."""
+
+    def test_fanout_queries_engines_concurrently(self):
+        """A fanout request takes as long as its slowest engine and merges the results."""
+        router = make_router(DelayedEngine('one', 0.05), DelayedEngine('two', 0.05), DelayedEngine('three', 0.05),
+                             fanout_max_engines=2)
+        params = SearchParameters(query='q', engine='two')
+
+        engines = router.route_fanout_request(params)
+        response = asyncio.run(router.execute_fanout(params, engines))
+
+        assert engines == ['two', 'one']
+        assert response.success and response.execution_time < 0.09
+        assert [result.title for result in response.results] == ['Shared', 'two', 'one']
+        assert set(router.get_latency_stats()) == {'one', 'two'}
+
+    def test_hedged_request_goes_to_backup_when_primary_is_slow(self):
+        """The backup answers once the primary exceeds its hedge delay and the primary is cancelled."""
+        slow, fast = DelayedEngine('slow', 1.0), DelayedEngine('fast', 0.01)
+        router = make_router(slow, fast, hedge_default_delay=0.05)
+        params = SearchParameters(query='q', engine='slow')
+
+        primary, backup = router.route_hedged_request(params)
+        response = asyncio.run(router.execute_hedged(params, primary, backup))
+
+        assert (primary, backup) == ('slow', 'fast')
+        assert response.engine_used == 'fast' and response.metadata['hedged']
+        assert slow.cancelled == 1
+
+    def test_hedged_request_skips_backup_when_primary_is_fast(self):
+        """No backup request is sent when the primary answers within its usual latency."""
+        primary, backup = DelayedEngine('primary', 0.01), DelayedEngine('backup', 0.01)
+        router = make_router(primary, backup, hedge_min_samples=1)
+        router.latency.record('primary', 0.5)
+        params = SearchParameters(query='q', engine='primary')
+
+        response = asyncio.run(router.execute_hedged(params, 'primary', 'backup'))
+
+        assert response.engine_used == 'primary' and not response.metadata['hedged']
+        assert router.get_hedge_delay('primary') >= 0.5
+        assert backup.calls == 0
+
+    def test_hedged_request_uses_backup_after_primary_fails(self):
+        """A failed primary is hedged right away."""
+        router = make_router(DelayedEngine('broken', 0.01, fail=True), DelayedEngine('backup', 0.01))
+        params = SearchParameters(query='q', engine='broken')
+
+        response = asyncio.run(router.execute_hedged(params, 'broken', 'backup'))
+
+        assert response.success and response.engine_used == 'backup'
+        assert router.get_latency_stats()['broken']['failures'] == 1